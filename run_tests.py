@@ -1,26 +1,174 @@
 #!/usr/bin/env python
-"""Run tests and print summary."""
-import subprocess
-import sys
+"""
+Run the UI test suite in parallel and print a summary.
+
+Tests are sharded across a process pool (one worker per CPU core by default).
+Each worker keeps a single long-lived browser (tests/support/worker_browser.py)
+and every test gets a fresh BrowserContext, so workers never share state.
+
+Usage:
+    python run_tests.py                      # all tests, one worker per core
+    python run_tests.py --workers 4          # fixed worker count
+    python run_tests.py tests.test_journeys  # only some modules/classes/tests
+    python run_tests.py --benchmark          # also record Web Vitals, fail on regressions
+    python run_tests.py --benchmark --update-baseline
+    python run_tests.py --profile-actions profiles   # per-action flamegraph + CSV
+    python run_tests.py --browser-server             # workers share one browser server
+"""
+import argparse
+import glob
+import multiprocessing
 import os
+import sys
+import time
+import traceback
+import unittest
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("BASE_URL", "http://localhost:3000")
+
+DEFAULT_TEST_MODULES = ["tests.test_journeys", "tests.test_components"]
+
+
+def iter_test_ids(suite):
+    """Flatten a unittest suite into test ids (module.Class.test_name)."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_test_ids(test)
+        else:
+            yield test.id()
+
+
+def collect_test_ids(names):
+    """Load tests by dotted name and return their ids in definition order."""
+    suite = unittest.defaultTestLoader.loadTestsFromNames(names)
+    return list(iter_test_ids(suite))
+
+
+def run_single_test(test_id):
+    """Run one test inside a pool worker and return a picklable summary."""
+    result = unittest.TestResult()
+    start = time.perf_counter()
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromName(test_id)
+        suite.run(result)
+    except Exception:
+        result.errors.append((test_id, traceback.format_exc()))
+    duration = time.perf_counter() - start
+
+    if result.errors:
+        status, details = "error", result.errors[0][1]
+    elif result.failures:
+        status, details = "failed", result.failures[0][1]
+    elif result.skipped:
+        status, details = "skipped", result.skipped[0][1]
+    else:
+        status, details = "passed", ""
+
+    return {
+        "id": test_id,
+        "status": status,
+        "duration": duration,
+        "details": details,
+        "worker": os.getpid(),
+    }
+
+
+def run_parallel(test_ids, workers):
+    """Shard tests across the process pool, printing results as they finish."""
+    results = []
+    # spawn: every worker starts its own Playwright driver (fork is not safe)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(run_single_test, test_id) for test_id in test_ids]
+        for future in as_completed(futures):
+            outcome = future.result()
+            results.append(outcome)
+            print(f"{outcome['id']} ... {outcome['status']} ({outcome['duration']:.2f}s)", flush=True)
+    return results
+
+
+def print_summary(results, wall_time, workers):
+    """Print failure details and the pytest-style summary line."""
+    problems = [r for r in results if r["status"] in ("failed", "error")]
+    for outcome in problems:
+        print(f"\n{'=' * 70}\n{outcome['status'].upper()}: {outcome['id']}\n{'-' * 70}")
+        print(outcome["details"])
+
+    counts = {}
+    for outcome in results:
+        counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+    serial_time = sum(r["duration"] for r in results)
+    parts = [f"{count} {status}" for status, count in sorted(counts.items())]
+    print(f"\n{', '.join(parts)} in {wall_time:.2f}s "
+          f"({workers} workers, {serial_time:.2f}s of test time)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run UI tests in parallel")
+    parser.add_argument("names", nargs="*", default=DEFAULT_TEST_MODULES,
+                        help="Test modules, classes or methods (dotted names)")
+    parser.add_argument("-n", "--workers", type=int,
+                        default=int(os.environ.get("TEST_WORKERS", os.cpu_count() or 1)),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Record Web Vitals per test and compare them to the baseline")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="With --benchmark: save this run as the new baseline")
+    parser.add_argument("--profile-actions", metavar="DIR", default=None,
+                        help="Export per-action timings (folded stacks + CSV) into DIR")
+    parser.add_argument("--browser-server", action="store_true",
+                        help="Attach workers to one shared browser server (reused if already running)")
+    parser.add_argument("--keep-browser-server", action="store_true",
+                        help="With --browser-server: leave a server started by this run running")
+    args = parser.parse_args(argv)
+
+    server_process = None
+    if args.browser_server and not os.environ.get("BROWSER_WS_ENDPOINT"):
+        from tests.support import browser_server
+        info, server_process = browser_server.ensure_server()
+        os.environ["BROWSER_WS_ENDPOINT"] = info.ws_endpoint
+        print(f"Browser server: {info.ws_endpoint}" + (" (reused)" if server_process is None else ""))
+
+    if args.profile_actions:
+        from tests.support import action_profiler
+        os.environ[action_profiler.PROFILE_DIR_ENV] = args.profile_actions
+        for stale in glob.glob(os.path.join(args.profile_actions, "actions*")):
+            os.remove(stale)
+
+    if args.benchmark:
+        from tests.perf import web_vitals
+        # Workers are spawned, so they inherit the environment set here
+        os.environ[web_vitals.BENCHMARK_ENV] = "1"
+        web_vitals.reset_results()
+
+    test_ids = collect_test_ids(args.names)
+    workers = max(1, min(args.workers, len(test_ids) or 1))
+
+    start = time.perf_counter()
+    try:
+        results = run_parallel(test_ids, workers)
+    finally:
+        if server_process is not None and not args.keep_browser_server:
+            browser_server.stop_server()
+    print_summary(results, time.perf_counter() - start, workers)
+    exit_code = 1 if any(r["status"] in ("failed", "error") for r in results) else 0
+
+    if args.profile_actions:
+        # Workers export their ring buffers on exit; the pool has shut down here
+        folded_path, csv_path = action_profiler.merge_profiles(args.profile_actions)
+        print(f"\nAction profile: {folded_path} (flamegraph) and {csv_path}")
+        merged = action_profiler.load_csv(csv_path)
+        print(action_profiler.format_summary(merged, "selector"))
+
+    if args.benchmark:
+        print()
+        benchmark_code = web_vitals.compare(
+            web_vitals.results_path(), web_vitals.DEFAULT_BASELINE_PATH, args.update_baseline
+        )
+        exit_code = exit_code or benchmark_code
+    return exit_code
+
 
-os.environ["BASE_URL"] = "http://localhost:3000"
-
-result = subprocess.run(
-    [sys.executable, "-m", "pytest", "tests/", "-v", "--tb=short"],
-    capture_output=True,
-    text=True,
-    timeout=600
-)
-
-print("STDOUT:")
-print(result.stdout)
-print("\nSTDERR:")
-print(result.stderr)
-print(f"\nReturn code: {result.returncode}")
-
-# Print summary line
-lines = result.stdout.split("\n")
-for line in lines:
-    if "passed" in line or "failed" in line or "error" in line:
-        print(line)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,12 @@ export function Providers({ children }: { children: ReactNode }) {
     },
   }))
 
+  // Expose the client so UI tests can wait for React Query to go idle
+  // instead of sleeping (see tests/pages/base_page.py wait_for_query_idle)
+  if (typeof window !== "undefined") {
+    ;(window as unknown as { __OTP_QUERY_CLIENT__?: QueryClient }).__OTP_QUERY_CLIENT__ = queryClient
+  }
+
   return (
     <QueryClientProvider client={queryClient}>
       {children}
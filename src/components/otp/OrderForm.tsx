@@ -64,7 +64,7 @@ export function OrderForm({
   const [showDeliverySettings, setShowDeliverySettings] = useState(false)
   const [itemValidationErrors, setItemValidationErrors] = useState<Record<number, string>>({})
   
-  const { items: availableItems, hasEndpoint, validateItem } = useItemSearch()
+  const { items: availableItems, hasEndpoint, searchItems, validateItem } = useItemSearch()
   
   const defaultWarehouse = form.watch("defaultWarehouse") || "Stores - SD"
   const watchedItems = form.watch("items") || []
@@ -160,6 +160,7 @@ export function OrderForm({
                     disabled={isLoading}
                     hasEndpoint={hasEndpoint}
                     availableItems={availableItems}
+                    searchItems={searchItems}
                     validateItem={validateItem}
                     onValidationChange={(isValid, error) =>
                       handleItemValidationChange(index, isValid, error)
@@ -306,6 +307,7 @@ export function OrderForm({
                     form.setValue("desiredDeliveryDate", value ?? "", { shouldDirty: true, shouldTouch: true })
                   }
                   placeholder="Select a date"
+                  warehouse={defaultWarehouse}
                 />
                   <p className="weekend-helper-text">
                     Weekend: {getWeekendLabel()} (Israel workweek: {getWorkweekLabel()})
@@ -1,7 +1,7 @@
 "use client"
 
 import React, { useEffect, useMemo, useState } from "react"
-import { Loader2, RotateCw, XCircle } from "lucide-react"
+import { ListPlus, Loader2, RotateCw, XCircle } from "lucide-react"
 import { Combobox } from "@/components/ui/combobox"
 import { AlertBanner } from "@/components/ui/alert-banner"
 import { LoadingSkeleton } from "@/components/ui/loading-skeleton"
@@ -9,12 +9,17 @@ import { useSalesOrders } from "@/hooks/useSalesOrders"
 import type { SalesOrderListItem } from "@/lib/api/types"
 import type { OTPApiError } from "@/lib/api/otpClient"
 
+// Orders per request; more pages load as the list is scrolled
+const SALES_ORDER_PAGE_SIZE = 25
+
 interface SalesOrderSelectorProps {
   value?: string | null
   onChange: (value: string | null) => void
   manualIdValue?: string
   onManualIdChange?: (value: string) => void
   disabled?: boolean
+  // Shows an "Add all" button for the orders loaded so far (batch re-promise)
+  onSelectAll?: (orders: SalesOrderListItem[]) => void
 }
 
 function getOrderLabel(order: SalesOrderListItem) {
@@ -38,6 +43,7 @@ export function SalesOrderSelector({
   manualIdValue,
   onManualIdChange,
   disabled,
+  onSelectAll,
 }: SalesOrderSelectorProps) {
   const [query, setQuery] = useState("")
   const [search, setSearch] = useState("")
@@ -55,7 +61,10 @@ export function SalesOrderSelector({
     error,
     refetch,
     dataUpdatedAt,
-  } = useSalesOrders({ limit: 25, search }, !disabled)
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = useSalesOrders({ limit: SALES_ORDER_PAGE_SIZE, search }, !disabled)
 
   const options = useMemo(
     () =>
@@ -85,6 +94,18 @@ export function SalesOrderSelector({
       <div className="flex items-center justify-between">
         <label className="block text-sm font-medium text-slate-700">Sales Order</label>
         <div className="flex items-center gap-2">
+          {onSelectAll && data.length > 0 && (
+            <button
+              type="button"
+              onClick={() => onSelectAll(data)}
+              disabled={disabled}
+              data-testid="sales-order-select-all"
+              className="inline-flex items-center gap-1 px-2.5 py-1.5 text-xs bg-slate-100 hover:bg-slate-200 disabled:opacity-50 rounded-lg text-slate-700"
+            >
+              <ListPlus className="h-3.5 w-3.5" />
+              Add all {data.length}
+            </button>
+          )}
           {value && (
             <button
               type="button"
@@ -109,7 +130,7 @@ export function SalesOrderSelector({
 
       {isLoading && <LoadingSkeleton lines={4} />}
 
-      {!isLoading && isFetching && (
+      {!isLoading && isFetching && !isFetchingNextPage && (
         <div className="flex items-center gap-2 text-xs text-slate-500">
           <Loader2 className="h-3.5 w-3.5 animate-spin" />
           Updating Sales Orders...
@@ -126,6 +147,9 @@ export function SalesOrderSelector({
           onQueryChange={setQuery}
           emptyLabel="No Sales Orders match your search"
           testId="sales-order-combobox"
+          hasMore={hasNextPage}
+          loadingMore={isFetchingNextPage}
+          onLoadMore={() => fetchNextPage()}
         />
       )}
 
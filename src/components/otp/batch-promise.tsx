@@ -0,0 +1,218 @@
+'use client';
+
+import React, { useRef, useState } from 'react';
+import { Layers, Loader2, Play, Square, Trash2, X } from 'lucide-react';
+import { SalesOrderSelector } from '@/components/otp/SalesOrderSelector';
+import { AlertBanner } from '@/components/ui/alert-banner';
+import { otpClient, OTPApiError } from '@/lib/api/otpClient';
+import type { PromiseBatchResult } from '@/lib/api/types';
+
+type RowStatus = 'pending' | 'done' | 'failed';
+
+interface BatchRow {
+  salesOrderId: string;
+  status: RowStatus;
+  result?: PromiseBatchResult;
+}
+
+interface BatchProgress {
+  done: number;
+  startedAt: number;
+  finishedAt?: number;
+}
+
+const CONFIDENCE_CLASSES: Record<string, string> = {
+  HIGH: 'bg-emerald-50 text-emerald-700 border-emerald-200',
+  MEDIUM: 'bg-amber-50 text-amber-700 border-amber-200',
+  LOW: 'bg-red-50 text-red-700 border-red-200',
+};
+
+function ordersPerSecond(progress: BatchProgress) {
+  const elapsed = ((progress.finishedAt ?? Date.now()) - progress.startedAt) / 1000;
+  return elapsed > 0 ? progress.done / elapsed : 0;
+}
+
+export function BatchPromise() {
+  const [rows, setRows] = useState<BatchRow[]>([]);
+  const [running, setRunning] = useState(false);
+  const [progress, setProgress] = useState<BatchProgress | null>(null);
+  const [error, setError] = useState<string | null>(null);
+  const controllerRef = useRef<AbortController | null>(null);
+
+  const addOrders = (ids: string[]) => {
+    setRows((current) => {
+      const known = new Set(current.map((row) => row.salesOrderId));
+      const added = ids.filter((id) => !known.has(id)).map((id) => ({ salesOrderId: id, status: 'pending' as RowStatus }));
+      return [...current, ...added];
+    });
+  };
+
+  const removeOrder = (id: string) => {
+    setRows((current) => current.filter((row) => row.salesOrderId !== id));
+  };
+
+  const handleRun = async () => {
+    if (rows.length === 0 || running) return;
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    const orders = rows.map((row) => ({ sales_order_id: row.salesOrderId }));
+    setRows((current) => current.map((row) => ({ salesOrderId: row.salesOrderId, status: 'pending' })));
+    setProgress({ done: 0, startedAt: Date.now() });
+    setError(null);
+    setRunning(true);
+
+    try {
+      await otpClient.evaluatePromiseBatch(
+        { orders },
+        (result) => {
+          setRows((current) =>
+            current.map((row, index) =>
+              index === result.index ? { ...row, status: result.status === 200 ? 'done' : 'failed', result } : row
+            )
+          );
+          setProgress((current) => (current ? { ...current, done: current.done + 1 } : current));
+        },
+        controller.signal
+      );
+    } catch (err) {
+      if (!controller.signal.aborted) {
+        setError(err instanceof OTPApiError ? err.message : 'Batch evaluation failed.');
+      }
+    } finally {
+      setProgress((current) => (current ? { ...current, finishedAt: Date.now() } : current));
+      setRunning(false);
+      controllerRef.current = null;
+    }
+  };
+
+  const handleCancel = () => {
+    controllerRef.current?.abort();
+  };
+
+  const failed = rows.filter((row) => row.status === 'failed').length;
+
+  return (
+    <div className="space-y-6">
+      {/* Header */}
+      <div className="flex items-center justify-between">
+        <div>
+          <h1 className="text-3xl font-bold text-slate-900">Batch Re-promise</h1>
+          <p className="text-sm text-slate-600 mt-1">Re-evaluate promise dates for many Sales Orders at once</p>
+        </div>
+        <div className="flex gap-2">
+          {rows.length > 0 && !running && (
+            <button
+              onClick={() => setRows([])}
+              className="inline-flex items-center gap-2 px-4 py-2 bg-red-100 hover:bg-red-200 text-red-700 rounded-lg transition"
+            >
+              <Trash2 className="w-4 h-4" />
+              Clear
+            </button>
+          )}
+          {running ? (
+            <button
+              onClick={handleCancel}
+              data-testid="batch-cancel"
+              className="inline-flex items-center gap-2 px-4 py-2 bg-slate-700 hover:bg-slate-800 text-white rounded-lg transition"
+            >
+              <Square className="w-4 h-4" />
+              Cancel
+            </button>
+          ) : (
+            <button
+              onClick={handleRun}
+              disabled={rows.length === 0}
+              data-testid="batch-run"
+              className="inline-flex items-center gap-2 px-4 py-2 bg-blue-600 hover:bg-blue-700 disabled:bg-slate-300 text-white rounded-lg transition"
+            >
+              <Play className="w-4 h-4" />
+              Re-promise {rows.length} {rows.length === 1 ? 'order' : 'orders'}
+            </button>
+          )}
+        </div>
+      </div>
+
+      <div className="bg-white rounded-xl border border-slate-200 p-6 shadow-sm">
+        <SalesOrderSelector
+          value={null}
+          onChange={(id) => id && addOrders([id])}
+          onSelectAll={(orders) => addOrders(orders.map((order) => order.name))}
+          disabled={running}
+        />
+      </div>
+
+      {error && <AlertBanner variant="error" title="Batch re-promise failed" description={error} />}
+
+      {progress && (
+        <div
+          data-testid="batch-progress"
+          data-done={progress.done}
+          data-total={rows.length}
+          className="bg-blue-50 border border-blue-200 rounded-lg p-4 flex items-center justify-between text-sm text-blue-900"
+        >
+          <span className="inline-flex items-center gap-2">
+            {running && <Loader2 className="w-4 h-4 animate-spin" />}
+            {progress.done} / {rows.length} evaluated{failed > 0 ? ` • ${failed} failed` : ''}
+          </span>
+          <span className="font-mono">{ordersPerSecond(progress).toFixed(1)} orders/s</span>
+        </div>
+      )}
+
+      {rows.length === 0 ? (
+        <div className="bg-white rounded-xl border border-slate-200 p-12 text-center shadow-sm">
+          <Layers className="w-12 h-12 mx-auto mb-4 text-slate-400 opacity-50" />
+          <p className="text-slate-600 font-medium">No Sales Orders selected</p>
+          <p className="text-slate-500 text-sm mt-1">Pick orders above, or add every listed order at once</p>
+        </div>
+      ) : (
+        <div className="bg-white rounded-xl border border-slate-200 shadow-sm overflow-hidden">
+          <table className="w-full text-sm" data-testid="batch-results">
+            <thead className="bg-slate-50 text-slate-600">
+              <tr>
+                <th className="px-4 py-3 text-left font-medium">Sales Order</th>
+                <th className="px-4 py-3 text-left font-medium">Promise Date</th>
+                <th className="px-4 py-3 text-left font-medium">Confidence</th>
+                <th className="px-4 py-3" />
+              </tr>
+            </thead>
+            <tbody className="divide-y divide-slate-100">
+              {rows.map((row) => {
+                const promise = row.result?.result;
+                return (
+                  <tr key={row.salesOrderId} data-testid="batch-row" data-status={row.status}>
+                    <td className="px-4 py-3 font-mono text-slate-900">{row.salesOrderId}</td>
+                    <td className="px-4 py-3 text-slate-700">
+                      {row.status === 'pending' && (running ? <Loader2 className="w-4 h-4 animate-spin text-slate-400" /> : '—')}
+                      {row.status === 'done' && (promise?.promise_date || 'Cannot fulfill')}
+                      {row.status === 'failed' && <span className="text-red-600">{row.result?.error || 'Failed'}</span>}
+                    </td>
+                    <td className="px-4 py-3">
+                      {promise && (
+                        <span
+                          className={`inline-flex px-2 py-0.5 text-xs border rounded-full ${CONFIDENCE_CLASSES[promise.confidence] || ''}`}
+                        >
+                          {promise.confidence}
+                        </span>
+                      )}
+                    </td>
+                    <td className="px-4 py-3 text-right">
+                      {!running && (
+                        <button
+                          onClick={() => removeOrder(row.salesOrderId)}
+                          aria-label={`Remove ${row.salesOrderId}`}
+                          className="p-1 hover:bg-slate-100 rounded transition"
+                        >
+                          <X className="w-4 h-4 text-slate-500" />
+                        </button>
+                      )}
+                    </td>
+                  </tr>
+                );
+              })}
+            </tbody>
+          </table>
+        </div>
+      )}
+    </div>
+  );
+}
@@ -3,16 +3,19 @@
 import React, { useState, useEffect } from 'react';
 import { PromiseCalculator } from '@/components/otp/promise-calculator';
 import { Scenarios } from '@/components/otp/scenarios';
+import { BatchPromise } from '@/components/otp/batch-promise';
 import { AuditTrace } from '@/components/otp/audit-trace';
 import { Settings } from '@/components/otp/settings';
-import { Calculator, BarChart3, History, Settings as SettingsIcon, Menu, X } from 'lucide-react';
+import { Calculator, BarChart3, History, Layers, Settings as SettingsIcon, Menu, X } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { otpClient } from '@/lib/api/otpClient';
+import { useBackendHealth } from '@/hooks/useBackendHealth';
 
-type Page = 'calculator' | 'scenarios' | 'audit' | 'settings';
+type Page = 'calculator' | 'batch' | 'scenarios' | 'audit' | 'settings';
 
 const NAVIGATION = [
   { id: 'calculator' as Page, label: 'Promise Calculator', icon: Calculator },
+  { id: 'batch' as Page, label: 'Batch Re-promise', icon: Layers },
   { id: 'scenarios' as Page, label: 'Scenarios (What-if)', icon: BarChart3 },
   { id: 'audit' as Page, label: 'Audit & Trace', icon: History },
   { id: 'settings' as Page, label: 'Settings', icon: SettingsIcon },
@@ -22,8 +25,8 @@ export function OTPDashboard() {
   const [currentPage, setCurrentPage] = useState<Page>('calculator');
   const [sidebarOpen, setSidebarOpen] = useState(true);
   const [isDesktop, setIsDesktop] = useState(true);
-  const [apiStatus, setApiStatus] = useState<'healthy' | 'offline' | 'checking'>('checking');
-  const [lastSync, setLastSync] = useState<string>('—');
+  const { status: apiStatus, checkedAt } = useBackendHealth();
+  const lastSync = checkedAt ? new Date(checkedAt).toLocaleTimeString() : '—';
 
   useEffect(() => {
     const handleResize = () => {
@@ -39,23 +42,6 @@ export function OTPDashboard() {
     return () => window.removeEventListener('resize', handleResize);
   }, []);
 
-  useEffect(() => {
-    const checkHealth = async () => {
-      try {
-        await otpClient.checkHealth();
-        setApiStatus('healthy');
-        setLastSync(new Date().toLocaleTimeString());
-      } catch {
-        setApiStatus('offline');
-        setLastSync(new Date().toLocaleTimeString());
-      }
-    };
-
-    checkHealth();
-    const interval = setInterval(checkHealth, 60000);
-    return () => clearInterval(interval);
-  }, []);
-
   const getCurrentPageLabel = () => {
     const page = NAVIGATION.find((nav) => nav.id === currentPage);
     return page?.label || 'OTP Dashboard';
@@ -210,6 +196,7 @@ export function OTPDashboard() {
             className="p-6 max-w-7xl"
           >
             {currentPage === 'calculator' && <PromiseCalculator />}
+            {currentPage === 'batch' && <BatchPromise />}
             {currentPage === 'scenarios' && <Scenarios />}
             {currentPage === 'audit' && <AuditTrace />}
             {currentPage === 'settings' && <Settings />}
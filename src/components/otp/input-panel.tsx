@@ -78,7 +78,7 @@ type DraftState = {
 }
 
 export function InputPanel({ form, onSubmit, isLoading, onClearResults }: InputPanelProps) {
-  const { isError: healthError } = useBackendHealth()
+  const { isError: healthError, status: healthStatus, checkedAt, nextCheckAt } = useBackendHealth()
   const backendOnline = !healthError
   const baseUrlWarning = otpClient.getBaseUrlWarning()
 
@@ -301,6 +301,10 @@ export function InputPanel({ form, onSubmit, isLoading, onClearResults }: InputP
         <div className="flex items-center justify-between mb-6">
           <h2 className="text-lg font-semibold text-slate-900">Order Input</h2>
           <div
+            data-testid="api-health-badge"
+            data-health-status={healthStatus}
+            data-checked-at={checkedAt ?? ""}
+            data-next-check-at={nextCheckAt ?? ""}
             className={`inline-flex items-center gap-2 px-3 py-1 rounded-full border text-xs font-medium ${
               backendOnline
                 ? "bg-green-50 border-green-200 text-green-700"
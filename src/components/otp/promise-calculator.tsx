@@ -12,20 +12,26 @@
  * - GET /otp/sales-orders?limit&offset&search → list of Sales Orders
  * - GET /otp/sales-orders/{id} → full details with items[], defaults{}
  * - POST /otp/promise → evaluate promise, returns promise_date, confidence, status, plan[]
+ * - POST /otp/promise/stream → same, as Server-Sent Events (orders of STREAM_MIN_ITEMS+ lines):
+ *   plan[] rows render as they arrive, before the summary
  * 
  * WEEKEND: Friday + Saturday (Israel workweek: Sun-Thu)
  * WAREHOUSES: Stores-SD, Goods In Transit-SD, Finished Goods-SD, Work In Progress-SD, All Warehouses-SD
  * STATUS LOGIC: Feasible (OK + promise exists), At Risk (LOW confidence), Not Feasible (CANNOT_FULFILL or no date)
  */
 
-import React, { useState } from 'react';
+import React, { useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import { z } from 'zod';
 import { InputPanel } from './input-panel';
-import { OtpResultPanel } from './result/OtpResultPanel';
+import { OtpResultPanel, PromiseStreamState } from './result/OtpResultPanel';
 import { motion } from 'framer-motion';
 import { otpClient, PromiseRequest, PromiseResponse } from '@/lib/api/otpClient';
+import type { PromisePlan, PromisePlanEvent } from '@/lib/api/types';
+
+// Orders with at least this many lines are evaluated over the streaming endpoint
+const STREAM_MIN_ITEMS = 20;
 
 // Validation schema
 const promiseFormSchema = z.object({
@@ -89,10 +95,25 @@ export function PromiseCalculator() {
   const [result, setResult] = useState<PromiseResponse | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  
+  const [stream, setStream] = useState<PromiseStreamState | null>(null);
+  const streamRows = useRef<PromisePlan[]>([]);
+  const flushPending = useRef(false);
+
   const clearResults = () => {
     setResult(null);
     setError(null);
+    setStream(null);
+  };
+
+  // Streamed rows are committed at most once per frame, not once per event
+  const handlePlanEvent = (event: PromisePlanEvent) => {
+    streamRows.current[event.index] = event.plan;
+    if (flushPending.current) return;
+    flushPending.current = true;
+    requestAnimationFrame(() => {
+      flushPending.current = false;
+      setStream({ plan: streamRows.current.filter(Boolean), total: event.total });
+    });
   };
 
   const form = useForm<any>({
@@ -118,6 +139,8 @@ export function PromiseCalculator() {
     setError(null);
     setIsLoading(true);
     setResult(null);
+    setStream(null);
+    streamRows.current = [];
 
     try {
       // Filter out items with empty item_code or invalid items (those that failed validation)
@@ -154,8 +177,15 @@ export function PromiseCalculator() {
 
       // sales_order_id already set if provided
 
-      // Call API
-      const response = await otpClient.evaluatePromise(request);
+      // Call API (large orders stream their plan rows)
+      const response =
+        validItems.length >= STREAM_MIN_ITEMS
+          ? await otpClient.evaluatePromiseStream(request, handlePlanEvent)
+          : await otpClient.evaluatePromise(request);
+      if (streamRows.current.length > 0) {
+        // Final rows before the result renders, so the table stays expanded
+        setStream({ plan: streamRows.current.filter(Boolean), total: streamRows.current.length });
+      }
 
       const afterCutoffNote = isAfterCutoff(data.orderCreatedAt, data.cutoffTime)
         ? 'After cutoff → processed next business day'
@@ -237,7 +267,7 @@ export function PromiseCalculator() {
         <InputPanel form={form} onSubmit={onSubmit} isLoading={isLoading} onClearResults={clearResults} />
 
         {/* Right Column: Results */}
-        <OtpResultPanel result={result} isLoading={isLoading} />
+        <OtpResultPanel result={result} isLoading={isLoading} stream={stream} />
       </div>
     </div>
   );
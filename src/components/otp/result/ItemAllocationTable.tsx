@@ -1,18 +1,30 @@
 "use client"
 
 import React, { useState } from "react"
-import { ChevronDown, ChevronUp } from "lucide-react"
+import { ChevronDown, ChevronUp, Loader2 } from "lucide-react"
 import { format, parseISO } from "date-fns"
 import { PromiseResponse } from "@/lib/api/otpClient"
+import type { PromisePlan } from "@/lib/api/types"
 
 interface ItemAllocationTableProps {
-  result: PromiseResponse
+  result?: PromiseResponse
+  // Streamed evaluation in progress: rows received so far, out of expectedItems
+  streamingPlan?: PromisePlan[]
+  expectedItems?: number
+  defaultExpanded?: boolean
 }
 
-export function ItemAllocationTable({ result }: ItemAllocationTableProps) {
-  const [expanded, setExpanded] = useState(false)
+export function ItemAllocationTable({
+  result,
+  streamingPlan,
+  expectedItems,
+  defaultExpanded = false,
+}: ItemAllocationTableProps) {
+  const [expanded, setExpanded] = useState(defaultExpanded)
 
-  const plan = result.plan || []
+  const streaming = streamingPlan !== undefined
+  const plan = streamingPlan ?? result?.plan ?? []
+  const showRows = expanded || streaming
 
   if (plan.length === 0) {
     return null
@@ -38,15 +50,24 @@ export function ItemAllocationTable({ result }: ItemAllocationTableProps) {
           <span className="px-2 py-0.5 text-xs font-semibold bg-slate-100 text-slate-600 rounded-full">
             {plan.length} {plan.length === 1 ? "item" : "items"}
           </span>
+          {streaming && (
+            <span
+              data-testid="allocation-streaming"
+              className="inline-flex items-center gap-1 text-xs text-slate-500"
+            >
+              <Loader2 className="w-3 h-3 animate-spin" />
+              Receiving {plan.length} of {expectedItems ?? "?"}
+            </span>
+          )}
         </div>
-        {expanded ? (
+        {showRows ? (
           <ChevronUp className="w-4 h-4 text-slate-400" />
         ) : (
           <ChevronDown className="w-4 h-4 text-slate-400" />
         )}
       </button>
 
-      {expanded && (
+      {showRows && (
         <div className="border-t border-slate-200">
           <div className="overflow-x-auto">
             <table className="w-full">
@@ -80,7 +101,7 @@ export function ItemAllocationTable({ result }: ItemAllocationTableProps) {
                   const shortage = item.shortage || 0
 
                   return (
-                    <tr key={idx} className="hover:bg-slate-50">
+                    <tr key={idx} className="hover:bg-slate-50" data-testid="allocation-row">
                       <td className="px-6 py-4 text-sm font-medium text-slate-900">
                         {item.item_code}
                       </td>
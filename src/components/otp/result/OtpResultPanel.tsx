@@ -3,6 +3,7 @@
 import React from "react"
 import { Calendar, Package, TrendingUp, AlertTriangle } from "lucide-react"
 import { PromiseResponse } from "@/lib/api/otpClient"
+import type { PromisePlan } from "@/lib/api/types"
 import { PromiseSummaryCard } from "./PromiseSummaryCard"
 import { DriversConstraintsCard } from "./DriversConstraintsCard"
 import { RecommendedActionsCard } from "./RecommendedActionsCard"
@@ -11,12 +12,19 @@ import { CustomerMessageCard } from "./CustomerMessageCard"
 import { StatTile } from "@/components/ui/StatTile"
 import { format, parseISO } from "date-fns"
 
+export interface PromiseStreamState {
+  plan: PromisePlan[]   // Rows received so far, in item order
+  total: number         // Rows to expect
+}
+
 interface OtpResultPanelProps {
   result: PromiseResponse | null
   isLoading: boolean
+  // Set while (and after) a result is streamed: rows render as they arrive
+  stream?: PromiseStreamState | null
 }
 
-export function OtpResultPanel({ result, isLoading }: OtpResultPanelProps) {
+export function OtpResultPanel({ result, isLoading, stream }: OtpResultPanelProps) {
   const safeFormatDate = (date: string | null, fmt: string, fallback = "—") => {
     if (!date) return fallback
     try {
@@ -51,6 +59,9 @@ export function OtpResultPanel({ result, isLoading }: OtpResultPanelProps) {
             </div>
           </div>
         </div>
+        {stream && (
+          <ItemAllocationTable streamingPlan={stream.plan} expectedItems={stream.total} />
+        )}
       </div>
     )
   }
@@ -151,7 +162,7 @@ export function OtpResultPanel({ result, isLoading }: OtpResultPanelProps) {
       </div>
 
       {/* Item Allocation Table (collapsible) */}
-      <ItemAllocationTable result={result} />
+      <ItemAllocationTable result={result} defaultExpanded={Boolean(stream)} />
 
       {/* Customer Message */}
       <CustomerMessageCard result={result} />
@@ -2,7 +2,7 @@
 
 import React, { useState } from "react"
 import { format, parseISO } from "date-fns"
-import { Copy, Check, Calendar } from "lucide-react"
+import { Copy, Check, Calendar, History } from "lucide-react"
 import { StatusChip } from "@/components/ui/StatusChip"
 import { PromiseResponse } from "@/lib/api/otpClient"
 
@@ -101,6 +101,16 @@ export function PromiseSummaryCard({ result }: PromiseSummaryCardProps) {
         </div>
         <div className="flex flex-col items-end gap-2">
           <StatusChip status={getStatus()} size="lg" />
+          {result.cached && (
+            <span
+              data-testid="promise-cached-badge"
+              className="inline-flex items-center gap-1 px-2 py-0.5 rounded-full text-[11px] font-medium bg-slate-100 text-slate-600 border border-slate-200"
+              title="Same order, rules and stock as a recent evaluation"
+            >
+              <History className="w-3 h-3" />
+              Cached
+            </span>
+          )}
         </div>
       </div>
 
@@ -20,8 +20,14 @@ interface ComboboxProps {
   emptyLabel?: string;
   onQueryChange?: (query: string) => void;
   testId?: string;
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
+// Start loading the next page this close to the bottom of the listbox
+const LOAD_MORE_THRESHOLD_PX = 96;
+
 export function Combobox({
   label,
   placeholder = 'Search...',
@@ -32,6 +38,9 @@ export function Combobox({
   emptyLabel = 'No results found',
   onQueryChange,
   testId,
+  hasMore = false,
+  loadingMore = false,
+  onLoadMore,
 }: ComboboxProps) {
   const selected = options.find((option) => option.value === value) || null;
   const [query, setQuery] = useState(selected?.label || '');
@@ -58,6 +67,14 @@ export function Combobox({
     );
   }, [options, query]);
 
+  const handleListScroll = (event: React.UIEvent<HTMLDivElement>) => {
+    if (!hasMore || loadingMore || !onLoadMore) return;
+    const list = event.currentTarget;
+    if (list.scrollTop + list.clientHeight >= list.scrollHeight - LOAD_MORE_THRESHOLD_PX) {
+      onLoadMore();
+    }
+  };
+
   const handleSelect = (option: ComboboxOption) => {
     onChange(option.value);
     setQuery(option.label);
@@ -97,9 +114,10 @@ export function Combobox({
         <div
           role="listbox"
           id={testId ? `${testId}-listbox` : undefined}
+          onScroll={handleListScroll}
           className="absolute z-20 mt-2 w-full max-h-64 overflow-auto rounded-lg border border-slate-200 bg-white shadow-lg"
         >
-          {filtered.length === 0 && (
+          {filtered.length === 0 && !loadingMore && (
             <div className="px-4 py-3 text-xs text-slate-500">{emptyLabel}</div>
           )}
           {filtered.map((option) => {
@@ -124,6 +142,14 @@ export function Combobox({
               </button>
             );
           })}
+          {(hasMore || loadingMore) && (
+            <div
+              className="px-4 py-2 text-xs text-slate-400"
+              data-testid={testId ? `${testId}-load-more` : undefined}
+            >
+              {loadingMore ? 'Loading more...' : 'Scroll for more'}
+            </div>
+          )}
         </div>
       )}
     </div>
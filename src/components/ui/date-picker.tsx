@@ -4,7 +4,8 @@ import React, { useEffect, useRef, useState } from 'react';
 import { DayPicker } from 'react-day-picker';
 import { format, isValid, parseISO } from 'date-fns';
 import { Calendar, X } from 'lucide-react';
-import { WEEKEND_DAYS } from '@/lib/weekend';
+import { isWeekendDate } from '@/lib/weekend';
+import { useWorkCalendar } from '@/hooks/useWorkCalendar';
 
 interface DatePickerInputProps {
   id?: string;
@@ -12,6 +13,7 @@ interface DatePickerInputProps {
   onChange: (value: string | null) => void;
   placeholder?: string;
   disabled?: boolean;
+  warehouse?: string; // Marks the holidays of this warehouse's plant calendar
 }
 
 export function DatePickerInput({
@@ -20,8 +22,10 @@ export function DatePickerInput({
   onChange,
   placeholder = 'Select a date',
   disabled = false,
+  warehouse,
 }: DatePickerInputProps) {
   const [open, setOpen] = useState(false);
+  const workCalendar = useWorkCalendar({ warehouse });
   const containerRef = useRef<HTMLDivElement>(null);
 
   const selectedDate = value ? parseISO(value) : undefined;
@@ -92,10 +96,12 @@ export function DatePickerInput({
             }}
             weekStartsOn={0}
             modifiers={{
-              weekend: (date) => WEEKEND_DAYS.includes(date.getDay() as typeof WEEKEND_DAYS[number]),
+              weekend: (date) => (workCalendar ? workCalendar.isWeekend(date) : isWeekendDate(date)),
+              holiday: (date) => workCalendar?.isHoliday(date) ?? false,
             }}
             modifiersClassNames={{
               weekend: 'otp-weekend-day',
+              holiday: 'otp-holiday-day',
             }}
             className="otp-day-picker"
           />
@@ -1,9 +1,11 @@
 'use client'
 
-import React, { useEffect, useState, useCallback } from 'react'
+import React, { useEffect, useMemo, useRef, useState, useCallback } from 'react'
 import { Combobox, ComboboxOption } from './combobox'
 import { AlertCircle } from 'lucide-react'
 
+const SEARCH_DEBOUNCE_MS = 120
+
 interface ItemCodeInputProps {
   value: string
   onChange: (value: string) => void
@@ -11,6 +13,7 @@ interface ItemCodeInputProps {
   disabled?: boolean
   hasEndpoint: boolean
   availableItems: Array<{ item_code: string; item_name?: string }>
+  searchItems?: (query: string) => Promise<Array<{ item_code: string; item_name?: string }>>
   onValidationChange?: (isValid: boolean, error?: string) => void
   validateItem?: (itemCode: string) => Promise<{ valid: boolean; error?: string }>
   error?: string
@@ -23,19 +26,69 @@ export function ItemCodeInput({
   disabled,
   hasEndpoint,
   availableItems,
+  searchItems,
   onValidationChange,
   validateItem,
   error,
 }: ItemCodeInputProps) {
   const [validationError, setValidationError] = useState<string | undefined>(error)
   const [isValidating, setIsValidating] = useState(false)
+  const [results, setResults] = useState(availableItems)
+  const latestQuery = useRef('')
+  const searchTimer = useRef<ReturnType<typeof setTimeout> | undefined>(undefined)
+
+  useEffect(() => setResults(availableItems), [availableItems])
+  useEffect(() => () => clearTimeout(searchTimer.current), [])
+
+  // Only the latest query's results are shown; cached queries resolve at once
+  const handleQueryChange = useCallback(
+    (query: string) => {
+      if (!searchItems) return
+      latestQuery.current = query
+      clearTimeout(searchTimer.current)
+      searchTimer.current = setTimeout(async () => {
+        const found = await searchItems(query)
+        if (latestQuery.current === query) setResults(found)
+      }, SEARCH_DEBOUNCE_MS)
+    },
+    [searchItems]
+  )
+
+  // Convert search results to combobox options
+  const options: ComboboxOption[] = useMemo(
+    () =>
+      results.map((item) => ({
+        value: item.item_code,
+        label: item.item_code,
+        description: item.item_name,
+      })),
+    [results]
+  )
 
-  // Convert available items to combobox options
-  const options: ComboboxOption[] = availableItems.map((item) => ({
-    value: item.item_code,
-    label: item.item_code,
-    description: item.item_name,
-  }))
+  // Validate with endpoint
+  const validateValue = useCallback(
+    async (code: string) => {
+      if (!validateItem) return
+      setIsValidating(true)
+      try {
+        const result = await validateItem(code)
+        if (!result.valid) {
+          setValidationError(result.error || 'Item not found')
+          onValidationChange?.(false, result.error)
+        } else {
+          setValidationError(undefined)
+          onValidationChange?.(true)
+        }
+      } catch (err) {
+        // Validation failed, assume valid (will validate on POST)
+        setValidationError(undefined)
+        onValidationChange?.(true)
+      } finally {
+        setIsValidating(false)
+      }
+    },
+    [validateItem, onValidationChange]
+  )
 
   // Handle blur validation if endpoint exists
   const handleBlur = useCallback(async () => {
@@ -54,30 +107,35 @@ export function ItemCodeInput({
       return
     }
 
-    // Validate with endpoint
-    setIsValidating(true)
-    try {
-      const result = await validateItem(value)
-      if (!result.valid) {
-        setValidationError(result.error || 'Item not found')
-        onValidationChange?.(false, result.error)
-      } else {
-        setValidationError(undefined)
-        onValidationChange?.(true)
-      }
-    } catch (err) {
-      // Validation failed, assume valid (will validate on POST)
-      setValidationError(undefined)
-      onValidationChange?.(true)
-    } finally {
-      setIsValidating(false)
-    }
-  }, [value, hasEndpoint, validateItem, onBlur, onValidationChange])
+    await validateValue(value)
+  }, [value, hasEndpoint, validateItem, validateValue, onBlur, onValidationChange])
+
+  // Values set from outside (e.g. every line of a loaded Sales Order) are
+  // validated right away; the hook batches the rows into one request.
+  // Typed values wait for blur.
+  const hasFocus = useRef(false)
+  const validateValueRef = useRef(validateValue)
+  useEffect(() => {
+    validateValueRef.current = validateValue
+  }, [validateValue])
+  useEffect(() => {
+    if (hasFocus.current || !value.trim() || !hasEndpoint || !validateItem) return
+    validateValueRef.current(value)
+  }, [value, hasEndpoint, validateItem])
+
+  const focusHandlers = {
+    onFocusCapture: () => {
+      hasFocus.current = true
+    },
+    onBlurCapture: () => {
+      hasFocus.current = false
+    },
+  }
 
   // If no endpoint and no items available, show simple text input
-  if (!hasEndpoint || options.length === 0) {
+  if (!hasEndpoint || availableItems.length === 0) {
     return (
-      <div>
+      <div {...focusHandlers}>
         <div className="relative">
           <input
             type="text"
@@ -108,12 +166,13 @@ export function ItemCodeInput({
 
   // Show combobox with available items
   return (
-    <div>
+    <div {...focusHandlers}>
       <Combobox
         placeholder="Search item code..."
         options={options}
         value={value}
         onChange={onChange}
+        onQueryChange={handleQueryChange}
         disabled={disabled || isValidating}
         emptyLabel="No items found"
         testId="item-code-search"
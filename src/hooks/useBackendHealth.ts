@@ -1,17 +1,24 @@
-import { useQuery } from "@tanstack/react-query"
+import { useCallback, useSyncExternalStore } from "react"
 import { otpClient } from "@/lib/api/otpClient"
+import { healthMonitor } from "@/lib/api/healthMonitor"
+
+const checkHealth = () => otpClient.checkHealth()
+const subscribe = (listener: () => void) => healthMonitor.subscribe(listener, checkHealth)
 
 /**
  * Check backend health status
- * Polls every 30 seconds to monitor connection
+ * Shared adaptive polling (see lib/api/healthMonitor.ts): every 30 seconds
+ * while healthy, backing off while offline, paused in hidden tabs
  * Used to disable UI when backend is offline
  */
 export function useBackendHealth() {
-  return useQuery({
-    queryKey: ["backend-health"],
-    queryFn: () => otpClient.checkHealth(),
-    staleTime: 30000, // 30 seconds
-    refetchInterval: 30000, // Re-check every 30 seconds
-    retry: false, // Don't retry on failure
-  })
+  const state = useSyncExternalStore(subscribe, healthMonitor.getState, healthMonitor.getServerState)
+  const refetch = useCallback(() => healthMonitor.refresh(), [])
+
+  return {
+    ...state,
+    isLoading: state.status === "checking",
+    isError: state.status === "offline",
+    refetch,
+  }
 }
@@ -3,12 +3,17 @@
  * 
  * Behavior:
  * - Checks if backend item search endpoint exists
- * - If exists: fetches list of valid items and provides autocomplete
+ * - If exists: fetches the first page of items and provides autocomplete;
+ *   typing searches the backend's index (the catalog is never downloaded)
+ * - Recent query results are cached; a query that extends a cached query
+ *   whose results were complete is answered locally
  * - If not exists: allows manual entry with validation on blur (if endpoint exists)
- * - Validates items against backend; if invalid, marks with error
+ * - Validates items against backend; if invalid, marks with error. Calls
+ *   made close together are sent as one batch POST /api/items/validate
  */
 
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
+import type { ItemSearchResponse, ItemValidateBatchResponse } from '@/lib/api/types'
 
 export interface Item {
   item_code: string
@@ -20,67 +25,240 @@ export interface UseItemSearchResult {
   items: Item[]
   isLoading: boolean
   hasEndpoint: boolean
-  searchItems: (query: string) => Item[]
-  validateItem: (itemCode: string) => Promise<{ valid: boolean; error?: string }>
+  searchItems: (query: string) => Promise<Item[]>
+  validateItem: (itemCode: string) => Promise<ValidationResult>
+}
+
+export interface ValidationResult {
+  valid: boolean
+  error?: string
 }
 
 const ITEM_SEARCH_ENDPOINT = '/api/items/search'
 const ITEM_VALIDATE_ENDPOINT = '/api/items/validate'
 
+export const ITEM_SEARCH_LIMIT = 20
+const VALIDATE_BATCH_DELAY_MS = 30
+const VALIDATE_BATCH_MAX = 200
+const VALIDATION_FAILED = 'Validation failed'
+const RECENT_QUERY_LIMIT = 50
+const RECENT_QUERY_TTL_MS = 60_000
+
+interface CachedSearch {
+  items: Item[]
+  hasMore: boolean
+  storedAt: number
+}
+
+function getApiBaseUrl() {
+  return process.env.NEXT_PUBLIC_API_BASE_URL || 'http://127.0.0.1:8001'
+}
+
+// Same matching and ranking as the backend: code prefix first, then the rest
+function matchLocally(items: Item[], query: string): Item[] {
+  const prefix: Item[] = []
+  const rest: Item[] = []
+  for (const item of items) {
+    const code = item.item_code.toLowerCase()
+    if (code.startsWith(query)) prefix.push(item)
+    else if (code.includes(query) || item.item_name?.toLowerCase().includes(query)) rest.push(item)
+  }
+  return [...prefix, ...rest].slice(0, ITEM_SEARCH_LIMIT)
+}
+
+async function fetchItemPage(query: string): Promise<CachedSearch> {
+  const params = new URLSearchParams({ query, limit: String(ITEM_SEARCH_LIMIT) })
+  const response = await fetch(`${getApiBaseUrl()}${ITEM_SEARCH_ENDPOINT}?${params}`, {
+    method: 'GET',
+    headers: { 'Content-Type': 'application/json' },
+  })
+  if (!response.ok) {
+    throw new Error(`Item search failed: ${response.status}`)
+  }
+  const data = (await response.json()) as ItemSearchResponse | Item[]
+  const items = Array.isArray(data) ? data : data.items || []
+  // Backends without paging return every match in one response
+  const hasMore = (!Array.isArray(data) && Boolean(data.has_more)) || items.length > ITEM_SEARCH_LIMIT
+  return { items: items.slice(0, ITEM_SEARCH_LIMIT), hasMore, storedAt: Date.now() }
+}
+
+async function validateOne(itemCode: string): Promise<ValidationResult> {
+  try {
+    const response = await fetch(
+      `${getApiBaseUrl()}${ITEM_VALIDATE_ENDPOINT}?item_code=${encodeURIComponent(itemCode)}`,
+      {
+        method: 'GET',
+        headers: { 'Content-Type': 'application/json' },
+      }
+    )
+
+    if (response.ok) {
+      const data = await response.json()
+      return { valid: data.valid !== false }
+    } else if (response.status === 404) {
+      return { valid: false, error: 'Item not found' }
+    } else {
+      return { valid: false, error: VALIDATION_FAILED }
+    }
+  } catch (error) {
+    // If endpoint fails, assume valid (will validate on POST response)
+    return { valid: true }
+  }
+}
+
+/**
+ * POST /api/items/validate {item_codes} -> {results: {code: {valid, error?}}}.
+ * Backends without the batch endpoint (404/405) get one GET per code.
+ * Codes missing from the returned map could not be checked.
+ */
+async function validateBatch(itemCodes: string[]): Promise<ItemValidateBatchResponse['results']> {
+  let response: Response
+  try {
+    response = await fetch(`${getApiBaseUrl()}${ITEM_VALIDATE_ENDPOINT}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ item_codes: itemCodes }),
+    })
+  } catch (error) {
+    // If endpoint fails, assume valid (will validate on POST response)
+    return {}
+  }
+
+  if (response.status === 404 || response.status === 405) {
+    const results = await Promise.all(itemCodes.map(validateOne))
+    return Object.fromEntries(itemCodes.map((code, index) => [code, results[index]]))
+  }
+  if (!response.ok) {
+    return Object.fromEntries(itemCodes.map((code) => [code, { valid: false, error: VALIDATION_FAILED }]))
+  }
+  try {
+    const data = (await response.json()) as ItemValidateBatchResponse
+    return data?.results || {}
+  } catch (error) {
+    // Non-JSON body (e.g. a proxy interstitial), assume valid like validateOne
+    return {}
+  }
+}
+
 export function useItemSearch(): UseItemSearchResult {
   const [items, setItems] = useState<Item[]>([])
   const [isLoading, setIsLoading] = useState(false)
   const [hasEndpoint, setHasEndpoint] = useState(false)
 
+  // Recent queries, least recently used first (Map keeps insertion order)
+  const recentRef = useRef(new Map<string, CachedSearch>())
+  const inFlightRef = useRef(new Map<string, Promise<CachedSearch>>())
+
+  const remember = useCallback((query: string, result: CachedSearch) => {
+    const recent = recentRef.current
+    recent.delete(query)
+    recent.set(query, result)
+    if (recent.size > RECENT_QUERY_LIMIT) {
+      recent.delete(recent.keys().next().value as string)
+    }
+  }, [])
+
+  const lookupRecent = useCallback((query: string): Item[] | null => {
+    const recent = recentRef.current
+    const now = Date.now()
+    const exact = recent.get(query)
+    if (exact && now - exact.storedAt < RECENT_QUERY_TTL_MS) {
+      remember(query, exact)
+      return exact.items
+    }
+    // Matches of "abc" are a subset of the matches of "ab": a complete
+    // cached result for any prefix of the query already holds the answer
+    for (let length = query.length - 1; length >= 0; length--) {
+      const shorter = recent.get(query.slice(0, length))
+      if (shorter && !shorter.hasMore && now - shorter.storedAt < RECENT_QUERY_TTL_MS) {
+        return matchLocally(shorter.items, query)
+      }
+    }
+    return null
+  }, [remember])
+
   // Check if backend has item search endpoint on mount
   useEffect(() => {
     const checkEndpoint = async () => {
+      setIsLoading(true)
       try {
-        const apiBaseUrl =
-          process.env.NEXT_PUBLIC_API_BASE_URL || 'http://127.0.0.1:8001'
-        
-        // Try to fetch items list
-        const response = await fetch(`${apiBaseUrl}/api/items/search?query=`, {
-          method: 'GET',
-          headers: { 'Content-Type': 'application/json' },
-        })
-        
-        if (response.ok) {
-          const data = await response.json()
-          setItems(Array.isArray(data) ? data : data.items || [])
-          setHasEndpoint(true)
-        } else {
-          // Endpoint doesn't exist or isn't ready
-          setHasEndpoint(false)
-        }
+        // First page only; typing searches the backend index
+        const page = await fetchItemPage('')
+        remember('', page)
+        setItems(page.items)
+        setHasEndpoint(true)
       } catch (error) {
-        // Backend endpoint not available
+        // Endpoint doesn't exist, isn't ready or backend not available
         setHasEndpoint(false)
+      } finally {
+        setIsLoading(false)
       }
     }
 
     checkEndpoint()
-  }, [])
+  }, [remember])
 
-  // Search items by query string
+  // Search items by query string (backend index + recent query cache)
   const searchItems = useCallback(
-    (query: string): Item[] => {
-      if (!query.trim()) return items
-
-      const lowerQuery = query.toLowerCase()
-      return items.filter(
-        (item) =>
-          item.item_code.toLowerCase().includes(lowerQuery) ||
-          item.item_name?.toLowerCase().includes(lowerQuery)
-      )
+    async (query: string): Promise<Item[]> => {
+      const normalized = query.trim().toLowerCase()
+      const cached = lookupRecent(normalized)
+      if (cached) return cached
+      if (!hasEndpoint) return []
+
+      let pending = inFlightRef.current.get(normalized)
+      if (!pending) {
+        pending = fetchItemPage(normalized).finally(() => inFlightRef.current.delete(normalized))
+        inFlightRef.current.set(normalized, pending)
+      }
+      try {
+        const result = await pending
+        remember(normalized, result)
+        return result.items
+      } catch (error) {
+        return []
+      }
     },
-    [items]
+    [hasEndpoint, lookupRecent, remember]
   )
 
-  // Validate single item against backend
+  // Validation requests made within VALIDATE_BATCH_DELAY_MS of each other
+  // (e.g. every row of a freshly loaded Sales Order) share one POST
+  const pendingValidationsRef = useRef(new Map<string, Array<(result: ValidationResult) => void>>())
+  const validationTimerRef = useRef<ReturnType<typeof setTimeout> | undefined>(undefined)
+  const validatedRef = useRef(new Map<string, ValidationResult>())
+
+  const flushValidations = useCallback(async () => {
+    validationTimerRef.current = undefined
+    const pending = pendingValidationsRef.current
+    pendingValidationsRef.current = new Map()
+    const codes = [...pending.keys()]
+
+    for (let start = 0; start < codes.length; start += VALIDATE_BATCH_MAX) {
+      const chunk = codes.slice(start, start + VALIDATE_BATCH_MAX)
+      let results: ItemValidateBatchResponse['results'] = {}
+      try {
+        results = await validateBatch(chunk)
+      } catch (error) {
+        // Fall through: every code of the chunk still settles, as valid
+      } finally {
+        for (const code of chunk) {
+          const result = results[code] ?? { valid: true }
+          // Only remember answers about the item, not transient failures
+          if (code in results && result.error !== VALIDATION_FAILED) validatedRef.current.set(code, result)
+          pending.get(code)?.forEach((resolve) => resolve(result))
+        }
+      }
+    }
+  }, [])
+
+  useEffect(() => () => clearTimeout(validationTimerRef.current), [])
+
+  // Validate single item against backend (coalesced into batch requests)
   const validateItem = useCallback(
-    async (itemCode: string): Promise<{ valid: boolean; error?: string }> => {
-      if (!itemCode.trim()) {
+    async (itemCode: string): Promise<ValidationResult> => {
+      const code = itemCode.trim()
+      if (!code) {
         return { valid: false, error: 'Item code is required' }
       }
 
@@ -89,32 +267,18 @@ export function useItemSearch(): UseItemSearchResult {
         return { valid: true }
       }
 
-      try {
-        const apiBaseUrl =
-          process.env.NEXT_PUBLIC_API_BASE_URL || 'http://127.0.0.1:8001'
-        
-        const response = await fetch(
-          `${apiBaseUrl}/api/items/validate?item_code=${encodeURIComponent(itemCode)}`,
-          {
-            method: 'GET',
-            headers: { 'Content-Type': 'application/json' },
-          }
-        )
-
-        if (response.ok) {
-          const data = await response.json()
-          return { valid: data.valid !== false }
-        } else if (response.status === 404) {
-          return { valid: false, error: 'Item not found' }
-        } else {
-          return { valid: false, error: 'Validation failed' }
+      const known = validatedRef.current.get(code)
+      if (known) return known
+
+      return new Promise<ValidationResult>((resolve) => {
+        const pending = pendingValidationsRef.current
+        pending.set(code, [...(pending.get(code) ?? []), resolve])
+        if (validationTimerRef.current === undefined) {
+          validationTimerRef.current = setTimeout(flushValidations, VALIDATE_BATCH_DELAY_MS)
         }
-      } catch (error) {
-        // If endpoint fails, assume valid (will validate on POST response)
-        return { valid: true }
-      }
+      })
     },
-    [hasEndpoint]
+    [hasEndpoint, flushValidations]
   )
 
   return {
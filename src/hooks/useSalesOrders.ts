@@ -1,8 +1,8 @@
 "use client"
 
-import { useQuery } from "@tanstack/react-query"
+import { useInfiniteQuery } from "@tanstack/react-query"
 import { otpClient } from "@/lib/api/otpClient"
-import type { SalesOrderListItem } from "@/lib/api/types"
+import type { SalesOrderListItem, SalesOrderPage } from "@/lib/api/types"
 
 export interface SalesOrderListParams {
   limit?: number
@@ -16,25 +16,35 @@ export interface SalesOrderListParams {
 
 /**
  * Sort sales orders by numeric suffix in name (e.g., SAL-ORD-2026-00016)
- * Extracts the last numeric part and sorts ascending
+ * Only needed for backends that return the whole list unpaginated; paginated
+ * pages already arrive in name order.
  */
 function sortSalesOrders(orders: SalesOrderListItem[]): SalesOrderListItem[] {
-  return [...orders].sort((a, b) => {
-    const extractNumber = (name: string): number => {
-      const match = name.match(/(\d+)$/);
-      return match ? parseInt(match[1], 10) : 0
-    }
-    return extractNumber(a.name) - extractNumber(b.name)
+  const keyed = orders.map((order) => {
+    const match = order.name.match(/(\d+)$/)
+    return { order, key: match ? parseInt(match[1], 10) : 0 }
   })
+  keyed.sort((a, b) => a.key - b.key)
+  return keyed.map((entry) => entry.order)
 }
 
+/**
+ * Cursor-paginated Sales Orders. `data` is the flat list of every page loaded
+ * so far; call fetchNextPage() while hasNextPage to load more.
+ */
 export function useSalesOrders(params?: SalesOrderListParams, enabled = true) {
-  return useQuery<SalesOrderListItem[]>({
+  return useInfiniteQuery({
     queryKey: ["sales-orders", params ?? {}],
-    queryFn: async () => {
-      const data = await otpClient.listSalesOrders(params)
-      return sortSalesOrders(data)
+    queryFn: async ({ pageParam }): Promise<SalesOrderPage> => {
+      const page = await otpClient.listSalesOrdersPage({ ...params, cursor: pageParam })
+      if (page.next_cursor === undefined) {
+        return { ...page, sales_orders: sortSalesOrders(page.sales_orders) }
+      }
+      return page
     },
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    select: (data): SalesOrderListItem[] => data.pages.flatMap((page) => page.sales_orders),
     enabled,
     staleTime: 60_000,
     refetchOnWindowFocus: false,
@@ -1,13 +1,17 @@
 /**
  * useStockData - Fetch stock metrics for item + warehouse combination
- * 
+ *
  * Purpose: Dynamically fetch stock data when item_code or warehouse changes
- * Endpoint: GET /api/items/stock?item_code={code}&warehouse={warehouse}
- * 
+ * Endpoint: POST /api/items/stock {pairs: [{item_code, warehouse}]}
+ *           (falls back to GET /api/items/stock?item_code=&warehouse=)
+ *
  * Behavior:
  * - Fetches stock data only if both item_code and warehouse are provided
  * - Returns stock_actual, stock_reserved, stock_available
  * - Gracefully handles missing endpoint (returns undefined)
+ * - Every row shares one cache keyed by item/warehouse pair (short TTL);
+ *   pairs requested together (e.g. all lines of a loaded order) are
+ *   fetched with a single bulk request, identical pairs only once
  */
 
 import { useState, useEffect } from 'react'
@@ -25,6 +29,150 @@ export interface UseStockDataResult {
   refetch: () => void
 }
 
+// POST /api/items/stock response (MOCK_STOCK_DATA shape)
+interface BulkStockResponse {
+  items: Array<{
+    item_code: string
+    item_name?: string
+    warehouses: Array<{ warehouse: string; stock: number; reserved: number; available: number }>
+  }>
+}
+
+const STOCK_ENDPOINT = '/api/items/stock'
+const STOCK_CACHE_TTL_MS = 15_000
+const STOCK_BATCH_DELAY_MS = 10
+const STOCK_BATCH_MAX = 200
+
+class StockFetchError extends Error {}
+
+interface CachedStock {
+  data: StockData | null
+  storedAt: number
+}
+
+type Pending = { resolve: (data: StockData | null) => void; reject: (error: Error) => void }
+
+// Shared by every useStockData instance on the page
+const stockCache = new Map<string, CachedStock>()
+const inFlight = new Map<string, Promise<StockData | null>>()
+let queued = new Map<string, Pending[]>()
+let flushTimer: ReturnType<typeof setTimeout> | undefined
+
+function pairKey(itemCode: string, warehouse: string) {
+  return `${itemCode}\u0000${warehouse}`
+}
+
+function splitKey(key: string) {
+  const [item_code, warehouse] = key.split('\u0000')
+  return { item_code, warehouse }
+}
+
+function getApiBaseUrl() {
+  return process.env.NEXT_PUBLIC_API_BASE_URL || 'http://127.0.0.1:8001'
+}
+
+async function fetchOne(key: string): Promise<StockData | null> {
+  const { item_code, warehouse } = splitKey(key)
+  const response = await fetch(
+    `${getApiBaseUrl()}${STOCK_ENDPOINT}?item_code=${encodeURIComponent(item_code)}&warehouse=${encodeURIComponent(warehouse)}`,
+    {
+      method: 'GET',
+      headers: { 'Content-Type': 'application/json' },
+    }
+  )
+  if (response.ok) {
+    const data = await response.json()
+    return {
+      stock_actual: data.stock_actual,
+      stock_reserved: data.stock_reserved,
+      stock_available: data.stock_available,
+    }
+  }
+  if (response.status === 404) {
+    // Item or warehouse not found - no data but no error
+    return null
+  }
+  throw new StockFetchError('Failed to fetch stock data')
+}
+
+async function fetchBulk(keys: string[]): Promise<Map<string, StockData | null>> {
+  const response = await fetch(`${getApiBaseUrl()}${STOCK_ENDPOINT}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ pairs: keys.map(splitKey) }),
+  })
+
+  const results = new Map<string, StockData | null>()
+  if (response.status === 404 || response.status === 405) {
+    // Backend without the bulk endpoint: one GET per pair
+    const rows = await Promise.all(keys.map(fetchOne))
+    keys.forEach((key, index) => results.set(key, rows[index]))
+    return results
+  }
+  if (!response.ok) {
+    throw new StockFetchError('Failed to fetch stock data')
+  }
+
+  const data = (await response.json()) as BulkStockResponse
+  for (const item of data.items || []) {
+    for (const row of item.warehouses || []) {
+      results.set(pairKey(item.item_code, row.warehouse), {
+        stock_actual: row.stock,
+        stock_reserved: row.reserved,
+        stock_available: row.available,
+      })
+    }
+  }
+  // Requested pairs missing from the response have no stock row
+  keys.forEach((key) => {
+    if (!results.has(key)) results.set(key, null)
+  })
+  return results
+}
+
+async function flushQueue() {
+  flushTimer = undefined
+  const batch = queued
+  queued = new Map()
+  const keys = [...batch.keys()]
+
+  for (let start = 0; start < keys.length; start += STOCK_BATCH_MAX) {
+    const chunk = keys.slice(start, start + STOCK_BATCH_MAX)
+    try {
+      const results = await fetchBulk(chunk)
+      const storedAt = Date.now()
+      for (const key of chunk) {
+        const data = results.get(key) ?? null
+        stockCache.set(key, { data, storedAt })
+        batch.get(key)?.forEach((pending) => pending.resolve(data))
+      }
+    } catch (err) {
+      const error = err instanceof Error ? err : new Error(String(err))
+      chunk.forEach((key) => batch.get(key)?.forEach((pending) => pending.reject(error)))
+    }
+  }
+}
+
+function readCachedStock(key: string): CachedStock | undefined {
+  const cached = stockCache.get(key)
+  if (cached && Date.now() - cached.storedAt < STOCK_CACHE_TTL_MS) return cached
+  return undefined
+}
+
+function loadStock(key: string): Promise<StockData | null> {
+  const existing = inFlight.get(key)
+  if (existing) return existing
+
+  const promise = new Promise<StockData | null>((resolve, reject) => {
+    queued.set(key, [...(queued.get(key) ?? []), { resolve, reject }])
+    if (flushTimer === undefined) {
+      flushTimer = setTimeout(flushQueue, STOCK_BATCH_DELAY_MS)
+    }
+  }).finally(() => inFlight.delete(key))
+  inFlight.set(key, promise)
+  return promise
+}
+
 export function useStockData(itemCode: string, warehouse: string): UseStockDataResult {
   const [stockData, setStockData] = useState<StockData | null>(null)
   const [isLoading, setIsLoading] = useState(false)
@@ -40,49 +188,44 @@ export function useStockData(itemCode: string, warehouse: string): UseStockDataR
       return
     }
 
-    const fetchStockData = async () => {
-      setIsLoading(true)
+    const key = pairKey(itemCode.trim(), warehouse.trim())
+    const cached = readCachedStock(key)
+    if (cached) {
+      setStockData(cached.data)
       setError(null)
+      setIsLoading(false)
+      return
+    }
 
-      try {
-        const apiBaseUrl = process.env.NEXT_PUBLIC_API_BASE_URL || 'http://127.0.0.1:8001'
-        
-        const response = await fetch(
-          `${apiBaseUrl}/api/items/stock?item_code=${encodeURIComponent(itemCode)}&warehouse=${encodeURIComponent(warehouse)}`,
-          {
-            method: 'GET',
-            headers: { 'Content-Type': 'application/json' },
-          }
-        )
-
-        if (response.ok) {
-          const data = await response.json()
-          setStockData({
-            stock_actual: data.stock_actual,
-            stock_reserved: data.stock_reserved,
-            stock_available: data.stock_available,
-          })
-        } else if (response.status === 404) {
-          // Item or warehouse not found - set to null but no error
-          setStockData(null)
-        } else {
-          // Other error - set error message
-          setError('Failed to fetch stock data')
-          setStockData(null)
-        }
-      } catch (err) {
-        // Endpoint doesn't exist or network error - silently fail
+    let cancelled = false
+    setIsLoading(true)
+    setError(null)
+
+    loadStock(key)
+      .then((data) => {
+        if (!cancelled) setStockData(data)
+      })
+      .catch((err) => {
+        if (cancelled) return
         setStockData(null)
-        setError(null)
-      } finally {
-        setIsLoading(false)
-      }
-    }
+        // Endpoint doesn't exist or network error - silently fail
+        setError(err instanceof StockFetchError ? err.message : null)
+      })
+      .finally(() => {
+        if (!cancelled) setIsLoading(false)
+      })
 
-    fetchStockData()
+    return () => {
+      cancelled = true
+    }
   }, [itemCode, warehouse, refetchTrigger])
 
-  const refetch = () => setRefetchTrigger((prev) => prev + 1)
+  const refetch = () => {
+    if (itemCode?.trim() && warehouse?.trim()) {
+      stockCache.delete(pairKey(itemCode.trim(), warehouse.trim()))
+    }
+    setRefetchTrigger((prev) => prev + 1)
+  }
 
   return { stockData, isLoading, error, refetch }
 }
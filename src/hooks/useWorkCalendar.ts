@@ -0,0 +1,26 @@
+"use client"
+
+import { useMemo } from "react"
+import { useQuery } from "@tanstack/react-query"
+import { fetchWorkCalendarAsset, WorkCalendar, type WorkCalendarAsset } from "@/lib/work-calendar"
+
+/**
+ * Plant work calendar (weekends + holidays) from public/work-calendar.json
+ * The asset is fetched once per session; null until it has loaded or if it
+ * is unavailable (callers fall back to the weekend days)
+ */
+export function useWorkCalendar(options: { calendarId?: string; warehouse?: string } = {}) {
+  const { calendarId, warehouse } = options
+  const { data } = useQuery<WorkCalendarAsset>({
+    queryKey: ["work-calendar"],
+    queryFn: fetchWorkCalendarAsset,
+    staleTime: Infinity,
+    retry: 1,
+    refetchOnWindowFocus: false,
+  })
+
+  return useMemo(
+    () => (data ? WorkCalendar.fromAsset(data, { calendarId, warehouse }) : null),
+    [data, calendarId, warehouse]
+  )
+}
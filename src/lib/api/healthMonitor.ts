@@ -0,0 +1,169 @@
+/**
+ * Backend health monitor shared by every health consumer
+ *
+ * One schedule per tab instead of one interval per component:
+ * - Healthy: poll every HEALTHY_POLL_MS
+ * - Offline: exponential backoff, OFFLINE_BASE_MS doubling up to OFFLINE_MAX_MS
+ * - Hidden tab: no polling; a tab that becomes visible polls once it is due
+ * - Other tabs: results are shared over a BroadcastChannel and reset every
+ *   tab's timer; tabs that heard a result from a peer wait PEER_GRACE_MS
+ *   longer, so the tab that polled last keeps polling for all of them
+ * - Piggyback: any successful OTP API response counts as a healthy check
+ *   (reported by otpClient) and pushes the next poll back
+ */
+
+import type { HealthCheckResponse } from "./types"
+
+export type HealthStatus = "checking" | "healthy" | "offline"
+
+export interface HealthState {
+  status: HealthStatus
+  data?: HealthCheckResponse
+  error?: Error
+  failures: number              // Consecutive failed checks
+  checkedAt: number | null      // Last poll, piggybacked response or broadcast
+  nextCheckAt: number | null    // null while no poll is scheduled (hidden tab)
+}
+
+export const HEALTHY_POLL_MS = 30_000
+export const OFFLINE_BASE_MS = 5_000
+export const OFFLINE_MAX_MS = 300_000
+export const PEER_GRACE_MS = 1_000
+const CHANNEL_NAME = "otp-health"
+
+const INITIAL_STATE: HealthState = { status: "checking", failures: 0, checkedAt: null, nextCheckAt: null }
+
+type HealthMessage = Pick<HealthState, "status" | "data" | "failures" | "checkedAt">
+
+/** Delay before the next poll after `failures` consecutive failures. */
+export function nextPollDelay(failures: number): number {
+  if (failures === 0) return HEALTHY_POLL_MS
+  return Math.min(OFFLINE_BASE_MS * 2 ** (failures - 1), OFFLINE_MAX_MS)
+}
+
+function isHidden() {
+  return typeof document !== "undefined" && document.visibilityState === "hidden"
+}
+
+class HealthMonitor {
+  private state: HealthState = INITIAL_STATE
+  private listeners = new Set<() => void>()
+  private check: (() => Promise<HealthCheckResponse>) | null = null
+  private timer: ReturnType<typeof setTimeout> | undefined
+  private polling = false
+  private fromPeer = false
+  private channel: BroadcastChannel | null = null
+
+  getState = (): HealthState => this.state
+
+  getServerState = (): HealthState => INITIAL_STATE
+
+  /** Subscribe (useSyncExternalStore); the first subscriber starts polling. */
+  subscribe = (listener: () => void, check: () => Promise<HealthCheckResponse>) => {
+    this.listeners.add(listener)
+    if (this.listeners.size === 1) this.start(check)
+    return () => {
+      this.listeners.delete(listener)
+      if (this.listeners.size === 0) this.stop()
+    }
+  }
+
+  /** Poll now (deduplicated while a poll is running). */
+  refresh = async () => {
+    if (!this.check || this.polling) return
+    this.polling = true
+    clearTimeout(this.timer)
+    try {
+      const data = await this.check()
+      this.apply({ status: "healthy", data, failures: 0, checkedAt: Date.now() }, true)
+    } catch (err) {
+      this.apply(
+        { status: "offline", data: this.state.data, failures: this.state.failures + 1, checkedAt: Date.now() },
+        true,
+        err instanceof Error ? err : new Error(String(err))
+      )
+    } finally {
+      this.polling = false
+    }
+  }
+
+  /** A regular API call succeeded: the backend is up, no poll needed for a while. */
+  reportSuccess() {
+    if (!this.check || this.polling) return
+    this.apply({ status: "healthy", data: this.state.data, failures: 0, checkedAt: Date.now() }, true)
+  }
+
+  private start(check: () => Promise<HealthCheckResponse>) {
+    this.check = check
+    if (typeof document !== "undefined") {
+      document.addEventListener("visibilitychange", this.handleVisibility)
+    }
+    if (typeof BroadcastChannel !== "undefined") {
+      this.channel = new BroadcastChannel(CHANNEL_NAME)
+      this.channel.onmessage = (event: MessageEvent<HealthMessage>) => {
+        const message = event.data
+        if (message.checkedAt !== null && message.checkedAt > (this.state.checkedAt ?? 0)) {
+          this.apply(message, false)
+        }
+      }
+    }
+    // Polls right away unless a recent result (e.g. before a remount) is still fresh
+    this.schedule()
+  }
+
+  private stop() {
+    clearTimeout(this.timer)
+    this.timer = undefined
+    this.check = null
+    if (typeof document !== "undefined") {
+      document.removeEventListener("visibilitychange", this.handleVisibility)
+    }
+    this.channel?.close()
+    this.channel = null
+  }
+
+  private handleVisibility = () => {
+    if (isHidden()) {
+      clearTimeout(this.timer)
+      this.setState({ ...this.state, nextCheckAt: null })
+    } else {
+      this.schedule()
+    }
+  }
+
+  private apply(next: HealthMessage, broadcast: boolean, error?: Error) {
+    this.fromPeer = !broadcast
+    this.setState({ ...this.state, ...next, error: next.status === "offline" ? error ?? this.state.error : undefined })
+    if (broadcast) {
+      this.channel?.postMessage({
+        status: next.status,
+        data: next.data,
+        failures: next.failures,
+        checkedAt: next.checkedAt,
+      } satisfies HealthMessage)
+    }
+    this.schedule()
+  }
+
+  private schedule() {
+    clearTimeout(this.timer)
+    if (!this.check || isHidden()) {
+      if (this.state.nextCheckAt !== null) this.setState({ ...this.state, nextCheckAt: null })
+      return
+    }
+    if (this.state.checkedAt === null) {
+      void this.refresh()
+      return
+    }
+    const due = this.state.checkedAt + nextPollDelay(this.state.failures) + (this.fromPeer ? PEER_GRACE_MS : 0)
+    this.timer = setTimeout(() => void this.refresh(), Math.max(0, due - Date.now()))
+    if (this.state.nextCheckAt !== due) this.setState({ ...this.state, nextCheckAt: due })
+  }
+
+  private setState(next: HealthState) {
+    this.state = next
+    this.listeners.forEach((listener) => listener())
+  }
+}
+
+export const healthMonitor = new HealthMonitor()
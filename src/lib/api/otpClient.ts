@@ -3,11 +3,16 @@ import type {
   PromiseEvaluateResponse,
   PromiseApplyRequest,
   PromiseApplyResponse,
+  PromiseBatchOrder,
+  PromiseBatchRequest,
+  PromiseBatchResult,
+  PromisePlanEvent,
   ProcurementSuggestionRequest,
   ProcurementSuggestionResponse,
   HealthCheckResponse,
   SalesOrderListItem,
   SalesOrderListResponse,
+  SalesOrderPage,
   SalesOrderDetailsResponse,
 } from "./types"
 import {
@@ -17,6 +22,7 @@ import {
   MOCK_SALES_ORDERS,
   MOCK_ITEM_CODES,
 } from "./mockData"
+import { healthMonitor } from "./healthMonitor"
 
 const RAW_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL || "http://127.0.0.1:8001"
 const API_BASE_URL = RAW_BASE_URL.replace(/\/+$/, "")
@@ -24,6 +30,22 @@ const MOCK_MODE = process.env.NEXT_PUBLIC_MOCK_MODE === "true"
 
 const DEFAULT_TIMEOUT_MS = 10000
 const HEALTH_TIMEOUT_MS = 5000
+const PROMISE_CACHE_TTL_MS = 30_000
+const PROMISE_CACHE_MAX_ENTRIES = 50
+const DEFAULT_WAREHOUSE = "Stores - SD"
+const BATCH_FALLBACK_CONCURRENCY = 4
+const MOCK_BATCH_DELAY_MS = 150
+
+// Backend defaults for PromiseRules: omitted and default values share a cache key
+const DEFAULT_PROMISE_RULES: Record<string, unknown> = {
+  no_weekends: true,
+  cutoff_time: "14:00",
+  timezone: "UTC",
+  lead_time_buffer_days: 1,
+  processing_lead_time_days: 1,
+  desired_date_mode: "LATEST_ACCEPTABLE",
+  order_created_at: null,
+}
 
 export interface NormalizedApiError {
   status: number
@@ -35,6 +57,17 @@ export type PromiseRequest = PromiseEvaluateRequest
 export type PromiseResponse = PromiseEvaluateResponse
 export type HealthResponse = HealthCheckResponse
 
+export interface SalesOrderListQuery {
+  limit?: number
+  offset?: number
+  cursor?: string
+  customer?: string
+  status?: string
+  from_date?: string
+  to_date?: string
+  search?: string
+}
+
 export class OTPApiError extends Error {
   status?: number
   code?: string
@@ -56,10 +89,15 @@ function normalizeBaseUrl(url: string) {
 async function fetchWithTimeout(input: RequestInfo, init: RequestInit, timeoutMs: number) {
   const controller = new AbortController()
   const timeoutId = setTimeout(() => controller.abort(), timeoutMs)
+  // A caller's signal (e.g. a Cancel button) aborts the request and its body stream
+  init.signal?.addEventListener("abort", () => controller.abort(), { once: true })
 
   try {
     return await fetch(input, { ...init, signal: controller.signal })
   } catch (error) {
+    if (init.signal?.aborted) {
+      throw error
+    }
     if (error instanceof DOMException && error.name === "AbortError") {
       throw new OTPApiError("Request timed out. Please try again.", {
         code: "TIMEOUT",
@@ -97,6 +135,105 @@ async function buildHttpError(response: Response): Promise<OTPApiError> {
   })
 }
 
+/** Hand each line of a streamed body to onLine as soon as it arrives. */
+async function readLines(response: Response, onLine: (line: string) => void) {
+  if (!response.body) {
+    const text = await response.text()
+    text.split("\n").forEach(onLine)
+    return
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ""
+  try {
+    for (;;) {
+      const { done, value } = await reader.read()
+      buffer += decoder.decode(value, { stream: !done })
+      let newline = buffer.indexOf("\n")
+      while (newline >= 0) {
+        onLine(buffer.slice(0, newline).replace(/\r$/, ""))
+        buffer = buffer.slice(newline + 1)
+        newline = buffer.indexOf("\n")
+      }
+      if (done) break
+    }
+  } catch (error) {
+    // Stop the download when a line handler gives up (e.g. an SSE error event)
+    reader.cancel().catch(() => undefined)
+    throw error
+  }
+  if (buffer) onLine(buffer)
+}
+
+/** NDJSON: one JSON value per non-blank line. */
+function readNdjson<T>(response: Response, onValue: (value: T) => void) {
+  return readLines(response, (line) => {
+    if (line.trim()) onValue(JSON.parse(line) as T)
+  })
+}
+
+/** Server-Sent Events: onEvent(event, data) per frame, data parsed as JSON. */
+async function readSse(response: Response, onEvent: (event: string, data: unknown) => void) {
+  let event = "message"
+  let data: string[] = []
+  const dispatch = () => {
+    if (data.length > 0) onEvent(event, JSON.parse(data.join("\n")))
+    event = "message"
+    data = []
+  }
+  await readLines(response, (line) => {
+    if (line === "") dispatch()
+    else if (line.startsWith("event:")) event = line.slice(6).trim()
+    else if (line.startsWith("data:")) data.push(line.slice(5).replace(/^ /, ""))
+  })
+  dispatch()
+}
+
+function abortError() {
+  return new DOMException("The batch was cancelled.", "AbortError")
+}
+
+/**
+ * Canonical form of what decides a promise: sorted (item_code, warehouse,
+ * qty) lines, rules merged over the defaults and desired_date. customer and
+ * sales_order_id are UI context only. Mirrors tests/mocks/promise_cache.py.
+ */
+export function canonicalPromiseRequest(request: PromiseEvaluateRequest): string {
+  const items = request.items
+    .map((item) => [item.item_code.trim(), item.warehouse || DEFAULT_WAREHOUSE, Number(item.qty)] as const)
+    .sort((a, b) => (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : a[1] < b[1] ? -1 : a[1] > b[1] ? 1 : a[2] - b[2]))
+
+  const rules: Record<string, unknown> = { ...DEFAULT_PROMISE_RULES }
+  for (const [key, value] of Object.entries(request.rules || {})) {
+    if (value !== undefined && value !== null && value !== "") rules[key] = value
+  }
+  const sortedRules = Object.fromEntries(Object.entries(rules).sort(([a], [b]) => (a < b ? -1 : 1)))
+
+  return JSON.stringify({ items, rules: sortedRules, desired_date: request.desired_date || null })
+}
+
+/** 53-bit string hash (cyrb53) as hex, for cache and in-flight keys. */
+export function hashString(value: string): string {
+  let h1 = 0xdeadbeef
+  let h2 = 0x41c6ce57
+  for (let i = 0; i < value.length; i++) {
+    const ch = value.charCodeAt(i)
+    h1 = Math.imul(h1 ^ ch, 2654435761)
+    h2 = Math.imul(h2 ^ ch, 1597334677)
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909)
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909)
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16)
+}
+
+interface CachedPromise {
+  canonical: string
+  response: PromiseEvaluateResponse
+  storedAt: number
+  stockVersion: number
+}
+
 function mapMockSalesOrders(): SalesOrderListItem[] {
   return MOCK_SALES_ORDERS.map((order) => ({
     name: order.name,
@@ -119,6 +256,9 @@ class OTPClient {
   private baseUrl: string
   private mockMode: boolean
   private baseUrlWarning: string | null = null
+  private promiseCache = new Map<string, CachedPromise>()
+  private inFlight = new Map<string, Promise<unknown>>()
+  private stockVersion = 0
 
   constructor() {
     this.baseUrl = normalizeBaseUrl(API_BASE_URL)
@@ -150,12 +290,33 @@ class OTPClient {
     return `${this.baseUrl}${normalized}`
   }
 
-  private async requestJson<T>(path: string, init: RequestInit, timeoutMs = DEFAULT_TIMEOUT_MS) {
+  /**
+   * Share one in-flight request between identical callers (double clicks,
+   * strict-mode double effects, several components asking for the same
+   * resource). Callers receive the same parsed response object.
+   */
+  private coalesce<T>(key: string, run: () => Promise<T>): Promise<T> {
+    const existing = this.inFlight.get(key)
+    if (existing) return existing as Promise<T>
+
+    const request = run().finally(() => this.inFlight.delete(key))
+    this.inFlight.set(key, request)
+    return request
+  }
+
+  private requestJson<T>(path: string, init: RequestInit, timeoutMs = DEFAULT_TIMEOUT_MS): Promise<T> {
+    const url = this.buildUrl(path)
+    const body = typeof init.body === "string" ? `${init.body.length}:${hashString(init.body)}` : ""
+    return this.coalesce(`${init.method || "GET"} ${url} ${body}`, () => this.fetchJson<T>(url, init, timeoutMs))
+  }
+
+  private async fetchJson<T>(url: string, init: RequestInit, timeoutMs: number): Promise<T> {
     try {
-      const response = await fetchWithTimeout(this.buildUrl(path), init, timeoutMs)
+      const response = await fetchWithTimeout(url, init, timeoutMs)
       if (!response.ok) {
         throw await buildHttpError(response)
       }
+      healthMonitor.reportSuccess()
       return (await response.json()) as T
     } catch (error) {
       if (error instanceof OTPApiError) {
@@ -187,16 +348,262 @@ class OTPClient {
     return this.health()
   }
 
+  /**
+   * Evaluate a promise. Identical requests (see canonicalPromiseRequest)
+   * within PROMISE_CACHE_TTL_MS on the same stock version are answered from
+   * the cache with `cached: true`.
+   */
   async evaluatePromise(request: PromiseEvaluateRequest): Promise<PromiseEvaluateResponse> {
     if (this.mockMode) {
       return getRandomMockResponse() || MOCK_PROMISE_RESPONSE_SUCCESS
     }
 
-    return this.requestJson<PromiseEvaluateResponse>("/otp/promise", {
+    const canonical = canonicalPromiseRequest(request)
+    const cached = this.cachedPromise(canonical)
+    if (cached) return cached
+
+    const response = await this.requestJson<PromiseEvaluateResponse>("/otp/promise", {
       method: "POST",
       headers: { "Content-Type": "application/json", Accept: "application/json" },
       body: JSON.stringify(request),
     })
+
+    this.storePromise(canonical, response)
+    return response
+  }
+
+  /**
+   * Evaluate a promise over POST /otp/promise/stream (Server-Sent Events):
+   * onPlan receives each item's plan as soon as the backend has planned it,
+   * the returned promise resolves with the summary. Shares evaluatePromise's
+   * result cache (a hit replays the cached plan). Backends without the
+   * endpoint (404/405) fall back to evaluatePromise.
+   */
+  async evaluatePromiseStream(
+    request: PromiseEvaluateRequest,
+    onPlan?: (event: PromisePlanEvent) => void,
+    signal?: AbortSignal
+  ): Promise<PromiseEvaluateResponse> {
+    const replay = (response: PromiseEvaluateResponse) => {
+      const plan = response.plan || []
+      plan.forEach((entry, index) => onPlan?.({ index, total: plan.length, plan: entry }))
+      return response
+    }
+
+    if (this.mockMode) {
+      return replay(await this.evaluatePromise(request))
+    }
+
+    const canonical = canonicalPromiseRequest(request)
+    const cached = this.cachedPromise(canonical)
+    if (cached) return replay(cached)
+
+    try {
+      const response = await fetchWithTimeout(
+        this.buildUrl("/otp/promise/stream"),
+        {
+          method: "POST",
+          headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+          body: JSON.stringify(request),
+          signal,
+        },
+        DEFAULT_TIMEOUT_MS
+      )
+      if (response.status === 404 || response.status === 405) {
+        return replay(await this.evaluatePromise(request))
+      }
+      if (!response.ok) {
+        throw await buildHttpError(response)
+      }
+      healthMonitor.reportSuccess()
+
+      const stream: { summary?: PromiseEvaluateResponse } = {}
+      await readSse(response, (event, data) => {
+        if (event === "plan") {
+          onPlan?.(data as PromisePlanEvent)
+        } else if (event === "summary") {
+          stream.summary = data as PromiseEvaluateResponse
+        } else if (event === "error") {
+          const failure = data as { status?: number; detail?: string }
+          throw new OTPApiError(failure.detail || "Promise evaluation failed.", {
+            status: failure.status,
+            code: `HTTP_${failure.status ?? 500}`,
+            detail: failure.detail,
+          })
+        }
+      })
+      if (!stream.summary) {
+        throw new OTPApiError("The promise stream ended before the result arrived.", {
+          code: "STREAM_INCOMPLETE",
+          status: 0,
+        })
+      }
+      this.storePromise(canonical, stream.summary)
+      return stream.summary
+    } catch (error) {
+      if (error instanceof TypeError && !signal?.aborted) {
+        throw new OTPApiError("Network error: Unable to reach backend server.", {
+          code: "NETWORK_ERROR",
+          status: 0,
+        })
+      }
+      throw error
+    }
+  }
+
+  private cachedPromise(canonical: string): PromiseEvaluateResponse | null {
+    const key = hashString(canonical)
+    const cached = this.promiseCache.get(key)
+    if (!cached) return null
+
+    const fresh =
+      cached.canonical === canonical &&
+      cached.stockVersion === this.stockVersion &&
+      Date.now() - cached.storedAt < PROMISE_CACHE_TTL_MS
+    this.promiseCache.delete(key)
+    if (!fresh) return null
+    // Re-insert to keep the Map in least-recently-used order
+    this.promiseCache.set(key, cached)
+    return { ...cached.response, cached: true }
+  }
+
+  private storePromise(canonical: string, response: PromiseEvaluateResponse) {
+    this.noteStockVersion(response)
+    this.promiseCache.set(hashString(canonical), {
+      canonical,
+      response,
+      storedAt: Date.now(),
+      stockVersion: this.stockVersion,
+    })
+    if (this.promiseCache.size > PROMISE_CACHE_MAX_ENTRIES) {
+      this.promiseCache.delete(this.promiseCache.keys().next().value as string)
+    }
+  }
+
+  private noteStockVersion(response: PromiseEvaluateResponse) {
+    if (typeof response.stock_version === "number" && response.stock_version !== this.stockVersion) {
+      // Stock moved on: everything cached so far was computed on old stock
+      this.stockVersion = response.stock_version
+      this.promiseCache.clear()
+    }
+  }
+
+  /**
+   * Re-promise many Sales Orders with one POST /otp/promise/batch. Results
+   * stream back as NDJSON in completion order and are handed to onResult as
+   * each order finishes; the returned promise resolves with every result in
+   * request order. Backends without the batch endpoint (404/405) get one
+   * details + evaluate call per order, BATCH_FALLBACK_CONCURRENCY at a time.
+   * Aborting `signal` cancels the batch with an AbortError.
+   */
+  async evaluatePromiseBatch(
+    request: PromiseBatchRequest,
+    onResult?: (result: PromiseBatchResult) => void,
+    signal?: AbortSignal
+  ): Promise<PromiseBatchResult[]> {
+    const results: PromiseBatchResult[] = new Array(request.orders.length)
+    const emit = (result: PromiseBatchResult) => {
+      results[result.index] = result
+      if (result.result) this.noteStockVersion(result.result)
+      onResult?.(result)
+    }
+
+    if (this.mockMode) {
+      for (const [index, order] of request.orders.entries()) {
+        await new Promise((resolve) => setTimeout(resolve, MOCK_BATCH_DELAY_MS))
+        if (signal?.aborted) throw abortError()
+        emit({ index, sales_order_id: order.sales_order_id, status: 200, result: getRandomMockResponse() || MOCK_PROMISE_RESPONSE_SUCCESS })
+      }
+      return results
+    }
+
+    try {
+      const response = await fetchWithTimeout(
+        this.buildUrl("/otp/promise/batch"),
+        {
+          method: "POST",
+          headers: { "Content-Type": "application/json", Accept: "application/x-ndjson" },
+          body: JSON.stringify(request),
+          signal,
+        },
+        DEFAULT_TIMEOUT_MS
+      )
+      if (response.status === 404 || response.status === 405) {
+        await this.evaluateBatchOneByOne(request, emit, signal)
+        return results
+      }
+      if (!response.ok) {
+        throw await buildHttpError(response)
+      }
+      healthMonitor.reportSuccess()
+      await readNdjson<PromiseBatchResult>(response, emit)
+      return results
+    } catch (error) {
+      if (error instanceof TypeError && !signal?.aborted) {
+        throw new OTPApiError("Network error: Unable to reach backend server.", {
+          code: "NETWORK_ERROR",
+          status: 0,
+        })
+      }
+      throw error
+    }
+  }
+
+  private async evaluateBatchOneByOne(
+    request: PromiseBatchRequest,
+    emit: (result: PromiseBatchResult) => void,
+    signal?: AbortSignal
+  ) {
+    let next = 0
+    const worker = async () => {
+      while (next < request.orders.length) {
+        if (signal?.aborted) throw abortError()
+        const index = next++
+        const order = request.orders[index]
+        try {
+          const result = await this.evaluatePromise(await this.batchOrderRequest(request, order))
+          emit({ index, sales_order_id: order.sales_order_id, status: 200, result })
+        } catch (error) {
+          if (!(error instanceof OTPApiError)) throw error
+          emit({ index, sales_order_id: order.sales_order_id, status: error.status || 0, error: error.message })
+        }
+      }
+    }
+    await Promise.all(Array.from({ length: Math.min(BATCH_FALLBACK_CONCURRENCY, request.orders.length) }, worker))
+  }
+
+  /** The single-order request for a batch entry (mirrors tests/mocks/promise_batch.py). */
+  private async batchOrderRequest(
+    request: PromiseBatchRequest,
+    order: PromiseBatchOrder
+  ): Promise<PromiseEvaluateRequest> {
+    const details = await this.getSalesOrderDetails(order.sales_order_id)
+    const warehouse = details.defaults?.warehouse || DEFAULT_WAREHOUSE
+    const items =
+      order.items ??
+      (details.items || [])
+        .filter((line) => line.item_code && line.qty)
+        .map((line) => ({
+          item_code: line.item_code as string,
+          qty: line.qty as number,
+          warehouse: line.warehouse || warehouse,
+        }))
+    if (items.length === 0) {
+      throw new OTPApiError("Sales Order has no items to promise.", { status: 422, code: "HTTP_422" })
+    }
+    const desiredDate = order.desired_date || request.desired_date || details.delivery_date
+    return {
+      customer: details.customer_name || details.customer || "",
+      items,
+      rules: { ...request.rules, ...order.rules },
+      sales_order_id: order.sales_order_id,
+      ...(desiredDate ? { desired_date: desiredDate } : {}),
+    }
+  }
+
+  /** Drop cached promise results (e.g. after writing to ERPNext). */
+  invalidatePromiseCache() {
+    this.promiseCache.clear()
   }
 
   async applyPromise(request: PromiseApplyRequest): Promise<PromiseApplyResponse> {
@@ -208,11 +615,13 @@ class OTPClient {
       }
     }
 
-    return this.requestJson<PromiseApplyResponse>("/otp/apply", {
+    const response = await this.requestJson<PromiseApplyResponse>("/otp/apply", {
       method: "POST",
       headers: { "Content-Type": "application/json", Accept: "application/json" },
       body: JSON.stringify(request),
     })
+    this.invalidatePromiseCache()
+    return response
   }
 
   async createProcurementSuggestion(
@@ -235,22 +644,25 @@ class OTPClient {
     })
   }
 
-  async listSalesOrders(params?: {
-    limit?: number
-    offset?: number
-    customer?: string
-    status?: string
-    from_date?: string
-    to_date?: string
-    search?: string
-  }): Promise<SalesOrderListItem[]> {
+  async listSalesOrders(params?: SalesOrderListQuery): Promise<SalesOrderListItem[]> {
+    const page = await this.listSalesOrdersPage(params)
+    return page.sales_orders
+  }
+
+  /**
+   * One page of Sales Orders. Pass the previous page's next_cursor as
+   * `cursor` to continue; next_cursor is null on the last page and undefined
+   * when the backend returned an unpaginated list.
+   */
+  async listSalesOrdersPage(params?: SalesOrderListQuery): Promise<SalesOrderPage> {
     if (this.mockMode) {
-      return mapMockSalesOrders()
+      return { sales_orders: mapMockSalesOrders(), next_cursor: null }
     }
 
     const url = new URL(this.buildUrl("/otp/sales-orders"))
     if (params?.limit !== undefined) url.searchParams.set("limit", String(params.limit))
     if (params?.offset !== undefined) url.searchParams.set("offset", String(params.offset))
+    if (params?.cursor) url.searchParams.set("cursor", params.cursor)
     if (params?.customer) url.searchParams.set("customer", params.customer)
     if (params?.status) url.searchParams.set("status", params.status)
     if (params?.from_date) url.searchParams.set("from_date", params.from_date)
@@ -258,6 +670,10 @@ class OTPClient {
     if (params?.search) url.searchParams.set("search", params.search)
 
     const fullUrl = url.toString()
+    return this.coalesce(`GET ${fullUrl}`, () => this.fetchSalesOrdersPage(fullUrl))
+  }
+
+  private async fetchSalesOrdersPage(fullUrl: string): Promise<SalesOrderPage> {
     let response: Response
     try {
       response = await fetchWithTimeout(
@@ -285,6 +701,7 @@ class OTPClient {
       httpError.detail = `HTTP ${response.status} - ${fullUrl}\n${httpError.detail || ""}`
       throw httpError
     }
+    healthMonitor.reportSuccess()
 
     const data = (await response.json()) as
       | SalesOrderListResponse
@@ -292,18 +709,19 @@ class OTPClient {
       | { data?: SalesOrderListItem[] }
 
     if (Array.isArray(data)) {
-      return data
+      return { sales_orders: data }
     }
 
     if (Array.isArray((data as SalesOrderListResponse).sales_orders)) {
-      return (data as SalesOrderListResponse).sales_orders
+      const list = data as SalesOrderListResponse
+      return { sales_orders: list.sales_orders, total: list.total, next_cursor: list.next_cursor }
     }
 
     if (Array.isArray((data as { data?: SalesOrderListItem[] }).data)) {
-      return (data as { data?: SalesOrderListItem[] }).data || []
+      return { sales_orders: (data as { data?: SalesOrderListItem[] }).data || [] }
     }
 
-    return []
+    return { sales_orders: [], next_cursor: null }
   }
 
   async getSalesOrderDetails(id: string): Promise<SalesOrderDetailsResponse> {
@@ -93,6 +93,8 @@ export interface PromiseEvaluateResponse {
   options: PromiseOption[]                   // Suggestions to improve promise
   error?: string                             // HTTP error reason if applicable
   error_detail?: string                      // Detailed error information
+  stock_version?: number                     // Stock snapshot the result was computed on
+  cached?: boolean                           // Served from the promise result cache
 }
 
 export interface PromisePlan {
@@ -119,6 +121,51 @@ export interface PromiseOption {
   po_id?: string | null                      // Related PO if applicable
 }
 
+/**
+ * POST /otp/promise/stream - "plan" Server-Sent Event, one per item in
+ * request order; a "summary" event with the full PromiseEvaluateResponse
+ * follows the last one
+ */
+export interface PromisePlanEvent {
+  index: number                              // Position in request.items
+  total: number                              // Number of plan events to expect
+  plan: PromisePlan
+}
+
+// ============================================================================
+// REQUEST/RESPONSE TYPES: POST /otp/promise/batch
+// ============================================================================
+
+/**
+ * POST /otp/promise/batch - Multi-order Promise Evaluation Request
+ * Re-promises many Sales Orders in one call (1..500 orders). Orders without
+ * items are loaded from ERPNext; order rules are merged over batch rules.
+ */
+export interface PromiseBatchRequest {
+  orders: PromiseBatchOrder[]
+  rules?: PromiseRules
+  desired_date?: string
+}
+
+export interface PromiseBatchOrder {
+  sales_order_id: string
+  items?: PromiseItem[]                      // Default: the Sales Order lines
+  desired_date?: string                      // Default: batch desired_date, then SO delivery date
+  rules?: PromiseRules
+}
+
+/**
+ * POST /otp/promise/batch - one NDJSON line per order, streamed in
+ * completion order (use index to match it to the request)
+ */
+export interface PromiseBatchResult {
+  index: number                              // Position in request.orders
+  sales_order_id: string
+  status: number                             // HTTP status of this order's evaluation
+  result?: PromiseEvaluateResponse           // Present when status is 200
+  error?: string                             // Present otherwise
+}
+
 // ============================================================================
 // REQUEST/RESPONSE TYPES: POST /otp/apply
 // ============================================================================
@@ -258,6 +305,28 @@ export interface SalesOrderListResponse {
   total: number
   limit: number
   offset?: number
+  // Opaque token for the next page; null on the last page. Absent when the
+  // backend does not paginate (the whole list came back in one response).
+  next_cursor?: string | null
+}
+
+// GET /api/items/search?query=&limit= (item codes starting with the query
+// first, then other code/name matches)
+export interface ItemSearchResponse {
+  items: { item_code: string; item_name?: string }[]
+  limit?: number
+  has_more?: boolean
+}
+
+// POST /api/items/validate {item_codes: string[]} (max 500 codes)
+export interface ItemValidateBatchResponse {
+  results: Record<string, { valid: boolean; error?: string }>
+}
+
+export interface SalesOrderPage {
+  sales_orders: SalesOrderListItem[]
+  total?: number
+  next_cursor?: string | null
 }
 
 // ============================================================================
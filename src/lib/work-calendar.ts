@@ -0,0 +1,122 @@
+/**
+ * Work Calendars - weekends + plant holidays as day bitmaps
+ *
+ * public/work-calendar.json is compiled by tests/mocks/work_calendar.py
+ * (python -m tests.mocks.work_calendar). The Python promise engine reads
+ * the same file, so the date picker and the promise dates agree on which
+ * days are working days.
+ *
+ * Each calendar is a base64 bitmap over the same date range: bit i (most
+ * significant bit first) is set when start + i is a working day.
+ * - isWorkingDay: one bit, O(1)
+ * - addWorkingDays: running working-day count + rank -> day table, O(1)
+ *
+ * Outside the compiled range only the calendar's weekend days are known.
+ */
+
+export const WORK_CALENDAR_URL = '/work-calendar.json';
+export const WORK_CALENDAR_VERSION = 1;
+
+export interface WorkCalendarAsset {
+  version: number;
+  start: string; // ISO date of bit 0
+  days: number;
+  default: string; // Calendar for warehouses not listed in `warehouses`
+  warehouses: Record<string, string>;
+  calendars: Record<string, { weekend_days: number[]; bitmap: string }>;
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+function decodeBase64(value: string): Uint8Array {
+  const binary = atob(value);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes;
+}
+
+function utcDay(date: Date): number {
+  return Date.UTC(date.getFullYear(), date.getMonth(), date.getDate());
+}
+
+export class WorkCalendar {
+  private readonly startUtc: number;
+  private readonly counts: Int32Array; // Working days in [0, i]
+  private readonly workingDays: Int32Array; // Rank -> day index
+
+  constructor(
+    readonly id: string,
+    start: string,
+    private readonly days: number,
+    readonly weekendDays: readonly number[],
+    private readonly bits: Uint8Array
+  ) {
+    this.startUtc = Date.parse(`${start}T00:00:00Z`);
+    this.counts = new Int32Array(days);
+    const working: number[] = [];
+    for (let index = 0; index < days; index++) {
+      if (this.bit(index)) working.push(index);
+      this.counts[index] = working.length;
+    }
+    this.workingDays = Int32Array.from(working);
+  }
+
+  /**
+   * Calendar for a warehouse's plant (or an explicit calendar id); the
+   * asset's default calendar when neither is known
+   */
+  static fromAsset(asset: WorkCalendarAsset, options: { calendarId?: string; warehouse?: string } = {}): WorkCalendar {
+    if (asset.version !== WORK_CALENDAR_VERSION) {
+      throw new Error(`Unsupported work calendar version ${asset.version}`);
+    }
+    const requested = options.calendarId ?? (options.warehouse ? asset.warehouses[options.warehouse] : undefined);
+    const id = requested && asset.calendars[requested] ? requested : asset.default;
+    const entry = asset.calendars[id];
+    return new WorkCalendar(id, asset.start, asset.days, entry.weekend_days, decodeBase64(entry.bitmap));
+  }
+
+  private bit(index: number): boolean {
+    return (this.bits[index >> 3] & (0x80 >> (index & 7))) !== 0;
+  }
+
+  /** Day index of a local calendar date, or -1 outside the compiled range */
+  private indexOf(date: Date): number {
+    const index = Math.round((utcDay(date) - this.startUtc) / DAY_MS);
+    return index >= 0 && index < this.days ? index : -1;
+  }
+
+  isWeekend(date: Date): boolean {
+    return this.weekendDays.includes(date.getDay());
+  }
+
+  isWorkingDay(date: Date): boolean {
+    const index = this.indexOf(date);
+    return index < 0 ? !this.isWeekend(date) : this.bit(index);
+  }
+
+  isHoliday(date: Date): boolean {
+    return !this.isWorkingDay(date) && !this.isWeekend(date);
+  }
+
+  /**
+   * date rolled forward to a working day, plus n working days;
+   * null when the result would leave the compiled range
+   */
+  addWorkingDays(date: Date, n: number): Date | null {
+    const index = this.indexOf(date);
+    if (index < 0) return null;
+    const rank = this.counts[index] - (this.bit(index) ? 1 : 0) + n;
+    if (rank < 0 || rank >= this.workingDays.length) return null;
+    return new Date(date.getFullYear(), date.getMonth(), date.getDate() + (this.workingDays[rank] - index));
+  }
+}
+
+export async function fetchWorkCalendarAsset(): Promise<WorkCalendarAsset> {
+  const response = await fetch(WORK_CALENDAR_URL);
+  if (!response.ok) {
+    throw new Error(`Work calendar unavailable (HTTP ${response.status})`);
+  }
+  return response.json();
+}
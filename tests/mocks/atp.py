@@ -0,0 +1,351 @@
+"""
+Available-to-Promise (ATP) Timelines per Item + Warehouse
+
+Models supply over time for the stub's promise engine. Each
+(item_code, warehouse) pair has dated events:
+- on-hand stock (supply) and reserved qty (demand) on the as-of date, from
+  MOCK_STOCK_DATA-shaped stock rows
+- purchase_order / production receipts (supply) on their expected dates;
+  synthetic_receipts() draws seeded ones for mock data and catalogs
+
+All timelines live in flat arrays, one segment per pair sorted by date:
+  day  event date (datetime64[D])
+  net  cumulative supply - demand up to and including the event
+  atp  min(net) over the rest of the segment: what can be promised from
+       that date on without breaking later demand. atp never decreases
+       within a segment, so the earliest date a qty is covered is a binary
+       search (vectorized over all lines of a batch), not a scan.
+
+Lines of one order that share a pair are allocated cumulatively: the
+second line needs the qty of the first one plus its own.
+
+Reservations and consumptions (AtpDelta) are applied incrementally: only
+the touched pairs' segments are re-sorted and re-summed, as one vectorized
+batch. A segment that outgrows its slot moves to the end of the arrays with
+room to grow; the arrays are compacted once half of them is stale.
+
+Usage:
+    atp = AtpIndex(MOCK_STOCK_DATA, date(2026, 2, 1), synthetic_receipts(MOCK_STOCK_DATA, date(2026, 2, 1), seed=7))
+    atp.earliest("WIDGET-ALPHA", "Stores - SD", 40)          # numpy.datetime64 or None
+    allocation = atp.allocate(pairs, qty, orders)            # AtpAllocation: dates + fulfillment sources
+    atp.apply([AtpDelta("WIDGET-ALPHA", "Stores - SD", 5, RESERVE, "2026-02-10", "SAL-ORD-2026-00001")])
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+SOURCES = ("stock", "purchase_order", "production", "demand")
+STOCK, PURCHASE_ORDER, PRODUCTION, DEMAND = range(4)
+NO_PAIR = -1
+EPSILON = 1e-9  # float qty comparisons
+RESERVE, CONSUME = "reserve", "consume"
+COLUMNS = ("day", "delta", "kind", "ref", "net", "atp")  # per-event arrays
+
+
+class Receipt(NamedTuple):
+    item_code: str
+    warehouse: str
+    date: str             # ISO expected date
+    qty: float
+    source: int           # PURCHASE_ORDER or PRODUCTION
+    ref: str              # PO / Work Order id
+
+
+class AtpDelta(NamedTuple):
+    """A change to one pair's demand or on-hand stock.
+
+    RESERVE: demand of qty from `date` on (as-of date when None); a negative
+    qty releases a reservation.
+    CONSUME: qty leaves on-hand stock on the as-of date; with `date`, it
+    fills the reservation made for that date.
+    """
+    item_code: str
+    warehouse: str
+    qty: float
+    kind: str = RESERVE
+    date: Optional[str] = None  # ISO date
+    ref: Optional[str] = None   # Sales Order id
+
+
+class AtpAllocation(NamedTuple):
+    """allocate() result; line arrays first, then one entry per (line, supply event) used."""
+    available_date: np.ndarray  # datetime64[D] per line, NaT when supply never covers it
+    covered: np.ndarray         # float per line, qty covered by known supply
+    line: np.ndarray            # int64 line index per entry
+    source: np.ndarray          # int8 index into SOURCES
+    qty: np.ndarray             # float
+    date: np.ndarray            # datetime64[D] supply date
+    ref: List[Optional[str]]    # PO / Work Order id
+
+
+def synthetic_receipts(stock: Mapping[str, Any], as_of: date, seed: Optional[int] = None,
+                       po_share: float = 0.4, production_share: float = 0.15,
+                       horizon_days: int = 60) -> List[Receipt]:
+    """Seeded PO / Work Order receipts for a share of the stock rows, up to horizon_days out."""
+    rows = [(item["item_code"], row["warehouse"], float(row["stock"]))
+            for item in stock["items"] for row in item["warehouses"]]
+    rng = np.random.default_rng(seed)
+    draw = rng.random(len(rows))
+    source = np.where(draw < po_share, PURCHASE_ORDER, np.where(draw < po_share + production_share, PRODUCTION, -1))
+    offsets = rng.integers(3, horizon_days + 1, len(rows))
+    qty = np.ceil(rng.lognormal(0.0, 0.6, len(rows)) * np.maximum([row[2] for row in rows], 10.0))
+    days = np.datetime_as_string(np.datetime64(as_of.isoformat(), "D") + offsets).tolist()
+
+    receipts = []
+    for index in np.flatnonzero(source >= 0).tolist():
+        item_code, warehouse, _ = rows[index]
+        prefix = "PUR-ORD" if source[index] == PURCHASE_ORDER else "MFG-WO"
+        receipts.append(Receipt(item_code, warehouse, days[index], float(qty[index]), int(source[index]),
+                                f"{prefix}-{as_of.year}-{index + 1:05d}"))
+    return receipts
+
+
+def _timelines(pair: np.ndarray, day: np.ndarray, delta: np.ndarray, kind: np.ndarray, ref: np.ndarray) -> Tuple:
+    """Events sorted into per-pair segments, same (day, kind, ref) events merged; running net and atp."""
+    # Same-day events: supply before demand
+    order = np.lexsort((ref, kind, day, pair))
+    pair, day, delta, kind, ref = pair[order], day[order], delta[order], kind[order], ref[order]
+    head = np.ones(len(pair), dtype=bool)
+    head[1:] = (pair[1:] != pair[:-1]) | (day[1:] != day[:-1]) | (kind[1:] != kind[:-1]) | (ref[1:] != ref[:-1])
+    heads = np.flatnonzero(head)
+    if len(heads) < len(pair):
+        delta = np.add.reduceat(delta, heads)
+        pair, day, kind, ref = pair[heads], day[heads], kind[heads], ref[heads]
+
+    first = np.ones(len(pair), dtype=bool)
+    first[1:] = pair[1:] != pair[:-1]
+    seg_start = np.flatnonzero(first)
+    seg_length = np.diff(np.append(seg_start, len(pair)))
+
+    # Segmented running sum: global cumsum minus the sum before the segment
+    total = np.cumsum(delta)
+    net = total - np.repeat(total[seg_start] - delta[seg_start], seg_length)
+
+    # Segmented suffix minimum by doubling: log2(longest segment) vector steps
+    ends = np.repeat(seg_start + seg_length, seg_length)
+    atp = net.copy()
+    position = np.arange(len(atp))
+    step = 1
+    while step < max(int(seg_length.max(initial=0)), 1):
+        ahead = position + step
+        inside = ahead < ends
+        atp[inside] = np.minimum(atp[inside], atp[ahead[inside]])
+        step *= 2
+    return pair[seg_start], seg_start, seg_length, day, delta, kind, ref, net, atp
+
+
+class AtpIndex:
+    """Cumulative supply/demand timelines of every (item, warehouse) pair in flat sorted arrays."""
+
+    def __init__(self, stock: Mapping[str, Any], as_of: date, receipts: Sequence[Receipt] = (),
+                 deltas: Sequence[AtpDelta] = ()):
+        self.as_of = np.datetime64(as_of.isoformat(), "D")
+        self.pairs: Dict[Tuple[str, str], int] = {}
+        self.refs: List[Optional[str]] = [None]
+        pair, day, delta, kind, ref = [], [], [], [], []
+        today = int(self.as_of.astype(np.int64))
+
+        def add(key: Tuple[str, str], when: int, qty: float, source: int, ref_index: int = 0) -> None:
+            pair.append(self.pairs.setdefault(key, len(self.pairs)))
+            day.append(when)
+            delta.append(qty)
+            kind.append(source)
+            ref.append(ref_index)
+
+        for item in stock["items"]:
+            for row in item["warehouses"]:
+                key = (item["item_code"], row["warehouse"])
+                add(key, today, float(row["stock"]), STOCK)
+                if row.get("reserved"):
+                    add(key, today, -float(row["reserved"]), DEMAND)
+        for receipt in receipts:
+            self.refs.append(receipt.ref)
+            when = max(int(np.datetime64(receipt.date, "D").astype(np.int64)), today)
+            add((receipt.item_code, receipt.warehouse), when, float(receipt.qty), receipt.source, len(self.refs) - 1)
+        events = zip((np.array(pair, dtype=np.int64), np.array(day, dtype=np.int64).astype("datetime64[D]"),
+                      np.array(delta, dtype=float), np.array(kind, dtype=np.int8), np.array(ref, dtype=np.int64)), self._delta_events(deltas))
+        _, seg_start, seg_length, *columns = _timelines(*(np.concatenate(column) for column in events))
+        self.day, self.delta, self.kind, self.ref, self.net, self.atp = columns
+        self.starts = seg_start.astype(np.int64)
+        self.lengths = seg_length.astype(np.int64)
+        self.capacity = self.lengths.copy()  # slot per pair: [start, start + capacity)
+        self.end = len(self.day)             # first free position
+        self.stale = 0                       # positions left behind by moved segments
+
+    def _delta_events(self, deltas: Sequence[AtpDelta]) -> Tuple[np.ndarray, ...]:
+        """Timeline events (pair, day, delta, kind, ref) of reservations and consumptions."""
+        unknown = {change.kind for change in deltas} - {RESERVE, CONSUME}
+        if unknown:
+            raise ValueError(f"Unknown ATP delta kind {sorted(unknown)[0]!r}")
+        pair = np.array([self.pairs.setdefault((change.item_code, change.warehouse), len(self.pairs))
+                         for change in deltas], dtype=np.int64)
+        qty = np.array([change.qty for change in deltas], dtype=float)
+        reserve = np.array([change.kind == RESERVE for change in deltas], dtype=bool)
+        when = np.array([change.date or "NaT" for change in deltas], dtype="datetime64[D]")
+        dated = ~np.isnat(when)
+        when = np.maximum(np.where(dated, when, self.as_of), self.as_of)
+
+        # RESERVE: demand on its date; CONSUME: stock out today, plus the filled reservation back on its date
+        consume = ~reserve
+        filled = consume & dated
+        kind = np.concatenate((np.full(reserve.sum(), DEMAND), np.full(consume.sum(), STOCK),
+                               np.full(filled.sum(), DEMAND))).astype(np.int8)
+        return (np.concatenate((pair[reserve], pair[consume], pair[filled])),
+                np.concatenate((when[reserve], np.full(consume.sum(), self.as_of), when[filled])),
+                np.concatenate((-qty[reserve], -qty[consume], qty[filled])),
+                kind, np.zeros(len(kind), dtype=np.int64))
+
+    def positions(self, pairs: np.ndarray) -> np.ndarray:
+        """Array positions of the pairs' events, segment after segment."""
+        lengths = self.lengths[pairs]
+        offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(self.starts[pairs], lengths) + offsets
+
+    def apply(self, deltas: Sequence[AtpDelta]) -> np.ndarray:
+        """Apply reservations / consumptions as one batch, recomputing only the touched pairs (returned)."""
+        new_pair, *new_columns = self._delta_events(deltas)
+        added = len(self.pairs) - len(self.starts)
+        if added:
+            self.starts = np.concatenate((self.starts, np.full(added, self.end, dtype=np.int64)))
+            self.lengths = np.concatenate((self.lengths, np.zeros(added, dtype=np.int64)))
+            self.capacity = np.concatenate((self.capacity, np.zeros(added, dtype=np.int64)))
+        touched = np.unique(new_pair)
+        if not len(touched):
+            return touched
+
+        old = self.positions(touched)
+        old_columns = (self.day[old], self.delta[old], self.kind[old], self.ref[old])
+        pair, seg_start, seg_length, *columns = _timelines(
+            np.concatenate((np.repeat(touched, self.lengths[touched]), new_pair)),
+            *(np.concatenate(column) for column in zip(old_columns, new_columns)))
+
+        # Segments that outgrow their slot move to the end, with room to double
+        moved = seg_length > self.capacity[pair]
+        if moved.any():
+            capacity = 2 * seg_length[moved]
+            self._reserve(self.end + int(capacity.sum()))
+            self.stale += int(self.capacity[pair[moved]].sum())
+            self.starts[pair[moved]] = self.end + np.cumsum(capacity) - capacity
+            self.capacity[pair[moved]] = capacity
+            self.end += int(capacity.sum())
+        self.lengths[pair] = seg_length
+
+        target = self.positions(pair)
+        for name, values in zip(COLUMNS, columns):
+            getattr(self, name)[target] = values
+        if self.stale * 2 > self.end:
+            self._compact()
+        return pair
+
+    def _reserve(self, size: int) -> None:
+        """Grow the event arrays, at least doubling, to hold size positions."""
+        if size <= len(self.day):
+            return
+        grown = max(size, 2 * len(self.day))
+        for name in COLUMNS:
+            values = getattr(self, name)
+            setattr(self, name, np.concatenate((values, np.zeros(grown - len(values), dtype=values.dtype))))
+
+    def _compact(self) -> None:
+        """Drop stale positions: segments back to back in pair order, slots trimmed to their lengths."""
+        keep = self.positions(np.arange(len(self.starts)))
+        for name in COLUMNS:
+            setattr(self, name, getattr(self, name)[keep])
+        self.starts = np.cumsum(self.lengths) - self.lengths
+        self.capacity = self.lengths.copy()
+        self.end = len(self.day)
+        self.stale = 0
+
+    def pair_index(self, item_code: str, warehouse: str) -> int:
+        """Pair position, or NO_PAIR when nothing is stocked or expected there."""
+        return self.pairs.get((item_code, warehouse), NO_PAIR)
+
+    def search(self, pairs: np.ndarray, qty: np.ndarray) -> np.ndarray:
+        """Index of the first event from which atp >= qty, per query; -1 when never (vectorized bisection)."""
+        if not len(self.starts):
+            return np.full(len(pairs), -1, dtype=np.int64)
+        known = pairs >= 0
+        lo = np.where(known, self.starts[np.maximum(pairs, 0)], 0)
+        end = np.where(known, lo + self.lengths[np.maximum(pairs, 0)], lo)
+        hi = end.copy()
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            covered = self.atp[np.where(active, mid, 0)] >= qty - EPSILON
+            hi = np.where(active & covered, mid, hi)
+            lo = np.where(active & ~covered, mid + 1, lo)
+        return np.where(lo < end, lo, -1)
+
+    def promisable(self, pairs: np.ndarray, on: np.datetime64) -> np.ndarray:
+        """Qty promisable from `on` without breaking later demand, per pair (0 before supply / for NO_PAIR)."""
+        if not len(self.starts):
+            return np.zeros(len(pairs))
+        known = pairs >= 0
+        lo = np.where(known, self.starts[np.maximum(pairs, 0)], 0)
+        first = lo.copy()
+        hi = np.where(known, lo + self.lengths[np.maximum(pairs, 0)], lo)
+        while True:  # first event after `on`
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            after = self.day[np.where(active, mid, 0)] > on
+            hi = np.where(active & after, mid, hi)
+            lo = np.where(active & ~after, mid + 1, lo)
+        return np.where(lo > first, np.maximum(self.atp[np.maximum(lo - 1, 0)], 0.0), 0.0)
+
+    def earliest(self, item_code: str, warehouse: str, qty: float) -> Optional[np.datetime64]:
+        """Earliest date qty is covered at one pair, or None."""
+        found = self.search(np.array([self.pair_index(item_code, warehouse)]), np.array([float(qty)]))[0]
+        return self.day[found] if found >= 0 else None
+
+    def allocate(self, pairs: np.ndarray, qty: np.ndarray, groups: np.ndarray) -> AtpAllocation:
+        """Earliest covering date and supply sources per line; lines sharing a group + pair stack up."""
+        pairs, qty, groups = np.asarray(pairs, np.int64), np.asarray(qty, float), np.asarray(groups, np.int64)
+        # Cumulative qty per (group, pair), in line order
+        order = np.lexsort((np.arange(len(pairs)), pairs, groups))
+        sorted_qty = qty[order]
+        running = np.cumsum(sorted_qty)
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (groups[order][1:] != groups[order][:-1]) | (pairs[order][1:] != pairs[order][:-1])
+        base = (running - sorted_qty)[first][np.cumsum(first) - 1]
+        upto = np.empty(len(qty))
+        upto[order] = running - base
+        since = upto - qty
+
+        found = self.search(pairs, upto)
+        available = np.where(found >= 0, self.day[np.maximum(found, 0)], np.datetime64("NaT", "D"))
+
+        # Which supply events fill each line's slice (since, upto] of the pair's promisable qty
+        entry_line: List[int] = []
+        entry_source: List[int] = []
+        entry_qty: List[float] = []
+        entry_day: List[Any] = []
+        refs: List[Optional[str]] = []
+        covered = np.zeros(len(qty))
+        atp = self.atp
+        for line, pair in enumerate(pairs.tolist()):
+            if pair < 0:
+                continue
+            start = int(self.starts[pair])
+            stop = int(found[line]) + 1 if found[line] >= 0 else start + int(self.lengths[pair])
+            floor = 0.0
+            for event in range(start, stop):
+                level = atp[event]
+                part = min(level, upto[line]) - max(floor, since[line])
+                if part > EPSILON:
+                    kind = int(self.kind[event])
+                    entry_line.append(line)
+                    entry_source.append(STOCK if kind == DEMAND else kind)
+                    entry_qty.append(part)
+                    entry_day.append(self.day[event])
+                    refs.append(self.refs[self.ref[event]])
+                    covered[line] += part
+                floor = max(floor, level)
+        return AtpAllocation(available, covered, np.array(entry_line, dtype=np.int64),
+                             np.array(entry_source, dtype=np.int8), np.array(entry_qty),
+                             np.array(entry_day, dtype="datetime64[D]"), refs)
@@ -0,0 +1,325 @@
+"""
+Synthetic ERP Catalog Generator
+
+Seeded, NumPy-vectorized generator for production-sized mock data:
+- Warehouses (the five real "- SD" warehouses plus regional ones)
+- Items with Zipf-like popularity and lognormal unit prices
+- Stock rows: each item stocked in 1..N warehouses, lognormal on-hand qty,
+  a reserved fraction per row
+- Sales orders: Zipf customers, dates spread over a window, 1..N lines drawn
+  by item popularity from warehouses that actually stock the item
+
+Every array is drawn in one batch call; only the final JSON assembly loops.
+The output is a CatalogBlobs of pre-serialized bodies in the same shapes as
+tests/mocks/otp.py, ready for tests/mocks/routes.py or tests/stub/server.py.
+
+Usage:
+    catalog = Catalog.generate(CatalogSpec(sales_orders=50_000, items=30_000, seed=7))
+    blobs = catalog.blobs()
+    python -m tests.mocks.catalog --orders 50000 --items 30000 --seed 7 --out /tmp/catalog
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple
+
+import numpy as np
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+
+REAL_WAREHOUSES = [
+    "Stores - SD",
+    "Finished Goods - SD",
+    "Goods In Transit - SD",
+    "Work In Progress - SD",
+    "All Warehouses - SD",
+]
+REGIONS = ["North", "South", "East", "West", "Central", "Harbor", "Airport", "Metro"]
+
+ITEM_FAMILIES = ["WIDGET", "COMPONENT", "GEAR", "BEARING", "VALVE", "SENSOR", "CABLE", "BRACKET",
+                 "MOTOR", "PUMP", "FILTER", "SWITCH", "PANEL", "SPRING", "HOUSING", "SEAL"]
+ITEM_GRADES = ["Standard", "Premium", "Heavy Duty", "Compact", "Industrial", "Precision", "Basic", "Pro"]
+CUSTOMER_STEMS = ["Acme", "Beta", "Gamma", "Delta", "Orion", "Vertex", "Summit", "Atlas", "Nova",
+                  "Pioneer", "Zenith", "Apex", "Harbor", "Crescent", "Evergreen", "Titan"]
+CUSTOMER_SUFFIXES = ["Corporation", "LLC", "Industries", "Trading", "Holdings", "Supply", "Group", "Ltd"]
+SO_STATUSES = ["Draft", "To Deliver and Bill", "To Deliver", "To Bill", "On Hold"]
+SO_STATUS_WEIGHTS = [0.35, 0.4, 0.1, 0.1, 0.05]
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    """Sizes and distribution knobs for one generated catalog."""
+
+    sales_orders: int = 20_000
+    items: int = 20_000
+    warehouses: int = 24
+    customers: int = 1_500
+    seed: int = 2026
+    start_date: date = date(2026, 1, 1)
+    window_days: int = 120
+    max_lines: int = 12
+    max_warehouses_per_item: int = 6
+    popularity_skew: float = 1.1     # Zipf exponent for item/customer popularity
+
+
+class CatalogBlobs(NamedTuple):
+    """Pre-serialized response bodies for a catalog."""
+
+    sales_orders_list: bytes               # GET /otp/sales-orders
+    sales_order_details: Dict[str, bytes]  # GET /otp/sales-orders/{id}
+    items: bytes                           # GET /otp/items
+    item_search: bytes                     # GET /api/items/search?query=
+    stock: bytes                           # MOCK_STOCK_DATA shape
+
+
+def zipf_weights(n: int, skew: float) -> np.ndarray:
+    """Normalized 1/rank^skew weights (rank 1 is the most popular)."""
+    weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** skew
+    return weights / weights.sum()
+
+
+def _serialize(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class Catalog:
+    """Column arrays for one synthetic catalog; JSON is built on demand."""
+
+    def __init__(self, spec: CatalogSpec):
+        self.spec = spec
+        rng = np.random.default_rng(spec.seed)
+
+        # Warehouses ------------------------------------------------------
+        regional = [f"{region} DC {n:02d} - SD" for n in range(1, spec.warehouses) for region in REGIONS]
+        self.warehouse_names = np.array((REAL_WAREHOUSES + regional)[:max(spec.warehouses, 1)], dtype=object)
+        n_wh = len(self.warehouse_names)
+        warehouse_weights = zipf_weights(n_wh, 0.8)
+
+        # Items -----------------------------------------------------------
+        n_items = spec.items
+        families = rng.integers(0, len(ITEM_FAMILIES), n_items)
+        grades = rng.integers(0, len(ITEM_GRADES), n_items)
+        numbers = np.arange(1, n_items + 1)
+        self.item_codes = np.array(
+            [f"{ITEM_FAMILIES[f]}-{n:06d}" for f, n in zip(families, numbers)], dtype=object)
+        self.item_names = np.array(
+            [f"{ITEM_GRADES[g]} {ITEM_FAMILIES[f].title()} {n}" for f, g, n in zip(families, grades, numbers)],
+            dtype=object)
+        self.item_prices = np.round(rng.lognormal(mean=3.5, sigma=1.0, size=n_items), 2)
+        # Popularity is a random permutation of Zipf ranks, so hot items are
+        # spread across families instead of clustering at low item numbers
+        self.item_weights = zipf_weights(n_items, spec.popularity_skew)[rng.permutation(n_items)]
+
+        # Stock rows (CSR by item: rows of item i are stock_offsets[i]:stock_offsets[i+1])
+        per_item = np.minimum(rng.geometric(0.55, n_items), min(spec.max_warehouses_per_item, n_wh))
+        self.stock_offsets = np.concatenate(([0], np.cumsum(per_item)))
+        n_rows = int(self.stock_offsets[-1])
+        self.stock_item = np.repeat(np.arange(n_items), per_item)
+        # Distinct warehouses per item: sort random keys biased by warehouse weight
+        keys = rng.random((n_items, n_wh)) ** (1.0 / (warehouse_weights * n_wh))
+        ranked = np.argsort(-keys, axis=1)
+        slot = np.arange(n_rows) - np.repeat(self.stock_offsets[:-1], per_item)
+        self.stock_warehouse = ranked[self.stock_item, slot]
+        self.stock_actual = np.floor(rng.lognormal(mean=3.0, sigma=1.2, size=n_rows)).astype(np.int64)
+        # A third of rows have nothing reserved; the rest reserve a beta fraction
+        reserved_share = rng.beta(2, 5, n_rows) * (rng.random(n_rows) > 0.33)
+        self.stock_reserved = np.floor(self.stock_actual * reserved_share).astype(np.int64)
+
+        # Customers & sales orders ---------------------------------------
+        stems = rng.integers(0, len(CUSTOMER_STEMS), spec.customers)
+        suffixes = rng.integers(0, len(CUSTOMER_SUFFIXES), spec.customers)
+        self.customer_names = np.array(
+            [f"{CUSTOMER_STEMS[s]} {CUSTOMER_SUFFIXES[x]} {i + 1:04d}" for i, (s, x) in enumerate(zip(stems, suffixes))],
+            dtype=object)
+
+        n_so = spec.sales_orders
+        self.so_names = np.array([f"SAL-ORD-2026-{n:05d}" for n in range(1, n_so + 1)], dtype=object)
+        self.so_customer = rng.choice(spec.customers, n_so, p=zipf_weights(spec.customers, spec.popularity_skew))
+        self.so_day = np.sort(rng.integers(0, spec.window_days, n_so))  # numbered in date order
+        self.so_lead_days = 3 + np.round(rng.gamma(2.0, 4.0, n_so)).astype(np.int64)
+        self.so_status = rng.choice(len(SO_STATUSES), n_so, p=SO_STATUS_WEIGHTS)
+
+        lines = np.minimum(1 + rng.poisson(2.5, n_so), spec.max_lines)
+        self.line_offsets = np.concatenate(([0], np.cumsum(lines)))
+        n_lines = int(self.line_offsets[-1])
+        self.line_item = rng.choice(n_items, n_lines, p=self.item_weights)
+        # Pick one of the item's stock rows, so every line has a real stock row
+        row_counts = per_item[self.line_item]
+        self.line_stock_row = self.stock_offsets[self.line_item] + np.floor(
+            rng.random(n_lines) * row_counts).astype(np.int64)
+        self.line_qty = np.maximum(1, np.round(rng.lognormal(1.5, 0.9, n_lines))).astype(np.int64)
+
+        line_totals = self.line_qty * self.item_prices[self.line_item]
+        self.so_item_count = lines
+        self.so_total_qty = np.add.reduceat(self.line_qty, self.line_offsets[:-1])
+        self.so_grand_total = np.round(np.add.reduceat(line_totals, self.line_offsets[:-1]), 2)
+
+    @classmethod
+    def generate(cls, spec: CatalogSpec = CatalogSpec()) -> "Catalog":
+        return cls(spec)
+
+    # ------------------------------------------------------------------
+    # Payloads (shapes match tests/mocks/otp.py)
+    # ------------------------------------------------------------------
+
+    def _date(self, day: int) -> str:
+        return (self.spec.start_date + timedelta(days=int(day))).isoformat()
+
+    def sales_orders_list(self) -> Dict[str, Any]:
+        orders = [
+            {
+                "name": name,
+                "customer": self.customer_names[customer],
+                "customer_name": self.customer_names[customer],
+                "so_date": self._date(day),
+                "transaction_date": self._date(day),
+                "delivery_date": self._date(day + lead),
+                "item_count": int(count),
+                "total_qty": int(qty),
+                "grand_total": float(total),
+                "status": SO_STATUSES[status],
+            }
+            for name, customer, day, lead, count, qty, total, status in zip(
+                self.so_names, self.so_customer, self.so_day, self.so_lead_days,
+                self.so_item_count, self.so_total_qty, self.so_grand_total, self.so_status)
+        ]
+        return {"sales_orders": orders, "total": len(orders), "limit": len(orders), "offset": 0}
+
+    def sales_order_details(self, index: int) -> Dict[str, Any]:
+        name = self.so_names[index]
+        customer = self.customer_names[self.so_customer[index]]
+        start, end = self.line_offsets[index], self.line_offsets[index + 1]
+        items = []
+        for position, line in enumerate(range(start, end), start=1):
+            item, row = self.line_item[line], self.line_stock_row[line]
+            actual, reserved = int(self.stock_actual[row]), int(self.stock_reserved[row])
+            items.append({
+                "name": f"{name}-{position:04d}",
+                "item_code": self.item_codes[item],
+                "item_name": self.item_names[item],
+                "description": f"{self.item_names[item]} ({self.item_codes[item]})",
+                "qty": int(self.line_qty[line]),
+                "uom": "NOS",
+                "warehouse": self.warehouse_names[self.stock_warehouse[row]],
+                "stock_actual": actual,
+                "stock_reserved": reserved,
+                "stock_available": actual - reserved,
+            })
+        day = self.so_day[index]
+        return {
+            "name": name,
+            "sales_order_id": name,
+            "customer": customer,
+            "customer_name": customer,
+            "transaction_date": self._date(day),
+            "delivery_date": self._date(day + self.so_lead_days[index]),
+            "status": SO_STATUSES[self.so_status[index]],
+            "items": items,
+            "defaults": {"warehouse": DEFAULT_WAREHOUSE, "delivery_mode": "LATEST_ACCEPTABLE"},
+        }
+
+    def stock_data(self) -> Dict[str, Any]:
+        items = []
+        for item in range(len(self.item_codes)):
+            rows = range(self.stock_offsets[item], self.stock_offsets[item + 1])
+            items.append({
+                "item_code": self.item_codes[item],
+                "item_name": self.item_names[item],
+                "warehouses": [
+                    {
+                        "warehouse": self.warehouse_names[self.stock_warehouse[row]],
+                        "stock": int(self.stock_actual[row]),
+                        "reserved": int(self.stock_reserved[row]),
+                        "available": int(self.stock_actual[row] - self.stock_reserved[row]),
+                    }
+                    for row in rows
+                ],
+            })
+        return {"items": items}
+
+    def item_search_items(self) -> List[Dict[str, str]]:
+        return [{"item_code": code, "item_name": name} for code, name in zip(self.item_codes, self.item_names)]
+
+    def blobs(self) -> CatalogBlobs:
+        """Serialize every endpoint body once."""
+        return CatalogBlobs(
+            sales_orders_list=_serialize(self.sales_orders_list()),
+            sales_order_details={
+                name: _serialize(self.sales_order_details(index)) for index, name in enumerate(self.so_names)
+            },
+            items=_serialize(list(self.item_codes)),
+            item_search=_serialize({"items": self.item_search_items()}),
+            stock=_serialize(self.stock_data()),
+        )
+
+
+# ----------------------------------------------------------------------
+# Blob files: one JSON file per endpoint, details as JSON lines
+# ----------------------------------------------------------------------
+
+BLOB_FILES = {
+    "sales_orders_list": "sales_orders.json",
+    "items": "items.json",
+    "item_search": "item_search.json",
+    "stock": "stock.json",
+}
+DETAILS_FILE = "sales_order_details.jsonl"
+
+
+def write_blobs(blobs: CatalogBlobs, directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    for field, filename in BLOB_FILES.items():
+        with open(os.path.join(directory, filename), "wb") as handle:
+            handle.write(getattr(blobs, field))
+    with open(os.path.join(directory, DETAILS_FILE), "wb") as handle:
+        for body in blobs.sales_order_details.values():
+            handle.write(body + b"\n")
+
+
+def load_blobs(directory: str) -> CatalogBlobs:
+    """Load blobs written by write_blobs (bodies are served as-is)."""
+    fields = {}
+    for field, filename in BLOB_FILES.items():
+        with open(os.path.join(directory, filename), "rb") as handle:
+            fields[field] = handle.read()
+    details = {}
+    with open(os.path.join(directory, DETAILS_FILE), "rb") as handle:
+        for line in handle:
+            body = line.rstrip(b"\n")
+            details[json.loads(body)["name"]] = body
+    return CatalogBlobs(sales_order_details=details, **fields)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic OTP catalog as JSON blobs")
+    parser.add_argument("--orders", type=int, default=CatalogSpec.sales_orders)
+    parser.add_argument("--items", type=int, default=CatalogSpec.items)
+    parser.add_argument("--warehouses", type=int, default=CatalogSpec.warehouses)
+    parser.add_argument("--customers", type=int, default=CatalogSpec.customers)
+    parser.add_argument("--seed", type=int, default=CatalogSpec.seed)
+    parser.add_argument("--out", required=True, help="Directory for the blob files")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    catalog = Catalog.generate(CatalogSpec(sales_orders=args.orders, items=args.items,
+                                           warehouses=args.warehouses, customers=args.customers, seed=args.seed))
+    generated = time.perf_counter()
+    blobs = catalog.blobs()
+    serialized = time.perf_counter()
+    write_blobs(blobs, args.out)
+
+    size_mb = sum(len(getattr(blobs, field)) for field in BLOB_FILES) / 1e6
+    size_mb += sum(len(body) for body in blobs.sales_order_details.values()) / 1e6
+    print(f"{args.orders} sales orders, {args.items} items, {len(catalog.stock_actual)} stock rows, "
+          f"{int(catalog.line_offsets[-1])} order lines -> {args.out} ({size_mb:.1f} MB)")
+    print(f"generate {generated - start:.2f}s, serialize {serialized - generated:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Indexed Item Search for GET /api/items/search
+
+Contract (used by useItemSearch and both Python mocks):
+- Query: query (case-insensitive substring of item_code or item_name),
+  limit (page size, 1..500)
+- Ranking: item codes starting with the query first (in code order), then
+  every other match (in catalog order)
+- Response: {"items": [{"item_code", "item_name"}, ...], "limit": L,
+  "has_more": bool}
+- Without limit every match is returned, so old clients keep working
+
+The index is built once:
+- Sorted lowercase item codes: a prefix query is a bisect (a flattened trie)
+- Trigram posting lists over "item_code\\nitem_name": a query of 3+ chars
+  only checks the items holding its rarest trigram
+- Queries of 1-2 chars match most of the catalog, so a scan that stops at
+  limit + 1 matches is already short
+
+POST /api/items/validate checks many codes at once (validate_item_codes):
+- Body: {"item_codes": ["WIDGET-ALPHA", ...]} (1..500 codes)
+- Response: {"results": {"WIDGET-ALPHA": {"valid": true},
+  "NOPE": {"valid": false, "error": "Item not found"}}}
+
+Usage:
+    index = ItemSearchIndex(MOCK_STOCK_DATA["items"])
+    status, body = index.respond({"query": "widg", "limit": "20"})
+    validate_item_codes(["WIDGET-ALPHA", "NOPE"], known_codes)
+"""
+
+import json
+from array import array
+from bisect import bisect_left
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from tests.mocks.sales_order_pages import parse_limit
+
+GRAM = 3
+MAX_VALIDATE_CODES = 500
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class ItemSearchIndex:
+    """Prefix + trigram index over item codes and names."""
+
+    def __init__(self, items: Iterable[Mapping[str, Any]]):
+        self.rows: List[bytes] = []
+        self.texts: List[str] = []
+        codes: List[str] = []
+        for item in items:
+            code, name = str(item["item_code"]), str(item.get("item_name") or "")
+            self.rows.append(json.dumps({"item_code": code, "item_name": name}).encode("utf-8"))
+            self.texts.append(f"{code}\n{name}".lower())
+            codes.append(code.lower())
+
+        order = sorted(range(len(codes)), key=codes.__getitem__)
+        self.sorted_codes = [codes[i] for i in order]
+        self.sorted_ids = array("i", order)
+
+        postings: Dict[str, List[int]] = {}
+        for item_id, text in enumerate(self.texts):
+            for gram in trigrams(text):
+                postings.setdefault(gram, []).append(item_id)
+        self.postings: Dict[str, array] = {gram: array("i", ids) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _prefix_ids(self, query: str) -> Iterable[int]:
+        for position in range(bisect_left(self.sorted_codes, query), len(self.sorted_codes)):
+            if not self.sorted_codes[position].startswith(query):
+                return
+            yield self.sorted_ids[position]
+
+    def _substring_ids(self, query: str) -> Iterable[int]:
+        candidates: Iterable[int] = range(len(self.texts))
+        if len(query) >= GRAM:
+            # A missing trigram is an empty posting list: no match at all
+            candidates = min((self.postings.get(gram, ()) for gram in trigrams(query)), key=len)
+        texts = self.texts
+        return (item_id for item_id in candidates if query in texts[item_id])
+
+    def search(self, query: str, limit: Optional[int] = None) -> Tuple[List[int], bool]:
+        """Ids of matching items (ranked) and whether more than limit matched."""
+        query = query.strip().lower()
+        if not query:
+            shown = len(self.rows) if limit is None else min(limit, len(self.rows))
+            return list(range(shown)), shown < len(self.rows)
+
+        wanted = len(self.rows) + 1 if limit is None else limit + 1
+        found: List[int] = []
+        seen: Set[int] = set()
+        for source in (self._prefix_ids(query), self._substring_ids(query)):
+            for item_id in source:
+                if item_id not in seen:
+                    seen.add(item_id)
+                    found.append(item_id)
+                    if len(found) == wanted:
+                        return found[:-1], True
+        return found, False
+
+    def linear_search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Unindexed reference: a full scan, as the stub did before the index."""
+        query = query.strip().lower()
+        matches = [item_id for item_id, text in enumerate(self.texts) if query in text]
+        return matches if limit is None else matches[:limit]
+
+    def body(self, query: str, limit: Optional[int] = None) -> bytes:
+        ids, has_more = self.search(query, limit)
+        tail = {"limit": len(ids) if limit is None else limit, "has_more": has_more}
+        return (b'{"items": [' + b", ".join(self.rows[i] for i in ids) + b"], "
+                + json.dumps(tail).encode("utf-8")[1:])
+
+    def respond(self, query: Mapping[str, str]) -> Tuple[int, bytes]:
+        """(status, body) for a request's query parameters; 400 for bad input."""
+        try:
+            body = self.body(query.get("query", ""), parse_limit(query.get("limit", "")))
+        except ValueError as error:
+            return 400, json.dumps({"detail": str(error)}).encode("utf-8")
+        return 200, body
+
+
+def validate_item_codes(item_codes: Any, known: Collection[str]) -> Dict[str, Any]:
+    """Batch validation response; ValueError for a malformed item_codes list."""
+    if not isinstance(item_codes, list) or not item_codes:
+        raise ValueError("item_codes: a non-empty list of item codes is required")
+    if len(item_codes) > MAX_VALIDATE_CODES:
+        raise ValueError(f"item_codes: at most {MAX_VALIDATE_CODES} codes per request")
+    if not all(isinstance(code, str) for code in item_codes):
+        raise ValueError("item_codes: every item code must be a string")
+    return {"results": {
+        code: {"valid": True} if code in known else {"valid": False, "error": "Item not found"}
+        for code in item_codes
+    }}
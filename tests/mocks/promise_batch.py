@@ -0,0 +1,86 @@
+"""
+Batch Promise Evaluation for POST /otp/promise/batch
+
+Contract (used by otpClient.evaluatePromiseBatch, the stub and the route
+mocks):
+- Body: {"orders": [{"sales_order_id": "SAL-ORD-2026-00001"}, ...],
+  "rules": {...}, "desired_date": "YYYY-MM-DD"} (1..500 orders)
+- An order may carry its own "items" (otherwise the backend loads the Sales
+  Order lines), "desired_date" and "rules" (merged over the batch rules)
+- Response: application/x-ndjson, one line per order as soon as it is
+  evaluated (completion order, not request order):
+  {"index": 0, "sales_order_id": "...", "status": 200, "result": {...}}
+  {"index": 3, "sales_order_id": "...", "status": 404, "error": "..."}
+  "result" is a PromiseEvaluateResponse
+- A malformed body is rejected with 422 before streaming starts
+
+Usage:
+    orders = parse_batch(payload)
+    request = order_request(orders[0], payload, details)  # PromiseEvaluateRequest or None
+    line = result_line(0, "SAL-ORD-2026-00001", 200, result=response)
+    results = parse_lines(body)
+"""
+
+import json
+from typing import Any, Dict, List, Mapping, Optional
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+
+MAX_BATCH_ORDERS = 500
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def parse_batch(payload: Any) -> List[Dict[str, Any]]:
+    """The orders of a batch body; ValueError for a malformed one."""
+    if not isinstance(payload, dict):
+        raise ValueError("body: a JSON object is required")
+    orders = payload.get("orders")
+    if not isinstance(orders, list) or not orders:
+        raise ValueError("orders: a non-empty list of {sales_order_id} is required")
+    if len(orders) > MAX_BATCH_ORDERS:
+        raise ValueError(f"orders: at most {MAX_BATCH_ORDERS} orders per request")
+    for order in orders:
+        if not isinstance(order, dict) or not isinstance(order.get("sales_order_id"), str):
+            raise ValueError("orders: every order needs a sales_order_id string")
+        if "items" in order and not isinstance(order["items"], list):
+            raise ValueError("orders: items must be a list")
+    return orders
+
+
+def order_request(order: Mapping[str, Any], batch: Mapping[str, Any],
+                  details: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """PromiseEvaluateRequest for one order, or None when its lines are unknown."""
+    items = order.get("items")
+    if items is None:
+        if details is None:
+            return None
+        warehouse = (details.get("defaults") or {}).get("warehouse") or DEFAULT_WAREHOUSE
+        items = [
+            {"item_code": line["item_code"], "qty": line["qty"], "warehouse": line.get("warehouse") or warehouse}
+            for line in details.get("items", [])
+        ]
+    request: Dict[str, Any] = {
+        "customer": (details or {}).get("customer_name") or (details or {}).get("customer"),
+        "items": items,
+        "rules": {**(batch.get("rules") or {}), **(order.get("rules") or {})},
+        "sales_order_id": order["sales_order_id"],
+    }
+    desired_date = order.get("desired_date") or batch.get("desired_date") or (details or {}).get("delivery_date")
+    if desired_date:
+        request["desired_date"] = desired_date
+    return request
+
+
+def result_line(index: int, sales_order_id: str, status: int,
+                result: Any = None, error: Optional[str] = None) -> bytes:
+    """One NDJSON line (newline included)."""
+    line: Dict[str, Any] = {"index": index, "sales_order_id": sales_order_id, "status": status}
+    if result is not None:
+        line["result"] = result
+    if error is not None:
+        line["error"] = error
+    return json.dumps(line).encode("utf-8") + b"\n"
+
+
+def parse_lines(body: bytes) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in body.splitlines() if line.strip()]
@@ -0,0 +1,101 @@
+"""
+Promise Result Cache for POST /otp/promise
+
+Re-clicking "Evaluate Promise" on an unchanged order sends the same request
+again. Results are cached under a canonical hash of what decides the
+promise:
+- items: item_code + warehouse (default DEFAULT_WAREHOUSE) + qty, sorted, so
+  line order does not matter
+- rules: merged over the backend defaults, so omitted and default values
+  give the same key
+- desired_date
+customer and sales_order_id are UI context and are not part of the key.
+
+Entries expire after a TTL and are dropped when the stock version moves on
+(the stub bumps it on POST /otp/apply). Responses carry "stock_version" and,
+when served from the cache, "cached": true. otpClient.ts keeps the matching
+client-side cache (canonicalPromiseRequest).
+
+Usage:
+    cache = PromiseCache(ttl_s=30)
+    key = promise_cache_key(payload)
+    response = cache.get(key, stock_version) or compute(payload)
+    cache.put(key, stock_version, response)
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+
+DEFAULT_TTL_S = 30.0
+DEFAULT_MAX_ENTRIES = 1_000
+
+# Backend defaults (PromiseRules in src/lib/api/types.ts)
+DEFAULT_RULES: Dict[str, Any] = {
+    "no_weekends": True,
+    "cutoff_time": "14:00",
+    "timezone": "UTC",
+    "lead_time_buffer_days": 1,
+    "processing_lead_time_days": 1,
+    "desired_date_mode": "LATEST_ACCEPTABLE",
+    "order_created_at": None,
+}
+
+
+def canonical_promise_request(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """The parts of a promise request that decide the result, normalized."""
+    items = sorted(
+        (str(item["item_code"]).strip(), item.get("warehouse") or DEFAULT_WAREHOUSE, float(item["qty"]))
+        for item in payload["items"]
+    )
+    given = {key: value for key, value in (payload.get("rules") or {}).items() if value not in (None, "")}
+    return {
+        "items": items,
+        "rules": {**DEFAULT_RULES, **given},
+        "desired_date": payload.get("desired_date") or None,
+    }
+
+
+def promise_cache_key(payload: Mapping[str, Any]) -> str:
+    """SHA-256 of the canonical request; KeyError/ValueError for malformed items."""
+    canonical = json.dumps(canonical_promise_request(payload), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PromiseCache:
+    """TTL + stock-version LRU of promise responses."""
+
+    def __init__(self, ttl_s: float = DEFAULT_TTL_S, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, stock_version: int) -> Optional[Any]:
+        """Cached response, or None when missing, expired or computed on older stock."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            stored_at, version, response = entry
+            if version == stock_version and self.clock() - stored_at < self.ttl_s:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return response
+            del self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, stock_version: int, response: Any) -> None:
+        self.entries[key] = (self.clock(), stock_version, response)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
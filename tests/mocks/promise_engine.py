@@ -0,0 +1,370 @@
+"""
+Reference Promise-date Engine
+
+Computes promise dates from the rules the UI sends (PromiseRules in
+src/lib/api/types.ts) instead of the fixed MOCK_PROMISE_RESPONSE_SUCCESS
+date. Whole batches of orders are evaluated at once: every date step is a
+working-day offset over arrays of lines/orders (WorkCalendar bitmaps, see
+tests/mocks/work_calendar.py), so there is no per-day Python loop.
+
+Rules:
+- Working days: the calendars in public/work-calendar.json, Friday +
+  Saturday weekends (src/lib/weekend.ts) plus plant holidays. Each line
+  uses its warehouse's calendar; the delivery buffer and the desired date
+  use the default calendar. With no_weekends=false every day counts as a
+  working day
+- Start: the order_created_at date (else today) rolled forward to a working
+  day; an order placed at or after cutoff_time on a working day starts on
+  the next working day (order_created_at is local time, timezone is echoed
+  only)
+- Line availability: enough stock at the line's warehouse -> the start day;
+  with ATP timelines (tests/mocks/atp.py) -> the first day stock, POs and
+  production cover it; array callers can also pass `available_offset`
+  working days. Otherwise a shortage and the order is CANNOT_FULFILL
+- Ship-ready: availability + processing_lead_time_days working days; the
+  order ships when its last line is ready
+- promise_date_raw: ship date + lead_time_buffer_days working days
+- desired_date_mode:
+    LATEST_ACCEPTABLE  promise = raw, late when after desired_date
+    NO_EARLY_DELIVERY  promise = desired_date (rolled to a working day)
+                       when raw is earlier; adjusted_due_to_no_early_delivery
+    STRICT_FAIL        raw after desired_date -> CANNOT_PROMISE_RELIABLY
+- Confidence: HIGH on time from stock, MEDIUM when late or waiting on
+  supply, LOW when the promise cannot be kept
+- Options (with a SplitAllocator, tests/mocks/split_allocation.py): orders
+  that are not HIGH are re-evaluated as shipped whole from the best single
+  warehouse (alternate_warehouse) and split across warehouses
+  (split_shipment); each plan that promises earlier, or fulfills a short
+  order, becomes a PromiseOption
+
+Usage:
+    engine = PromiseEngine()                        # WorkCalendar.load() of public/work-calendar.json
+    responses = engine.evaluate([payload, ...], StockIndex(MOCK_STOCK_DATA))   # PromiseEvaluateResponse dicts
+    responses = engine.evaluate([payload, ...], stock, atp=AtpIndex(MOCK_STOCK_DATA, today, receipts))
+    responses = engine.evaluate([payload, ...], stock, atp=atp, allocator=SplitAllocator(atp))   # + options
+    dates = engine.evaluate_arrays(orders, lines)   # PromiseOrders + PromiseLines -> PromiseDates
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from tests.mocks.atp import SOURCES, STOCK, AtpAllocation, AtpIndex
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+from tests.mocks.promise_cache import DEFAULT_RULES
+from tests.mocks.split_allocation import AllocationPlan, SplitAllocator
+from tests.mocks.stock import StockIndex
+from tests.mocks.work_calendar import WorkCalendar
+
+DAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+MODES = ("LATEST_ACCEPTABLE", "NO_EARLY_DELIVERY", "STRICT_FAIL")
+STATUSES = ("OK", "CANNOT_FULFILL", "CANNOT_PROMISE_RELIABLY")
+CONFIDENCES = ("HIGH", "MEDIUM", "LOW")
+NO_SUPPLY = -1  # available_offset of a line nothing can fulfill
+
+OK, CANNOT_FULFILL, CANNOT_PROMISE_RELIABLY = range(3)
+HIGH, MEDIUM, LOW = range(3)
+NAT = np.datetime64("NaT", "D")
+MAX_OPTION_WAREHOUSES = 3  # named in a split_shipment description
+
+
+class PromiseOrders(NamedTuple):
+    """One entry per order."""
+    order_date: np.ndarray       # datetime64[D]
+    after_cutoff: np.ndarray     # bool, placed at/after cutoff_time
+    no_weekends: np.ndarray      # bool
+    buffer_days: np.ndarray      # int64, lead_time_buffer_days
+    processing_days: np.ndarray  # int64, processing_lead_time_days
+    desired_date: np.ndarray     # datetime64[D], NaT when not given
+    mode: np.ndarray             # int8 index into MODES
+
+
+class PromiseLines(NamedTuple):
+    """One entry per order line."""
+    order: np.ndarray             # int64 index into PromiseOrders
+    available_offset: np.ndarray  # int64 working days until the qty is available, NO_SUPPLY for never
+    calendar: Optional[np.ndarray] = None  # int64 WorkCalendar index of the line's warehouse; None = default
+    available_date: Optional[np.ndarray] = None  # datetime64[D] supply date (ATP), NaT for never; None = start day
+
+
+class PromiseDates(NamedTuple):
+    """evaluate_arrays result; line arrays first, then order arrays."""
+    line_start: np.ndarray    # datetime64[D] per line, first processing day at the line's warehouse
+    available: np.ndarray     # datetime64[D] per line (as if in stock for NO_SUPPLY lines)
+    ship_ready: np.ndarray    # datetime64[D] per line
+    start: np.ndarray         # datetime64[D] per order
+    promise_raw: np.ndarray   # datetime64[D] per order, NaT when it cannot be fulfilled
+    promise: np.ndarray       # datetime64[D] per order, NaT when it cannot be fulfilled
+    can_fulfill: np.ndarray   # bool per order
+    late: np.ndarray          # bool per order, raw promise after desired_date
+    adjusted: np.ndarray      # bool per order, moved to desired_date (NO_EARLY_DELIVERY)
+    status: np.ndarray        # int8 index into STATUSES
+    confidence: np.ndarray    # int8 index into CONFIDENCES
+
+
+class PromiseEngine:
+    """Vectorized promise dates on the plant work calendars."""
+
+    def __init__(self, calendar: Optional[WorkCalendar] = None):
+        self.calendar = calendar or WorkCalendar.load()
+        self.default_calendar = self.calendar.index(self.calendar.default)
+
+    def offset(self, dates: np.ndarray, days: Any, no_weekends: Any, calendars: Any = None) -> np.ndarray:
+        """dates rolled forward to a working day plus `days` working days; calendar days where not no_weekends."""
+        calendars = self.default_calendar if calendars is None else calendars
+        working = self.calendar.offset(dates, days, calendars)
+        return np.where(no_weekends, working, dates + np.asarray(days, dtype="timedelta64[D]"))
+
+    def evaluate_arrays(self, orders: PromiseOrders, lines: PromiseLines) -> PromiseDates:
+        """Promise dates for every order at once."""
+        count = len(orders.order_date)
+        no_weekends = orders.no_weekends
+        start = self._start(orders.order_date, orders.after_cutoff, no_weekends, self.default_calendar)
+
+        # Each line is processed on its own warehouse's calendar
+        calendars = self.default_calendar if lines.calendar is None else lines.calendar
+        line_weekends = no_weekends[lines.order]
+        line_start = self._start(orders.order_date[lines.order], orders.after_cutoff[lines.order], line_weekends,
+                                 calendars)
+        short = lines.available_offset < 0
+        from_day = line_start
+        if lines.available_date is not None:
+            short = short | np.isnat(lines.available_date)
+            from_day = np.where(short, line_start, np.maximum(line_start, lines.available_date))
+        available = self.offset(from_day, np.maximum(lines.available_offset, 0), line_weekends, calendars)
+        ship_ready = self.offset(available, orders.processing_days[lines.order], line_weekends, calendars)
+
+        # Latest ship-ready day per order; any short line makes the order unfulfillable
+        ready_days = ship_ready.astype(np.int64)
+        ship_days = np.full(count, np.iinfo(np.int64).min)
+        np.maximum.at(ship_days, lines.order, ready_days)
+        has_lines = np.bincount(lines.order, minlength=count) > 0
+        can_fulfill = has_lines & (np.bincount(lines.order, weights=short, minlength=count) == 0)
+        waits_on_supply = np.bincount(lines.order, weights=(available > line_start) & ~short, minlength=count) > 0
+
+        ship = np.where(can_fulfill, ship_days, start.astype(np.int64)).astype("datetime64[D]")
+        promise_raw = np.where(can_fulfill, self.offset(ship, orders.buffer_days, no_weekends), NAT)
+
+        desired = orders.desired_date
+        desired_workday = self.offset(desired, 0, no_weekends)
+        late = can_fulfill & (promise_raw > desired)
+        adjusted = can_fulfill & (orders.mode == 1) & (promise_raw < desired_workday)
+        promise = np.where(adjusted, desired_workday, promise_raw)
+        strict_fail = late & (orders.mode == 2)
+
+        status = np.where(~can_fulfill, CANNOT_FULFILL, np.where(strict_fail, CANNOT_PROMISE_RELIABLY, OK))
+        confidence = np.where(~can_fulfill | strict_fail, LOW, np.where(late | waits_on_supply, MEDIUM, HIGH))
+        return PromiseDates(line_start, available, ship_ready, start, promise_raw, promise, can_fulfill, late, adjusted,
+                            status.astype(np.int8), confidence.astype(np.int8))
+
+    def _start(self, placed: np.ndarray, after_cutoff: np.ndarray, no_weekends: np.ndarray,
+               calendars: Any) -> np.ndarray:
+        """First processing day: next working day when placed after the cutoff on a working day."""
+        on_workday = self.calendar.is_working_day(placed, calendars) | ~no_weekends
+        return self.offset(placed, (after_cutoff & on_workday).astype(np.int64), no_weekends, calendars)
+
+    # ------------------------------------------------------------------
+    # PromiseEvaluateRequest / Response adapters
+    # ------------------------------------------------------------------
+
+    def evaluate(self, payloads: Sequence[Mapping[str, Any]], stock: StockIndex, today: Optional[date] = None,
+                 atp: Optional[AtpIndex] = None, allocator: Optional[SplitAllocator] = None) -> List[Dict[str, Any]]:
+        """PromiseEvaluateResponse per request; lines are fulfilled from stock, or from the ATP timelines when given.
+
+        With an allocator (over the same ATP timelines) responses carry
+        split_shipment / alternate_warehouse options.
+        """
+        today_text = (today or date.today()).isoformat()
+        order_dates, after_cutoff, no_weekends, buffer_days, processing_days, desired, modes = ([] for _ in range(7))
+        line_order: List[int] = []
+        line_qty: List[float] = []
+        line_supply: List[float] = []  # on-hand qty, or the ATP pair index
+        line_calendar: List[int] = []
+        all_rules = []
+        for index, payload in enumerate(payloads):
+            rules = {**DEFAULT_RULES, **{key: value for key, value in (payload.get("rules") or {}).items()
+                                         if value is not None}}
+            all_rules.append(rules)
+            created = rules["order_created_at"] or ""
+            order_dates.append(created[:10] or today_text)
+            after_cutoff.append(len(created) >= 16 and created[11:16] >= rules["cutoff_time"])
+            no_weekends.append(bool(rules["no_weekends"]))
+            buffer_days.append(int(rules["lead_time_buffer_days"]))
+            processing_days.append(int(rules["processing_lead_time_days"]))
+            desired.append(payload.get("desired_date") or "NaT")
+            modes.append(MODES.index(rules["desired_date_mode"]) if rules["desired_date_mode"] in MODES else 0)
+            for item in payload["items"]:
+                warehouse = item.get("warehouse") or DEFAULT_WAREHOUSE
+                line_order.append(index)
+                line_qty.append(float(item["qty"]))
+                line_calendar.append(self.calendar.warehouse_index(warehouse))
+                if atp is not None:
+                    line_supply.append(atp.pair_index(item["item_code"], warehouse))
+                else:
+                    row = stock.lookup(item["item_code"], warehouse)
+                    line_supply.append(max(float(row["stock_available"]), 0.0) if row else 0.0)
+
+        orders = PromiseOrders(
+            np.array(order_dates, dtype="datetime64[D]"), np.array(after_cutoff, dtype=bool),
+            np.array(no_weekends, dtype=bool), np.array(buffer_days, dtype=np.int64),
+            np.array(processing_days, dtype=np.int64), np.array(desired, dtype="datetime64[D]"),
+            np.array(modes, dtype=np.int8),
+        )
+        order = np.array(line_order, dtype=np.int64)
+        qty = np.array(line_qty)
+        calendars = np.array(line_calendar, dtype=np.int64)
+        if atp is not None:
+            allocation = atp.allocate(np.array(line_supply, dtype=np.int64), qty, order)
+            lines = PromiseLines(order, np.zeros(len(qty), dtype=np.int64), calendars, allocation.available_date)
+        else:
+            on_hand = np.array(line_supply)
+            covered = np.minimum(qty, on_hand)
+            used = np.flatnonzero(covered > 0)
+            allocation = AtpAllocation(np.full(len(qty), NAT), covered, used, np.full(len(used), STOCK, np.int8),
+                                       covered[used], np.full(len(used), NAT), [None] * len(used))
+            lines = PromiseLines(order, np.where(on_hand >= qty, 0, NO_SUPPLY), calendars)
+        dates = self.evaluate_arrays(orders, lines)
+        responses = self._responses(payloads, all_rules, after_cutoff, dates, allocation,
+                                    self._source_dates(orders, lines, dates, allocation))
+        if allocator is not None:
+            for payload, response in zip(payloads, responses):
+                if response["confidence"] != "HIGH":
+                    response["options"] = self._options(payload, response, stock, today, atp, allocator)
+        return responses
+
+    def _options(self, payload: Mapping[str, Any], response: Dict[str, Any], stock: StockIndex,
+                 today: Optional[date], atp: Optional[AtpIndex], allocator: SplitAllocator) -> List[Dict[str, Any]]:
+        """alternate_warehouse / split_shipment PromiseOptions whose plan promises earlier than the response."""
+        lines = [(item["item_code"], float(item["qty"])) for item in payload["items"]]
+        current = {item.get("warehouse") or DEFAULT_WAREHOUSE for item in payload["items"]}
+        preferred = next(iter(current)) if len(current) == 1 else None
+        plans = []
+        single = allocator.no_split(lines, preferred)
+        if single.date is not None and set(single.warehouses) != current:
+            plans.append(("alternate_warehouse", single))
+        split = allocator.split(lines, preferred)
+        if split.date is not None and len(split.warehouses) > 1:
+            plans.append(("split_shipment", split))
+        if not plans:
+            return []
+
+        alternatives = [{**payload, "items": self._plan_items(payload, plan)} for _, plan in plans]
+        options = []
+        for (option_type, plan), result in zip(plans, self.evaluate(alternatives, stock, today, atp)):
+            raw = result["promise_date_raw"]
+            if raw is None:
+                continue
+            if response["promise_date_raw"] is None:
+                impact = f"Fulfills the order by {raw} (currently short)"
+            else:
+                gain = int((np.datetime64(response["promise_date_raw"], "D") - np.datetime64(raw, "D")).astype(int))
+                if gain <= 0:
+                    continue
+                impact = f"Could reduce promise date by {gain} day(s), to {raw}"
+            if option_type == "alternate_warehouse":
+                description = f"Ship all {len(lines)} line(s) from {plan.warehouses[0]}"
+            else:
+                totals: Dict[str, float] = {}
+                for draws in plan.lines:
+                    for warehouse, qty in draws:
+                        totals[warehouse] = totals.get(warehouse, 0.0) + qty
+                named = [f"{qty:g} from {warehouse}" for warehouse, qty in list(totals.items())[:MAX_OPTION_WAREHOUSES]]
+                more = len(totals) - MAX_OPTION_WAREHOUSES
+                description = (f"Split across {len(totals)} warehouses: {', '.join(named)}"
+                               + (f" and {more} more" if more > 0 else ""))
+                impact += f", in {len(totals)} shipments"
+            options.append({"type": option_type, "description": description, "impact": impact, "po_id": None})
+        return options
+
+    @staticmethod
+    def _plan_items(payload: Mapping[str, Any], plan: AllocationPlan) -> List[Dict[str, Any]]:
+        """The payload's items as the plan ships them: one item per (line, warehouse) draw."""
+        return [{**item, "qty": qty, "warehouse": warehouse}
+                for item, draws in zip(payload["items"], plan.lines) for warehouse, qty in draws]
+
+    def _source_dates(self, orders: PromiseOrders, lines: PromiseLines, dates: PromiseDates,
+                      allocation: AtpAllocation) -> Any:
+        """Available and ship-ready day of every fulfillment source (supply date, not before the line's start)."""
+        line = allocation.line
+        weekends = orders.no_weekends[lines.order[line]]
+        calendars = self.default_calendar if lines.calendar is None else lines.calendar[line]
+        since = dates.line_start[line]
+        supply_day = np.where(np.isnat(allocation.date), since, np.maximum(since, allocation.date))
+        available = self.offset(supply_day, 0, weekends, calendars)
+        ready = self.offset(available, orders.processing_days[lines.order[line]], weekends, calendars)
+        return np.datetime_as_string(available).tolist(), np.datetime_as_string(ready).tolist()
+
+    def _responses(self, payloads: Sequence[Mapping[str, Any]], all_rules: List[Dict[str, Any]],
+                   after_cutoff: List[bool], dates: PromiseDates, allocation: AtpAllocation,
+                   source_dates: Any) -> List[Dict[str, Any]]:
+        source_available, source_ready = source_dates
+        supply_day = np.datetime_as_string(allocation.date).tolist()
+        start = np.datetime_as_string(dates.start).tolist()
+        promise_raw = np.datetime_as_string(dates.promise_raw).tolist()
+        promise = np.datetime_as_string(dates.promise).tolist()
+        weekend = " and ".join(DAY_NAMES[day] for day in self.calendar.weekend_days[self.calendar.default])
+        entry_lines = allocation.line.tolist()
+
+        responses = []
+        line = 0
+        entry = 0
+        for index, payload in enumerate(payloads):
+            rules = all_rules[index]
+            can_fulfill = bool(dates.can_fulfill[index])
+            plan, blockers = [], []
+            incoming = 0
+            for item in payload["items"]:
+                qty = float(item["qty"])
+                warehouse = item.get("warehouse") or DEFAULT_WAREHOUSE
+                fulfillment = []
+                while entry < len(entry_lines) and entry_lines[entry] == line:
+                    source = SOURCES[allocation.source[entry]]
+                    fulfillment.append({"source": source, "qty": float(allocation.qty[entry]),
+                                        "available_date": source_available[entry],
+                                        "ship_ready_date": source_ready[entry], "warehouse": warehouse})
+                    if source != "stock":
+                        fulfillment[-1]["expected_date"] = supply_day[entry]
+                        fulfillment[-1]["po_id"] = allocation.ref[entry] if source == "purchase_order" else None
+                        incoming += 1
+                    entry += 1
+                shortage = max(qty - float(allocation.covered[line]), 0.0)
+                if shortage > 0:
+                    blockers.append(f"{item['item_code']}: short {shortage:g} in {warehouse}")
+                plan.append({"item_code": item["item_code"], "qty_required": qty,
+                             "fulfillment": fulfillment, "shortage": shortage})
+                line += 1
+
+            reasons = [f"Processing starts {start[index]}"
+                       + (f" (ordered after the {rules['cutoff_time']} cutoff)" if after_cutoff[index] else "")]
+            if can_fulfill:
+                if incoming:
+                    reasons.append(f"{incoming} allocation(s) wait on incoming purchase orders or production")
+                reasons.append(f"{rules['processing_lead_time_days']} processing + {rules['lead_time_buffer_days']} "
+                               "buffer day(s) after the last item is available")
+                if rules["no_weekends"]:
+                    reasons.append(f"{weekend} and plant holidays are not working days")
+            desired = payload.get("desired_date") or None
+            adjusted = bool(dates.adjusted[index])
+            if adjusted:
+                reasons.append(f"Delivery held to the desired date {desired} (no early delivery)")
+            if dates.status[index] == CANNOT_PROMISE_RELIABLY:
+                blockers.append(f"Earliest date {promise_raw[index]} is after the required date {desired}")
+
+            responses.append({
+                "status": STATUSES[dates.status[index]],
+                "promise_date": promise[index] if can_fulfill else None,
+                "promise_date_raw": promise_raw[index] if can_fulfill else None,
+                "desired_date": desired,
+                "desired_date_mode": rules["desired_date_mode"],
+                "on_time": (not bool(dates.late[index])) if can_fulfill and desired else None,
+                "adjusted_due_to_no_early_delivery": adjusted,
+                "can_fulfill": can_fulfill,
+                "confidence": CONFIDENCES[dates.confidence[index]],
+                "plan": plan,
+                "reasons": reasons,
+                "blockers": blockers,
+                "options": [],
+            })
+        return responses
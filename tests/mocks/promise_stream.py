@@ -0,0 +1,89 @@
+"""
+Streaming Promise Evaluation (Server-Sent Events) for POST /otp/promise/stream
+
+Large orders wait a long time for the whole PromiseEvaluateResponse. The
+streaming variant sends each item's PromisePlan as soon as it is planned,
+then the summary.
+
+Contract (used by otpClient.evaluatePromiseStream, the stub and the route
+mocks):
+- Body: a PromiseEvaluateRequest, the same as POST /otp/promise
+- Response: text/event-stream, one "plan" event per item in request order,
+  then one "summary" event:
+    event: plan
+    data: {"index": 0, "total": 40, "plan": {PromisePlan}}
+
+    event: summary
+    data: {PromiseEvaluateResponse, including the full plan}
+- A failure after the stream has started arrives as
+    event: error
+    data: {"status": 504, "detail": "..."}
+- A malformed body is rejected with 422 before streaming starts
+
+Usage:
+    items = parse_stream_items(payload)
+    chunk = sse_event("plan", {"index": 0, "total": 1, "plan": plan_entry(item, stock.lookup(code, wh), day)})
+    events = parse_events(body)   # [("plan", {...}), ..., ("summary", {...})]
+"""
+
+import json
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+
+SSE_CONTENT_TYPE = "text/event-stream"
+
+
+def parse_stream_items(payload: Any) -> List[Dict[str, Any]]:
+    """The items of a stream request; ValueError for a malformed one."""
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ValueError("items: at least one item is required")
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("item_code"), str):
+            raise ValueError("items: every item needs an item_code string")
+        if isinstance(item.get("qty"), bool) or not isinstance(item.get("qty"), (int, float)):
+            raise ValueError("items: every item needs a numeric qty")
+    return items
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    """One SSE frame (blank line included)."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+def parse_events(body: bytes) -> List[Tuple[str, Any]]:
+    """(event, data) pairs of an SSE body; multi-line data is joined with newlines."""
+    events = []
+    for frame in body.decode("utf-8").split("\n\n"):
+        event, data = "message", []
+        for line in frame.splitlines():
+            if line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                data.append(line[5:].lstrip())
+        if data:
+            events.append((event, json.loads("\n".join(data))))
+    return events
+
+
+def plan_entry(item: Mapping[str, Any], stock: Optional[Mapping[str, Any]], ship_date: str) -> Dict[str, Any]:
+    """PromisePlan for one request item, filled from its stock row (StockIndex.lookup)."""
+    qty = float(item["qty"])
+    available = max(float(stock["stock_available"]), 0.0) if stock else 0.0
+    fulfilled = min(qty, available)
+    fulfillment = []
+    if fulfilled > 0:
+        fulfillment.append({
+            "source": "stock",
+            "qty": fulfilled,
+            "available_date": ship_date,
+            "ship_ready_date": ship_date,
+            "warehouse": item.get("warehouse") or DEFAULT_WAREHOUSE,
+        })
+    return {
+        "item_code": item["item_code"],
+        "qty_required": qty,
+        "fulfillment": fulfillment,
+        "shortage": qty - fulfilled,
+    }
@@ -0,0 +1,282 @@
+"""
+Context-level API Route Mocks for OTP Tests
+
+Serves the responses from tests/mocks/otp.py through ONE route per BrowserContext:
+- Response bodies are serialized to bytes once, at import time
+- A single regex route forwards only API URLs to Python (page assets never
+  leave the browser)
+- Dispatch is a dict lookup on the exact path, then a prefix table for
+  parameterized paths such as /otp/sales-orders/{id}
+
+Usage:
+    router = install_otp_mocks(context)   # once, right after new_context()
+    router = install_catalog_mocks(context, Catalog.generate().blobs())  # large catalog
+"""
+
+import json
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+from tests.mocks.otp import (
+    MOCK_HEALTH_RESPONSE,
+    MOCK_SALES_ORDERS_LIST,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
+    MOCK_PROMISE_RESPONSE_SUCCESS,
+    MOCK_STOCK_DATA,
+)
+from tests.mocks.item_search import ItemSearchIndex, validate_item_codes
+from tests.mocks.promise_batch import order_request, parse_batch, result_line
+from tests.mocks.promise_stream import parse_stream_items, plan_entry, sse_event
+from tests.mocks.sales_order_pages import SalesOrderPager
+from tests.mocks.stock import StockIndex
+
+if TYPE_CHECKING:  # catalog.py needs NumPy; only catalog-backed routers use it
+    from tests.mocks.catalog import CatalogBlobs
+
+# Only URLs matching this pattern are routed to Python at all
+API_URL_PATTERN = re.compile(r"/(health|otp/|api/items/)")
+
+CORS_HEADERS = {
+    "access-control-allow-origin": "*",
+    "access-control-allow-methods": "GET, POST, OPTIONS",
+    "access-control-allow-headers": "Content-Type, Accept",
+}
+JSON_HEADERS = {**CORS_HEADERS, "content-type": "application/json"}
+
+NOT_FOUND_BODY = b'{"detail": "Not Found"}'
+
+
+def serialize(payload: Any) -> bytes:
+    """Serialize a mock payload to the exact bytes sent on the wire."""
+    return json.dumps(payload).encode("utf-8")
+
+
+# Pre-serialized bodies (built once at import, reused for every request)
+HEALTH_BODY = serialize(MOCK_HEALTH_RESPONSE)
+SALES_ORDERS_PAGER = SalesOrderPager(MOCK_SALES_ORDERS_LIST)
+PROMISE_SUCCESS_BODY = serialize(MOCK_PROMISE_RESPONSE_SUCCESS)
+SALES_ORDER_DETAILS_BODIES = {
+    "SAL-ORD-2026-00001": serialize(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001),
+    "SAL-ORD-2026-00002": serialize(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002),
+}
+
+# A responder returns (status, body) for a request, or None to let it through
+Responder = Callable[[Request, str], Optional[Tuple[int, bytes]]]
+
+
+def static(body: bytes, status: int = 200) -> Responder:
+    """Responder that always returns the same pre-serialized body."""
+    result = (status, body)
+    return lambda request, rest: result
+
+
+def lookup(bodies: Dict[str, bytes]) -> Responder:
+    """Responder for /prefix/{key} paths backed by a dict of bodies."""
+    def respond(request: Request, rest: str) -> Optional[Tuple[int, bytes]]:
+        body = bodies.get(unquote(rest))
+        return (200, body) if body is not None else (404, NOT_FOUND_BODY)
+    return respond
+
+
+def query_param(request: Request, name: str) -> str:
+    """Last value of a query string parameter ("" when absent)."""
+    values = parse_qs(urlsplit(request.url).query).get(name)
+    return values[-1] if values else ""
+
+
+def query_params(request: Request) -> Dict[str, str]:
+    """Query string parameters of a request (last value wins)."""
+    return {key: values[-1] for key, values in parse_qs(urlsplit(request.url).query).items()}
+
+
+def sales_order_pages(pager: SalesOrderPager) -> Responder:
+    """Responder for /otp/sales-orders?limit=&cursor=&search= (cursor pagination)."""
+    return lambda request, rest: pager.respond(query_params(request))
+
+
+def item_search(index: ItemSearchIndex) -> Responder:
+    """Responder for /api/items/search?query=&limit= backed by a prebuilt index."""
+    return lambda request, rest: index.respond(query_params(request))
+
+
+def item_validate(item_codes: FrozenSet[str]) -> Responder:
+    """Responder for GET /api/items/validate?item_code=... and the batch POST."""
+    def respond(request: Request, rest: str) -> Tuple[int, bytes]:
+        if request.method == "POST":
+            try:
+                payload = request.post_data_json or {}
+                return 200, serialize(validate_item_codes(payload.get("item_codes"), item_codes))
+            except ValueError as error:
+                return 422, serialize({"detail": str(error)})
+        item_code = query_param(request, "item_code")
+        if item_code in item_codes:
+            return 200, serialize({"valid": True, "item_code": item_code})
+        return 404, serialize({"detail": "Item not found"})
+    return respond
+
+
+def item_stock(stock: Dict[str, Any]) -> Responder:
+    """Responder for GET /api/items/stock?item_code=&warehouse= and the bulk POST (MOCK_STOCK_DATA shape)."""
+    index = StockIndex(stock)
+
+    def respond(request: Request, rest: str) -> Tuple[int, bytes]:
+        if request.method == "POST":
+            try:
+                payload = request.post_data_json or {}
+                return 200, serialize(index.bulk(payload.get("pairs")))
+            except ValueError as error:
+                return 422, serialize({"detail": str(error)})
+        row = index.lookup(query_param(request, "item_code"), query_param(request, "warehouse"))
+        if row is None:
+            return 404, serialize({"detail": "No stock for item/warehouse"})
+        return 200, serialize(row)
+    return respond
+
+
+def promise_batch(details_bodies: Dict[str, bytes], result: bytes = PROMISE_SUCCESS_BODY) -> Responder:
+    """Responder for POST /otp/promise/batch: every known order gets result, NDJSON in request order.
+
+    page.route cannot stream, so all lines arrive in one body; the stub
+    server streams them as they finish.
+    """
+    result_payload = json.loads(result)
+
+    def respond(request: Request, rest: str) -> Tuple[int, bytes]:
+        payload = request.post_data_json
+        try:
+            orders = parse_batch(payload)
+        except ValueError as error:
+            return 422, serialize({"detail": str(error)})
+        lines = []
+        for index, order in enumerate(orders):
+            details = details_bodies.get(order["sales_order_id"])
+            if order_request(order, payload, json.loads(details) if details else None) is None:
+                lines.append(result_line(index, order["sales_order_id"], 404, error="Sales Order not found"))
+            else:
+                lines.append(result_line(index, order["sales_order_id"], 200, result=result_payload))
+        return 200, b"".join(lines)
+    return respond
+
+
+def promise_stream(stock: Dict[str, Any], result: bytes = PROMISE_SUCCESS_BODY) -> Responder:
+    """Responder for POST /otp/promise/stream: a plan event per item, then result with that plan.
+
+    page.route cannot stream, so all events arrive in one body; the stub
+    server spaces them out.
+    """
+    index = StockIndex(stock)
+    result_payload = json.loads(result)
+    ship_date = result_payload.get("promise_date") or MOCK_PROMISE_RESPONSE_SUCCESS["promise_date"]
+
+    def respond(request: Request, rest: str) -> Tuple[int, bytes]:
+        try:
+            items = parse_stream_items(request.post_data_json)
+        except ValueError as error:
+            return 422, serialize({"detail": str(error)})
+        plan = [plan_entry(item, index.lookup(item["item_code"], item.get("warehouse")), ship_date) for item in items]
+        events = [sse_event("plan", {"index": i, "total": len(plan), "plan": entry}) for i, entry in enumerate(plan)]
+        events.append(sse_event("summary", {**result_payload, "plan": plan}))
+        return 200, b"".join(events)
+    return respond
+
+
+class MockRouter:
+    """Single-route dispatcher: exact path dict first, then longest prefix."""
+
+    def __init__(self):
+        self.exact: Dict[str, Responder] = {}
+        self.prefixes: List[Tuple[str, Responder]] = []
+        self.hits: Dict[str, int] = {}
+
+    def add(self, path: str, responder: Responder) -> "MockRouter":
+        """Register a responder for an exact path (e.g. "/otp/promise")."""
+        self.exact[path] = responder
+        return self
+
+    def add_prefix(self, prefix: str, responder: Responder) -> "MockRouter":
+        """Register a responder for every path under prefix (e.g. "/otp/sales-orders/")."""
+        self.prefixes = [entry for entry in self.prefixes if entry[0] != prefix]
+        self.prefixes.append((prefix, responder))
+        # Longest prefix wins, so keep the table sorted
+        self.prefixes.sort(key=lambda entry: len(entry[0]), reverse=True)
+        return self
+
+    def resolve(self, request: Request) -> Optional[Tuple[int, bytes]]:
+        """Find the response for a request, or None when nothing matches."""
+        path = urlsplit(request.url).path.rstrip("/") or "/"
+        responder = self.exact.get(path)
+        if responder is not None:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            return responder(request, "")
+        for prefix, responder in self.prefixes:
+            if path.startswith(prefix):
+                self.hits[prefix] = self.hits.get(prefix, 0) + 1
+                return responder(request, path[len(prefix):])
+        return None
+
+    def handle(self, route: Route) -> None:
+        """Playwright route handler."""
+        request = route.request
+        if request.method == "OPTIONS":
+            route.fulfill(status=204, headers=CORS_HEADERS)
+            return
+        resolved = self.resolve(request)
+        if resolved is None:
+            route.fallback()
+            return
+        status, body = resolved
+        route.fulfill(status=status, headers=JSON_HEADERS, body=body)
+
+    def install(self, context: BrowserContext) -> "MockRouter":
+        """Register the router on a BrowserContext (covers all its pages)."""
+        context.route(API_URL_PATTERN, self.handle)
+        return self
+
+
+def build_otp_router() -> MockRouter:
+    """Router serving the default OTP mock responses."""
+    return (
+        MockRouter()
+        .add("/health", static(HEALTH_BODY))
+        .add("/otp/health", static(HEALTH_BODY))
+        .add("/otp/sales-orders", sales_order_pages(SALES_ORDERS_PAGER))
+        .add("/otp/promise", static(PROMISE_SUCCESS_BODY))
+        .add("/otp/promise/batch", promise_batch(SALES_ORDER_DETAILS_BODIES))
+        .add("/otp/promise/stream", promise_stream(MOCK_STOCK_DATA))
+        .add_prefix("/otp/sales-orders/", lookup(SALES_ORDER_DETAILS_BODIES))
+    )
+
+
+def install_otp_mocks(context: BrowserContext) -> MockRouter:
+    """Install the default OTP mocks on a context and return the router."""
+    return build_otp_router().install(context)
+
+
+def build_catalog_router(blobs: "CatalogBlobs") -> MockRouter:
+    """Router serving a generated catalog (tests/mocks/catalog.py) on top of the defaults.
+
+    Indexing a large catalog takes a moment: build the router once per test
+    class and call router.install(context) per test.
+    """
+    item_codes = frozenset(json.loads(blobs.items))
+    stock = json.loads(blobs.stock)
+    return (
+        build_otp_router()
+        .add("/otp/sales-orders", sales_order_pages(SalesOrderPager(blobs.sales_orders_list)))
+        .add_prefix("/otp/sales-orders/", lookup(blobs.sales_order_details))
+        .add("/otp/promise/batch", promise_batch(blobs.sales_order_details))
+        .add("/otp/items", static(blobs.items))
+        .add("/api/items/search", item_search(ItemSearchIndex(json.loads(blobs.item_search)["items"])))
+        .add("/api/items/validate", item_validate(item_codes))
+        .add("/api/items/stock", item_stock(stock))
+        .add("/otp/promise/stream", promise_stream(stock))
+    )
+
+
+def install_catalog_mocks(context: BrowserContext, blobs: "CatalogBlobs") -> MockRouter:
+    """Install catalog-backed mocks on a context and return the router."""
+    return build_catalog_router(blobs).install(context)
@@ -0,0 +1,125 @@
+"""
+Cursor Pagination for GET /otp/sales-orders
+
+Contract (used by otpClient.listSalesOrdersPage and both Python mocks):
+- Query: limit, cursor, search, customer, status
+- Orders are sorted by name (ERPNext naming series are zero-padded, so this
+  is also numeric order)
+- Response: {"sales_orders": [...], "total": N, "limit": L, "next_cursor": C}
+  where next_cursor is an opaque token for the following page, or null on
+  the last page
+- Without limit and cursor the whole (filtered) list is returned, so old
+  clients keep working
+
+Cursors are keyset positions (the last name served), not offsets: a page is
+a bisect plus a scan of limit rows, whatever page the client is on.
+
+Usage:
+    pager = SalesOrderPager(MOCK_SALES_ORDERS_LIST)       # or catalog bytes
+    status, body = pager.respond({"limit": "25", "search": "acme"})
+"""
+
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(name: str) -> str:
+    return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Name a cursor points after; ValueError for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor {cursor!r}") from None
+
+
+def parse_limit(value: str) -> Optional[int]:
+    """limit query parameter clamped to 1..MAX_PAGE_SIZE (None when absent)."""
+    if not value:
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid limit {value!r}") from None
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+class SalesOrderPager:
+    """Sales order list pre-sorted and pre-serialized per row."""
+
+    def __init__(self, payload: Union[Dict[str, Any], bytes]):
+        data = json.loads(payload) if isinstance(payload, bytes) else payload
+        orders = sorted(data["sales_orders"], key=lambda order: order["name"])
+        self.names: List[str] = [order["name"] for order in orders]
+        self.rows: List[bytes] = [json.dumps(order).encode("utf-8") for order in orders]
+        self.search_text: List[str] = [
+            f"{order['name']} {order.get('customer_name') or ''} {order.get('customer') or ''}".lower()
+            for order in orders
+        ]
+        self.customers: List[str] = [order.get("customer") or "" for order in orders]
+        self.statuses: List[str] = [order.get("status") or "" for order in orders]
+        self._totals: Dict[Tuple[str, str, str], int] = {("", "", ""): len(orders)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _matches(self, index: int, search: str, customer: str, status: str) -> bool:
+        return ((not search or search in self.search_text[index])
+                and (not customer or self.customers[index] == customer)
+                and (not status or self.statuses[index] == status))
+
+    def total(self, search: str = "", customer: str = "", status: str = "") -> int:
+        """Number of orders matching the filters (counted once per filter set)."""
+        key = (search, customer, status)
+        if key not in self._totals:
+            self._totals[key] = sum(1 for index in range(len(self.names))
+                                    if self._matches(index, search, customer, status))
+        return self._totals[key]
+
+    def page(self, limit: Optional[int] = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+             search: str = "", customer: str = "", status: str = "") -> Tuple[List[bytes], Optional[str]]:
+        """Serialized rows after cursor and the cursor of the following page."""
+        search = search.strip().lower()
+        start = bisect_right(self.names, decode_cursor(cursor)) if cursor else 0
+        limit = len(self.names) if limit is None else limit
+        picked: List[int] = []
+        for index in range(start, len(self.names)):
+            if self._matches(index, search, customer, status):
+                if len(picked) == limit:
+                    return [self.rows[i] for i in picked], encode_cursor(self.names[picked[-1]])
+                picked.append(index)
+        return [self.rows[i] for i in picked], None
+
+    def body(self, limit: Optional[int] = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+             search: str = "", customer: str = "", status: str = "") -> bytes:
+        """Response body for one page (rows are joined, not re-serialized)."""
+        rows, next_cursor = self.page(limit, cursor, search, customer, status)
+        tail = {
+            "total": self.total(search.strip().lower(), customer, status),
+            "limit": len(rows) if limit is None else limit,
+            "next_cursor": next_cursor,
+        }
+        return b'{"sales_orders": [' + b", ".join(rows) + b"], " + json.dumps(tail).encode("utf-8")[1:]
+
+    def respond(self, query: Mapping[str, str]) -> Tuple[int, bytes]:
+        """(status, body) for a request's query parameters; 400 for bad input."""
+        try:
+            body = self.body(
+                limit=parse_limit(query.get("limit", "")),
+                cursor=query.get("cursor") or None,
+                search=query.get("search", ""),
+                customer=query.get("customer", ""),
+                status=query.get("status", ""),
+            )
+        except ValueError as error:
+            return 400, json.dumps({"detail": str(error)}).encode("utf-8")
+        return 200, body
@@ -0,0 +1,156 @@
+"""
+Multi-Warehouse Split Allocation over ATP Timelines
+
+Finds the earliest supply date that covers a whole order across a set of
+warehouses (tests/mocks/atp.py timelines), under two policies:
+- no_split: every line from one warehouse, one shipment. Warehouses that
+  miss an item, or stay short of it even at the end of its timeline, are
+  pruned; the remaining items x warehouses grid is one vectorized
+  AtpIndex.search, and the warehouse with the earliest latest date wins.
+- split:    an item may draw from several warehouses. The order date is
+  the latest date any item gets covered. Items that even every
+  warehouse's final level cannot cover are rejected up front. Then, while
+  some item is still short on the candidate date (one vectorized check),
+  the one with the largest shortfall has its warehouses' timelines merged
+  by date through a heap until it is covered; that day becomes the new
+  candidate. Items already covered on the candidate date are never merged.
+
+At that date lines are filled greedily: warehouses that already ship
+part of the order first, then the one that covers the rest of the line,
+then the most promisable qty, so a split plan uses few shipments.
+
+PromiseEngine.evaluate(..., allocator=...) turns the plans into
+split_shipment / alternate_warehouse PromiseOptions by re-evaluating the
+order as each plan would ship it.
+
+Usage:
+    allocator = SplitAllocator(atp)                          # every warehouse in the index
+    plan = allocator.split([("WIDGET-ALPHA", 40), ("GEAR-TYPE-A", 5)], preferred="Stores - SD")
+    plan.date, plan.lines, plan.warehouses                   # datetime64 or None, per line (warehouse, qty)
+"""
+
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tests.mocks.atp import EPSILON, NO_PAIR, AtpIndex
+
+NO_SPLIT, SPLIT = "no_split", "split"
+
+
+class AllocationPlan(NamedTuple):
+    policy: str                           # NO_SPLIT or SPLIT
+    date: Optional[np.datetime64]         # supply date covering every line; None when infeasible
+    lines: List[List[Tuple[str, float]]]  # per line: (warehouse, qty) draws
+
+    @property
+    def warehouses(self) -> List[str]:
+        """Warehouses shipping part of the order, in first-use order."""
+        return list(dict.fromkeys(warehouse for draws in self.lines for warehouse, _ in draws))
+
+
+class SplitAllocator:
+    """Earliest-date order allocation across a warehouse set, with and without splitting."""
+
+    def __init__(self, atp: AtpIndex, warehouses: Optional[Sequence[str]] = None):
+        self.atp = atp
+        self.warehouses = list(warehouses) if warehouses is not None else sorted({key[1] for key in atp.pairs})
+
+    def _needs(self, lines: Sequence[Tuple[str, float]]) -> Tuple[List[str], np.ndarray, List[int]]:
+        """Distinct item codes, total qty per item and each line's item position."""
+        codes: Dict[str, int] = {}
+        line_code = [codes.setdefault(code, len(codes)) for code, _ in lines]
+        need = np.zeros(len(codes))
+        np.add.at(need, line_code, [float(qty) for _, qty in lines])
+        return list(codes), need, line_code
+
+    def _grid(self, codes: List[str]) -> np.ndarray:
+        """items x warehouses ATP pair indices (NO_PAIR where nothing is stocked or expected)."""
+        pairs = self.atp.pairs
+        return np.array([[pairs.get((code, warehouse), NO_PAIR) for warehouse in self.warehouses] for code in codes],
+                        dtype=np.int64).reshape(len(codes), len(self.warehouses))
+
+    def _final(self, grid: np.ndarray) -> np.ndarray:
+        """Qty promisable at the end of each timeline, the most a warehouse can ever give."""
+        safe = np.maximum(grid, 0)
+        last = np.maximum(self.atp.starts[safe] + self.atp.lengths[safe] - 1, 0)
+        return np.where((grid >= 0) & (self.atp.lengths[safe] > 0), np.maximum(self.atp.atp[last], 0.0), 0.0)
+
+    def _preferred(self, preferred: Optional[str]) -> int:
+        return self.warehouses.index(preferred) if preferred in self.warehouses else -1
+
+    def no_split(self, lines: Sequence[Tuple[str, float]], preferred: Optional[str] = None) -> AllocationPlan:
+        """Earliest date one warehouse covers every line (ties go to `preferred`, then warehouse order)."""
+        codes, need, _ = self._needs(lines)
+        grid = self._grid(codes)
+        candidates = np.flatnonzero((self._final(grid) >= need[:, None] - EPSILON).all(axis=0))
+        if not len(codes) or not len(candidates):
+            return AllocationPlan(NO_SPLIT, None, [[] for _ in lines])
+
+        found = self.atp.search(grid[:, candidates].ravel(), np.repeat(need, len(candidates)))
+        latest = self.atp.day[found].reshape(len(codes), len(candidates)).max(axis=0)
+        best = candidates[np.lexsort((candidates != self._preferred(preferred), latest))[0]]
+        warehouse = self.warehouses[best]
+        return AllocationPlan(NO_SPLIT, latest[np.flatnonzero(candidates == best)[0]],
+                              [[(warehouse, float(qty))] for _, qty in lines])
+
+    def split(self, lines: Sequence[Tuple[str, float]], preferred: Optional[str] = None) -> AllocationPlan:
+        """Earliest date the warehouses together cover every line, filled with few shipments."""
+        codes, need, line_code = self._needs(lines)
+        grid = self._grid(codes)
+        if not len(codes) or (self._final(grid).sum(axis=1) < need - EPSILON).any():
+            return AllocationPlan(SPLIT, None, [[] for _ in lines])
+
+        date = self.atp.as_of
+        while True:
+            left = self.atp.promisable(grid.ravel(), date).reshape(grid.shape)
+            shortfall = need - left.sum(axis=1)
+            if shortfall.max() <= EPSILON:
+                break
+            worst = int(shortfall.argmax())
+            date = np.datetime64(self._covering_day(grid[worst], need[worst]), "D")
+
+        preferred_index = self._preferred(preferred)
+        used: Dict[int, None] = {}
+        plan_lines = []
+        for code, (_, qty) in zip(line_code, lines):
+            rest, draws = float(qty), []
+            while rest > EPSILON:
+                levels = left[code]
+                stocked = np.flatnonzero(levels > EPSILON).tolist()
+                warehouse = min(stocked, key=lambda index: (index not in used, levels[index] < rest - EPSILON,
+                                                             index != preferred_index, -levels[index]))
+                take = min(rest, float(levels[warehouse]))
+                left[code, warehouse] -= take
+                rest -= take
+                used[warehouse] = None
+                draws.append((self.warehouses[warehouse], take))
+            plan_lines.append(draws)
+        return AllocationPlan(SPLIT, date, plan_lines)
+
+    def _covering_day(self, pairs: np.ndarray, need: float) -> int:
+        """First day (epoch days) the warehouses' promisable qty adds up to need; heap merge by date."""
+        atp, starts, lengths = self.atp.atp, self.atp.starts, self.atp.lengths
+        days = self.atp.day.view(np.int64)
+        heap = []
+        for warehouse, pair in enumerate(pairs.tolist()):
+            if pair >= 0 and lengths[pair]:
+                start = int(starts[pair])
+                heap.append((int(days[start]), warehouse, start, start + int(lengths[pair])))
+        heapq.heapify(heap)
+
+        level = [0.0] * len(pairs)
+        total = 0.0
+        while heap:
+            day = heap[0][0]
+            while heap and heap[0][0] == day:
+                _, warehouse, event, end = heapq.heappop(heap)
+                value = max(float(atp[event]), 0.0)
+                total += value - level[warehouse]
+                level[warehouse] = value
+                if event + 1 < end:
+                    heapq.heappush(heap, (int(days[event + 1]), warehouse, event + 1, end))
+            if total >= need - EPSILON:
+                return day
+        raise ValueError("Supply never covers the item")  # excluded by the final-level check in split()
@@ -0,0 +1,74 @@
+"""
+Stock Lookups for /api/items/stock
+
+Indexes MOCK_STOCK_DATA-shaped stock (tests/mocks/otp.py or a generated
+catalog) by (item_code, warehouse) pair.
+
+Bulk contract, POST /api/items/stock:
+- Body: {"pairs": [{"item_code": "WIDGET-ALPHA", "warehouse": "Stores - SD"}, ...]}
+  (1..500 pairs, warehouse defaults to DEFAULT_WAREHOUSE)
+- Response: MOCK_STOCK_DATA shape, only the requested pairs that exist:
+  {"items": [{"item_code", "item_name", "warehouses": [{"warehouse",
+  "stock", "reserved", "available"}]}]}
+
+Usage:
+    index = StockIndex(MOCK_STOCK_DATA)
+    index.lookup("WIDGET-ALPHA", "Stores - SD")    # GET /api/items/stock body or None
+    index.bulk([{"item_code": "WIDGET-ALPHA", "warehouse": "Stores - SD"}])
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE
+
+MAX_STOCK_PAIRS = 500
+
+
+class StockIndex:
+    """Stock rows keyed by (item_code, warehouse)."""
+
+    def __init__(self, stock: Mapping[str, Any]):
+        self.rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.item_names: Dict[str, str] = {}
+        for item in stock["items"]:
+            self.item_names[item["item_code"]] = item.get("item_name", "")
+            for row in item["warehouses"]:
+                self.rows[(item["item_code"], row["warehouse"])] = row
+
+    def lookup(self, item_code: str, warehouse: str = DEFAULT_WAREHOUSE) -> Optional[Dict[str, Any]]:
+        """Single pair in the GET /api/items/stock shape, or None."""
+        row = self.rows.get((item_code, warehouse or DEFAULT_WAREHOUSE))
+        if row is None:
+            return None
+        return {
+            "item_code": item_code,
+            "warehouse": warehouse or DEFAULT_WAREHOUSE,
+            "stock_actual": row["stock"],
+            "stock_reserved": row["reserved"],
+            "stock_available": row["available"],
+        }
+
+    def bulk(self, pairs: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """POST /api/items/stock response; ValueError for a malformed pairs list."""
+        if not isinstance(pairs, list) or not pairs:
+            raise ValueError("pairs: a non-empty list of {item_code, warehouse} is required")
+        if len(pairs) > MAX_STOCK_PAIRS:
+            raise ValueError(f"pairs: at most {MAX_STOCK_PAIRS} pairs per request")
+
+        items: Dict[str, Dict[str, Any]] = {}
+        for pair in pairs:
+            if not isinstance(pair, dict) or not isinstance(pair.get("item_code"), str):
+                raise ValueError("pairs: every pair needs an item_code string")
+            item_code = pair["item_code"]
+            warehouse = pair.get("warehouse") or DEFAULT_WAREHOUSE
+            row = self.rows.get((item_code, warehouse))
+            if row is None:
+                continue
+            entry = items.setdefault(item_code, {
+                "item_code": item_code,
+                "item_name": self.item_names.get(item_code, ""),
+                "warehouses": [],
+            })
+            if all(existing["warehouse"] != warehouse for existing in entry["warehouses"]):
+                entry["warehouses"].append(row)
+        return {"items": list(items.values())}
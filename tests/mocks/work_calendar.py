@@ -0,0 +1,263 @@
+"""
+Working-day Calendars (weekends + plant holidays) as a Bitmap Asset
+
+Each plant calendar is compiled into one bit per day over a multi-year
+range and written to public/work-calendar.json. That file is read by the
+UI (src/lib/work-calendar.ts, date-picker.tsx) and by the Python promise
+engine (tests/mocks/promise_engine.py), so both see the same working days.
+
+Asset format (version 1):
+    {
+      "version": 1,
+      "start": "2026-01-01",          # day 0 of every bitmap
+      "days": 1096,
+      "default": "default",           # calendar for unmapped warehouses
+      "warehouses": {"Work In Progress - SD": "north-plant", ...},
+      "calendars": {
+        "default": {"weekend_days": [5, 6], "bitmap": "<base64>"},
+        ...
+      }
+    }
+  bitmap: bit i (most significant bit first) is 1 when start + i is a
+  working day. weekend_days use JS numbering (0 = Sunday), as in
+  src/lib/weekend.ts; a non-working day that is not a weekend day is a
+  holiday.
+
+Lookups:
+- is_working_day: one bit, O(1)
+- offset (add N working days): the running count of working days gives
+  the rank of the start day; a rank -> day table gives the day N ranks
+  later, O(1). All calendars share one concatenated count array and one
+  rank table, so a single array expression covers lines on different
+  calendars.
+
+Outside the compiled range only each calendar's weekend days are known
+(as in isWorkingDay of src/lib/work-calendar.ts): those dates, and offsets
+that run past either edge, fall back to np.busday_offset with the
+calendar's weekmask instead of failing.
+
+Usage:
+    calendar = WorkCalendar.load()                  # public/work-calendar.json
+    calendar.is_working_day(dates, calendar.index("north-plant"))
+    calendar.offset(dates, days, calendars)         # roll forward, then add working days
+    python -m tests.mocks.work_calendar --start-year 2026 --years 3 --out public/work-calendar.json
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+WEEKEND_DAYS = (5, 6)  # Friday, Saturday; JS numbering (0 = Sunday), src/lib/weekend.ts
+ASSET_VERSION = 1
+ASSET_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "public", "work-calendar.json"))
+DEFAULT_CALENDAR = "default"
+
+# Israeli public rest days (Yom Tov and Independence Day) that fall in the workweek or on Saturday
+IL_HOLIDAYS = [
+    "2026-04-02", "2026-04-08", "2026-04-22", "2026-05-22", "2026-09-12", "2026-09-13", "2026-09-21",
+    "2026-09-26", "2026-10-03",
+    "2027-04-22", "2027-04-28", "2027-05-12", "2027-06-11", "2027-10-02", "2027-10-03", "2027-10-11",
+    "2027-10-16", "2027-10-23",
+    "2028-04-11", "2028-04-17", "2028-05-02", "2028-05-31", "2028-09-21", "2028-09-22", "2028-09-30",
+    "2028-10-05", "2028-10-12",
+]
+# Annual maintenance shutdown of the northern plant (first week of August)
+NORTH_PLANT_SHUTDOWNS = [f"{year}-08-0{day}" for year in (2026, 2027, 2028) for day in range(2, 7)]
+
+
+@dataclass(frozen=True)
+class CalendarSpec:
+    weekend_days: Tuple[int, ...] = WEEKEND_DAYS
+    holidays: Sequence[str] = field(default_factory=list)
+
+
+PLANT_CALENDARS: Dict[str, CalendarSpec] = {
+    DEFAULT_CALENDAR: CalendarSpec(holidays=IL_HOLIDAYS),
+    "north-plant": CalendarSpec(holidays=IL_HOLIDAYS + NORTH_PLANT_SHUTDOWNS),
+}
+WAREHOUSE_CALENDARS = {"Work In Progress - SD": "north-plant"}
+
+
+def _js_weekday(days: np.ndarray) -> np.ndarray:
+    """JS weekday (0 = Sunday) of datetime64[D] values; 1970-01-01 was a Thursday."""
+    return (days.astype(np.int64) + 4) % 7
+
+
+class WorkCalendar:
+    """Working-day bitmaps of several calendars over one date range."""
+
+    def __init__(self, start: date, working: Mapping[str, np.ndarray], weekend_days: Mapping[str, Sequence[int]],
+                 default: str = DEFAULT_CALENDAR, warehouses: Optional[Mapping[str, str]] = None):
+        self.start = np.datetime64(start.isoformat() if isinstance(start, date) else start, "D")
+        self.ids: List[str] = list(working)
+        self.days = len(working[self.ids[0]])
+        self.weekend_days = {calendar: tuple(days) for calendar, days in weekend_days.items()}
+        self.default = default
+        self.warehouses = dict(warehouses or {})
+        # Calendars back to back: ranks keep counting across calendars, so one table serves all of them
+        self.working = np.concatenate([np.asarray(working[calendar], dtype=bool) for calendar in self.ids])
+        self.counts = np.cumsum(self.working, dtype=np.int64)
+        self.working_positions = np.flatnonzero(self.working)  # rank - 1 -> position
+        # np.busday_* weekmasks (Monday first) for dates outside the range
+        self.weekmasks = ["".join("0" if (day + 1) % 7 in self.weekend_days[calendar] else "1" for day in range(7))
+                          for calendar in self.ids]
+
+    @property
+    def end(self) -> np.datetime64:
+        """First day after the range."""
+        return self.start + self.days
+
+    def index(self, calendar: str) -> int:
+        """Position of a calendar id; KeyError when unknown."""
+        if calendar not in self.ids:
+            raise KeyError(f"Unknown work calendar {calendar!r}")
+        return self.ids.index(calendar)
+
+    def warehouse_index(self, warehouse: str) -> int:
+        """Calendar position for a warehouse (the default calendar when unmapped)."""
+        return self.index(self.warehouses.get(warehouse, self.default))
+
+    def is_working_day(self, dates: Any, calendars: Any = 0) -> np.ndarray:
+        """O(1) bitmap lookups; outside the range only the calendar's weekend days are non-working."""
+        dates, calendars = np.broadcast_arrays(np.asarray(dates, dtype="datetime64[D]"),
+                                               np.asarray(calendars, dtype=np.int64))
+        day = (dates - self.start).astype(np.int64)
+        inside = (day >= 0) & (day < self.days)
+        result = self.working[calendars * self.days + np.where(inside, day, 0)]
+        for calendar, weekmask in self._outside(~inside, calendars):
+            result[calendar] = np.is_busday(dates[calendar], weekmask=weekmask)
+        return result
+
+    def offset(self, dates: Any, days: Any, calendars: Any = 0) -> np.ndarray:
+        """dates rolled forward to a working day plus `days` (>= 0) working days; NaT stays NaT."""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        missing = np.isnat(dates)
+        dates, days, calendars = np.broadcast_arrays(np.where(missing, self.start, dates),
+                                                     np.asarray(days, dtype=np.int64),
+                                                     np.asarray(calendars, dtype=np.int64))
+        day = (dates - self.start).astype(np.int64)
+        result = np.empty(dates.shape, dtype="datetime64[D]")
+
+        # Before the range: weekend-rule working days up to the start come first, the rest from the bitmap
+        remaining = days.copy()
+        done = day >= self.days
+        for calendar, weekmask in self._outside(day < 0, calendars):
+            rolled = np.busday_offset(dates[calendar], 0, roll="forward", weekmask=weekmask)
+            before = np.busday_count(rolled, self.start, weekmask=weekmask)
+            early = days[calendar] < before
+            result[np.flatnonzero(calendar)[early]] = np.busday_offset(rolled[early], days[calendar][early],
+                                                                       weekmask=weekmask)
+            done[np.flatnonzero(calendar)[early]] = True
+            remaining[calendar] = days[calendar] - before
+        for calendar, weekmask in self._outside(done & (day >= self.days), calendars):
+            result[calendar] = np.busday_offset(dates[calendar], days[calendar], roll="forward", weekmask=weekmask)
+
+        # Rank (0-based) of the first working day on or after each date, plus the offset
+        positions = calendars * self.days + np.clip(day, 0, self.days - 1)
+        rank = self.counts[positions] - self.working[positions] + remaining
+        end_rank = self.counts[(calendars + 1) * self.days - 1]  # first rank past the calendar's range
+        target = self.working_positions[np.clip(rank, 0, len(self.working_positions) - 1)]
+        inside = ~done
+        result[inside] = (self.start + (target - calendars * self.days))[inside]
+        # Past the end: the rest of the working days by the weekend rule
+        for calendar, weekmask in self._outside(inside & (rank >= end_rank), calendars):
+            result[calendar] = np.busday_offset(self.end, rank[calendar] - end_rank[calendar], roll="forward",
+                                                weekmask=weekmask)
+        return np.where(missing, np.datetime64("NaT", "D"), result)
+
+    def _outside(self, selected: np.ndarray, calendars: np.ndarray) -> Iterator[Tuple[np.ndarray, str]]:
+        """(mask, weekmask) per calendar among the selected elements, for the weekend-rule fallback."""
+        if not selected.any():
+            return
+        for calendar in np.unique(calendars[selected]).tolist():
+            yield selected & (calendars == calendar), self.weekmasks[calendar]
+
+    # ------------------------------------------------------------------
+    # Compile / asset I/O
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def compile(cls, start_year: int, years: int, calendars: Mapping[str, CalendarSpec] = PLANT_CALENDARS,
+                warehouses: Optional[Mapping[str, str]] = None) -> "WorkCalendar":
+        """Bitmaps for `years` whole years from January 1st of start_year."""
+        start = np.datetime64(f"{start_year}-01-01", "D")
+        all_days = np.arange(start, np.datetime64(f"{start_year + years}-01-01", "D"))
+        weekday = _js_weekday(all_days)
+        working = {}
+        for calendar, spec in calendars.items():
+            closed = np.isin(weekday, spec.weekend_days) | np.isin(all_days, np.array(spec.holidays, "datetime64[D]"))
+            working[calendar] = ~closed
+        weekend_days = {calendar: spec.weekend_days for calendar, spec in calendars.items()}
+        return cls(date(start_year, 1, 1), working, weekend_days,
+                   warehouses=WAREHOUSE_CALENDARS if warehouses is None else warehouses)
+
+    def holidays(self, calendar: str = DEFAULT_CALENDAR) -> np.ndarray:
+        """Non-working days of a calendar that are not weekend days."""
+        position = self.index(calendar)
+        segment = self.working[position * self.days:(position + 1) * self.days]
+        all_days = np.arange(self.start, self.end)
+        return all_days[~segment & ~np.isin(_js_weekday(all_days), self.weekend_days[calendar])]
+
+    def to_asset(self) -> Dict[str, Any]:
+        calendars = {}
+        for position, calendar in enumerate(self.ids):
+            bits = np.packbits(self.working[position * self.days:(position + 1) * self.days])
+            calendars[calendar] = {
+                "weekend_days": list(self.weekend_days[calendar]),
+                "bitmap": base64.b64encode(bits.tobytes()).decode("ascii"),
+            }
+        return {
+            "version": ASSET_VERSION,
+            "start": str(self.start),
+            "days": self.days,
+            "default": self.default,
+            "warehouses": self.warehouses,
+            "calendars": calendars,
+        }
+
+    @classmethod
+    def from_asset(cls, asset: Mapping[str, Any]) -> "WorkCalendar":
+        """ValueError for an unsupported asset version."""
+        if asset.get("version") != ASSET_VERSION:
+            raise ValueError(f"Unsupported work calendar version {asset.get('version')!r}")
+        days = int(asset["days"])
+        working = {}
+        for calendar, entry in asset["calendars"].items():
+            bits = np.frombuffer(base64.b64decode(entry["bitmap"]), dtype=np.uint8)
+            working[calendar] = np.unpackbits(bits)[:days].astype(bool)
+        weekend_days = {calendar: entry["weekend_days"] for calendar, entry in asset["calendars"].items()}
+        return cls(date.fromisoformat(asset["start"]), working, weekend_days, asset.get("default", DEFAULT_CALENDAR),
+                   asset.get("warehouses"))
+
+    @classmethod
+    def load(cls, path: str = ASSET_PATH) -> "WorkCalendar":
+        with open(path) as handle:
+            return cls.from_asset(json.load(handle))
+
+    def dump(self, path: str = ASSET_PATH) -> None:
+        with open(path, "w") as handle:
+            handle.write(json.dumps(self.to_asset(), indent=2) + "\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compile plant work calendars into the bitmap asset")
+    parser.add_argument("--start-year", type=int, default=2026)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--out", default=ASSET_PATH, help="Asset path (default: public/work-calendar.json)")
+    args = parser.parse_args(argv)
+
+    calendar = WorkCalendar.compile(args.start_year, args.years)
+    calendar.dump(args.out)
+    print(f"{len(calendar.ids)} calendars, {calendar.days} days -> {args.out} ({os.path.getsize(args.out)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,48 @@ Follows Page Object Model pattern from AutomationSamana25 course:
 """
 
 import os
-from playwright.sync_api import Page
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Optional, TypeVar
+
+from playwright.sync_api import Error as PlaywrightError, Locator, Page, expect
+
+from tests.support.action_profiler import PROFILER, timed_action
+from tests.support.warm_start import needs_ngrok_probe
+
+
+# JS probe for the React Query client exposed by src/app/providers.tsx
+QUERY_IDLE_SCRIPT = """() => {
+    const client = window.__OTP_QUERY_CLIENT__;
+    if (!client) return document.readyState === "complete";
+    return client.isFetching() === 0 && client.isMutating() === 0;
+}"""
+
+# Installs a one-shot MutationObserver on the first node matching the selector
+DOM_MUTATION_ARM_SCRIPT = """(selector) => {
+    const target = document.querySelector(selector) || document.body;
+    window.__otpDomMutated = false;
+    const observer = new MutationObserver(() => {
+        window.__otpDomMutated = true;
+        observer.disconnect();
+    });
+    observer.observe(target, { childList: true, subtree: true, attributes: true, characterData: true });
+}"""
+
+
+T = TypeVar("T")
+
+# React re-renders can detach a node between resolving and acting on it;
+# only those errors are retried (and counted in the action profile)
+ACTION_RETRIES = 2
+DETACHED_ERRORS = ("not attached to the DOM", "Element is detached")
+
+
+class WaitTiming(NamedTuple):
+    """How long a single readiness wait actually took."""
+
+    label: str
+    duration_ms: float
 
 
 class BasePage:
@@ -18,14 +59,17 @@ class BasePage:
     def __init__(self, page: Page):
         """Initialize page object with Playwright page instance."""
         self.page = page
+        self.wait_timings: List[WaitTiming] = []
 
+    @timed_action
     def navigate_to(self, path: str = "/") -> "BasePage":
         """Navigate to a specific path."""
         base_url = os.environ.get("BASE_URL", "http://localhost:3000")
         self.page.goto(f"{base_url}{path}", timeout=60000)
         
-        # Handle ngrok warning page (if present)
-        self._handle_ngrok_warning()
+        # Handle ngrok warning page (only possible on cold ngrok contexts)
+        if needs_ngrok_probe(self.page.context, base_url):
+            self._handle_ngrok_warning()
         
         self.page.wait_for_load_state("domcontentloaded", timeout=30000)
         return self
@@ -43,28 +87,125 @@ class BasePage:
             # No ngrok warning page, continue normally
             pass
 
+    def _retry_detached(self, action: Callable[[], T]) -> T:
+        """Run action, retrying when the target node was detached mid-action."""
+        for attempt in range(ACTION_RETRIES + 1):
+            try:
+                return action()
+            except PlaywrightError as error:
+                if attempt == ACTION_RETRIES or not any(text in str(error) for text in DETACHED_ERRORS):
+                    raise
+                PROFILER.note_retry()
+
+    # ------------------------------------------------------------------
+    # Readiness waits - wait on concrete signals instead of fixed sleeps
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def timed_wait(self, label: str) -> Iterator[None]:
+        """Record how long the wrapped readiness wait took."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.wait_timings.append(WaitTiming(label, duration_ms))
+
+    @timed_action
+    def wait_for_api_response(
+        self, url_part: str, action: Callable[[], None], timeout: int = 10000
+    ) -> "BasePage":
+        """Run action and wait for the response whose URL contains url_part.
+
+        Example: ``wait_for_api_response("/otp/promise", button.click)``
+        """
+        with self.timed_wait(f"response:{url_part}"):
+            with self.page.expect_response(lambda response: url_part in response.url, timeout=timeout):
+                action()
+        return self
+
+    @timed_action
+    def wait_for_dom_mutation(
+        self, action: Callable[[], None], selector: str = "body", timeout: int = 5000
+    ) -> "BasePage":
+        """Run action and wait until the DOM under selector changes."""
+        self.page.evaluate(DOM_MUTATION_ARM_SCRIPT, selector)
+        with self.timed_wait(f"mutation:{selector}"):
+            action()
+            self.page.wait_for_function("() => window.__otpDomMutated === true", timeout=timeout)
+        return self
+
+    @timed_action
+    def wait_for_query_idle(self, timeout: int = 10000) -> "BasePage":
+        """Wait until React Query has no in-flight queries or mutations."""
+        with self.timed_wait("query-idle"):
+            self.page.wait_for_function(QUERY_IDLE_SCRIPT, timeout=timeout)
+        return self
+
+    @timed_action
+    def wait_for_locator(self, locator: Locator, state: str = "visible", timeout: int = 5000) -> "BasePage":
+        """Wait for a locator to reach the given state."""
+        with self.timed_wait(f"locator:{state}"):
+            locator.wait_for(state=state, timeout=timeout)
+        return self
+
+    def try_wait_for_locator(self, locator: Locator, state: str = "visible", timeout: int = 5000) -> bool:
+        """Like wait_for_locator, but return False instead of raising on timeout."""
+        try:
+            self.wait_for_locator(locator, state=state, timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    @timed_action
+    def wait_for_input_value(self, locator: Locator, value: str, timeout: int = 5000) -> "BasePage":
+        """Wait for an input to hold the given value."""
+        with self.timed_wait(f"value:{value!r}"):
+            expect(locator).to_have_value(value, timeout=timeout)
+        return self
+
+    def get_wait_report(self, slowest_first: bool = True) -> List[WaitTiming]:
+        """Get all recorded wait timings (slowest first by default)."""
+        if slowest_first:
+            return sorted(self.wait_timings, key=lambda timing: timing.duration_ms, reverse=True)
+        return list(self.wait_timings)
+
+    def total_wait_ms(self, label_prefix: Optional[str] = None) -> float:
+        """Total time spent in readiness waits, optionally filtered by label prefix."""
+        return sum(
+            timing.duration_ms
+            for timing in self.wait_timings
+            if label_prefix is None or timing.label.startswith(label_prefix)
+        )
+
+    @timed_action
     def wait_for_network_idle(self, timeout: int = 5000) -> "BasePage":
         """Wait for network to be idle (for API calls)."""
-        self.page.wait_for_load_state("networkidle", timeout=timeout)
+        with self.timed_wait("networkidle"):
+            self.page.wait_for_load_state("networkidle", timeout=timeout)
         return self
 
+    @timed_action
     def fill_input(self, selector: str, value: str) -> "BasePage":
         """Fill input field with value."""
-        self.page.locator(selector).fill(value)
+        self._retry_detached(lambda: self.page.locator(selector).fill(value))
         return self
 
+    @timed_action
     def get_input_value(self, selector: str) -> str:
         """Get value from input field."""
         return self.page.locator(selector).input_value()
 
+    @timed_action
     def click(self, selector: str) -> "BasePage":
         """Click on element."""
-        self.page.locator(selector).click()
+        self._retry_detached(lambda: self.page.locator(selector).click())
         return self
 
+    @timed_action
     def get_text(self, selector: str) -> str:
         """Get text from element."""
-        return self.page.locator(selector).inner_text()
+        return self._retry_detached(lambda: self.page.locator(selector).inner_text())
 
     def is_visible(self, selector: str) -> bool:
         """Check if element is visible."""
@@ -74,19 +215,21 @@ class BasePage:
         """Get element by test ID."""
         return self.page.get_by_test_id(test_id)
 
+    @timed_action
     def wait_for_visible(self, selector: str, timeout: int = 5000) -> "BasePage":
         """Wait for element to be visible."""
-        self.page.locator(selector).wait_for(state="visible", timeout=timeout)
-        return self
+        return self.wait_for_locator(self.page.locator(selector), "visible", timeout)
 
+    @timed_action
     def wait_for_hidden(self, selector: str, timeout: int = 5000) -> "BasePage":
         """Wait for element to be hidden."""
-        self.page.locator(selector).wait_for(state="hidden", timeout=timeout)
-        return self
+        return self.wait_for_locator(self.page.locator(selector), "hidden", timeout)
 
+    @timed_action
     def wait_for_element_count(self, selector: str, count: int, timeout: int = 5000) -> "BasePage":
         """Wait for element count to match."""
-        self.page.locator(selector).count() == count
+        with self.timed_wait(f"count:{selector}"):
+            expect(self.page.locator(selector)).to_have_count(count, timeout=timeout)
         return self
 
     def get_by_role(self, role: str, name: str = None):
@@ -95,6 +238,7 @@ class BasePage:
             return self.page.get_by_role(role, name=name)
         return self.page.get_by_role(role)
 
+    @timed_action
     def select_option(self, selector: str, option_label: str) -> "BasePage":
         """Select option from dropdown."""
         self.page.locator(selector).select_option(label=option_label)
@@ -9,8 +9,11 @@ Encapsulates all interactions with the Promise Calculator page:
 Follows POM pattern: selectors as attributes, methods return self for chaining
 """
 
+from typing import Any, Dict
+
 from playwright.sync_api import Page, expect
 from tests.pages.base_page import BasePage
+from tests.support.action_profiler import timed_action
 
 
 class PromiseCalculatorPage(BasePage):
@@ -36,17 +39,46 @@ class PromiseCalculatorPage(BasePage):
 
     # Sales Order Mode (VERIFIED: data-testid exists)
     SALES_ORDER_MANUAL_INPUT = '[data-testid="sales-order-manual-input"]'
+    SALES_ORDER_COMBOBOX = '[data-testid="sales-order-combobox"]'
+    SALES_ORDER_COMBOBOX_INPUT = '[data-testid="sales-order-combobox-input"]'
     SALES_ORDER_OPTION = '[role="option"]'  # Combobox options
+    SALES_ORDER_LISTBOX = '[data-testid="sales-order-combobox-listbox"]'
+    API_HEALTH_BADGE = '[data-testid="api-health-badge"]'
+    CLEAR_SELECTION_BUTTON = 'button:has-text("Clear")'
+
+    # Delivery Settings & Calendar
+    DESIRED_DATE_BUTTON = '#desiredDeliveryDate'
+    CALENDAR_BUTTON = '#desiredDeliveryDate'
+    DATE_PICKER = '.otp-day-picker'
+    HOLIDAY_DAY = '.otp-day-picker .otp-holiday-day'
+    WORK_CALENDAR_ASSET = '/work-calendar.json'
+
+    # API endpoints the page waits on (substring match on response URL)
+    PROMISE_ENDPOINT = '/otp/promise'
+    PROMISE_STREAM_ENDPOINT = '/otp/promise/stream'
+    ITEM_VALIDATE_ENDPOINT = '/api/items/validate'
+    ITEM_STOCK_ENDPOINT = '/api/items/stock'
 
     # Results Section (text-based from actual results)
     PROMISE_DATE_LABEL = 'Promise Date'
     CONFIDENCE_LABEL = 'Confidence'
     STATUS_TEXTS = ['Feasible', 'At Risk', 'Not Feasible']
+    ALLOCATION_ROW = '[data-testid="allocation-row"]'
+    ALLOCATION_STREAMING = '[data-testid="allocation-streaming"]'
 
     # API & Status (text-based from actual UI)
     API_CONNECTED_TEXT = 'API connected'
     API_OFFLINE_TEXT = 'API offline'
 
+    # Batch Re-promise screen
+    BATCH_NAV_TEXT = 'Batch Re-promise'
+    BATCH_SELECT_ALL_BUTTON = '[data-testid="sales-order-select-all"]'
+    BATCH_RUN_BUTTON = '[data-testid="batch-run"]'
+    BATCH_CANCEL_BUTTON = '[data-testid="batch-cancel"]'
+    BATCH_PROGRESS = '[data-testid="batch-progress"]'
+    BATCH_ROW = '[data-testid="batch-row"]'
+    PROMISE_BATCH_ENDPOINT = '/otp/promise/batch'
+
     # Item Management (VERIFIED from browser)
     REMOVE_ITEM_BUTTON = 'button >> svg.lucide-trash-2'  # Remove button
     ITEM_COUNT_BADGE = 'span:has-text(" item")'  # Item count badge
@@ -55,6 +87,7 @@ class PromiseCalculatorPage(BasePage):
         """Initialize Promise Calculator page object."""
         super().__init__(page)
 
+    @timed_action
     def verify_page_loaded(self) -> "PromiseCalculatorPage":
         """Verify Promise Calculator page is loaded."""
         # Verify heading or key element is visible
@@ -66,12 +99,26 @@ class PromiseCalculatorPage(BasePage):
             expect(self.page).to_have_url("http://localhost:3000")
         return self
 
+    @timed_action
     def verify_sidebar_visible(self) -> "PromiseCalculatorPage":
         """Verify sidebar is visible."""
         sidebar_nav = self.page.get_by_role("button", name="Promise Calculator")
         expect(sidebar_nav).to_be_visible()
         return self
 
+    @timed_action
+    def get_health_schedule(self) -> Dict[str, Any]:
+        """Health badge state: status, checked_at and next_check_at (epoch ms, None when unset)."""
+        badge = self.page.locator(self.API_HEALTH_BADGE).first
+        checked_at = badge.get_attribute("data-checked-at")
+        next_check_at = badge.get_attribute("data-next-check-at")
+        return {
+            "status": badge.get_attribute("data-health-status"),
+            "checked_at": int(checked_at) if checked_at else None,
+            "next_check_at": int(next_check_at) if next_check_at else None,
+        }
+
+    @timed_action
     def get_api_health_status(self) -> str:
         """Get API health badge status."""
         if self.page.get_by_text(self.API_CONNECTED_TEXT).count() > 0:
@@ -82,35 +129,68 @@ class PromiseCalculatorPage(BasePage):
             return "offline"
         return "unknown"
 
+    @timed_action
     def navigate_to_promise_calculator(self) -> "PromiseCalculatorPage":
         """Navigate to Promise Calculator page."""
         self.navigate_to("/")
         self.verify_page_loaded()
         return self
 
+    @timed_action
+    def open_batch_repromise(self) -> "PromiseCalculatorPage":
+        """Switch to the Batch Re-promise screen from the sidebar."""
+        self.page.get_by_role("button", name=self.BATCH_NAV_TEXT).click()
+        expect(self.page.get_by_role("heading", name=self.BATCH_NAV_TEXT)).to_be_visible()
+        return self
+
+    @timed_action
+    def add_all_listed_sales_orders(self) -> "PromiseCalculatorPage":
+        """Add every Sales Order loaded in the selector to the batch."""
+        button = self.page.locator(self.BATCH_SELECT_ALL_BUTTON).first
+        expect(button).to_be_visible(timeout=10000)
+        button.click()
+        return self
+
+    @timed_action
+    def run_batch(self, timeout: int = 15000) -> "PromiseCalculatorPage":
+        """Start the batch and wait until every row has a result."""
+        rows = self.page.locator(self.BATCH_ROW).count()
+        self.page.locator(self.BATCH_RUN_BUTTON).click()
+        progress = self.page.locator(self.BATCH_PROGRESS)
+        expect(progress).to_have_attribute("data-total", str(rows), timeout=timeout)
+        expect(progress).to_have_attribute("data-done", str(rows), timeout=timeout)
+        expect(self.page.locator(self.BATCH_RUN_BUTTON)).to_be_visible(timeout=timeout)
+        return self
+
+    @timed_action
     def switch_to_manual_mode(self) -> "PromiseCalculatorPage":
         """Switch to Manual Order mode."""
         self.click(self.MANUAL_MODE_BUTTON)
-        self.page.wait_for_timeout(500)
+        self.wait_for_visible(self.SALES_ORDER_MANUAL_INPUT)
         return self
 
+    @timed_action
     def verify_manual_mode_active(self) -> "PromiseCalculatorPage":
         """Verify Manual Order mode is active."""
         manual_button = self.page.locator(self.MANUAL_MODE_BUTTON).first
         expect(manual_button).to_be_visible()
         return self
 
+    @timed_action
     def switch_to_sales_order_mode(self) -> "PromiseCalculatorPage":
         """Switch to From Sales Order ID mode."""
         self.click(self.SALES_ORDER_MODE_BUTTON)
-        self.page.wait_for_timeout(500)
+        self.wait_for_query_idle()
+        self.wait_for_visible(self.SALES_ORDER_COMBOBOX)
         return self
 
+    @timed_action
     def fill_customer(self, customer_name: str) -> "PromiseCalculatorPage":
         """Fill customer name (Manual mode)."""
         self.fill_input(self.CUSTOMER_INPUT, customer_name)
         return self
 
+    @timed_action
     def add_item(
         self, item_code: str, qty: int = 1, warehouse: str = "Stores - SD"
     ) -> "PromiseCalculatorPage":
@@ -124,7 +204,6 @@ class PromiseCalculatorPage(BasePage):
         # Fill item code
         item_input = self.page.locator(self.ITEM_CODE_INPUT).first
         item_input.fill(item_code)
-        self.page.wait_for_timeout(500)
 
         # Fill quantity
         qty_field = self.page.locator(self.ITEM_QTY_INPUT).first
@@ -139,70 +218,76 @@ class PromiseCalculatorPage(BasePage):
         # Click Add Item button
         add_button = self.page.get_by_role("button", name=self.ADD_ITEM_BUTTON_TEXT)
         if add_button.is_visible():
-            add_button.click()
-        self.page.wait_for_timeout(300)
+            self.wait_for_dom_mutation(add_button.click)
         return self
 
+    @timed_action
     def open_delivery_settings(self) -> "PromiseCalculatorPage":
         """Open Delivery Settings section."""
         toggle = self.page.get_by_role("button", name="Delivery Settings")
         if toggle.is_visible():
             toggle.click()
-            self.page.wait_for_timeout(300)
+            self.wait_for_visible(self.DESIRED_DATE_BUTTON)
         return self
 
+    @timed_action
     def open_date_picker(self) -> "PromiseCalculatorPage":
         """Open the desired delivery date picker."""
         self.open_delivery_settings()
         date_button = self.page.locator(self.DESIRED_DATE_BUTTON)
         if date_button.is_visible():
             date_button.click()
-            self.page.wait_for_timeout(300)
+            self.wait_for_visible(self.DATE_PICKER)
         return self
 
+    @timed_action
     def remove_item_at_index(self, index: int = 0) -> "PromiseCalculatorPage":
         """Remove item from items list by index."""
         remove_buttons = self.page.locator(self.REMOVE_ITEM_BUTTON)
         if remove_buttons.count() > index:
-            remove_buttons.nth(index).click()
-            self.page.wait_for_timeout(300)
+            self.wait_for_dom_mutation(remove_buttons.nth(index).click)
         return self
 
+    @timed_action
     def get_items_list_count(self) -> int:
         """Get count of items in items list."""
         return self.page.locator(self.ITEMS_LIST_ITEM).count()
 
+    @timed_action
     def verify_item_in_list(self, item_code: str) -> bool:
         """Verify item code is in items list."""
         items_list = self.page.locator(self.ITEMS_LIST)
         return item_code in items_list.inner_text()
 
+    @timed_action
     def evaluate_promise(self) -> "PromiseCalculatorPage":
-        """Click Evaluate Promise button."""
+        """Click Evaluate Promise button and wait for the /otp/promise response."""
         evaluate_btn = self.page.get_by_role("button", name=self.EVALUATE_PROMISE_BUTTON_TEXT)
-        if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+        if evaluate_btn.is_visible() and evaluate_btn.is_enabled():
+            self.wait_for_api_response(self.PROMISE_ENDPOINT, evaluate_btn.click)
         return self
 
+    @timed_action
     def wait_for_results(self, timeout: int = 10000) -> "PromiseCalculatorPage":
         """Wait for results section to be visible."""
         results_label = self.page.get_by_text(self.PROMISE_DATE_LABEL).first
-        results_label.wait_for(state="visible", timeout=timeout)
-        return self
+        return self.wait_for_locator(results_label, "visible", timeout)
 
+    @timed_action
     def get_promise_date(self) -> str:
         """Get promise date from results."""
         label = self.page.get_by_text(self.PROMISE_DATE_LABEL).first
         container = label.locator("xpath=..")
         return container.inner_text()
 
+    @timed_action
     def get_confidence_level(self) -> str:
         """Get confidence level from results."""
         label = self.page.get_by_text(self.CONFIDENCE_LABEL).first
         container = label.locator("xpath=..")
         return container.inner_text()
 
+    @timed_action
     def get_status_badge(self) -> str:
         """Get status badge text."""
         for status in self.STATUS_TEXTS:
@@ -210,48 +295,81 @@ class PromiseCalculatorPage(BasePage):
                 return status
         return ""
 
+    @timed_action
     def select_sales_order(self, sales_order_id: str) -> "PromiseCalculatorPage":
         """Select sales order from combobox."""
         # Open combobox
         combobox_input = self.page.locator(self.SALES_ORDER_COMBOBOX_INPUT).first
         combobox_input.click()
-        self.page.wait_for_timeout(500)
 
-        # Select option
+        # Select option (wait for the listbox to render before scanning)
         option = self.page.locator(self.SALES_ORDER_OPTION)
+        if not self.try_wait_for_locator(option.first):
+            return self
         for i in range(option.count()):
             if sales_order_id in option.nth(i).inner_text():
                 option.nth(i).click()
-                self.page.wait_for_timeout(500)
+                # Sales order details load through React Query
+                self.wait_for_query_idle()
                 break
         return self
 
+    @timed_action
+    def search_sales_orders(self, combobox_input, term: str) -> "PromiseCalculatorPage":
+        """Type into the sales order combobox and wait for the debounced search to settle."""
+        self.wait_for_api_response("/otp/sales-orders", lambda: combobox_input.fill(term))
+        self.wait_for_query_idle()
+        return self
+
+    @timed_action
+    def load_more_sales_orders(self) -> "PromiseCalculatorPage":
+        """Scroll the open sales order list to the end and wait for the next page."""
+        listbox = self.page.locator(self.SALES_ORDER_LISTBOX).first
+        self.wait_for_api_response(
+            "cursor=", lambda: listbox.evaluate("list => list.scrollTo(0, list.scrollHeight)")
+        )
+        self.wait_for_query_idle()
+        return self
+
+    @timed_action
     def get_selected_sales_order(self) -> str:
         """Get currently selected sales order ID."""
         combobox_input = self.page.locator(self.SALES_ORDER_COMBOBOX_INPUT).first
         return combobox_input.input_value()
 
+    @timed_action
     def clear_sales_order_selection(self) -> "PromiseCalculatorPage":
         """Clear sales order selection."""
         self.click(self.CLEAR_SELECTION_BUTTON)
-        self.page.wait_for_timeout(300)
+        combobox_input = self.page.locator(self.SALES_ORDER_COMBOBOX_INPUT).first
+        self.wait_for_input_value(combobox_input, "")
         return self
 
+    @timed_action
     def open_calendar(self) -> "PromiseCalculatorPage":
         """Open calendar picker."""
         self.click(self.CALENDAR_BUTTON)
-        self.page.wait_for_timeout(300)
+        self.wait_for_visible(self.DATE_PICKER)
         return self
 
+    @timed_action
     def get_calendar_days(self) -> list:
         """Get all calendar day elements."""
         calendar_days = self.page.locator('[data-testid="calendar-day"]')
         return [calendar_days.nth(i).inner_text() for i in range(calendar_days.count())]
 
+    @timed_action
+    def open_date_picker_with_work_calendar(self) -> "PromiseCalculatorPage":
+        """Open the date picker and wait for the plant work calendar asset."""
+        self.wait_for_api_response(self.WORK_CALENDAR_ASSET, self.open_date_picker)
+        return self
+
+    @timed_action
     def is_validation_error_visible(self) -> bool:
         """Check if validation error is visible."""
         return self.is_visible(self.VALIDATION_ERROR)
 
+    @timed_action
     def get_validation_error_text(self) -> str:
         """Get validation error message."""
         return self.get_text(self.VALIDATION_ERROR)
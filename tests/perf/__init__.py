@@ -0,0 +1 @@
+"""Performance tooling: load generators and benchmarks for the OTP UI/API."""
@@ -0,0 +1,151 @@
+"""
+ATP Benchmark: Index Build, Order Allocation, Binary Search vs Scan
+
+Builds ATP timelines (tests/mocks/atp.py) for a generated catalog's stock
+rows plus seeded PO / production receipts, then allocates random orders
+against them:
+- build:    AtpIndex over every (item, warehouse) pair of the catalog
+- allocate: AtpIndex.allocate per order (earliest dates + fulfillment
+            sources), p50/p95 latency in ms
+- search:   the vectorized bisection for every line of every order
+- scan:     the same earliest dates per line in plain Python, walking each
+            pair's events in date order and checking every later level
+
+search and scan must agree on every line; a mismatch fails the run.
+
+Usage:
+    python -m tests.perf.atp --items 20000 --lines 200
+    python -m tests.perf.atp --items 50000 --orders 500 --output atp.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tests.mocks.atp import AtpIndex, synthetic_receipts
+from tests.mocks.catalog import Catalog, CatalogSpec
+from tests.perf.load_promise import summarize_latencies
+
+AS_OF = date(2026, 1, 1)
+
+
+def generate_orders(atp: AtpIndex, orders: int, lines: int, seed: Optional[int]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """(pairs, qty) per order; ~2% of lines ask for a pair nothing is stocked at."""
+    rng = np.random.default_rng(seed)
+    batches = []
+    for _ in range(orders):
+        pairs = rng.integers(0, len(atp.pairs), lines)
+        pairs[rng.random(lines) < 0.02] = -1
+        batches.append((pairs, rng.integers(1, 40, lines).astype(float)))
+    return batches
+
+
+def scan(atp: AtpIndex, pairs: np.ndarray, qty: np.ndarray) -> List[Optional[Any]]:
+    """Earliest covering date per line, one event at a time (lines sharing a pair stack up)."""
+    days = atp.day.astype(object)
+    deltas = atp.delta.tolist()
+    taken: Dict[int, float] = {}
+    result: List[Optional[Any]] = []
+    for pair, amount in zip(pairs.tolist(), qty.tolist()):
+        if pair < 0:
+            result.append(None)
+            continue
+        taken[pair] = need = taken.get(pair, 0.0) + amount
+        start, stop = int(atp.starts[pair]), int(atp.starts[pair] + atp.lengths[pair])
+        levels, level = [], 0.0
+        for event in range(start, stop):
+            level += deltas[event]
+            levels.append(level)
+        found = None
+        for offset in range(len(levels)):
+            if all(later >= need - 1e-9 for later in levels[offset:]):
+                found = days[start + offset]
+                break
+        result.append(found)
+    return result
+
+
+def _timed(fn: Any, *args: Any) -> Any:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(items: int, order_count: int, lines: int, seed: Optional[int]) -> Dict[str, Any]:
+    stock = Catalog.generate(CatalogSpec(sales_orders=1, items=items, seed=seed or 2026)).stock_data()
+    receipts = synthetic_receipts(stock, AS_OF, seed=seed)
+    atp, build_s = _timed(AtpIndex, stock, AS_OF, receipts)
+    batches = generate_orders(atp, order_count, lines, seed)
+
+    allocate_ms, search_s, scan_s, mismatches, short = [], 0.0, 0.0, 0, 0
+    for pairs, qty in batches:
+        groups = np.zeros(len(pairs), dtype=np.int64)
+        allocation, seconds = _timed(atp.allocate, pairs, qty, groups)
+        allocate_ms.append(seconds * 1000)
+        short += int(np.isnat(allocation.available_date).sum())
+        upto = qty.copy()  # one order: cumulative qty per pair, as allocate() computes it
+        for pair in np.unique(pairs[pairs >= 0]).tolist():
+            upto[pairs == pair] = np.cumsum(qty[pairs == pair])
+        _, seconds = _timed(atp.search, pairs, upto)
+        search_s += seconds
+        reference, seconds = _timed(scan, atp, pairs, qty)
+        scan_s += seconds
+        actual = allocation.available_date.astype(object)
+        mismatches += sum(actual[line] != reference[line] for line in range(len(pairs)))
+
+    total_lines = order_count * lines
+    return {
+        "pairs": len(atp.pairs),
+        "events": int(atp.lengths.sum()),
+        "receipts": len(receipts),
+        "orders": order_count,
+        "lines_per_order": lines,
+        "short_lines": short,
+        "mismatches": int(mismatches),
+        "build_ms": round(build_s * 1000, 2),
+        "allocate_ms": {key: None if value is None else round(value, 3)
+                        for key, value in summarize_latencies(allocate_ms).items()},
+        "search_lines_per_s": round(total_lines / search_s),
+        "scan_lines_per_s": round(total_lines / scan_s),
+    }
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    allocate = report["allocate_ms"]
+    lines = [f"{report['pairs']:,} pairs, {report['events']:,} events ({report['receipts']:,} receipts), "
+             f"index built in {report['build_ms']:.1f} ms",
+             f"{report['orders']} orders x {report['lines_per_order']} lines, {report['short_lines']} short lines, "
+             f"{report['mismatches']} mismatches",
+             f"{'allocate':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+             f"{'':>10} {allocate['p50']:>9.3f} {allocate['p95']:>9.3f} {allocate['max']:>9.3f}",
+             f"{'path':>10} {'lines/s':>12}"]
+    for name in ("search", "scan"):
+        lines.append(f"{name:>10} {report[name + '_lines_per_s']:>12,}")
+    lines.append(f"search vs scan: {report['search_lines_per_s'] / report['scan_lines_per_s']:.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ATP index build, order allocation and binary search vs scan")
+    parser.add_argument("--items", type=int, default=20_000, help="Catalog items (stock rows follow)")
+    parser.add_argument("--orders", type=int, default=200, help="Orders to allocate")
+    parser.add_argument("--lines", type=int, default=200, help="Lines per order")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.items, args.orders, args.lines, args.seed)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
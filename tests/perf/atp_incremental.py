@@ -0,0 +1,126 @@
+"""
+ATP Benchmark: Incremental Deltas vs Full Rebuild
+
+Builds ATP timelines (tests/mocks/atp.py) for a generated catalog, then
+applies batches of random reservations / consumptions (as bulk
+/otp/apply calls would) two ways:
+- incremental: AtpIndex.apply, re-sorting and re-summing only the touched
+               (item, warehouse) segments
+- rebuild:     a new AtpIndex from the stock rows, receipts and every delta
+               applied so far
+
+After the last batch both indexes must hold the same timelines (events,
+net and atp per pair); a mismatch fails the run.
+
+Usage:
+    python -m tests.perf.atp_incremental --items 50000
+    python -m tests.perf.atp_incremental --items 50000 --batches 1,10,100,1000,10000 --output atp_incremental.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tests.mocks.atp import COLUMNS, CONSUME, RESERVE, AtpDelta, AtpIndex, synthetic_receipts
+from tests.mocks.catalog import Catalog, CatalogSpec
+
+AS_OF = date(2026, 1, 1)
+
+
+def generate_deltas(atp: AtpIndex, count: int, rng: np.random.Generator) -> List[AtpDelta]:
+    """Reservations (70%) and consumptions on random existing pairs, dated up to 60 days out."""
+    keys = list(atp.pairs)
+    picks = rng.integers(0, len(keys), count)
+    days = np.datetime_as_string(atp.as_of + rng.integers(0, 60, count)).tolist()
+    qty = rng.integers(1, 20, count).tolist()
+    reserve = (rng.random(count) < 0.7).tolist()
+    dated = (rng.random(count) < 0.5).tolist()
+    return [AtpDelta(*keys[pick], float(amount), RESERVE if is_reserve else CONSUME, day if is_dated else None)
+            for pick, amount, is_reserve, is_dated, day in zip(picks.tolist(), qty, reserve, dated, days)]
+
+
+def mismatched_pairs(left: AtpIndex, right: AtpIndex) -> int:
+    """Pairs whose timelines differ between two indexes."""
+    if left.pairs != right.pairs:
+        return abs(len(left.pairs) - len(right.pairs)) or len(left.pairs)
+    pairs = np.arange(len(left.pairs))
+    differs = left.lengths != right.lengths
+    same = pairs[~differs]
+    left_at, right_at = left.positions(same), right.positions(same)
+    owner = np.repeat(same, left.lengths[same])
+    for name in COLUMNS:
+        a, b = getattr(left, name)[left_at], getattr(right, name)[right_at]
+        bad = ~np.isclose(a, b) if a.dtype.kind == "f" else a != b
+        differs[owner[bad]] = True
+    return int(differs.sum())
+
+
+def _timed(fn: Any, *args: Any) -> Any:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(items: int, batch_sizes: List[int], seed: Optional[int]) -> Dict[str, Any]:
+    stock = Catalog.generate(CatalogSpec(sales_orders=1, items=items, seed=seed or 2026)).stock_data()
+    receipts = synthetic_receipts(stock, AS_OF, seed=seed)
+    atp = AtpIndex(stock, AS_OF, receipts)
+    rng = np.random.default_rng(seed)
+
+    applied: List[AtpDelta] = []
+    rows = []
+    for size in batch_sizes:
+        deltas = generate_deltas(atp, size, rng)
+        touched, incremental_s = _timed(atp.apply, deltas)
+        applied.extend(deltas)
+        rebuilt, rebuild_s = _timed(AtpIndex, stock, AS_OF, receipts, applied)
+        rows.append({
+            "deltas": size,
+            "pairs_touched": len(touched),
+            "incremental_ms": round(incremental_s * 1000, 3),
+            "rebuild_ms": round(rebuild_s * 1000, 2),
+        })
+
+    return {
+        "items": items,
+        "pairs": len(atp.pairs),
+        "events": int(atp.lengths.sum()),
+        "mismatched_pairs": mismatched_pairs(atp, rebuilt),
+        "batches": rows,
+    }
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{report['items']:,} items, {report['pairs']:,} pairs, {report['events']:,} events, "
+             f"{report['mismatched_pairs']} mismatched pairs",
+             f"{'deltas':>8} {'touched':>9} {'incr ms':>10} {'rebuild ms':>11} {'speedup':>8}"]
+    for row in report["batches"]:
+        speedup = row["rebuild_ms"] / max(row["incremental_ms"], 1e-3)
+        lines.append(f"{row['deltas']:>8,} {row['pairs_touched']:>9,} {row['incremental_ms']:>10.3f} "
+                     f"{row['rebuild_ms']:>11.1f} {speedup:>7.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Incremental ATP deltas vs a full index rebuild")
+    parser.add_argument("--items", type=int, default=50_000, help="Catalog items (stock rows follow)")
+    parser.add_argument("--batches", default="1,10,100,1000,10000", help="Comma-separated deltas per batch")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.items, [int(size) for size in args.batches.split(",")], args.seed)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 1 if report["mismatched_pairs"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
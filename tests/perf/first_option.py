@@ -0,0 +1,153 @@
+"""
+Time-to-first-option Benchmark for the Sales Order Selector
+
+How long until the first Sales Order option can be shown, as the number of
+open orders grows, for:
+- paged: GET /otp/sales-orders?limit=25 (cursor pagination, what
+  SalesOrderSelector requests)
+- full:  GET /otp/sales-orders without limit (the whole list, what a
+  backend without pagination returns)
+
+Two modes:
+- HTTP (default): the in-process stub server with a generated catalog;
+  time = request + JSON decode, i.e. the earliest the UI could render
+- Browser (--browser): the app at BASE_URL with catalog route mocks; time =
+  clicking "From Sales Order ID" until the first option is visible
+
+Usage:
+    python -m tests.perf.first_option --sizes 1000 10000 40000
+    python -m tests.perf.first_option --stub-profile erpnext --repeat 50
+    BASE_URL=http://localhost:3000 python -m tests.perf.first_option --browser --sizes 1000 40000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from tests.mocks.catalog import Catalog, CatalogSpec
+from tests.mocks.sales_order_pages import SalesOrderPager
+from tests.perf.load_promise import summarize_latencies
+
+DEFAULT_SIZES = [1_000, 10_000, 40_000]
+PAGE_SIZE = 25  # SALES_ORDER_PAGE_SIZE in SalesOrderSelector.tsx
+MODES = {"paged": f"/otp/sales-orders?limit={PAGE_SIZE}", "full": "/otp/sales-orders"}
+
+
+def sales_orders_body(orders: int, seed: int) -> bytes:
+    """Serialized sales order list of a generated catalog (details are not built)."""
+    spec = CatalogSpec(sales_orders=orders, items=min(orders, 5_000), seed=seed)
+    return json.dumps(Catalog.generate(spec).sales_orders_list()).encode("utf-8")
+
+
+def _round(summary: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    return {key: round(value, 2) if value is not None else None for key, value in summary.items()}
+
+
+async def measure_http(body: bytes, repeat: int, profile: str, seed: Optional[int]) -> Dict[str, Any]:
+    """Request + decode time of the first page vs the full list on the stub."""
+    from tests.perf.http_pool import HttpPool
+    from tests.stub.latency import LatencyModel
+    from tests.stub.server import OTPStubServer
+
+    server = OTPStubServer(LatencyModel.from_preset(profile, seed=seed))
+    server.sales_order_pager = SalesOrderPager(body)
+    port = await server.start("127.0.0.1", 0)
+    pool = HttpPool(f"http://127.0.0.1:{port}", size=1)
+    results: Dict[str, Any] = {}
+    try:
+        for mode, path in MODES.items():
+            timings: List[float] = []
+            response_bytes = 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                response = await pool.get_json(path, timeout=60.0)
+                if not response.ok:
+                    raise RuntimeError(f"{path} returned HTTP {response.status}")
+                response.json()["sales_orders"]
+                timings.append((time.perf_counter() - start) * 1000)
+                response_bytes = len(response.body)
+            results[mode] = {"ms": _round(summarize_latencies(timings)), "bytes": response_bytes}
+    finally:
+        await pool.close()
+        await server.close()
+    return results
+
+
+def measure_browser(body: bytes, repeat: int) -> Dict[str, Any]:
+    """Click "From Sales Order ID" -> first option visible, in the real app."""
+    from playwright.sync_api import sync_playwright
+
+    from tests.mocks.routes import build_otp_router, sales_order_pages, static
+    from tests.pages.promise_calculator_page import PromiseCalculatorPage
+    from tests.support.browser_factory import launch_browser
+    from tests.support.warm_start import new_warm_context
+
+    routers = {
+        "paged": build_otp_router().add("/otp/sales-orders", sales_order_pages(SalesOrderPager(body))),
+        "full": build_otp_router().add("/otp/sales-orders", static(body)),
+    }
+    results: Dict[str, Any] = {}
+    with sync_playwright() as playwright:
+        browser = launch_browser(playwright)
+        try:
+            for mode, router in routers.items():
+                timings: List[float] = []
+                for _ in range(repeat):
+                    context = new_warm_context(browser)
+                    router.install(context)
+                    page = context.new_page()
+                    promise_page = PromiseCalculatorPage(page).navigate_to_promise_calculator()
+                    start = time.perf_counter()
+                    page.locator(promise_page.SALES_ORDER_MODE_BUTTON).first.click()
+                    page.locator(promise_page.SALES_ORDER_COMBOBOX_INPUT).first.click(timeout=60000)
+                    page.locator(promise_page.SALES_ORDER_OPTION).first.wait_for(state="visible", timeout=60000)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    context.close()
+                results[mode] = {"ms": _round(summarize_latencies(timings))}
+        finally:
+            browser.close()
+    return results
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{'orders':>8} {'paged p50 ms':>13} {'full p50 ms':>12} {'full bytes':>12} {'speedup':>8}"]
+    for row in report["sizes"]:
+        paged, full = row["paged"]["ms"]["p50"], row["full"]["ms"]["p50"]
+        speedup = f"{full / paged:.1f}x" if paged else "-"
+        lines.append(f"{row['orders']:>8} {paged:>13.2f} {full:>12.2f} "
+                     f"{row['full'].get('bytes', 0):>12} {speedup:>8}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sales order time-to-first-option vs order count")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Order counts to test")
+    parser.add_argument("--repeat", type=int, default=20, help="Samples per size and mode")
+    parser.add_argument("--seed", type=int, default=2026, help="Catalog seed")
+    parser.add_argument("--stub-profile", default="none", help="Stub latency preset (HTTP mode)")
+    parser.add_argument("--browser", action="store_true", help="Measure in the app at BASE_URL")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {"mode": "browser" if args.browser else "http", "page_size": PAGE_SIZE, "sizes": []}
+    for orders in args.sizes:
+        body = sales_orders_body(orders, args.seed)
+        if args.browser:
+            result = measure_browser(body, args.repeat)
+        else:
+            result = asyncio.run(measure_http(body, args.repeat, args.stub_profile, args.seed))
+        report["sizes"].append({"orders": orders, **result})
+        print(f"{orders} orders done", file=sys.stderr, flush=True)
+
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
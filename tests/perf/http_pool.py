@@ -0,0 +1,151 @@
+"""
+Pooled asyncio HTTP/1.1 Client
+
+Minimal keep-alive client for load tests and benchmarks:
+- Fixed-size pool of persistent connections per origin (http or https)
+- Content-Length and chunked response bodies (on_chunk sees each chunk as
+  it arrives, for streamed responses)
+- Per-request timeout; a timed-out connection is discarded, not reused
+"""
+
+import asyncio
+import json
+import ssl
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class HttpResponse:
+    """Status, headers and raw body of one response."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class HttpPool:
+    """Keep-alive connection pool for a single origin."""
+
+    def __init__(self, base_url: str, size: int = 10):
+        parts = urlsplit(base_url.rstrip("/"))
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or (443 if self.scheme == "https" else 80)
+        self.base_path = parts.path
+        self.size = size
+        self.connections_opened = 0
+        self._idle: List[Connection] = []
+        self._slots = asyncio.Semaphore(size)
+        self._ssl = ssl.create_default_context() if self.scheme == "https" else None
+
+    async def _open(self) -> Connection:
+        self.connections_opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self._ssl)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+    ) -> HttpResponse:
+        """Send one request on a pooled connection (raises asyncio.TimeoutError)."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._open()
+            try:
+                response = await asyncio.wait_for(
+                    self._exchange(connection, method, path, body, headers, on_chunk), timeout
+                )
+            except BaseException:
+                connection[1].close()
+                raise
+            if response.headers.get("connection", "").lower() == "close":
+                connection[1].close()
+            else:
+                self._idle.append(connection)
+            return response
+
+    async def _exchange(
+        self, connection: Connection, method: str, path: str,
+        body: Optional[bytes], headers: Optional[Dict[str, str]],
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+    ) -> HttpResponse:
+        reader, writer = connection
+        request_headers = {
+            "Host": self.host if self.port in (80, 443) else f"{self.host}:{self.port}",
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+            # ngrok free tunnels serve an HTML interstitial without this
+            "ngrok-skip-browser-warning": "1",
+            **(headers or {}),
+        }
+        if body is not None:
+            request_headers.setdefault("Content-Type", "application/json")
+            request_headers["Content-Length"] = str(len(body))
+        head = f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in request_headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n" + (body or b""))
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split(b" ", 2)[1])
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked(reader, on_chunk)
+        elif "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        elif status in (204, 304) or method == "HEAD":
+            data = b""
+        else:
+            data = await reader.read()
+            response_headers["connection"] = "close"
+        return HttpResponse(status, response_headers, data)
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader,
+                            on_chunk: Optional[Callable[[bytes], None]] = None) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                await reader.readuntil(b"\r\n")
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+            if on_chunk is not None:
+                on_chunk(chunks[-1])
+
+    async def get_json(self, path: str, timeout: float = 10.0) -> HttpResponse:
+        return await self.request("GET", path, timeout=timeout)
+
+    async def post_json(self, path: str, payload: Any, timeout: float = 10.0,
+                        on_chunk: Optional[Callable[[bytes], None]] = None) -> HttpResponse:
+        return await self.request("POST", path, json.dumps(payload).encode("utf-8"), timeout=timeout,
+                                  on_chunk=on_chunk)
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
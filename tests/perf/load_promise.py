@@ -0,0 +1,225 @@
+"""
+Load Generator for POST /otp/promise
+
+Replays PromiseEvaluateRequest payloads at a fixed target rate (open loop) and
+reports latency percentiles, throughput and error rates as JSON.
+
+Payloads are built from tests/mocks/otp.py: items and warehouses come from the
+mock sales orders and stock rows, rules/desired_date are varied per request.
+
+Latency is measured from each request's *scheduled* send time, so queueing
+behind a saturated pool counts against the server (no coordinated omission).
+Requests slower than the UI's 10 s DEFAULT_TIMEOUT_MS (otpClient.ts) are
+reported as timeouts, counted from the scheduled send time as well.
+
+Usage:
+    python -m tests.perf.load_promise --base-url http://127.0.0.1:8001 --rps 50 --duration 30
+    python -m tests.perf.load_promise --stub --stub-profile erpnext --rps 100 --output report.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from tests.mocks.otp import (
+    DEFAULT_WAREHOUSE,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
+    MOCK_STOCK_DATA,
+    VALID_ITEM_CODES,
+)
+from tests.perf.http_pool import HttpPool
+
+UI_TIMEOUT_S = 10.0  # DEFAULT_TIMEOUT_MS in src/lib/api/otpClient.ts
+DELIVERY_MODES = ["LATEST_ACCEPTABLE", "NO_EARLY_DELIVERY", "STRICT_FAIL"]
+SALES_ORDERS = [MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001, MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002]
+
+
+def warehouses_by_item() -> Dict[str, List[str]]:
+    """Warehouses that hold stock for each item code."""
+    return {
+        item["item_code"]: [row["warehouse"] for row in item["warehouses"]] or [DEFAULT_WAREHOUSE]
+        for item in MOCK_STOCK_DATA["items"]
+    }
+
+
+class PromisePayloadFactory:
+    """Builds varied PromiseEvaluateRequest payloads from the mock data."""
+
+    def __init__(self, seed: Optional[int] = None, today: Optional[date] = None):
+        self.rng = random.Random(seed)
+        self.today = today or date.today()
+        self.warehouses = warehouses_by_item()
+
+    def build(self) -> Dict[str, Any]:
+        rng = self.rng
+        if rng.random() < 0.5:
+            order = rng.choice(SALES_ORDERS)
+            items = [
+                {"item_code": line["item_code"], "qty": line["qty"], "warehouse": line["warehouse"]}
+                for line in order["items"]
+            ]
+            customer, sales_order_id = order["customer_name"], order["sales_order_id"]
+        else:
+            codes = rng.sample(VALID_ITEM_CODES, rng.randint(1, len(VALID_ITEM_CODES)))
+            items = [
+                {"item_code": code, "qty": rng.randint(1, 25), "warehouse": rng.choice(self.warehouses[code])}
+                for code in codes
+            ]
+            customer, sales_order_id = "Load Test Customer", None
+
+        order_created = self.today - timedelta(days=rng.randint(0, 3))
+        payload: Dict[str, Any] = {
+            "customer": customer,
+            "items": items,
+            "desired_date": (self.today + timedelta(days=rng.randint(3, 30))).isoformat(),
+            "rules": {
+                "no_weekends": rng.random() < 0.9,
+                "cutoff_time": rng.choice(["12:00", "14:00", "16:00"]),
+                "timezone": "UTC",
+                "lead_time_buffer_days": rng.randint(0, 3),
+                "processing_lead_time_days": rng.randint(1, 2),
+                "desired_date_mode": rng.choice(DELIVERY_MODES),
+                "order_created_at": f"{order_created.isoformat()}T{rng.randint(8, 18):02d}:{rng.choice(['00', '30'])}",
+            },
+        }
+        if sales_order_id:
+            payload["sales_order_id"] = sales_order_id
+        return payload
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize_latencies(latencies_ms: List[float]) -> Dict[str, Optional[float]]:
+    """p50/p95/p99/min/max/mean of a list of latencies (ms)."""
+    ordered = sorted(latencies_ms)
+    return {
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "min": ordered[0] if ordered else None,
+        "max": ordered[-1] if ordered else None,
+        "mean": sum(ordered) / len(ordered) if ordered else None,
+    }
+
+
+async def run_load(
+    base_url: str,
+    rps: float,
+    duration_s: float,
+    connections: int = 20,
+    timeout_s: float = UI_TIMEOUT_S,
+    seed: Optional[int] = None,
+    path: str = "/otp/promise",
+) -> Dict[str, Any]:
+    """Fire requests at a fixed rate for duration_s and return the JSON report."""
+    factory = PromisePayloadFactory(seed=seed)
+    pool = HttpPool(base_url, size=connections)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    total = int(rps * duration_s)
+    loop = asyncio.get_running_loop()
+
+    async def fire(scheduled_at: float, payload: Dict[str, Any]) -> None:
+        try:
+            # The deadline covers the wait for a pool slot too, as the UI's would
+            remaining = scheduled_at + timeout_s - loop.time()
+            response = await asyncio.wait_for(pool.post_json(path, payload, timeout=timeout_s), max(remaining, 0))
+            elapsed_ms = (loop.time() - scheduled_at) * 1000
+            if response.ok:
+                latencies.append(elapsed_ms)
+            else:
+                errors[f"http_{response.status}"] = errors.get(f"http_{response.status}", 0) + 1
+        except asyncio.TimeoutError:
+            errors["timeout"] = errors.get("timeout", 0) + 1
+        except (OSError, asyncio.IncompleteReadError, ValueError) as error:
+            key = f"connection:{type(error).__name__}"
+            errors[key] = errors.get(key, 0) + 1
+
+    start = loop.time()
+    tasks = []
+    for index in range(total):
+        scheduled_at = start + index / rps
+        delay = scheduled_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(fire(scheduled_at, factory.build())))
+    await asyncio.gather(*tasks)
+    wall_s = loop.time() - start
+    await pool.close()
+
+    error_count = sum(errors.values())
+    return {
+        "target": f"{base_url.rstrip('/')}{path}",
+        "target_rps": rps,
+        "duration_s": round(wall_s, 3),
+        "connections": connections,
+        "connections_opened": pool.connections_opened,
+        "requests": total,
+        "succeeded": len(latencies),
+        "throughput_rps": round(len(latencies) / wall_s, 2) if wall_s else 0.0,
+        "latency_ms": {key: round(value, 2) if value is not None else None
+                       for key, value in summarize_latencies(latencies).items()},
+        "errors": {
+            "count": error_count,
+            "rate": round(error_count / total, 4) if total else 0.0,
+            "by_type": dict(sorted(errors.items())),
+        },
+    }
+
+
+async def run_against_stub(args: argparse.Namespace) -> Dict[str, Any]:
+    """Start the local stub server in-process and load it."""
+    from tests.stub.latency import LatencyModel
+    from tests.stub.server import OTPStubServer
+
+    server = OTPStubServer(LatencyModel.from_preset(args.stub_profile, seed=args.seed))
+    port = await server.start("127.0.0.1", 0)
+    try:
+        return await run_load(f"http://127.0.0.1:{port}", args.rps, args.duration,
+                              args.connections, args.timeout, args.seed)
+    finally:
+        await server.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load test POST /otp/promise")
+    parser.add_argument("--base-url", default=None, help="OTP API base URL (default: $BASE_URL)")
+    parser.add_argument("--rps", type=float, default=20.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds")
+    parser.add_argument("--connections", type=int, default=20, help="Connection pool size")
+    parser.add_argument("--timeout", type=float, default=UI_TIMEOUT_S, help="Per-request timeout (s)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--stub", action="store_true", help="Run against an in-process stub server")
+    parser.add_argument("--stub-profile", default="erpnext", help="Latency preset for --stub")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    if args.stub:
+        report = asyncio.run(run_against_stub(args))
+    else:
+        base_url = args.base_url or os.environ.get("BASE_URL", "http://127.0.0.1:8001")
+        report = asyncio.run(run_load(base_url, args.rps, args.duration, args.connections, args.timeout, args.seed))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text + "\n")
+    print(text)
+    return 0 if report["errors"]["count"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
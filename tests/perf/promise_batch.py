@@ -0,0 +1,133 @@
+"""
+Batch Re-promise Benchmark: Orders per Second
+
+Re-promises the same Sales Orders of a generated catalog against the
+in-process stub server (promise result cache off, so every order pays the
+latency profile):
+- batch:   one POST /otp/promise/batch, NDJSON streamed back
+- single:  GET /otp/sales-orders/{id} + POST /otp/promise per order, one
+  order at a time
+- single4: the same, BATCH_FALLBACK_CONCURRENCY (4) orders at a time, what
+  otpClient.evaluatePromiseBatch does when the backend has no batch endpoint
+
+Usage:
+    python -m tests.perf.promise_batch --orders 100
+    python -m tests.perf.promise_batch --stub-profile lan --orders 500 --output batch.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from tests.mocks.catalog import Catalog, CatalogSpec
+from tests.mocks.promise_batch import MAX_BATCH_ORDERS, order_request, parse_lines
+
+FALLBACK_CONCURRENCY = 4  # BATCH_FALLBACK_CONCURRENCY in otpClient.ts
+
+
+async def run_batch(pool: Any, ids: List[str]) -> int:
+    """Failed orders of the batch path."""
+    failed = 0
+    for start in range(0, len(ids), MAX_BATCH_ORDERS):
+        chunk = ids[start:start + MAX_BATCH_ORDERS]
+        response = await pool.post_json("/otp/promise/batch",
+                                        {"orders": [{"sales_order_id": sid} for sid in chunk]}, timeout=600.0)
+        if not response.ok:
+            raise AssertionError(f"Batch request failed: HTTP {response.status}")
+        lines = parse_lines(response.body)
+        if sorted(line["index"] for line in lines) != list(range(len(chunk))):
+            raise AssertionError("Batch response is missing orders")
+        failed += sum(1 for line in lines if line["status"] != 200)
+    return failed
+
+
+async def run_single(pool: Any, ids: List[str], concurrency: int) -> int:
+    """Failed orders of the one-request-per-order path."""
+    queue = list(reversed(ids))
+    failed = 0
+
+    async def worker() -> None:
+        nonlocal failed
+        while queue:
+            sales_order_id = queue.pop()
+            details = await pool.get_json(f"/otp/sales-orders/{quote(sales_order_id)}", timeout=60.0)
+            if not details.ok:
+                failed += 1
+                continue
+            payload = order_request({"sales_order_id": sales_order_id}, {}, details.json())
+            if not (await pool.post_json("/otp/promise", payload, timeout=60.0)).ok:
+                failed += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return failed
+
+
+async def measure(blobs: Any, ids: List[str], profile: str, seed: Optional[int]) -> Dict[str, Any]:
+    from tests.perf.http_pool import HttpPool
+    from tests.stub.latency import LatencyModel
+    from tests.stub.server import OTPStubServer
+
+    modes = (("batch", 1, None), ("single", 1, 1), ("single4", FALLBACK_CONCURRENCY, FALLBACK_CONCURRENCY))
+    results: Dict[str, Any] = {}
+    for mode, pool_size, concurrency in modes:
+        server = OTPStubServer(LatencyModel.from_preset(profile, seed=seed), blobs=blobs, promise_cache_ttl_s=0)
+        port = await server.start("127.0.0.1", 0)
+        pool = HttpPool(f"http://127.0.0.1:{port}", size=pool_size)
+        try:
+            start = time.perf_counter()
+            if concurrency is None:
+                failed = await run_batch(pool, ids)
+            else:
+                failed = await run_single(pool, ids, concurrency)
+            elapsed = time.perf_counter() - start
+            results[mode] = {
+                "seconds": round(elapsed, 3),
+                "orders_per_s": round(len(ids) / elapsed, 1),
+                "failed": failed,
+                "requests": sum(server.request_counts.values()),
+            }
+        finally:
+            await pool.close()
+            await server.close()
+    return results
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{'path':>8} {'orders/s':>9} {'seconds':>8} {'requests':>9} {'failed':>7}"]
+    for name in ("batch", "single", "single4"):
+        row = report[name]
+        lines.append(f"{name:>8} {row['orders_per_s']:>9.1f} {row['seconds']:>8.2f} "
+                     f"{row['requests']:>9} {row['failed']:>7}")
+    lines.append(f"batch vs single: {report['batch']['orders_per_s'] / report['single']['orders_per_s']:.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Orders/s of batch vs per-order promise evaluation")
+    parser.add_argument("--orders", type=int, default=100, help="Sales Orders to re-promise")
+    parser.add_argument("--stub-profile", default="erpnext", help="Stub latency preset")
+    parser.add_argument("--seed", type=int, default=2026, help="Catalog and latency seed")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    spec = CatalogSpec(sales_orders=args.orders, items=min(args.orders * 5, 5_000), seed=args.seed)
+    blobs = Catalog.generate(spec).blobs()
+    ids = list(blobs.sales_order_details)[:args.orders]
+    report = {
+        "profile": args.stub_profile,
+        "orders": len(ids),
+        **asyncio.run(measure(blobs, ids, args.stub_profile, args.seed)),
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
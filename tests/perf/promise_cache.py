@@ -0,0 +1,130 @@
+"""
+Promise Result Cache Benchmark: Re-click Latency of POST /otp/promise
+
+Times what a user waits for when re-clicking "Evaluate Promise" on an
+unchanged order, against the in-process stub server:
+- miss: result cache disabled, every click pays the ERPNext latency profile
+- hit:  the same requests again with the cache warm ("cached": true)
+- key:  computing the canonical cache key alone (promise_cache_key)
+
+Payloads come from PromisePayloadFactory (tests/perf/load_promise.py). Before
+timing, the run checks that a hit is marked cached and that POST /otp/apply
+(a stock version bump) turns the next click back into a miss.
+
+Usage:
+    python -m tests.perf.promise_cache --stub-profile erpnext --requests 200
+    python -m tests.perf.promise_cache --stub-profile lan --output cache.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from tests.mocks.promise_cache import promise_cache_key
+from tests.perf.load_promise import PromisePayloadFactory, summarize_latencies
+
+PROMISE_PATH = "/otp/promise"
+
+
+def _round(summary: Dict[str, Optional[float]], digits: int = 2) -> Dict[str, Optional[float]]:
+    return {key: round(value, digits) if value is not None else None for key, value in summary.items()}
+
+
+async def time_posts(pool: Any, payloads: List[Dict[str, Any]], expect_cached: Optional[bool]) -> List[float]:
+    timings: List[float] = []
+    for payload in payloads:
+        start = time.perf_counter()
+        response = await pool.post_json(PROMISE_PATH, payload, timeout=60.0)
+        timings.append((time.perf_counter() - start) * 1000)
+        if expect_cached is None or not response.ok:
+            continue  # injected faults are not cached; they only add noise to the miss column
+        if bool(response.json().get("cached")) != expect_cached:
+            raise AssertionError(f"Expected cached={expect_cached} for {payload!r}")
+    return timings
+
+
+async def check_invalidation(pool: Any, payload: Dict[str, Any]) -> None:
+    """Hit, then /otp/apply bumps the stock version, then miss."""
+    await pool.post_json(PROMISE_PATH, payload)
+    if not (await pool.post_json(PROMISE_PATH, payload)).json().get("cached"):
+        raise AssertionError("Repeated request was not served from the cache")
+    await pool.post_json("/otp/apply", {"sales_order_id": "SAL-ORD-2026-00001"})
+    if (await pool.post_json(PROMISE_PATH, payload)).json().get("cached"):
+        raise AssertionError("Cached promise survived a stock version change")
+
+
+async def measure(payloads: List[Dict[str, Any]], profile: str, seed: Optional[int]) -> Dict[str, Any]:
+    from tests.perf.http_pool import HttpPool
+    from tests.stub.latency import LatencyModel
+    from tests.stub.server import OTPStubServer
+
+    results: Dict[str, Any] = {}
+    for mode, ttl_s in (("miss", 0.0), ("hit", 3600.0)):
+        server = OTPStubServer(LatencyModel.from_preset(profile, seed=seed), promise_cache_ttl_s=ttl_s)
+        port = await server.start("127.0.0.1", 0)
+        pool = HttpPool(f"http://127.0.0.1:{port}", size=1)
+        try:
+            if mode == "hit":
+                await check_invalidation(pool, payloads[0])
+                server.latency = LatencyModel.from_preset("none")  # priming is not measured
+                await time_posts(pool, payloads, expect_cached=None)
+                server.latency = LatencyModel.from_preset(profile, seed=seed)
+            results[mode] = _round(summarize_latencies(await time_posts(pool, payloads, expect_cached=mode == "hit")))
+        finally:
+            await pool.close()
+            await server.close()
+    return results
+
+
+def time_keys(payloads: List[Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    timings: List[float] = []
+    for payload in payloads:
+        start = time.perf_counter()
+        promise_cache_key(payload)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return _round(summarize_latencies(timings), 1)
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    miss, hit = report["miss_ms"], report["hit_ms"]
+    lines = [f"{'path':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+    for name, row in (("miss", miss), ("hit", hit)):
+        lines.append(f"{name:>6} {row['p50']:>9.2f} {row['p95']:>9.2f} {row['p99']:>9.2f}")
+    lines.append(f"key p50 {report['key_us']['p50']:.1f} us, hit speedup {miss['p50'] / max(hit['p50'], 1e-6):.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="POST /otp/promise latency with and without the result cache")
+    parser.add_argument("--requests", type=int, default=100, help="Distinct payloads (one click each per path)")
+    parser.add_argument("--stub-profile", default="erpnext", help="Stub latency preset")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    factory = PromisePayloadFactory(seed=args.seed)
+    distinct: Dict[str, Dict[str, Any]] = {}
+    while len(distinct) < args.requests:
+        payload = factory.build()
+        distinct.setdefault(promise_cache_key(payload), payload)
+    payloads = list(distinct.values())
+    timings = asyncio.run(measure(payloads, args.stub_profile, args.seed))
+    report = {
+        "profile": args.stub_profile,
+        "requests": args.requests,
+        "miss_ms": timings["miss"],
+        "hit_ms": timings["hit"],
+        "key_us": time_keys(payloads),
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
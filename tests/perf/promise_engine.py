@@ -0,0 +1,221 @@
+"""
+Promise Engine Benchmark: Vectorized vs Day-by-day
+
+Generates random orders (order dates, some outside the work calendar's
+compiled years, cutoffs, rules, desired dates, lines
+on each plant calendar, in stock / waiting on supply / short) and computes
+their promise dates:
+- vectorized: PromiseEngine.evaluate_arrays, WorkCalendar offsets over the
+  whole batch
+- naive:      the same rules per order in plain Python, stepping one
+  calendar day at a time and skipping weekend days and holidays
+- requests:   PromiseEngine.evaluate on PromiseEvaluateRequest payloads
+  against the mock stock, i.e. what the stub's --promise-engine serves
+
+Both date paths must agree on every order (status, confidence, promise
+dates); a mismatch fails the run.
+
+Usage:
+    python -m tests.perf.promise_engine --orders 20000
+    python -m tests.perf.promise_engine --orders 100000 --lines 8 --output engine.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE, MOCK_STOCK_DATA, VALID_ITEM_CODES
+from tests.mocks.promise_engine import (CANNOT_FULFILL, CANNOT_PROMISE_RELIABLY, HIGH, LOW, MEDIUM, MODES, OK,
+                                        PromiseEngine, PromiseLines, PromiseOrders)
+from tests.mocks.stock import StockIndex
+from tests.mocks.work_calendar import WorkCalendar
+
+EPOCH = date(2026, 1, 1)
+
+
+def generate(orders: int, max_lines: int, calendars: int, seed: Optional[int]) -> Any:
+    """Random PromiseOrders + PromiseLines, lines grouped by order."""
+    rng = np.random.default_rng(seed)
+    order_date = np.datetime64(EPOCH.isoformat(), "D") + rng.integers(0, 365, orders)
+    # ~5% before the work calendar's range and ~5% after it (weekend-only fallback, as in DayByDay)
+    edge = rng.random(orders)
+    order_date[edge < 0.05] -= 400
+    order_date[edge > 0.95] += 365 * 3
+    desired = order_date + rng.integers(0, 30, orders)
+    desired[rng.random(orders) < 0.3] = np.datetime64("NaT", "D")
+    batch = PromiseOrders(
+        order_date=order_date,
+        after_cutoff=rng.random(orders) < 0.3,
+        no_weekends=rng.random(orders) < 0.8,
+        buffer_days=rng.integers(0, 4, orders),
+        processing_days=rng.integers(0, 4, orders),
+        desired_date=desired,
+        mode=rng.integers(0, len(MODES), orders).astype(np.int8),
+    )
+    counts = rng.integers(1, max_lines + 1, orders)
+    order = np.repeat(np.arange(orders), counts)
+    offset = np.where(rng.random(len(order)) < 0.8, 0, rng.integers(1, 20, len(order)))
+    offset[rng.random(len(order)) < 0.01] = -1
+    calendar = rng.integers(0, calendars, len(order))
+    return batch, PromiseLines(order, offset, calendar)
+
+
+class DayByDay:
+    """Working days of one calendar, checked one date at a time."""
+
+    def __init__(self, calendar: WorkCalendar, calendar_id: str):
+        self.weekend_days = set(calendar.weekend_days[calendar_id])
+        self.holidays = set(calendar.holidays(calendar_id).astype(object))
+
+    def is_working_day(self, day: date) -> bool:
+        return (day.weekday() + 1) % 7 not in self.weekend_days and day not in self.holidays
+
+    def add_days(self, day: date, days: int, skip: bool) -> date:
+        """Roll forward to a working day, then step `days` working days one day at a time."""
+        while skip and not self.is_working_day(day):
+            day += timedelta(days=1)
+        while days > 0:
+            day += timedelta(days=1)
+            if not skip or self.is_working_day(day):
+                days -= 1
+        return day
+
+
+def naive(calendar: WorkCalendar, orders: PromiseOrders, lines: PromiseLines) -> List[Dict[str, Any]]:
+    """The engine's rules, order by order and day by day."""
+    plants = [DayByDay(calendar, calendar_id) for calendar_id in calendar.ids]
+    default = plants[calendar.index(calendar.default)]
+    order_dates = orders.order_date.astype(object)
+    desired_dates = orders.desired_date.astype(object)
+    order_lines: List[List[Any]] = [[] for _ in order_dates]
+    for index, offset, plant in zip(lines.order.tolist(), lines.available_offset.tolist(), lines.calendar.tolist()):
+        order_lines[index].append((offset, plants[plant]))
+
+    def start(plant: DayByDay, placed: date, after_cutoff: bool, skip: bool) -> date:
+        return plant.add_days(placed, int(after_cutoff and (not skip or plant.is_working_day(placed))), skip)
+
+    results = []
+    for index, placed in enumerate(order_dates):
+        skip, after_cutoff = bool(orders.no_weekends[index]), bool(orders.after_cutoff[index])
+        offsets = [offset for offset, _ in order_lines[index]]
+        if not offsets or min(offsets) < 0:
+            results.append({"status": CANNOT_FULFILL, "confidence": LOW, "promise_raw": None, "promise": None})
+            continue
+        ship = max(plant.add_days(plant.add_days(start(plant, placed, after_cutoff, skip), offset, skip),
+                                  int(orders.processing_days[index]), skip)
+                   for offset, plant in order_lines[index])
+        raw = default.add_days(ship, int(orders.buffer_days[index]), skip)
+        desired, mode = desired_dates[index], MODES[orders.mode[index]]
+        late = desired is not None and raw > desired
+        promise = raw
+        if desired is not None and mode == "NO_EARLY_DELIVERY" and raw < default.add_days(desired, 0, skip):
+            promise = default.add_days(desired, 0, skip)
+        strict_fail = late and mode == "STRICT_FAIL"
+        results.append({
+            "status": CANNOT_PROMISE_RELIABLY if strict_fail else OK,
+            "confidence": LOW if strict_fail else MEDIUM if late or max(offsets) > 0 else HIGH,
+            "promise_raw": raw,
+            "promise": promise,
+        })
+    return results
+
+
+def check(vectorized: Any, reference: List[Dict[str, Any]]) -> int:
+    """Orders where the two paths disagree."""
+    raw = vectorized.promise_raw.astype(object)
+    promise = vectorized.promise.astype(object)
+    mismatches = 0
+    for index, expected in enumerate(reference):
+        actual = {"status": int(vectorized.status[index]), "confidence": int(vectorized.confidence[index]),
+                  "promise_raw": raw[index], "promise": promise[index]}
+        mismatches += actual != expected
+    return mismatches
+
+
+def request_payloads(orders: PromiseOrders, lines: PromiseLines) -> List[Dict[str, Any]]:
+    """PromiseEvaluateRequest bodies with the generated rules and line counts."""
+    counts = np.bincount(lines.order, minlength=len(orders.order_date)).tolist()
+    dates = np.datetime_as_string(orders.order_date).tolist()
+    desired = np.datetime_as_string(orders.desired_date).tolist()
+    payloads = []
+    for index, count in enumerate(counts):
+        items = [{"item_code": VALID_ITEM_CODES[(index + line) % len(VALID_ITEM_CODES)], "qty": 1 + line % 3,
+                  "warehouse": DEFAULT_WAREHOUSE} for line in range(count)]
+        payloads.append({
+            "items": items,
+            "desired_date": None if desired[index] == "NaT" else desired[index],
+            "rules": {
+                "no_weekends": bool(orders.no_weekends[index]),
+                "lead_time_buffer_days": int(orders.buffer_days[index]),
+                "processing_lead_time_days": int(orders.processing_days[index]),
+                "desired_date_mode": MODES[orders.mode[index]],
+                "order_created_at": f"{dates[index]}T{'15:30' if orders.after_cutoff[index] else '09:00'}",
+            },
+        })
+    return payloads
+
+
+def _timed(fn: Any, *args: Any) -> Any:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(order_count: int, max_lines: int, repeat: int, seed: Optional[int]) -> Dict[str, Any]:
+    engine = PromiseEngine()
+    orders, lines = generate(order_count, max_lines, len(engine.calendar.ids), seed)
+    payloads = request_payloads(orders, lines)
+    stock = StockIndex(MOCK_STOCK_DATA)
+
+    vectorized_s = min(_timed(engine.evaluate_arrays, orders, lines)[1] for _ in range(repeat))
+    vectorized = engine.evaluate_arrays(orders, lines)
+    reference, naive_s = _timed(naive, engine.calendar, orders, lines)
+    requests_s = min(_timed(engine.evaluate, payloads, stock)[1] for _ in range(repeat))
+
+    def row(seconds: float) -> Dict[str, float]:
+        return {"seconds": round(seconds, 4), "orders_per_s": round(order_count / seconds)}
+
+    return {
+        "orders": order_count,
+        "lines": len(lines.order),
+        "mismatches": check(vectorized, reference),
+        "vectorized": row(vectorized_s),
+        "naive": row(naive_s),
+        "requests": row(requests_s),
+    }
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{report['orders']} orders, {report['lines']} lines, {report['mismatches']} mismatches",
+             f"{'path':>11} {'orders/s':>12} {'seconds':>9}"]
+    for name in ("vectorized", "naive", "requests"):
+        row = report[name]
+        lines.append(f"{name:>11} {row['orders_per_s']:>12,} {row['seconds']:>9.3f}")
+    lines.append(f"vectorized vs naive: {report['naive']['seconds'] / report['vectorized']['seconds']:.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Vectorized promise engine vs a day-by-day loop")
+    parser.add_argument("--orders", type=int, default=20_000, help="Orders per batch")
+    parser.add_argument("--lines", type=int, default=5, help="Maximum lines per order")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of the engine paths (best is kept)")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.orders, args.lines, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
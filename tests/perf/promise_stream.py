@@ -0,0 +1,121 @@
+"""
+Streaming Promise Benchmark: Time to First Row
+
+Evaluates orders of growing size over POST /otp/promise/stream on the
+in-process stub server and records, per request:
+- first row: time until the first "plan" event is received (when
+  ItemAllocationTable can render its first row)
+- summary:   time until the "summary" event, i.e. what the UI waits for
+  when the same evaluation is not streamed
+
+Per-item planning time is the stub's stream_item_delay_ms (--item-delay-ms);
+the latency profile adds the time to the first byte.
+
+Usage:
+    python -m tests.perf.promise_stream --lines 10 50 200
+    python -m tests.perf.promise_stream --item-delay-ms 40 --stub-profile erpnext --output stream.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from tests.mocks.otp import DEFAULT_WAREHOUSE, VALID_ITEM_CODES
+from tests.mocks.promise_stream import parse_events
+from tests.perf.load_promise import summarize_latencies
+from tests.stub.server import DEFAULT_STREAM_ITEM_DELAY_MS, OTPStubServer
+
+DEFAULT_LINES = [10, 50, 200]
+STREAM_PATH = "/otp/promise/stream"
+
+
+def _round(summary: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    return {key: round(value, 2) if value is not None else None for key, value in summary.items()}
+
+
+def order_payload(lines: int) -> Dict[str, Any]:
+    items = [{"item_code": VALID_ITEM_CODES[index % len(VALID_ITEM_CODES)], "qty": 1 + index % 5,
+              "warehouse": DEFAULT_WAREHOUSE} for index in range(lines)]
+    return {"customer": "Stream Benchmark", "items": items}
+
+
+async def time_stream(pool: Any, payload: Dict[str, Any]) -> Dict[str, float]:
+    """Milliseconds to the first plan event and to the summary of one request."""
+    start = time.perf_counter()
+    first_row: List[float] = []
+
+    def on_chunk(chunk: bytes) -> None:
+        if not first_row and b"event: plan" in chunk:
+            first_row.append((time.perf_counter() - start) * 1000)
+
+    response = await pool.post_json(STREAM_PATH, payload, timeout=600.0, on_chunk=on_chunk)
+    summary_ms = (time.perf_counter() - start) * 1000
+    events = parse_events(response.body)
+    if not response.ok or not events or events[-1][0] != "summary":
+        raise AssertionError(f"Stream failed: HTTP {response.status}")
+    if sum(1 for event, _ in events if event == "plan") != len(payload["items"]):
+        raise AssertionError("Stream is missing plan events")
+    return {"first_row": first_row[0], "summary": summary_ms}
+
+
+async def measure(lines: List[int], repeat: int, item_delay_ms: float, profile: str,
+                  seed: Optional[int]) -> List[Dict[str, Any]]:
+    from tests.perf.http_pool import HttpPool
+    from tests.stub.latency import LatencyModel
+
+    server = OTPStubServer(LatencyModel.from_preset(profile, seed=seed), stream_item_delay_ms=item_delay_ms)
+    port = await server.start("127.0.0.1", 0)
+    pool = HttpPool(f"http://127.0.0.1:{port}", size=1)
+    rows = []
+    try:
+        for count in lines:
+            payload = order_payload(count)
+            samples = [await time_stream(pool, payload) for _ in range(repeat)]
+            rows.append({
+                "lines": count,
+                "first_row_ms": _round(summarize_latencies([sample["first_row"] for sample in samples])),
+                "summary_ms": _round(summarize_latencies([sample["summary"] for sample in samples])),
+            })
+            print(f"{count} lines done", file=sys.stderr, flush=True)
+    finally:
+        await pool.close()
+        await server.close()
+    return rows
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{'lines':>6} {'first row p50':>14} {'summary p50':>12} {'sooner':>8}"]
+    for row in report["sizes"]:
+        first, summary = row["first_row_ms"]["p50"], row["summary_ms"]["p50"]
+        lines.append(f"{row['lines']:>6} {first:>14.2f} {summary:>12.2f} {summary / max(first, 1e-6):>7.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time to first row vs full result on /otp/promise/stream")
+    parser.add_argument("--lines", type=int, nargs="+", default=DEFAULT_LINES, help="Order sizes (item lines)")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per order size")
+    parser.add_argument("--item-delay-ms", type=float, default=DEFAULT_STREAM_ITEM_DELAY_MS,
+                        help="Stub planning time per item")
+    parser.add_argument("--stub-profile", default="none", help="Stub latency preset")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = {
+        "profile": args.stub_profile,
+        "item_delay_ms": args.item_delay_ms,
+        "sizes": asyncio.run(measure(args.lines, args.repeat, args.item_delay_ms, args.stub_profile, args.seed)),
+    }
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Item Search Microbenchmark: Trigram/Prefix Index vs Linear Filter
+
+Replays typing sessions against /api/items/search implementations, one
+query per keystroke:
+- indexed: ItemSearchIndex.search(query, limit=20) (tests/mocks/item_search.py)
+- linear:  substring test over every item (the old stub / client filter)
+
+Sessions type a random item's code or a word of its name, character by
+character, from catalogs generated by tests/mocks/catalog.py. Results of both
+paths are cross-checked before timing.
+
+Usage:
+    python -m tests.perf.search_index --sizes 10000 100000
+    python -m tests.perf.search_index --sessions 200 --output search.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from tests.mocks.catalog import Catalog, CatalogSpec
+from tests.mocks.item_search import ItemSearchIndex
+from tests.perf.load_promise import summarize_latencies
+
+DEFAULT_SIZES = [10_000, 100_000]
+RESULT_LIMIT = 20  # ITEM_SEARCH_LIMIT in src/hooks/useItemSearch.ts
+
+
+def typing_queries(items: List[Dict[str, str]], sessions: int, seed: int) -> List[str]:
+    """Every prefix of what a user types for `sessions` random items."""
+    rng = random.Random(seed)
+    queries: List[str] = []
+    for _ in range(sessions):
+        item = rng.choice(items)
+        target = item["item_code"] if rng.random() < 0.6 else rng.choice(item["item_name"].split())
+        queries.extend(target[:length] for length in range(1, len(target) + 1))
+    return queries
+
+
+def time_queries(search: Callable[[str], Any], queries: List[str]) -> Dict[str, float]:
+    timings: List[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return {key: round(value, 1) for key, value in summarize_latencies(timings).items()}
+
+
+def check_equivalent(index: ItemSearchIndex, queries: List[str]) -> None:
+    """The index must find exactly what a full scan finds."""
+    for query in queries:
+        found, _ = index.search(query)
+        if sorted(found) != index.linear_search(query):
+            raise AssertionError(f"Indexed and linear search disagree for {query!r}")
+
+
+def run(size: int, sessions: int, seed: int) -> Dict[str, Any]:
+    catalog = Catalog.generate(CatalogSpec(sales_orders=1, items=size, seed=seed))
+    items = catalog.item_search_items()
+    start = time.perf_counter()
+    index = ItemSearchIndex(items)
+    build_s = time.perf_counter() - start
+
+    queries = typing_queries(items, sessions, seed)
+    check_equivalent(index, queries[:: max(1, len(queries) // 200)])
+    return {
+        "items": size,
+        "keystrokes": len(queries),
+        "index_build_s": round(build_s, 3),
+        "trigrams": len(index.postings),
+        "indexed_us": time_queries(lambda query: index.search(query, RESULT_LIMIT), queries),
+        "linear_us": time_queries(index.linear_search, queries),
+    }
+
+
+def format_table(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'items':>8} {'build s':>8} {'indexed p50/p95 us':>20} {'linear p50/p95 us':>20} {'speedup':>8}"]
+    for row in rows:
+        indexed, linear = row["indexed_us"], row["linear_us"]
+        lines.append(f"{row['items']:>8} {row['index_build_s']:>8.2f} "
+                     f"{indexed['p50']:>9.1f} / {indexed['p95']:>8.1f} "
+                     f"{linear['p50']:>9.1f} / {linear['p95']:>8.1f} "
+                     f"{linear['p50'] / indexed['p50']:>7.0f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Indexed vs linear item search per keystroke")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Catalog sizes (items)")
+    parser.add_argument("--sessions", type=int, default=100, help="Typing sessions per size")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    rows = [run(size, args.sessions, args.seed) for size in args.sizes]
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps({"limit": RESULT_LIMIT, "sizes": rows}, indent=2) + "\n")
+    print(format_table(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Split Allocation Benchmark: Heap Merge + Pruning vs Brute Force
+
+Builds ATP timelines (tests/mocks/atp.py) for a generated catalog stocked
+across 20 warehouses, with several rounds of seeded PO / production
+receipts per stock row, then solves random large orders with
+SplitAllocator (tests/mocks/split_allocation.py):
+- no_split / split: the allocator's earliest dates and plans, p50/p95 ms
+- brute:            every warehouse x every item for no_split, and every
+                    candidate event date x every item x every warehouse for
+                    split, each level found by walking the timeline
+
+Both must agree on every order's dates, and every split plan must fill
+each line without drawing more than a warehouse can promise on the plan
+date; a mismatch fails the run.
+
+Usage:
+    python -m tests.perf.split_allocation --lines 120 --warehouses 20
+    python -m tests.perf.split_allocation --orders 200 --lines 200 --output split.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tests.mocks.atp import EPSILON, NO_PAIR, AtpIndex, synthetic_receipts
+from tests.mocks.catalog import Catalog, CatalogSpec
+from tests.mocks.split_allocation import AllocationPlan, SplitAllocator
+from tests.perf.load_promise import summarize_latencies
+
+AS_OF = date(2026, 1, 1)
+
+
+def generate_orders(stock: Dict[str, Any], orders: int, lines: int,
+                    seed: Optional[int]) -> List[List[Tuple[str, float]]]:
+    """(item_code, qty) lines, qty up to a fifth of the item's largest stock row.
+
+    Odd orders draw from every item stocked in 2+ warehouses; even ones only
+    from the items of one warehouse, so a single-warehouse plan can exist.
+    """
+    rng = np.random.default_rng(seed)
+    rows = {item["item_code"]: item["warehouses"] for item in stock["items"]}
+    spread = [code for code, stocked in rows.items() if len(stocked) > 1]
+    by_warehouse: Dict[str, List[str]] = {}
+    for code, stocked in rows.items():
+        for row in stocked:
+            by_warehouse.setdefault(row["warehouse"], []).append(code)
+    local = [codes for codes in by_warehouse.values() if len(codes) >= lines]
+    result = []
+    for index in range(orders):
+        pool = local[rng.integers(len(local))] if index % 2 == 0 and local else spread
+        picks = [pool[pick] for pick in rng.integers(0, len(pool), lines).tolist()]
+        result.append([(code, float(rng.integers(1, max(max(row["stock"] for row in rows[code]) // 5, 1) + 2)))
+                       for code in picks])
+    return result
+
+
+def _levels(atp: AtpIndex, pair: int) -> List[Tuple[Any, float]]:
+    start, stop = int(atp.starts[pair]), int(atp.starts[pair] + atp.lengths[pair])
+    return list(zip(atp.day[start:stop].tolist(), atp.atp[start:stop].tolist()))
+
+
+def brute(allocator: SplitAllocator, lines: List[Tuple[str, float]]) -> Tuple[Optional[Any], Optional[Any]]:
+    """(no_split date, split date) from exhaustive walks over every warehouse and candidate date."""
+    atp = allocator.atp
+    need: Dict[str, float] = {}
+    for code, qty in lines:
+        need[code] = need.get(code, 0.0) + qty
+    timelines = {(code, warehouse): _levels(atp, atp.pair_index(code, warehouse))
+                 for code in need for warehouse in allocator.warehouses
+                 if atp.pair_index(code, warehouse) != NO_PAIR}
+
+    def promisable(code: str, warehouse: str, on: Any) -> float:
+        level = 0.0
+        for day, value in timelines.get((code, warehouse), []):
+            if day <= on:
+                level = max(value, 0.0)
+        return level
+
+    no_split = None
+    for warehouse in allocator.warehouses:
+        latest = None
+        for code, qty in need.items():
+            found = next((day for day, value in timelines.get((code, warehouse), []) if value >= qty - EPSILON), None)
+            if found is None:
+                latest = None
+                break
+            latest = found if latest is None else max(latest, found)
+        if latest is not None and (no_split is None or latest < no_split):
+            no_split = latest
+
+    split = None
+    for on in sorted({day for timeline in timelines.values() for day, _ in timeline}):
+        if all(sum(promisable(code, warehouse, on) for warehouse in allocator.warehouses) >= qty - EPSILON
+               for code, qty in need.items()):
+            split = on
+            break
+    return no_split, split
+
+
+def plan_errors(allocator: SplitAllocator, lines: List[Tuple[str, float]], plan: AllocationPlan) -> int:
+    """Lines not filled exactly, plus (item, warehouse) draws beyond what is promisable on the plan date."""
+    if plan.date is None:
+        return 0
+    errors = sum(abs(sum(qty for _, qty in draws) - amount) > 1e-6 for (_, amount), draws in zip(lines, plan.lines))
+    drawn: Dict[Tuple[str, str], float] = {}
+    for (code, _), draws in zip(lines, plan.lines):
+        for warehouse, qty in draws:
+            drawn[(code, warehouse)] = drawn.get((code, warehouse), 0.0) + qty
+    keys = list(drawn)
+    pairs = np.array([allocator.atp.pair_index(code, warehouse) for code, warehouse in keys], dtype=np.int64)
+    limits = allocator.atp.promisable(pairs, plan.date)
+    return errors + int(sum(drawn[key] > limit + 1e-6 for key, limit in zip(keys, limits.tolist())))
+
+
+def _timed(fn: Any, *args: Any) -> Any:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(items: int, warehouses: int, receipt_rounds: int, order_count: int, lines: int,
+            seed: Optional[int]) -> Dict[str, Any]:
+    spec = CatalogSpec(sales_orders=1, items=items, warehouses=warehouses, seed=seed or 2026)
+    stock = Catalog.generate(spec).stock_data()
+    base = seed or 0
+    receipts = [receipt for round_ in range(receipt_rounds)
+                for receipt in synthetic_receipts(stock, AS_OF, seed=base + round_)]
+    atp = AtpIndex(stock, AS_OF, receipts)
+    allocator = SplitAllocator(atp)
+    orders = generate_orders(stock, order_count, lines, seed)
+
+    no_split_ms, split_ms, brute_s = [], [], 0.0
+    mismatches, feasible = 0, {"no_split": 0, "split": 0}
+    shipments = []
+    for order in orders:
+        single, seconds = _timed(allocator.no_split, order)
+        no_split_ms.append(seconds * 1000)
+        split, seconds = _timed(allocator.split, order)
+        split_ms.append(seconds * 1000)
+        expected, seconds = _timed(brute, allocator, order)
+        brute_s += seconds
+        mismatches += (single.date, split.date) != expected
+        mismatches += plan_errors(allocator, order, single) + plan_errors(allocator, order, split)
+        feasible["no_split"] += single.date is not None
+        feasible["split"] += split.date is not None
+        if split.date is not None:
+            shipments.append(len(split.warehouses))
+
+    def latency(values: List[float]) -> Dict[str, Optional[float]]:
+        return {key: None if value is None else round(value, 3) for key, value in summarize_latencies(values).items()}
+
+    return {
+        "pairs": len(atp.pairs),
+        "events": int(atp.lengths.sum()),
+        "warehouses": len(allocator.warehouses),
+        "orders": order_count,
+        "lines_per_order": lines,
+        "feasible": feasible,
+        "mean_split_shipments": round(sum(shipments) / len(shipments), 2) if shipments else None,
+        "mismatches": int(mismatches),
+        "no_split_ms": latency(no_split_ms),
+        "split_ms": latency(split_ms),
+        "brute_ms_per_order": round(brute_s * 1000 / order_count, 2),
+    }
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    lines = [f"{report['pairs']:,} pairs ({report['events']:,} events) over {report['warehouses']} warehouses; "
+             f"{report['orders']} orders x "
+             f"{report['lines_per_order']} lines, {report['mismatches']} mismatches",
+             f"feasible: {report['feasible']['no_split']} without split, {report['feasible']['split']} with split "
+             f"(mean {report['mean_split_shipments']} shipments)",
+             f"{'policy':>10} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+    for name in ("no_split", "split"):
+        row = report[name + "_ms"]
+        lines.append(f"{name:>10} {row['p50']:>9.3f} {row['p95']:>9.3f} {row['max']:>9.3f}")
+    lines.append(f"{'brute':>10} {report['brute_ms_per_order']:>9.1f} ms per order")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Split allocation solver vs brute force")
+    parser.add_argument("--items", type=int, default=5_000, help="Catalog items (stock rows follow)")
+    parser.add_argument("--warehouses", type=int, default=20, help="Warehouses in the catalog")
+    parser.add_argument("--receipt-rounds", type=int, default=4, help="Seeded receipt draws per stock row")
+    parser.add_argument("--orders", type=int, default=50, help="Orders to solve")
+    parser.add_argument("--lines", type=int, default=120, help="Lines per order")
+    parser.add_argument("--seed", type=int, default=2026)
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = measure(args.items, args.warehouses, args.receipt_rounds, args.orders, args.lines, args.seed)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+    print(format_table(report))
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
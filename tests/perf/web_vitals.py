@@ -0,0 +1,278 @@
+"""
+Web Vitals & Interaction Benchmarks for the Playwright Journeys
+
+Benchmark mode (OTP_BENCHMARK=1, or `python run_tests.py --benchmark`) adds an
+init script to each test's BrowserContext that records, inside the page:
+- Navigation timing (TTFB, DOMContentLoaded, load)
+- LCP, CLS (largest session window) and long tasks
+- "Evaluate Promise" click -> first "Promise Date" paint
+- Sales order combobox keystroke -> filtered options painted
+
+Every test appends one JSON line to the results file. `compare` takes the
+median per test and metric and fails when it regresses past the thresholds in
+the baseline file; `--update-baseline` rewrites the baseline from the results.
+
+Usage:
+    python run_tests.py --benchmark tests.test_journeys
+    python -m tests.perf.web_vitals compare
+    python -m tests.perf.web_vitals compare --update-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from typing import Any, Dict, List, Optional
+
+from playwright.sync_api import BrowserContext, Page
+
+BENCHMARK_ENV = "OTP_BENCHMARK"
+RESULTS_ENV = "OTP_BENCHMARK_RESULTS"
+
+PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS_PATH = os.path.join(PERF_DIR, "results", "web_vitals.jsonl")
+DEFAULT_BASELINE_PATH = os.path.join(PERF_DIR, "baselines", "web_vitals.json")
+
+# Lower is better for every metric; a regression must exceed BOTH the relative
+# and the absolute slack (keeps sub-millisecond noise from failing the run)
+DEFAULT_THRESHOLDS = {
+    "ttfb_ms": {"relative": 0.5, "absolute": 50},
+    "dom_content_loaded_ms": {"relative": 0.3, "absolute": 100},
+    "load_ms": {"relative": 0.3, "absolute": 150},
+    "lcp_ms": {"relative": 0.25, "absolute": 150},
+    "cls": {"relative": 0.5, "absolute": 0.02},
+    "long_task_count": {"relative": 0.5, "absolute": 2},
+    "long_task_total_ms": {"relative": 0.5, "absolute": 100},
+    "evaluate_to_result_ms": {"relative": 0.25, "absolute": 100},
+    "keystroke_to_options_ms": {"relative": 0.25, "absolute": 30},
+}
+
+# Runs before any page script. Observers are buffered, so entries recorded
+# before they attach (e.g. the first LCP candidate) are not lost.
+VITALS_INIT_SCRIPT = """(() => {
+    if (window.__otpVitals) return;
+    const vitals = window.__otpVitals = {
+        lcp: null, clsWindows: [], longTasks: [],
+        evaluateToResult: [], keystrokeToOptions: [],
+    };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true });
+        } catch (error) { /* entry type not supported */ }
+    };
+
+    observe("largest-contentful-paint", (entry) => { vitals.lcp = entry.startTime; });
+    observe("longtask", (entry) => { vitals.longTasks.push(entry.duration); });
+    // CLS = largest session window (shifts < 1 s apart, window <= 5 s)
+    observe("layout-shift", (entry) => {
+        if (entry.hadRecentInput) return;
+        const current = vitals.clsWindows[vitals.clsWindows.length - 1];
+        if (current && entry.startTime - current.last < 1000 && entry.startTime - current.first < 5000) {
+            current.value += entry.value;
+            current.last = entry.startTime;
+        } else {
+            vitals.clsWindows.push({ first: entry.startTime, last: entry.startTime, value: entry.value });
+        }
+    });
+
+    // Interaction timing: stamp the input event, stop at the next frame after
+    // the DOM reflects it (rAF ~ paint), so the number is what the user sees.
+    let pendingEvaluate = null;
+    let pendingKeystroke = null;
+    const finish = (bucket, start) => {
+        requestAnimationFrame(() => bucket.push(performance.now() - start));
+    };
+
+    document.addEventListener("click", (event) => {
+        const button = event.target.closest && event.target.closest("button");
+        if (button && button.textContent.includes("Evaluate Promise")) pendingEvaluate = event.timeStamp;
+    }, true);
+    document.addEventListener("input", (event) => {
+        if (event.target.matches && event.target.matches('input[role="combobox"]')) {
+            pendingKeystroke = event.timeStamp;
+        }
+    }, true);
+
+    const touchesOptions = (node) => node.nodeType === 1 &&
+        (node.matches('[role="option"], [role="listbox"]') || node.querySelector('[role="option"]'));
+    const showsPromiseDate = (node) => node.nodeType === 1 && node.textContent.includes("Promise Date");
+
+    const start = () => new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            const nodes = [...mutation.addedNodes, ...mutation.removedNodes];
+            if (pendingKeystroke !== null && (touchesOptions(mutation.target) || nodes.some(touchesOptions))) {
+                finish(vitals.keystrokeToOptions, pendingKeystroke);
+                pendingKeystroke = null;
+            }
+            if (pendingEvaluate !== null && mutation.addedNodes.length && [...mutation.addedNodes].some(showsPromiseDate)) {
+                finish(vitals.evaluateToResult, pendingEvaluate);
+                pendingEvaluate = null;
+            }
+        }
+    }).observe(document.documentElement, { childList: true, subtree: true });
+    if (document.documentElement) start(); else document.addEventListener("readystatechange", start, { once: true });
+})()"""
+
+COLLECT_SCRIPT = """() => {
+    const vitals = window.__otpVitals;
+    const [nav] = performance.getEntriesByType("navigation");
+    if (!vitals || !nav) return null;
+    const sum = (values) => values.reduce((total, value) => total + value, 0);
+    return {
+        ttfb_ms: nav.responseStart - nav.startTime,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd - nav.startTime,
+        load_ms: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        lcp_ms: vitals.lcp,
+        cls: Math.max(0, ...vitals.clsWindows.map((session) => session.value)),
+        long_task_count: vitals.longTasks.length,
+        long_task_total_ms: sum(vitals.longTasks),
+        evaluate_to_result_ms: vitals.evaluateToResult.length ? Math.max(...vitals.evaluateToResult) : null,
+        keystroke_to_options_ms: vitals.keystrokeToOptions.length ? Math.max(...vitals.keystrokeToOptions) : null,
+    };
+}"""
+
+
+def benchmark_enabled() -> bool:
+    """True when the run was started in benchmark mode."""
+    return os.environ.get(BENCHMARK_ENV, "").lower() in ("1", "true", "yes")
+
+
+def results_path() -> str:
+    return os.environ.get(RESULTS_ENV, DEFAULT_RESULTS_PATH)
+
+
+def attach_vitals_probe(context: BrowserContext) -> None:
+    """Install the in-page probe on every page the context opens."""
+    context.add_init_script(VITALS_INIT_SCRIPT)
+
+
+def collect_vitals(page: Page) -> Optional[Dict[str, Optional[float]]]:
+    """Read the metrics recorded so far (None if the page never navigated)."""
+    try:
+        return page.evaluate(COLLECT_SCRIPT)
+    except Exception:
+        return None
+
+
+def record_vitals(test_id: str, page: Page, path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Collect the page's metrics and append them to the results file."""
+    metrics = collect_vitals(page)
+    if metrics is None:
+        return None
+    entry = {"test": test_id, "metrics": metrics}
+    path = path or results_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # One short line per write; O_APPEND keeps lines from parallel workers intact
+    with open(path, "a") as handle:
+        handle.write(json.dumps(entry) + "\n")
+    return entry
+
+
+def reset_results(path: Optional[str] = None) -> None:
+    """Remove the results file before a fresh benchmark run."""
+    path = path or results_path()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    """Median of every metric per test across all recorded runs."""
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    with open(path) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            per_test = samples.setdefault(entry["test"], {})
+            for metric, value in entry["metrics"].items():
+                if value is not None:
+                    per_test.setdefault(metric, []).append(value)
+    return {
+        test: {metric: round(statistics.median(values), 4) for metric, values in metrics.items()}
+        for test, metrics in samples.items()
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"thresholds": DEFAULT_THRESHOLDS, "tests": {}}
+    with open(path) as handle:
+        baseline = json.load(handle)
+    baseline.setdefault("thresholds", DEFAULT_THRESHOLDS)
+    baseline.setdefault("tests", {})
+    return baseline
+
+
+def find_regressions(
+    current: Dict[str, Dict[str, float]], baseline: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Metrics that are worse than the baseline by more than their threshold."""
+    thresholds = {**DEFAULT_THRESHOLDS, **baseline.get("thresholds", {})}
+    regressions = []
+    for test, metrics in sorted(current.items()):
+        reference = baseline["tests"].get(test, {})
+        for metric, value in sorted(metrics.items()):
+            base = reference.get(metric)
+            limit = thresholds.get(metric)
+            if base is None or limit is None:
+                continue
+            allowed = max(base * (1 + limit["relative"]), base + limit["absolute"])
+            if value > allowed:
+                regressions.append({
+                    "test": test, "metric": metric,
+                    "baseline": base, "current": value, "allowed": round(allowed, 4),
+                })
+    return regressions
+
+
+def compare(results: str, baseline_path: str, update_baseline: bool = False) -> int:
+    """Print a comparison table; return 1 on any regression (0 after an update)."""
+    if not os.path.exists(results):
+        print(f"No benchmark results at {results} (run with {BENCHMARK_ENV}=1 first)")
+        return 1
+    current = load_results(results)
+    baseline = load_baseline(baseline_path)
+
+    for test, metrics in sorted(current.items()):
+        print(test)
+        reference = baseline["tests"].get(test, {})
+        for metric, value in sorted(metrics.items()):
+            base = reference.get(metric)
+            if base is None:
+                delta = "new"
+            else:
+                delta = f"{(value - base) / base:+.0%}" if base else f"{value - base:+.2f}"
+            print(f"    {metric:<26} {value:>10.2f}   baseline {base if base is not None else '-':>10}   {delta}")
+
+    if update_baseline:
+        baseline["tests"] = current
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+        print(f"\nBaseline updated: {baseline_path}")
+        return 0
+
+    regressions = find_regressions(current, baseline)
+    for regression in regressions:
+        print(f"REGRESSION {regression['test']} {regression['metric']}: "
+              f"{regression['current']:.2f} > {regression['allowed']:.2f} (baseline {regression['baseline']})")
+    print(f"\n{len(regressions)} regression(s) across {len(current)} test(s)")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare Web Vitals benchmark results to the baseline")
+    parser.add_argument("command", choices=["compare"])
+    parser.add_argument("--results", default=results_path())
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Overwrite the baseline with these results instead of comparing")
+    args = parser.parse_args(argv)
+    return compare(args.results, args.baseline, args.update_baseline)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Local OTP stub backend (real HTTP) built on the data in tests/mocks/otp.py."""
@@ -0,0 +1,136 @@
+"""
+Latency & Fault Profiles for the OTP Stub Server
+
+A profile decides, per request:
+- How long to wait before answering (distribution + jitter)
+- Whether to fail with an HTTP error instead (error_rate)
+- Whether to hang past the UI's 10 s DEFAULT_TIMEOUT_MS (timeout_rate)
+
+Presets approximate the production ERPNext-backed OTP service; any field can
+be overridden per endpoint.
+"""
+
+import math
+import random
+from dataclasses import dataclass, replace
+from typing import Dict, Optional
+
+DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Latency distribution plus fault injection for one endpoint."""
+
+    distribution: str = "fixed"
+    mean_ms: float = 0.0
+    stddev_ms: float = 0.0          # normal/lognormal spread, uniform half-width
+    jitter_ms: float = 0.0          # extra uniform 0..jitter_ms added on top
+    min_ms: float = 0.0
+    max_ms: float = 30000.0
+    error_rate: float = 0.0         # fraction of requests answered with error_status
+    error_status: int = 503
+    timeout_rate: float = 0.0       # fraction of requests that hang for hang_ms
+    hang_ms: float = 15000.0
+
+    def __post_init__(self):
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {self.distribution!r}, expected one of {DISTRIBUTIONS}")
+
+    def sample_ms(self, rng: random.Random) -> float:
+        """Draw one response delay in milliseconds."""
+        if self.distribution == "fixed":
+            delay = self.mean_ms
+        elif self.distribution == "uniform":
+            delay = rng.uniform(self.mean_ms - self.stddev_ms, self.mean_ms + self.stddev_ms)
+        elif self.distribution == "normal":
+            delay = rng.gauss(self.mean_ms, self.stddev_ms)
+        elif self.distribution == "lognormal":
+            delay = _lognormal_ms(rng, self.mean_ms, self.stddev_ms)
+        else:  # exponential
+            delay = rng.expovariate(1.0 / self.mean_ms) if self.mean_ms > 0 else 0.0
+
+        if self.jitter_ms:
+            delay += rng.uniform(0, self.jitter_ms)
+        return min(max(delay, self.min_ms), self.max_ms)
+
+    def roll_fault(self, rng: random.Random) -> Optional[str]:
+        """Return "timeout", "error" or None for this request."""
+        roll = rng.random()
+        if roll < self.timeout_rate:
+            return "timeout"
+        if roll < self.timeout_rate + self.error_rate:
+            return "error"
+        return None
+
+
+def _lognormal_ms(rng: random.Random, mean_ms: float, stddev_ms: float) -> float:
+    """Lognormal draw parameterized by the arithmetic mean and stddev."""
+    if mean_ms <= 0:
+        return 0.0
+    if stddev_ms <= 0:
+        return mean_ms
+    sigma_sq = math.log(1 + (stddev_ms / mean_ms) ** 2)
+    mu = math.log(mean_ms) - sigma_sq / 2
+    return rng.lognormvariate(mu, math.sqrt(sigma_sq))
+
+
+# Presets: "erpnext" mirrors what we see in production - fast health checks,
+# promise evaluation dominated by ERPNext stock/PO lookups (long right tail).
+PRESETS: Dict[str, Dict[str, LatencyProfile]] = {
+    "none": {
+        "default": LatencyProfile(),
+    },
+    "lan": {
+        "default": LatencyProfile("normal", mean_ms=15, stddev_ms=5, jitter_ms=5),
+    },
+    "erpnext": {
+        "default": LatencyProfile("lognormal", mean_ms=120, stddev_ms=80, jitter_ms=20),
+        "/health": LatencyProfile("normal", mean_ms=20, stddev_ms=8),
+        "/otp/promise": LatencyProfile("lognormal", mean_ms=650, stddev_ms=450, jitter_ms=50, error_rate=0.005),
+        # Per-order latency comes from /otp/promise; this is only the request overhead
+        "/otp/promise/batch": LatencyProfile("normal", mean_ms=30, stddev_ms=10),
+        # Time to the first byte; per-item planning is the stub's stream_item_delay_ms
+        "/otp/promise/stream": LatencyProfile("normal", mean_ms=60, stddev_ms=20),
+        "/otp/sales-orders": LatencyProfile("lognormal", mean_ms=250, stddev_ms=150, jitter_ms=30),
+        "/api/items/validate": LatencyProfile("lognormal", mean_ms=60, stddev_ms=30),
+        "/api/items/stock": LatencyProfile("lognormal", mean_ms=90, stddev_ms=50),
+    },
+    "degraded": {
+        "default": LatencyProfile("lognormal", mean_ms=900, stddev_ms=900, jitter_ms=200, error_rate=0.05),
+        "/otp/promise": LatencyProfile(
+            "lognormal", mean_ms=3500, stddev_ms=3000, error_rate=0.08, timeout_rate=0.03
+        ),
+        "/otp/promise/batch": LatencyProfile("lognormal", mean_ms=900, stddev_ms=900, jitter_ms=200),
+        "/otp/promise/stream": LatencyProfile("lognormal", mean_ms=900, stddev_ms=900, jitter_ms=200),
+    },
+}
+
+
+class LatencyModel:
+    """Resolves the profile for a request path and owns the seeded RNG."""
+
+    def __init__(self, profiles: Dict[str, LatencyProfile], seed: Optional[int] = None):
+        if "default" not in profiles:
+            profiles = {**profiles, "default": LatencyProfile()}
+        self.profiles = profiles
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def from_preset(cls, name: str, seed: Optional[int] = None, **overrides) -> "LatencyModel":
+        """Build from a preset, applying field overrides (e.g. error_rate=0.1) to every profile."""
+        if name not in PRESETS:
+            raise ValueError(f"Unknown latency preset {name!r}, expected one of {sorted(PRESETS)}")
+        profiles = {path: replace(profile, **overrides) if overrides else profile
+                    for path, profile in PRESETS[name].items()}
+        return cls(profiles, seed=seed)
+
+    def profile_for(self, path: str) -> LatencyProfile:
+        """Exact path first, then the longest configured prefix, then default."""
+        if path in self.profiles:
+            return self.profiles[path]
+        best = None
+        for key in self.profiles:
+            if key != "default" and path.startswith(key) and (best is None or len(key) > len(best)):
+                best = key
+        return self.profiles[best or "default"]
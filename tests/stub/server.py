@@ -0,0 +1,688 @@
+"""
+OTP Stub Server (asyncio, real HTTP)
+
+Serves every endpoint otpClient.ts / the item hooks call, using the data in
+tests/mocks/otp.py:
+- GET  /health
+- POST /otp/promise (result cache, see tests/mocks/promise_cache.py; rule-based
+  dates with --promise-engine, see tests/mocks/promise_engine.py; incoming
+  POs / production with --atp, see tests/mocks/atp.py; split_shipment /
+  alternate_warehouse options, see tests/mocks/split_allocation.py)
+- POST /otp/promise/batch (NDJSON stream, see tests/mocks/promise_batch.py)
+- POST /otp/promise/stream (SSE, per-item plans, see tests/mocks/promise_stream.py)
+- GET  /otp/sales-orders (cursor pagination, see tests/mocks/sales_order_pages.py)
+- GET  /otp/sales-orders/{id}
+- GET  /otp/items
+- POST /otp/apply (with --atp, reserves the order's lines on the ATP timelines)
+- POST /otp/procurement-suggest
+- GET  /api/items/search (indexed, see tests/mocks/item_search.py)
+- GET  /api/items/validate, POST /api/items/validate (batch)
+- GET  /api/items/stock, POST /api/items/stock (bulk, see tests/mocks/stock.py)
+
+Unlike page.route mocks this exercises real sockets: CORS preflights,
+keep-alive connection reuse and client timeouts. Response delays and faults
+come from tests/stub/latency.py.
+
+A generated catalog (tests/mocks/catalog.py) can replace the small mock data
+set: its pre-serialized bodies are served as-is.
+
+Usage:
+    python -m tests.stub.server --port 8001 --profile erpnext
+    python -m tests.stub.server --catalog-orders 50000 --catalog-items 30000
+    python -m tests.stub.server --catalog-dir /tmp/catalog   # blobs from `python -m tests.mocks.catalog`
+    python -m tests.stub.server --stream-item-delay-ms 40    # slower per-item planning on /otp/promise/stream
+    python -m tests.stub.server --promise-engine             # dates from the rules (tests/mocks/promise_engine.py)
+    python -m tests.stub.server --promise-engine --atp       # ... and from seeded PO / production receipts
+    NEXT_PUBLIC_API_BASE_URL=http://127.0.0.1:8001 npm run dev
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from datetime import date
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from tests.mocks.otp import (
+    DEFAULT_WAREHOUSE,
+    MOCK_HEALTH_RESPONSE,
+    MOCK_PROMISE_RESPONSE_SUCCESS,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
+    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
+    MOCK_SALES_ORDERS_LIST,
+    MOCK_STOCK_DATA,
+)
+from tests.mocks.item_search import ItemSearchIndex, validate_item_codes
+from tests.mocks.promise_batch import NDJSON_CONTENT_TYPE, order_request, parse_batch, result_line
+from tests.mocks.promise_cache import DEFAULT_TTL_S, PromiseCache, promise_cache_key
+from tests.mocks.promise_stream import SSE_CONTENT_TYPE, parse_stream_items, plan_entry, sse_event
+from tests.mocks.sales_order_pages import SalesOrderPager
+from tests.mocks.stock import StockIndex
+from tests.stub.latency import PRESETS, LatencyModel
+
+if TYPE_CHECKING:  # catalog.py, atp.py and promise_engine.py need NumPy; only the flags using them import them
+    from tests.mocks.atp import AtpDelta, AtpIndex
+    from tests.mocks.catalog import CatalogBlobs
+    from tests.mocks.promise_engine import PromiseEngine
+    from tests.mocks.split_allocation import SplitAllocator
+
+REASONS = {
+    200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 422: "Unprocessable Entity", 500: "Internal Server Error",
+    503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Accept",
+    "Access-Control-Max-Age": "600",
+}
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+# Orders of one /otp/promise/batch evaluated at the same time (backend workers)
+BATCH_CONCURRENCY = 16
+# Time to plan one item on /otp/promise/stream (ERPNext stock + PO lookups)
+DEFAULT_STREAM_ITEM_DELAY_MS = 25.0
+
+
+class StubRequest:
+    """Parsed HTTP request."""
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = parts.path.rstrip("/") or "/"
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        """Decode the body as JSON (None for an empty body)."""
+        return json.loads(self.body) if self.body else None
+
+
+class StubResponse:
+    """Response with a JSON payload (or pre-serialized bytes), or a chunked stream."""
+
+    def __init__(self, status: int = 200, payload: Any = None, headers: Optional[Dict[str, str]] = None,
+                 stream: Optional[AsyncIterator[bytes]] = None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers or {}
+        self.stream = stream
+
+    def body(self) -> bytes:
+        if self.payload is None:
+            return b""
+        if isinstance(self.payload, bytes):
+            return self.payload
+        return json.dumps(self.payload).encode("utf-8")
+
+
+Handler = Callable[[StubRequest, str], Awaitable[StubResponse]]
+
+
+def _not_found(detail: str = "Not Found") -> StubResponse:
+    return StubResponse(404, {"detail": detail})
+
+
+class OTPStubServer:
+    """Routing table + HTTP/1.1 keep-alive transport for the OTP stub."""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, blobs: Optional["CatalogBlobs"] = None,
+                 promise_cache_ttl_s: float = DEFAULT_TTL_S,
+                 stream_item_delay_ms: float = DEFAULT_STREAM_ITEM_DELAY_MS,
+                 promise_engine: Optional["PromiseEngine"] = None, atp_seed: Optional[int] = None):
+        self.latency = latency or LatencyModel.from_preset("none")
+        self.stream_item_delay_ms = stream_item_delay_ms
+        # None serves MOCK_PROMISE_RESPONSE_SUCCESS for every request
+        self.promise_engine = promise_engine
+        # Bumped by /otp/apply; cached promises computed on older stock are stale
+        self.stock_version = 1
+        self.promise_cache = PromiseCache(promise_cache_ttl_s) if promise_cache_ttl_s > 0 else None
+        self.exact: Dict[Tuple[str, str], Handler] = {}
+        self.prefixes: List[Tuple[str, str, Handler]] = []
+        self.request_counts: Dict[str, int] = {}
+        self.connections_opened = 0
+        self._suggestion_seq = 0
+        self._connection_tasks: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Payloads may be dicts or pre-serialized bytes (StubResponse sends both)
+        if blobs is None:
+            self.stock = StockIndex(MOCK_STOCK_DATA)
+            self.items = {item["item_code"]: item for item in MOCK_STOCK_DATA["items"]}
+            self.sales_order_pager = SalesOrderPager(MOCK_SALES_ORDERS_LIST)
+            self.sales_orders: Dict[str, Any] = {
+                "SAL-ORD-2026-00001": MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
+                "SAL-ORD-2026-00002": MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
+            }
+        else:
+            stock = json.loads(blobs.stock)
+            self.stock = StockIndex(stock)
+            self.items = {item["item_code"]: item for item in stock["items"]}
+            self.sales_order_pager = SalesOrderPager(blobs.sales_orders_list)
+            self.sales_orders = blobs.sales_order_details
+        self.item_index = ItemSearchIndex(self.items.values())
+        # ATP timelines (stock + seeded PO / production receipts) for the engine; None = on-hand stock only
+        self.atp: Optional["AtpIndex"] = None
+        self.allocator: Optional["SplitAllocator"] = None  # options across every warehouse of the ATP index
+        if promise_engine is not None and atp_seed is not None:
+            from tests.mocks.atp import AtpIndex, synthetic_receipts
+            from tests.mocks.split_allocation import SplitAllocator
+            stock_data = MOCK_STOCK_DATA if blobs is None else stock
+            self.atp = AtpIndex(stock_data, date.today(), synthetic_receipts(stock_data, date.today(), seed=atp_seed))
+            self.allocator = SplitAllocator(self.atp)
+        self._register_default_routes()
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def add_route(self, method: str, path: str, handler: Handler) -> None:
+        """Register a handler for an exact method + path."""
+        self.exact[(method, path)] = handler
+
+    def add_prefix_route(self, method: str, prefix: str, handler: Handler) -> None:
+        """Register a handler for every path under prefix (longest prefix wins)."""
+        self.prefixes.append((method, prefix, handler))
+        self.prefixes.sort(key=lambda entry: len(entry[1]), reverse=True)
+
+    def _resolve(self, method: str, path: str) -> Tuple[Optional[Handler], str]:
+        handler = self.exact.get((method, path))
+        if handler is not None:
+            return handler, ""
+        for route_method, prefix, handler in self.prefixes:
+            if route_method == method and path.startswith(prefix):
+                return handler, path[len(prefix):]
+        return None, ""
+
+    def _register_default_routes(self) -> None:
+        self.add_route("GET", "/health", self.handle_health)
+        self.add_route("GET", "/otp/health", self.handle_health)
+        self.add_route("POST", "/otp/promise", self.handle_promise)
+        self.add_route("POST", "/otp/promise/batch", self.handle_promise_batch)
+        self.add_route("POST", "/otp/promise/stream", self.handle_promise_stream)
+        self.add_route("GET", "/otp/sales-orders", self.handle_sales_orders)
+        self.add_prefix_route("GET", "/otp/sales-orders/", self.handle_sales_order_details)
+        self.add_route("GET", "/otp/items", self.handle_items)
+        self.add_route("POST", "/otp/apply", self.handle_apply)
+        self.add_route("POST", "/otp/procurement-suggest", self.handle_procurement_suggest)
+        self.add_route("GET", "/api/items/search", self.handle_item_search)
+        self.add_route("GET", "/api/items/validate", self.handle_item_validate)
+        self.add_route("POST", "/api/items/validate", self.handle_item_validate_batch)
+        self.add_route("GET", "/api/items/stock", self.handle_item_stock)
+        self.add_route("POST", "/api/items/stock", self.handle_item_stock_bulk)
+
+    # ------------------------------------------------------------------
+    # Endpoint handlers
+    # ------------------------------------------------------------------
+
+    async def handle_health(self, request: StubRequest, rest: str) -> StubResponse:
+        return StubResponse(200, MOCK_HEALTH_RESPONSE)
+
+    async def handle_promise(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json() or {}
+        if not payload.get("items"):
+            return StubResponse(422, {"detail": "items: at least one item is required"})
+        try:
+            response = self.evaluate_promise(payload)
+        except ValueError as error:
+            return StubResponse(422, {"detail": str(error)})
+        key = self._promise_key(payload)
+        if self.promise_cache is not None and key is not None:
+            self.promise_cache.put(key, self.stock_version, response)
+        return StubResponse(200, response)
+
+    def evaluate_promise(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """PromiseEvaluateResponse for one request; ValueError for rules/items the engine cannot read."""
+        if self.promise_engine is None:
+            return {**MOCK_PROMISE_RESPONSE_SUCCESS, "stock_version": self.stock_version}
+        try:
+            result = self.promise_engine.evaluate([payload], self.stock, atp=self.atp, allocator=self.allocator)[0]
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Cannot evaluate promise: {error}") from error
+        return {**result, "stock_version": self.stock_version}
+
+    @staticmethod
+    def _promise_key(payload: Any) -> Optional[str]:
+        try:
+            return promise_cache_key(payload)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None  # malformed items are not cached
+
+    def cached_promise(self, request: StubRequest) -> Optional[StubResponse]:
+        """Cache hit for POST /otp/promise, answered without the ERPNext latency."""
+        if self.promise_cache is None or request.method != "POST" or request.path != "/otp/promise":
+            return None
+        try:
+            key = self._promise_key(request.json())
+        except ValueError:
+            return None  # handle_promise reports the bad request
+        if key is None:
+            return None
+        response = self.promise_cache.get(key, self.stock_version)
+        if response is None:
+            return None
+        return StubResponse(200, {**response, "cached": True})
+
+    async def handle_promise_batch(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json()
+        try:
+            orders = parse_batch(payload)
+        except ValueError as error:
+            return StubResponse(422, {"detail": str(error)})
+        return StubResponse(200, headers={"Content-Type": NDJSON_CONTENT_TYPE},
+                            stream=self._stream_batch(orders, payload))
+
+    async def _stream_batch(self, orders: List[Dict[str, Any]], batch: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """Evaluate up to BATCH_CONCURRENCY orders at once; yield lines as they finish."""
+        slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async def run(index: int, order: Dict[str, Any]) -> bytes:
+            async with slots:
+                return await self._evaluate_order(index, order, batch)
+
+        tasks = [asyncio.ensure_future(run(index, order)) for index, order in enumerate(orders)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _evaluate_order(self, index: int, order: Dict[str, Any], batch: Dict[str, Any]) -> bytes:
+        """One batch line: the single-order endpoint's cache, latency and faults, per order."""
+        sales_order_id = order["sales_order_id"]
+        details = self.sales_orders.get(sales_order_id)
+        if isinstance(details, bytes):
+            details = json.loads(details)
+        payload = order_request(order, batch, details)
+        if payload is None:
+            return result_line(index, sales_order_id, 404, error=f"Sales Order {sales_order_id} not found")
+        if not payload["items"]:
+            return result_line(index, sales_order_id, 422, error="items: at least one item is required")
+
+        key = self._promise_key(payload)
+        if self.promise_cache is not None and key is not None:
+            cached = self.promise_cache.get(key, self.stock_version)
+            if cached is not None:
+                return result_line(index, sales_order_id, 200, result={**cached, "cached": True})
+        failure = await self._simulate("/otp/promise")
+        if failure is not None:
+            return result_line(index, sales_order_id, failure.status, error=failure.payload["detail"])
+        try:
+            result = self.evaluate_promise(payload)
+        except ValueError as error:
+            return result_line(index, sales_order_id, 422, error=str(error))
+        if self.promise_cache is not None and key is not None:
+            self.promise_cache.put(key, self.stock_version, result)
+        return result_line(index, sales_order_id, 200, result=result)
+
+    async def handle_promise_stream(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json()
+        try:
+            items = parse_stream_items(payload)
+            summary = self.evaluate_promise(payload) if self.promise_engine is not None else None
+        except ValueError as error:
+            return StubResponse(422, {"detail": str(error)})
+        return StubResponse(200, headers={"Content-Type": SSE_CONTENT_TYPE, "Cache-Control": "no-cache"},
+                            stream=self._stream_plan(items, summary))
+
+    async def _stream_plan(self, items: List[Dict[str, Any]],
+                           summary: Optional[Dict[str, Any]] = None) -> AsyncIterator[bytes]:
+        """One plan event per item, stream_item_delay_ms apart, then the summary.
+
+        With the promise engine the plan is the engine's; otherwise it is built
+        from stock around the mock promise date. Not served from the promise
+        cache: the point is the per-item timing.
+        """
+        ship_date = MOCK_PROMISE_RESPONSE_SUCCESS["promise_date"]
+        plan = []
+        for index, item in enumerate(items):
+            if self.stream_item_delay_ms > 0:
+                await asyncio.sleep(self.stream_item_delay_ms / 1000)
+            if summary is not None:
+                entry = summary["plan"][index]
+            else:
+                warehouse = item.get("warehouse") or DEFAULT_WAREHOUSE
+                entry = plan_entry(item, self.stock.lookup(item["item_code"], warehouse), ship_date)
+            plan.append(entry)
+            yield sse_event("plan", {"index": index, "total": len(items), "plan": entry})
+        if summary is None:
+            summary = {**MOCK_PROMISE_RESPONSE_SUCCESS, "plan": plan, "stock_version": self.stock_version}
+        yield sse_event("summary", summary)
+
+    async def handle_sales_orders(self, request: StubRequest, rest: str) -> StubResponse:
+        status, body = self.sales_order_pager.respond(request.query)
+        return StubResponse(status, body)
+
+    async def handle_sales_order_details(self, request: StubRequest, rest: str) -> StubResponse:
+        details = self.sales_orders.get(unquote(rest))
+        if details is None:
+            return _not_found(f"Sales Order {unquote(rest)} not found")
+        return StubResponse(200, details)
+
+    async def handle_items(self, request: StubRequest, rest: str) -> StubResponse:
+        return StubResponse(200, list(self.items))
+
+    async def handle_apply(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json() or {}
+        # Validate before anything changes, so a 400 leaves the stock version alone
+        reservations = (self.reservations(payload.get("sales_order_id", ""), payload.get("promise_date"))
+                        if self.atp is not None else [])
+        self.stock_version += 1
+        if reservations:
+            self.atp.apply(reservations)
+        return StubResponse(200, {
+            "status": "success",
+            "sales_order_id": payload.get("sales_order_id", ""),
+            "actions_taken": ["Added comment to Sales Order", "Updated custom field 'Promise Date'"],
+        })
+
+    def reservations(self, sales_order_id: str, promise_date: Optional[str]) -> List["AtpDelta"]:
+        """ATP reservations for a known Sales Order's lines from its promise date (ValueError when malformed)."""
+        import numpy as np
+
+        from tests.mocks.atp import RESERVE, AtpDelta
+        details = self.sales_orders.get(sales_order_id)
+        if isinstance(details, bytes):
+            details = json.loads(details)
+        if not details:
+            return []
+        if promise_date is not None:
+            np.datetime64(promise_date, "D")  # the format AtpIndex parses; raises ValueError
+        warehouse = (details.get("defaults") or {}).get("warehouse") or DEFAULT_WAREHOUSE
+        deltas = []
+        for line in details.get("items", []):
+            if line.get("item_code") is None or line.get("qty") is None:
+                raise ValueError(f"{sales_order_id}: line {line.get('item_code')} needs item_code and qty")
+            deltas.append(AtpDelta(line["item_code"], line.get("warehouse") or warehouse, float(line["qty"]),
+                                   RESERVE, promise_date, sales_order_id))
+        return deltas
+
+    async def handle_procurement_suggest(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json() or {}
+        self._suggestion_seq += 1
+        return StubResponse(200, {
+            "status": "success",
+            "suggestion_id": f"MAT-REQ-2026-{self._suggestion_seq:05d}",
+            "type": "Material Request",
+            "items_count": len(payload.get("items", [])),
+            "erpnext_url": "",
+        })
+
+    async def handle_item_search(self, request: StubRequest, rest: str) -> StubResponse:
+        status, body = self.item_index.respond(request.query)
+        return StubResponse(status, body)
+
+    async def handle_item_validate(self, request: StubRequest, rest: str) -> StubResponse:
+        item_code = request.query.get("item_code", "")
+        if item_code not in self.items:
+            return _not_found("Item not found")
+        return StubResponse(200, {"valid": True, "item_code": item_code})
+
+    async def handle_item_validate_batch(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json() or {}
+        try:
+            return StubResponse(200, validate_item_codes(payload.get("item_codes"), self.items))
+        except ValueError as error:
+            return StubResponse(422, {"detail": str(error)})
+
+    async def handle_item_stock(self, request: StubRequest, rest: str) -> StubResponse:
+        item_code = request.query.get("item_code", "")
+        row = self.stock.lookup(item_code, request.query.get("warehouse", DEFAULT_WAREHOUSE))
+        if row is None:
+            return _not_found("No stock for item/warehouse")
+        return StubResponse(200, row)
+
+    async def handle_item_stock_bulk(self, request: StubRequest, rest: str) -> StubResponse:
+        payload = request.json() or {}
+        try:
+            return StubResponse(200, self.stock.bulk(payload.get("pairs")))
+        except ValueError as error:
+            return StubResponse(422, {"detail": str(error)})
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    async def dispatch(self, request: StubRequest) -> StubResponse:
+        """Route a request, applying the latency profile and fault injection."""
+        if request.method == "OPTIONS":
+            return StubResponse(204)
+
+        handler, rest = self._resolve(request.method, request.path)
+        if handler is None:
+            if any(path == request.path for _, path in self.exact):
+                return StubResponse(405, {"detail": "Method Not Allowed"})
+            return _not_found()
+
+        self.request_counts[request.path] = self.request_counts.get(request.path, 0) + 1
+        cached = self.cached_promise(request)
+        if cached is not None:
+            return cached
+        failure = await self._simulate(request.path)
+        if failure is not None:
+            return failure
+
+        try:
+            return await handler(request, rest)
+        except (ValueError, json.JSONDecodeError) as error:
+            return StubResponse(400, {"detail": f"Bad request: {error}"})
+
+    async def _simulate(self, path: str) -> Optional[StubResponse]:
+        """Wait out the latency profile of path; the injected fault response, if any."""
+        profile = self.latency.profile_for(path)
+        fault = profile.roll_fault(self.latency.rng)
+        if fault == "timeout":
+            await asyncio.sleep(profile.hang_ms / 1000)
+            return StubResponse(504, {"detail": "Injected timeout"})
+
+        delay_ms = profile.sample_ms(self.latency.rng)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+        if fault == "error":
+            return StubResponse(profile.error_status, {"detail": "Injected fault"})
+        return None
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[StubRequest]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", "0") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return StubRequest(method.upper(), target, headers, body)
+
+    @staticmethod
+    def _encode_head(response: StubResponse, headers: Dict[str, str], keep_alive: bool) -> bytes:
+        headers = {**CORS_HEADERS, **response.headers, **headers}
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        head = f"HTTP/1.1 {response.status} {REASONS.get(response.status, 'Unknown')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        return head.encode("latin-1") + b"\r\n"
+
+    @classmethod
+    def _encode_response(cls, response: StubResponse, keep_alive: bool) -> bytes:
+        body = response.body()
+        headers = {"Content-Length": str(len(body))}
+        if body and "Content-Type" not in response.headers:
+            headers["Content-Type"] = "application/json"
+        return cls._encode_head(response, headers, keep_alive) + body
+
+    async def _write_stream(self, writer: asyncio.StreamWriter, response: StubResponse, keep_alive: bool) -> None:
+        """Send response.stream as chunked transfer encoding, flushing every chunk."""
+        writer.write(self._encode_head(response, {"Transfer-Encoding": "chunked"}, keep_alive))
+        async for chunk in response.stream:
+            if chunk:
+                writer.write(f"{len(chunk):x}\r\n".encode("latin-1") + chunk + b"\r\n")
+                await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections_opened += 1
+        task = asyncio.current_task()
+        self._connection_tasks.add(task)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except ValueError as error:
+                    writer.write(self._encode_response(StubResponse(400, {"detail": str(error)}), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                response = await self.dispatch(request)
+                if response.stream is not None:
+                    await self._write_stream(writer, response, keep_alive)
+                else:
+                    writer.write(self._encode_response(response, keep_alive))
+                    await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connection_tasks.discard(task)
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8001) -> int:
+        """Start listening; returns the bound port (useful with port=0)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop accepting connections and drop the open ones."""
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._connection_tasks):
+            task.cancel()
+        await asyncio.gather(*self._connection_tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8001) -> None:
+        bound = await self.start(host, port)
+        print(f"OTP stub server listening on http://{host}:{bound}", flush=True)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def run_in_thread(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Run the server on a background event loop; returns its base URL."""
+        ready = threading.Event()
+        bound: Dict[str, int] = {}
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            bound["port"] = self._loop.run_until_complete(self.start(host, port))
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="otp-stub-server", daemon=True)
+        self._thread.start()
+        ready.wait(timeout=10)
+        return f"http://{host}:{bound['port']}"
+
+    def stop(self) -> None:
+        """Stop a server started with run_in_thread."""
+        if self._loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self.close(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._loop = None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Local OTP stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--profile", default="none", choices=sorted(PRESETS),
+                        help="Latency preset (see tests/stub/latency.py)")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for reproducible latency")
+    parser.add_argument("--error-rate", type=float, default=None, help="Override error rate on every endpoint")
+    parser.add_argument("--timeout-rate", type=float, default=None, help="Override hang rate on every endpoint")
+    parser.add_argument("--catalog-orders", type=int, default=None,
+                        help="Serve a generated catalog with this many sales orders")
+    parser.add_argument("--catalog-items", type=int, default=None, help="Items in the generated catalog")
+    parser.add_argument("--catalog-seed", type=int, default=None, help="Seed for the generated catalog")
+    parser.add_argument("--catalog-dir", default=None, help="Serve catalog blobs written by tests.mocks.catalog")
+    parser.add_argument("--promise-cache-ttl", type=float, default=DEFAULT_TTL_S,
+                        help="Seconds a /otp/promise result stays cached (0 disables the cache)")
+    parser.add_argument("--stream-item-delay-ms", type=float, default=DEFAULT_STREAM_ITEM_DELAY_MS,
+                        help="Delay before each plan event of /otp/promise/stream")
+    parser.add_argument("--promise-engine", action="store_true",
+                        help="Compute promise dates from the request rules instead of the fixed mock response")
+    parser.add_argument("--atp", action="store_true",
+                        help="With --promise-engine, also promise from seeded purchase order / production receipts")
+    parser.add_argument("--atp-seed", type=int, default=7, help="Seed for the --atp receipts")
+    return parser
+
+
+def load_catalog(args: argparse.Namespace) -> Optional["CatalogBlobs"]:
+    """Blobs for --catalog-dir / --catalog-* (None for the default mock data)."""
+    if args.catalog_dir:
+        from tests.mocks.catalog import load_blobs
+        return load_blobs(args.catalog_dir)
+    if args.catalog_orders or args.catalog_items or args.catalog_seed is not None:
+        from tests.mocks.catalog import Catalog, CatalogSpec
+        defaults = CatalogSpec()
+        spec = CatalogSpec(
+            sales_orders=args.catalog_orders or defaults.sales_orders,
+            items=args.catalog_items or defaults.items,
+            seed=defaults.seed if args.catalog_seed is None else args.catalog_seed,
+        )
+        return Catalog.generate(spec).blobs()
+    return None
+
+
+def load_promise_engine(args: argparse.Namespace) -> Optional["PromiseEngine"]:
+    """PromiseEngine for --promise-engine (None serves the fixed mock response)."""
+    if not args.promise_engine:
+        return None
+    from tests.mocks.promise_engine import PromiseEngine
+    return PromiseEngine()
+
+
+def build_server(args: argparse.Namespace) -> OTPStubServer:
+    overrides = {}
+    if args.error_rate is not None:
+        overrides["error_rate"] = args.error_rate
+    if args.timeout_rate is not None:
+        overrides["timeout_rate"] = args.timeout_rate
+    return OTPStubServer(LatencyModel.from_preset(args.profile, seed=args.seed, **overrides), blobs=load_catalog(args),
+                         promise_cache_ttl_s=args.promise_cache_ttl,
+                         stream_item_delay_ms=args.stream_item_delay_ms, promise_engine=load_promise_engine(args),
+                         atp_seed=args.atp_seed if args.atp else None)
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(build_server(args).serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
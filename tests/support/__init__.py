@@ -0,0 +1 @@
+"""Test infrastructure shared by the UI test suites (browsers, runners)."""
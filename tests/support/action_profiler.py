@@ -0,0 +1,253 @@
+"""
+Per-action Timing for Page Objects
+
+Page object methods decorated with @timed_action are recorded into an
+in-memory ring buffer:
+- Action name (Class.method), selector, duration, retries, success
+- Nesting is kept, so PromiseCalculatorPage.add_item -> BasePage.click shows
+  up as a stack with self time per frame
+
+Recording is a perf_counter pair and a deque append. Files are only written
+when OTP_ACTION_PROFILE points at a directory: each process then exports, at
+exit, a flamegraph "folded stacks" file (flamegraph.pl / speedscope) and a CSV.
+
+Usage:
+    OTP_ACTION_PROFILE=profiles python run_tests.py
+    python run_tests.py --profile-actions profiles
+    flamegraph.pl profiles/actions.folded > actions.svg
+"""
+
+import csv
+import functools
+import glob
+import inspect
+import multiprocessing.util
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+PROFILE_DIR_ENV = "OTP_ACTION_PROFILE"
+DEFAULT_CAPACITY = 20000
+
+CSV_FIELDS = ["stack", "action", "selector", "duration_ms", "self_ms", "retries", "ok"]
+
+
+class ActionRecord(NamedTuple):
+    """One finished page object action."""
+
+    stack: Tuple[str, ...]
+    action: str
+    selector: str
+    duration_ms: float
+    self_ms: float
+    retries: int
+    ok: bool
+
+
+class _Frame:
+    __slots__ = ("action", "selector", "start", "child_ms", "retries")
+
+    def __init__(self, action: str, selector: str):
+        self.action = action
+        self.selector = selector
+        self.start = time.perf_counter()
+        self.child_ms = 0.0
+        self.retries = 0
+
+
+class ActionProfiler:
+    """Ring buffer of ActionRecords plus the stack of actions in progress."""
+
+    def __init__(self, capacity: Optional[int] = DEFAULT_CAPACITY):
+        self.records: Deque[ActionRecord] = deque(maxlen=capacity)
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, action: str, selector: str = "") -> _Frame:
+        frame = _Frame(action, selector)
+        self._stack().append(frame)
+        return frame
+
+    def end(self, frame: _Frame, ok: bool = True) -> ActionRecord:
+        stack = self._stack()
+        names = tuple(entry.action for entry in stack)
+        stack.pop()
+        duration_ms = (time.perf_counter() - frame.start) * 1000
+        if stack:
+            stack[-1].child_ms += duration_ms
+        record = ActionRecord(names, frame.action, frame.selector, duration_ms,
+                              max(duration_ms - frame.child_ms, 0.0), frame.retries, ok)
+        self.records.append(record)
+        return record
+
+    def note_retry(self) -> None:
+        """Count a retry against the innermost running action."""
+        stack = self._stack()
+        if stack:
+            stack[-1].retries += 1
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def summary(self, key: str = "action") -> List[Dict[str, object]]:
+        """Total/mean/max time grouped by "action" or "selector", slowest first."""
+        groups: Dict[str, Dict[str, object]] = {}
+        for record in self.records:
+            name = getattr(record, key) or "-"
+            group = groups.setdefault(name, {key: name, "count": 0, "total_ms": 0.0,
+                                             "max_ms": 0.0, "retries": 0})
+            group["count"] += 1
+            group["total_ms"] += record.self_ms
+            group["max_ms"] = max(group["max_ms"], record.duration_ms)
+            group["retries"] += record.retries
+        for group in groups.values():
+            group["mean_ms"] = group["total_ms"] / group["count"]
+        return sorted(groups.values(), key=lambda group: group["total_ms"], reverse=True)
+
+    def export_folded(self, path: str) -> None:
+        """Write self time (microseconds) per stack in flamegraph folded format."""
+        write_folded(path, folded_lines(self.records))
+
+    def export_csv(self, path: str) -> None:
+        with open(path, "w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(CSV_FIELDS)
+            for record in self.records:
+                writer.writerow([";".join(record.stack), record.action, record.selector,
+                                 f"{record.duration_ms:.3f}", f"{record.self_ms:.3f}",
+                                 record.retries, int(record.ok)])
+
+    def export(self, directory: str) -> None:
+        """Write this process's actions-<pid>.folded / .csv into directory."""
+        if not self.records:
+            return
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f"actions-{os.getpid()}")
+        self.export_folded(base + ".folded")
+        self.export_csv(base + ".csv")
+
+
+def folded_lines(records: Iterable[ActionRecord]) -> Dict[str, int]:
+    """Aggregate self time in microseconds per ";"-joined stack."""
+    totals: Dict[str, int] = {}
+    for record in records:
+        key = ";".join(record.stack)
+        totals[key] = totals.get(key, 0) + int(record.self_ms * 1000)
+    return totals
+
+
+def write_folded(path: str, totals: Dict[str, int]) -> None:
+    with open(path, "w") as handle:
+        for stack, micros in sorted(totals.items()):
+            if micros > 0:
+                handle.write(f"{stack} {micros}\n")
+
+
+def merge_profiles(directory: str) -> Tuple[str, str]:
+    """Merge every worker's files into actions.folded and actions.csv."""
+    totals: Dict[str, int] = {}
+    for path in glob.glob(os.path.join(directory, "actions-*.folded")):
+        with open(path) as handle:
+            for line in handle:
+                stack, _, micros = line.rstrip("\n").rpartition(" ")
+                totals[stack] = totals.get(stack, 0) + int(micros)
+    folded_path = os.path.join(directory, "actions.folded")
+    write_folded(folded_path, totals)
+
+    csv_path = os.path.join(directory, "actions.csv")
+    with open(csv_path, "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(CSV_FIELDS)
+        for path in sorted(glob.glob(os.path.join(directory, "actions-*.csv"))):
+            with open(path, newline="") as handle:
+                rows = csv.reader(handle)
+                next(rows, None)
+                writer.writerows(rows)
+    return folded_path, csv_path
+
+
+def load_csv(path: str) -> ActionProfiler:
+    """Rebuild a profiler from an exported CSV (e.g. the merged actions.csv)."""
+    profiler = ActionProfiler(capacity=None)
+    with open(path, newline="") as handle:
+        for row in csv.DictReader(handle):
+            profiler.records.append(ActionRecord(
+                tuple(row["stack"].split(";")), row["action"], row["selector"],
+                float(row["duration_ms"]), float(row["self_ms"]), int(row["retries"]), row["ok"] == "1",
+            ))
+    return profiler
+
+
+def format_summary(profiler: ActionProfiler, key: str = "action", limit: int = 10) -> str:
+    """Top entries of ActionProfiler.summary as a fixed-width table."""
+    lines = [f"{key:<60} {'count':>6} {'self ms':>10} {'mean ms':>9} {'max ms':>9} {'retries':>7}"]
+    for group in profiler.summary(key)[:limit]:
+        lines.append(f"{str(group[key])[:60]:<60} {group['count']:>6} {group['total_ms']:>10.1f} "
+                     f"{group['mean_ms']:>9.1f} {group['max_ms']:>9.1f} {group['retries']:>7}")
+    return "\n".join(lines)
+
+
+PROFILER = ActionProfiler()
+
+
+# Argument names that identify what an action targets, in order of preference
+SELECTOR_PARAMS = ("selector", "locator", "url_part", "path")
+LOCATOR_REPR = re.compile(r"selector=(['\"])(.*)\1>$")
+
+
+def describe_target(value: object) -> str:
+    """Selector string for a CSS selector, URL part or Playwright Locator."""
+    if isinstance(value, str):
+        return value
+    text = repr(value)
+    match = LOCATOR_REPR.search(text)
+    return match.group(2) if match else text
+
+
+def timed_action(func: Callable) -> Callable:
+    """Record the decorated page object method in PROFILER.
+
+    The selector comes from the first argument named in SELECTOR_PARAMS.
+    """
+    params = list(inspect.signature(func).parameters)
+    target = next((param for param in SELECTOR_PARAMS if param in params), None)
+    target_index = params.index(target) if target else None
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        selector = ""
+        if target is not None:
+            if target in kwargs:
+                selector = describe_target(kwargs[target])
+            elif len(args) > target_index:
+                selector = describe_target(args[target_index])
+        frame = PROFILER.begin(name, selector)
+        ok = False
+        try:
+            result = func(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            PROFILER.end(frame, ok)
+
+    return wrapper
+
+
+def _export_at_exit() -> None:
+    directory = os.environ.get(PROFILE_DIR_ENV)
+    if directory:
+        PROFILER.export(directory)
+
+
+# Not atexit: pool workers leave through os._exit(), which skips atexit but
+# still runs multiprocessing finalizers (as does the main process on exit)
+multiprocessing.util.Finalize(None, _export_at_exit, exitpriority=10)
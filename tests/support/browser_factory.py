@@ -0,0 +1,118 @@
+"""
+Browser Factory
+
+One place that turns the CI matrix environment into a Playwright browser:
+- BROWSER: chromium (default), chrome, msedge, firefox, webkit
+- HEADLESS: true by default; HEADLESS=false for a visible browser
+- SCREEN_WIDTH / SCREEN_HEIGHT: viewport of every test context (1920x1080)
+- BROWSER_WS_ENDPOINT: connect to an already running browser server instead
+  of launching one (see `python -m playwright launch-server`)
+- BROWSER_ARGS: extra command line switches, space separated
+
+Chromium-based engines get low-overhead switches: no GPU compositing and no
+throttling of background tabs/timers (parallel workers run many at once).
+"""
+
+import os
+import shlex
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Browser, BrowserType, Playwright
+
+# BROWSER value -> (Playwright engine, release channel)
+ENGINES: Dict[str, Tuple[str, Optional[str]]] = {
+    "chromium": ("chromium", None),
+    "chrome": ("chromium", "chrome"),
+    "msedge": ("chromium", "msedge"),
+    "edge": ("chromium", "msedge"),
+    "firefox": ("firefox", None),
+    "webkit": ("webkit", None),
+    "safari": ("webkit", None),
+}
+
+LOW_OVERHEAD_CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-gpu-compositing",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--mute-audio",
+]
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class BrowserConfig:
+    """Launch settings resolved from the environment."""
+
+    engine: str = "chromium"
+    channel: Optional[str] = None
+    headless: bool = True
+    width: int = 1920
+    height: int = 1080
+    ws_endpoint: Optional[str] = None
+    extra_args: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_env(cls) -> "BrowserConfig":
+        name = os.environ.get("BROWSER", "chromium").strip().lower() or "chromium"
+        if name not in ENGINES:
+            raise ValueError(f"Unsupported BROWSER={name!r}, expected one of {sorted(ENGINES)}")
+        engine, channel = ENGINES[name]
+        return cls(
+            engine=engine,
+            channel=channel,
+            headless=_env_flag("HEADLESS", True),
+            width=int(os.environ.get("SCREEN_WIDTH", "1920")),
+            height=int(os.environ.get("SCREEN_HEIGHT", "1080")),
+            ws_endpoint=os.environ.get("BROWSER_WS_ENDPOINT") or None,
+            extra_args=tuple(shlex.split(os.environ.get("BROWSER_ARGS", ""))),
+        )
+
+    @property
+    def viewport(self) -> Dict[str, int]:
+        return {"width": self.width, "height": self.height}
+
+    def launch_args(self) -> List[str]:
+        """Command line switches for this engine."""
+        base = LOW_OVERHEAD_CHROMIUM_ARGS if self.engine == "chromium" else []
+        return [*base, *self.extra_args]
+
+    def launch_options(self) -> Dict[str, Any]:
+        """Keyword arguments for BrowserType.launch (also valid launch-server config)."""
+        options: Dict[str, Any] = {"headless": self.headless, "args": self.launch_args()}
+        if self.channel:
+            options["channel"] = self.channel
+        return options
+
+
+def browser_type(playwright: Playwright, config: BrowserConfig) -> BrowserType:
+    return getattr(playwright, config.engine)
+
+
+def launch_browser(playwright: Playwright, config: Optional[BrowserConfig] = None) -> Browser:
+    """Connect to BROWSER_WS_ENDPOINT when set, otherwise launch a browser."""
+    config = config or BrowserConfig.from_env()
+    engine = browser_type(playwright, config)
+    if config.ws_endpoint:
+        return engine.connect(config.ws_endpoint)
+    return engine.launch(**config.launch_options())
+
+
+def context_options(config: Optional[BrowserConfig] = None) -> Dict[str, Any]:
+    """Keyword arguments for Browser.new_context (viewport from SCREEN_*)."""
+    config = config or BrowserConfig.from_env()
+    return {"viewport": config.viewport}
@@ -0,0 +1,176 @@
+"""
+Shared Browser Server
+
+Runs ONE Playwright browser server per machine; test workers attach with
+BrowserType.connect(ws_endpoint) and only create contexts (a few ms) instead
+of each starting a driver and a browser process.
+
+The Python package has no BrowserType.launch_server, so the server is the
+driver's `launch-server` command, configured from browser_factory (engine,
+headless mode, low-overhead args).
+
+A running server is recorded in a state file, so later runs on the same
+machine reuse it instead of launching another:
+
+Usage:
+    python -m tests.support.browser_server            # start, print endpoint, serve until Ctrl+C
+    python -m tests.support.browser_server --status
+    python -m tests.support.browser_server --stop
+    python run_tests.py --browser-server              # reuse or start one for the run
+"""
+
+import argparse
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+from tests.support.browser_factory import BrowserConfig
+
+STATE_DIR = os.path.join(tempfile.gettempdir(), "otp-ui-tests")
+START_TIMEOUT_S = 30.0
+
+
+@dataclass
+class ServerInfo:
+    """A browser server process and the endpoint workers connect to."""
+
+    pid: int
+    ws_endpoint: str
+    engine: str
+
+
+def state_path(config: BrowserConfig) -> str:
+    channel = f"-{config.channel}" if config.channel else ""
+    mode = "headless" if config.headless else "headed"
+    return os.path.join(STATE_DIR, f"browser-server-{config.engine}{channel}-{mode}.json")
+
+
+def is_alive(info: ServerInfo) -> bool:
+    """The process exists and its WebSocket port accepts connections."""
+    try:
+        os.kill(info.pid, 0)
+    except (OSError, ValueError):
+        return False
+    parts = urlsplit(info.ws_endpoint)
+    try:
+        with socket.create_connection((parts.hostname, parts.port), timeout=1.0):
+            return True
+    except OSError:
+        return False
+
+
+def read_state(config: BrowserConfig) -> Optional[ServerInfo]:
+    """The recorded server for this config, if it is still running."""
+    try:
+        with open(state_path(config)) as handle:
+            info = ServerInfo(**json.load(handle))
+    except (OSError, ValueError, TypeError):
+        return None
+    return info if is_alive(info) else None
+
+
+def _write_state(config: BrowserConfig, info: ServerInfo) -> None:
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(state_path(config), "w") as handle:
+        json.dump(asdict(info), handle)
+
+
+def start_server(config: Optional[BrowserConfig] = None) -> Tuple[ServerInfo, subprocess.Popen]:
+    """Launch a browser server process and wait for its ws:// endpoint."""
+    config = config or BrowserConfig.from_env()
+    options = {**config.launch_options(), "host": "127.0.0.1"}
+    os.makedirs(STATE_DIR, exist_ok=True)
+    config_file = os.path.join(STATE_DIR, f"launch-{os.getpid()}.json")
+    with open(config_file, "w") as handle:
+        json.dump(options, handle)
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "playwright", "launch-server", "--browser", config.engine, "--config", config_file],
+        stdout=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
+        text=True,
+        start_new_session=True,  # outlives Ctrl+C in the test runner's terminal
+    )
+    deadline = time.monotonic() + START_TIMEOUT_S
+    endpoint = None
+    while endpoint is None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([process.stdout], [], [], remaining)[0]:
+            break
+        line = process.stdout.readline()
+        if not line:
+            break
+        if line.startswith("ws://"):
+            endpoint = line.strip()
+    os.remove(config_file)
+    if endpoint is None:
+        process.kill()
+        raise RuntimeError(f"Browser server for {config.engine} did not report a ws:// endpoint")
+
+    info = ServerInfo(pid=process.pid, ws_endpoint=endpoint, engine=config.engine)
+    _write_state(config, info)
+    return info, process
+
+
+def ensure_server(config: Optional[BrowserConfig] = None) -> Tuple[ServerInfo, Optional[subprocess.Popen]]:
+    """Reuse this machine's server for config, or start one (process is None when reused)."""
+    config = config or BrowserConfig.from_env()
+    info = read_state(config)
+    if info is not None:
+        return info, None
+    return start_server(config)
+
+
+def stop_server(config: Optional[BrowserConfig] = None) -> bool:
+    """Stop the recorded server for config; False if none was running."""
+    config = config or BrowserConfig.from_env()
+    info = read_state(config)
+    try:
+        os.remove(state_path(config))
+    except OSError:
+        pass
+    if info is None:
+        return False
+    # The server runs in its own session: python wrapper -> node driver -> browser
+    os.killpg(info.pid, signal.SIGTERM)
+    return True
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Shared Playwright browser server for UI test workers")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--status", action="store_true", help="Print the running server's endpoint")
+    group.add_argument("--stop", action="store_true", help="Stop the running server")
+    args = parser.parse_args(argv)
+    config = BrowserConfig.from_env()
+
+    if args.status:
+        info = read_state(config)
+        print(info.ws_endpoint if info else "not running")
+        return 0 if info else 1
+    if args.stop:
+        return 0 if stop_server(config) else 1
+
+    info, process = ensure_server(config)
+    print(f"BROWSER_WS_ENDPOINT={info.ws_endpoint}", flush=True)
+    if process is None:
+        print(f"(already running, pid {info.pid})")
+        return 0
+    try:
+        process.wait()
+    except KeyboardInterrupt:
+        stop_server(config)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
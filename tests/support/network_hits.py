@@ -0,0 +1,102 @@
+"""
+Network Hits per User Action
+
+Counts the API requests a page actually puts on the wire (route mocks see
+them too), grouped by the user action that caused them:
+- Only URLs matching API_URL_PATTERN (/health, /otp/..., /api/items/...)
+- CORS preflights (OPTIONS) are not counted
+- Each action closes only once no counted request is in flight and none
+  has started for QUIET_MS, so requests fired after the block returns
+  (debounced validation, per-row follow-ups) still count for the action
+
+Coalesced or cached requests never reach the network, so they do not count.
+
+Usage:
+    hits = NetworkHits(page)
+    with hits.action("load"):
+        promise_page.navigate_to_promise_calculator()
+    self.assertEqual(hits.count("load", "GET /health"), 1)
+    print(hits.report())
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Pattern, Set
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Page, Request, TimeoutError
+
+from tests.mocks.routes import API_URL_PATTERN
+
+IDLE_TIMEOUT_MS = 10000
+QUIET_MS = 500     # longer than the client batching / debounce delays
+POLL_MS = 50
+
+
+def request_key(request: Request) -> str:
+    """"METHOD /path" (query string dropped)."""
+    return f"{request.method} {urlsplit(request.url).path.rstrip('/') or '/'}"
+
+
+class NetworkHits:
+    """Per-action counters of API requests seen by a page."""
+
+    def __init__(self, page: Page, pattern: Pattern[str] = API_URL_PATTERN):
+        self.page = page
+        self.pattern = pattern
+        self.actions: Dict[str, List[Request]] = {}
+        self._current: Optional[List[Request]] = None
+        self._in_flight: Set[Request] = set()
+        self._last_started = time.monotonic()
+        page.on("request", self._record)
+        page.on("requestfinished", self._in_flight.discard)
+        page.on("requestfailed", self._in_flight.discard)
+
+    def _record(self, request: Request) -> None:
+        if request.method == "OPTIONS" or not self.pattern.search(request.url):
+            return
+        self._in_flight.add(request)
+        self._last_started = time.monotonic()
+        if self._current is not None:
+            self._current.append(request)
+
+    def wait_for_quiet(self, quiet_ms: int = QUIET_MS, timeout: int = IDLE_TIMEOUT_MS) -> None:
+        """Wait until no API request is in flight and none has started for quiet_ms."""
+        deadline = time.monotonic() + timeout / 1000
+        while self._in_flight or (time.monotonic() - self._last_started) * 1000 < quiet_ms:
+            if time.monotonic() > deadline:
+                pending = ", ".join(sorted(request_key(request) for request in self._in_flight))
+                raise TimeoutError(f"API requests not quiet after {timeout} ms (in flight: {pending or 'none'})")
+            # Playwright dispatches request events while this call waits
+            self.page.wait_for_timeout(POLL_MS)
+
+    @contextmanager
+    def action(self, name: str, idle_timeout: int = IDLE_TIMEOUT_MS) -> Iterator[List[Request]]:
+        """Attribute every API request made inside the block (and until quiet) to name."""
+        recorded = self.actions.setdefault(name, [])
+        self._current = recorded
+        try:
+            yield recorded
+            self.wait_for_quiet(timeout=idle_timeout)
+        finally:
+            self._current = None
+
+    def requests(self, name: str, key: Optional[str] = None) -> List[Request]:
+        """Requests of an action, optionally only those matching "METHOD /path"."""
+        recorded = self.actions.get(name, [])
+        return [request for request in recorded if key is None or request_key(request) == key]
+
+    def count(self, name: str, key: Optional[str] = None) -> int:
+        return len(self.requests(name, key))
+
+    def counts(self, name: str) -> Dict[str, int]:
+        return dict(Counter(request_key(request) for request in self.actions.get(name, [])))
+
+    def report(self) -> str:
+        """One line per action and endpoint, for failure messages."""
+        lines = []
+        for name in self.actions:
+            for key, hits in sorted(self.counts(name).items()):
+                lines.append(f"{name:<24} {hits:>4}  {key}")
+        return "\n".join(lines)
@@ -0,0 +1,134 @@
+"""
+Warm-start BrowserContexts
+
+Cold start (first goto, ngrok interstitial, downloading every Next.js chunk)
+is paid once per worker process instead of once per test:
+- A warm-up context loads the app once, clicks through the ngrok "Visit Site"
+  interstitial if there is one, and snapshots storage state (cookies incl.
+  the ngrok bypass cookie, localStorage)
+- Every test context starts from that snapshot and shares an in-memory cache
+  of /_next/static assets (browser HTTP caches are per context otherwise)
+- ngrok targets also get the ngrok-skip-browser-warning header, so
+  navigate_to can skip its 2 s interstitial probe on warm contexts; targets
+  that are not ngrok never need the probe at all
+
+The app registers no service worker, so contexts block them to keep the
+snapshot the only state carried between tests.
+
+Disable with OTP_WARM_START=0.
+"""
+
+import os
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Route
+
+from tests.mocks.routes import API_URL_PATTERN
+from tests.support.browser_factory import context_options
+
+WARM_START_ENV = "OTP_WARM_START"
+NGROK_HOST_SUFFIXES = (".ngrok-free.app", ".ngrok-free.dev", ".ngrok.app", ".ngrok.dev", ".ngrok.io")
+NGROK_SKIP_HEADER = {"ngrok-skip-browser-warning": "1"}
+
+# Content-hashed build output; safe to serve from memory for the whole run
+STATIC_ASSET_GLOB = "**/_next/static/**"
+
+_storage_state: Optional[Dict[str, Any]] = None
+_warm_up_failed = False
+_asset_cache: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+_warm_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+def get_base_url() -> str:
+    return os.environ.get("BASE_URL", "http://localhost:3000")
+
+
+def is_ngrok_url(url: str) -> bool:
+    """True when the URL points at an ngrok tunnel (interstitial possible)."""
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host.endswith(suffix) for suffix in NGROK_HOST_SUFFIXES)
+
+
+def warm_start_enabled() -> bool:
+    return os.environ.get(WARM_START_ENV, "1").lower() not in ("0", "false", "no")
+
+
+def needs_ngrok_probe(context: BrowserContext, base_url: Optional[str] = None) -> bool:
+    """Whether navigate_to must look for the ngrok interstitial."""
+    return is_ngrok_url(base_url or get_base_url()) and context not in _warm_contexts
+
+
+def _serve_static_asset(route: Route) -> None:
+    """Fulfill hashed assets from the process-wide cache, fetching on a miss."""
+    request = route.request
+    if request.method != "GET":
+        route.fallback()
+        return
+    cached = _asset_cache.get(request.url)
+    if cached is None:
+        response = route.fetch()
+        if response.status != 200:
+            route.fulfill(response=response)
+            return
+        cached = (response.status, response.headers, response.body())
+        _asset_cache[request.url] = cached
+    status, headers, body = cached
+    route.fulfill(status=status, headers=headers, body=body)
+
+
+def _context_options(base_url: str) -> Dict[str, Any]:
+    options: Dict[str, Any] = {**context_options(), "service_workers": "block"}
+    if is_ngrok_url(base_url):
+        options["extra_http_headers"] = NGROK_SKIP_HEADER
+    return options
+
+
+def _warm_up(browser: Browser, base_url: str) -> Dict[str, Any]:
+    """Load the app once and return its storage state."""
+    context = browser.new_context(**_context_options(base_url))
+    try:
+        # The API is not needed to boot the shell; keep warm-up off the backend
+        context.route(API_URL_PATTERN, lambda route: route.abort())
+        context.route(STATIC_ASSET_GLOB, _serve_static_asset)
+        page = context.new_page()
+        page.goto(base_url, timeout=60000, wait_until="load")
+        visit_button = page.get_by_role("button", name="Visit Site")
+        if is_ngrok_url(base_url) and visit_button.is_visible():
+            visit_button.click()
+            page.wait_for_load_state("load", timeout=30000)
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+def new_warm_context(browser: Browser, **options: Any) -> BrowserContext:
+    """Create a test context that starts from this worker's warm snapshot."""
+    if not warm_start_enabled():
+        return browser.new_context(**{**context_options(), **options})
+
+    global _storage_state, _warm_up_failed
+    base_url = get_base_url()
+    if _storage_state is None and not _warm_up_failed:
+        try:
+            _storage_state = _warm_up(browser, base_url)
+        except Exception:
+            # App unreachable: fall back to cold contexts and let the tests
+            # report the real navigation error
+            _warm_up_failed = True
+    if _storage_state is None:
+        return browser.new_context(**{**context_options(), **options})
+
+    context = browser.new_context(**{**_context_options(base_url), "storage_state": _storage_state, **options})
+    context.route(STATIC_ASSET_GLOB, _serve_static_asset)
+    _warm_contexts.add(context)
+    return context
+
+
+def reset_warm_start() -> None:
+    """Forget the snapshot and asset cache (next context warms up again)."""
+    global _storage_state, _warm_up_failed
+    _storage_state = None
+    _warm_up_failed = False
+    _asset_cache.clear()
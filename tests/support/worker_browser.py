@@ -0,0 +1,58 @@
+"""
+Worker-scoped Browser
+
+Each test process (a run_tests.py worker, or a plain pytest/unittest run)
+holds ONE long-lived Playwright browser:
+- Started lazily on first use
+- Shared by every test class that runs in the process
+- Released once when the process exits
+
+With BROWSER_WS_ENDPOINT set (run_tests.py --browser-server) the process only
+connects to the machine's shared browser server, and "release" is a
+disconnect; there is no browser process to shut down.
+
+Tests isolate themselves by creating a fresh BrowserContext per test.
+Engine, headless mode and launch args come from tests/support/browser_factory.py.
+"""
+
+import multiprocessing.util
+from typing import Optional
+
+from playwright.sync_api import Browser, Playwright, sync_playwright
+
+from tests.support.browser_factory import launch_browser
+
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+
+
+def get_worker_browser() -> Browser:
+    """Get the browser owned by this process, launching (or connecting) on first use."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        if _playwright is None:
+            _playwright = sync_playwright().start()
+            # A finalizer, not atexit: pool workers exit through os._exit()
+            multiprocessing.util.Finalize(None, shutdown_worker_browser, exitpriority=20)
+        _browser = launch_browser(_playwright)
+    return _browser
+
+
+def shutdown_worker_browser() -> None:
+    """Close (or disconnect from) the worker browser and stop Playwright; safe to call twice."""
+    global _playwright, _browser
+    try:
+        if _browser is not None:
+            _browser.close()
+    except Exception:
+        pass
+    finally:
+        _browser = None
+
+    try:
+        if _playwright is not None:
+            _playwright.stop()
+    except Exception:
+        pass
+    finally:
+        _playwright = None
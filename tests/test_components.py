@@ -9,24 +9,26 @@ Components tested:
 - Item Code Input Field (validation, valid/invalid codes)
 - Calendar & Weekend Settings (highlighting, business rules)
 - Results Panel (data rendering)
+- Batch Re-promise (multi-order evaluation)
 
 Follows AutomationSamana25 course pattern with unittest framework.
 """
 
 import unittest
-import json
 import re
-from playwright.sync_api import sync_playwright, expect
+from playwright.sync_api import expect
 from tests.pages.promise_calculator_page import PromiseCalculatorPage
+from tests.support.worker_browser import get_worker_browser
+from tests.support.warm_start import new_warm_context
 from tests.mocks.otp import (
-    MOCK_HEALTH_RESPONSE,
-    MOCK_SALES_ORDERS_LIST,
-    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
-    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
-    MOCK_PROMISE_RESPONSE_SUCCESS,
-    VALID_ITEM_CODES,
-    INVALID_ITEM_CODE,
+    VALID_ITEM_CODES, INVALID_ITEM_CODE, DEFAULT_WAREHOUSE, MOCK_SALES_ORDERS_LIST, MOCK_STOCK_DATA,
 )
+from tests.mocks.item_search import ItemSearchIndex
+from tests.mocks.routes import (
+    HEALTH_BODY, install_otp_mocks, item_search, item_stock, item_validate, lookup, sales_order_pages, serialize,
+)
+from tests.mocks.sales_order_pages import SalesOrderPager
+from tests.support.network_hits import NetworkHits
 
 
 class PromiseCalculatorComponentTest(unittest.TestCase):
@@ -34,99 +36,23 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up browser once for all tests in this class."""
-        cls.playwright = sync_playwright().start()
-        cls.browser = cls.playwright.chromium.launch(headless=False)
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up after all tests are done."""
-        import threading
-        
-        def close_browser():
-            try:
-                cls.browser.close()
-            except (KeyboardInterrupt, Exception):
-                pass
-        
-        # Close browser in a thread with timeout
-        thread = threading.Thread(target=close_browser, daemon=True)
-        thread.start()
-        thread.join(timeout=5)
-        
-        try:
-            cls.playwright.stop()
-        except (KeyboardInterrupt, Exception):
-            pass
+        """Attach to the long-lived browser owned by this worker process."""
+        cls.browser = get_worker_browser()
 
     def setUp(self):
-        """Set up before each test method."""
-        self.page = self.browser.new_page()
-        self.promise_page = PromiseCalculatorPage(self.page)
+        """Set up a fresh browser context and page for each test method."""
+        self.context = new_warm_context(self.browser)
         self._mock_api_endpoints()
+        self.page = self.context.new_page()
+        self.promise_page = PromiseCalculatorPage(self.page)
 
     def tearDown(self):
         """Clean up after each test method."""
-        self.page.close()
+        self.context.close()
 
     def _mock_api_endpoints(self):
-        """Mock all API endpoints."""
-        # Mock health check endpoints
-        def handle_health(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_HEALTH_RESPONSE),
-            )
-
-        self.page.route("**/health", handle_health)
-        self.page.route("**/otp/health", handle_health)
-
-        # Mock sales orders list
-        def handle_sales_orders_list(route):
-            url = route.request.url
-            if "/otp/sales-orders/" in url:
-                return
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDERS_LIST),
-            )
-
-        self.page.route("**/otp/sales-orders**", handle_sales_orders_list)
-
-        # Mock individual sales order details
-        def handle_so_00001(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001),
-            )
-
-        def handle_so_00002(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002),
-            )
-
-        self.page.route("**/otp/sales-orders/SAL-ORD-2026-00001**", handle_so_00001)
-        self.page.route("**/otp/sales-orders/SAL-ORD-2026-00002**", handle_so_00002)
-
-        # Mock promise evaluation endpoint
-        def handle_promise_eval(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_PROMISE_RESPONSE_SUCCESS),
-            )
-
-        self.page.route("**/otp/promise", handle_promise_eval)
+        """Mock all API endpoints (one route on the test's BrowserContext)."""
+        self.mock_router = install_otp_mocks(self.context)
 
     # ========================================================================
     # COMPONENT: Sales Order Combobox
@@ -140,17 +66,17 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Switch to Sales Order mode
         so_mode_button = self.page.get_by_test_id("input-mode-sales-order").first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Open dropdown
         combobox_input = self.page.get_by_test_id(
             "sales-order-combobox-input"
         ).first
         combobox_input.click()
-        self.page.wait_for_timeout(500)
 
         # Verify options appear
         options = self.page.get_by_role("option")
+        self.promise_page.try_wait_for_locator(options.first)
         option_count = options.count()
         self.assertGreater(option_count, 0)
 
@@ -171,17 +97,17 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Switch to Sales Order mode
         so_mode_button = self.page.get_by_test_id("input-mode-sales-order").first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Open dropdown
         combobox_input = self.page.get_by_test_id(
             "sales-order-combobox-input"
         ).first
         combobox_input.click()
-        self.page.wait_for_timeout(500)
 
         # Get all options
         options = self.page.get_by_role("option")
+        self.promise_page.try_wait_for_locator(options.first)
         option_count = options.count()
 
         # Extract numeric parts and verify sorting
@@ -211,7 +137,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Switch to Sales Order mode (VERIFIED: data-testid="input-mode-sales-order")
         so_mode_button = self.page.get_by_test_id("input-mode-sales-order").first
         so_mode_button.click()
-        self.page.wait_for_timeout(1000)
+        self.promise_page.wait_for_query_idle()
 
         # In sales-order mode, SalesOrderSelector renders a Combobox with testId="sales-order-combobox"
         # Find the input inside that combobox (VERIFIED from source)
@@ -223,9 +149,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         
         # Type search term
         combobox_input.click()
-        self.page.wait_for_timeout(300)
-        combobox_input.fill("SAL-ORD")
-        self.page.wait_for_timeout(1500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD")
 
         # Verify options appear
         options = self.page.get_by_role("option")
@@ -244,21 +168,19 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Switch to Sales Order mode
         so_mode_button = self.page.get_by_test_id("input-mode-sales-order").first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Select a sales order
         combobox_input = self.page.get_by_test_id(
             "sales-order-combobox-input"
         ).first
         combobox_input.click()
-        self.page.wait_for_timeout(300)
-        combobox_input.fill("SAL-ORD-2026-00001")
-        self.page.wait_for_timeout(500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00001")
 
         option = self.page.get_by_role("option").first
-        if option.is_visible():
+        if self.promise_page.try_wait_for_locator(option):
             option.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_query_idle()
 
             # Verify selected
             selected_value = combobox_input.input_value()
@@ -270,12 +192,31 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             ).first
             if clear_button.is_visible():
                 clear_button.click()
-                self.page.wait_for_timeout(300)
+                self.promise_page.wait_for_input_value(combobox_input, "")
 
                 # Verify cleared
                 cleared_value = combobox_input.input_value()
                 self.assertEqual(cleared_value, "")
 
+    def test_combobox_05_scroll_loads_next_page(self):
+        """Component Test: Scrolling to the end of the list loads the next page."""
+        template = MOCK_SALES_ORDERS_LIST["sales_orders"][0]
+        orders = [{**template, "name": f"SAL-ORD-2026-{number:05d}"} for number in range(1, 61)]
+        self.mock_router.add("/otp/sales-orders", sales_order_pages(SalesOrderPager({"sales_orders": orders})))
+
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.switch_to_sales_order_mode()
+        self.page.get_by_test_id("sales-order-combobox-input").first.click()
+
+        # First page only
+        options = self.page.get_by_role("option")
+        expect(options).to_have_count(25)
+
+        # Second page is appended after the first
+        self.promise_page.load_more_sales_orders()
+        expect(options).to_have_count(50)
+        expect(options.nth(25)).to_contain_text("SAL-ORD-2026-00026")
+
     # ========================================================================
     # COMPONENT: Item Code Input Field
     # Test: Validation, valid/invalid codes, error messages
@@ -298,7 +239,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         ).first
         valid_item = VALID_ITEM_CODES[0]  # WIDGET-ALPHA
         item_code_input.fill(valid_item)
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -306,8 +246,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
 
         add_button = self.page.get_by_role("button", name="Add Item")
         if add_button.is_visible():
-            add_button.click()
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_dom_mutation(add_button.click)
 
             # Verify no error messages
             error_messages = self.page.locator('[role="alert"]')
@@ -334,33 +273,27 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
 
         # Add first item
         item_code_input.fill(VALID_ITEM_CODES[0])  # WIDGET-ALPHA
-        self.page.wait_for_timeout(300)
         qty_input.clear()
         qty_input.fill("5")
 
         if add_button.is_visible():
-            add_button.click()
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_dom_mutation(add_button.click)
 
         # Add second item
         item_code_input.fill(VALID_ITEM_CODES[1])  # WIDGET-BETA
-        self.page.wait_for_timeout(300)
         qty_input.clear()
         qty_input.fill("3")
 
         if add_button.is_visible():
-            add_button.click()
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_dom_mutation(add_button.click)
 
         # Add third item
         item_code_input.fill(VALID_ITEM_CODES[2])  # COMPONENT-X
-        self.page.wait_for_timeout(300)
         qty_input.clear()
         qty_input.fill("2")
 
         if add_button.is_visible():
-            add_button.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_dom_mutation(add_button.click)
 
         # Verify items are in the form by checking item count badge
         # VERIFIED from browser: Item count appears as "X item" or "X items" in a badge
@@ -399,7 +332,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             'input[data-testid="item-code-search-input"], input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill(INVALID_ITEM_CODE)  # INVALID-ITEM-XYZ
-        self.page.wait_for_timeout(500)
 
         # Try to add the item
         add_button = self.page.get_by_role("button", name="Add Item")
@@ -438,7 +370,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Test first 3 valid item codes
         for item_code in VALID_ITEM_CODES[:3]:
             item_code_input.fill(item_code)
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_input_value(item_code_input, item_code)
 
             qty_input.clear()
             qty_input.fill("1")
@@ -447,6 +379,71 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             input_value = item_code_input.input_value()
             self.assertEqual(input_value, item_code)
 
+    def test_item_input_05_sales_order_lines_validated_in_one_request(self):
+        """Component Test: Loading a Sales Order validates all its lines in one request."""
+        self.mock_router.add("/api/items/search", item_search(ItemSearchIndex(MOCK_STOCK_DATA["items"])))
+        self.mock_router.add("/api/items/validate", item_validate(frozenset(VALID_ITEM_CODES)))
+        hits = NetworkHits(self.page)
+
+        # Item search answering is what enables validation in the form
+        self.promise_page.wait_for_api_response(
+            "/api/items/search", self.promise_page.navigate_to_promise_calculator
+        )
+        self.promise_page.switch_to_sales_order_mode()
+        # The action stays open past the first response until the form settles,
+        # so a second POST or a per-line GET would be counted
+        with hits.action("select sales order"):
+            self.promise_page.wait_for_api_response(
+                self.promise_page.ITEM_VALIDATE_ENDPOINT,
+                lambda: self.promise_page.select_sales_order("SAL-ORD-2026-00001"),
+            )
+            self.promise_page.wait_for_query_idle()
+
+        validations = hits.requests("select sales order", "POST " + self.promise_page.ITEM_VALIDATE_ENDPOINT)
+        self.assertEqual(hits.count("select sales order", "GET " + self.promise_page.ITEM_VALIDATE_ENDPOINT), 0)
+        self.assertEqual(len(validations), 1, hits.report())
+        self.assertEqual(
+            sorted(validations[0].post_data_json["item_codes"]),
+            ["COMPONENT-X", "WIDGET-ALPHA", "WIDGET-BETA"],
+        )
+
+    def _serve_large_sales_order(self, name: str, line_count: int) -> None:
+        """Serve one Sales Order with line_count lines cycling through VALID_ITEM_CODES."""
+        lines = [
+            {"name": f"{name}-{index:04d}", "item_code": VALID_ITEM_CODES[index % len(VALID_ITEM_CODES)],
+             "qty": 1, "uom": "NOS", "warehouse": DEFAULT_WAREHOUSE}
+            for index in range(1, line_count + 1)
+        ]
+        details = {"name": name, "sales_order_id": name, "customer": "Acme Corporation", "items": lines,
+                   "defaults": {"warehouse": DEFAULT_WAREHOUSE, "delivery_mode": "LATEST_ACCEPTABLE"}}
+        summary = {**MOCK_SALES_ORDERS_LIST["sales_orders"][0], "name": name, "item_count": len(lines)}
+        self.mock_router.add("/otp/sales-orders", sales_order_pages(SalesOrderPager({"sales_orders": [summary]})))
+        self.mock_router.add_prefix("/otp/sales-orders/", lookup({name: serialize(details)}))
+        self.mock_router.add(self.promise_page.ITEM_STOCK_ENDPOINT, item_stock(MOCK_STOCK_DATA))
+
+    def test_item_input_06_sales_order_stock_fetched_in_one_request(self):
+        """Component Test: Stock for every line of a 50-line Sales Order arrives in one request."""
+        name = "SAL-ORD-2026-00050"
+        self._serve_large_sales_order(name, 50)
+        hits = NetworkHits(self.page)
+
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.switch_to_sales_order_mode()
+        # Stays open until the form settles, so a per-line GET would be counted
+        with hits.action("select sales order"):
+            self.promise_page.wait_for_api_response(
+                self.promise_page.ITEM_STOCK_ENDPOINT,
+                lambda: self.promise_page.select_sales_order(name),
+            )
+            self.promise_page.wait_for_query_idle()
+
+        stock_requests = hits.requests("select sales order", "POST " + self.promise_page.ITEM_STOCK_ENDPOINT)
+        self.assertEqual(hits.count("select sales order", "GET " + self.promise_page.ITEM_STOCK_ENDPOINT), 0)
+        self.assertEqual(len(stock_requests), 1, hits.report())
+        pairs = stock_requests[0].post_data_json["pairs"]
+        self.assertEqual(len(pairs), len(VALID_ITEM_CODES))
+        self.assertEqual(sorted(pair["item_code"] for pair in pairs), sorted(VALID_ITEM_CODES))
+
     # ========================================================================
     # COMPONENT: Calendar & Weekend Settings
     # Test: Weekend highlighting, toggle, date selection
@@ -459,12 +456,12 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Open delivery settings and calendar
         delivery_toggle = self.page.get_by_role("button", name="Delivery Settings")
         delivery_toggle.click()
-        self.page.wait_for_timeout(300)
+        self.promise_page.wait_for_visible("#desiredDeliveryDate")
 
         calendar_button = self.page.locator("#desiredDeliveryDate")
         if calendar_button.is_visible():
             calendar_button.click()
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_visible(".otp-day-picker")
 
             weekend_days = self.page.locator(".otp-day-picker .otp-weekend-day")
             self.assertGreaterEqual(weekend_days.count(), 0)
@@ -476,7 +473,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Open delivery settings
         delivery_toggle = self.page.get_by_role("button", name="Delivery Settings")
         delivery_toggle.click()
-        self.page.wait_for_timeout(300)
+        self.promise_page.wait_for_visible("#desiredDeliveryDate")
 
         # Look for "No Weekends" toggle/checkbox
         no_weekends_toggle = self.page.locator(
@@ -489,7 +486,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
 
             # Toggle the state
             no_weekends_toggle.click()
-            self.page.wait_for_timeout(300)
 
             # Verify state changed
             new_state = no_weekends_toggle.is_checked()
@@ -509,7 +505,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             'input[data-testid="item-code-search-input"], input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -518,7 +513,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Open delivery settings and verify no-weekends setting
         delivery_toggle = self.page.get_by_role("button", name="Delivery Settings")
         delivery_toggle.click()
-        self.page.wait_for_timeout(300)
+        self.promise_page.wait_for_visible("#desiredDeliveryDate")
 
         no_weekends_toggle = self.page.locator(
             'label:has-text("Exclude weekends from promise dates") input[type="checkbox"]'
@@ -532,8 +527,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Evaluate promise
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Verify results appear
             results_label = self.page.get_by_text("Promise Date").first
@@ -546,24 +540,35 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Open delivery settings and date picker
         delivery_toggle = self.page.get_by_role("button", name="Delivery Settings")
         delivery_toggle.click()
-        self.page.wait_for_timeout(300)
+        self.promise_page.wait_for_visible("#desiredDeliveryDate")
 
         date_button = self.page.locator("#desiredDeliveryDate")
         if date_button.is_visible():
             date_button.click()
-            self.page.wait_for_timeout(300)
+            self.promise_page.wait_for_visible(".otp-day-picker")
 
             day_button = self.page.locator(".otp-day-picker button").filter(
                 has_text="15"
             ).first
             if day_button.is_visible():
                 day_button.click()
-                self.page.wait_for_timeout(300)
+                self.promise_page.wait_for_hidden(".otp-day-picker")
 
                 # Verify date button shows a selected value
                 button_text = date_button.inner_text()
                 self.assertTrue(button_text)
 
+    def test_calendar_05_plant_holidays_marked(self):
+        """Component Test: Holidays from public/work-calendar.json are marked in the date picker."""
+        # September 2026: Rosh Hashana (Sat 12, Sun 13), Yom Kippur (Mon 21), Sukkot (Sat 26)
+        self.context.clock.set_fixed_time("2026-09-01T09:00:00")
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.open_date_picker_with_work_calendar()
+
+        # Saturdays stay weekend days; only workweek holidays get the holiday marker
+        holidays = self.page.locator(PromiseCalculatorPage.HOLIDAY_DAY)
+        expect(holidays).to_have_text(["13", "21"])
+
     # ========================================================================
     # COMPONENT: Results Panel
     # Test: Promise date rendering, confidence display, drivers list
@@ -583,7 +588,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             'input[data-testid="item-code-search-input"], input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -592,8 +596,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Evaluate
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Verify results section visible
             results_label = self.page.get_by_text("Promise Date").first
@@ -619,7 +622,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             'input[data-testid="item-code-search-input"], input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -628,8 +630,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Evaluate
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Verify results section visible
             results_label = self.page.get_by_text("Promise Date").first
@@ -663,7 +664,6 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
             'input[data-testid="item-code-search-input"], input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -672,8 +672,7 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
         # Evaluate
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Verify results section visible
             results_label = self.page.get_by_text("Promise Date").first
@@ -687,6 +686,164 @@ class PromiseCalculatorComponentTest(unittest.TestCase):
                 status_text = status_element.inner_text()
                 self.assertTrue(status_text)
 
+    def test_results_04_repeat_evaluation_served_from_cache(self):
+        """Component Test: Re-evaluating an unchanged order reuses the cached result."""
+        hits = NetworkHits(self.page)
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.switch_to_manual_mode()
+        self.promise_page.fill_customer("Test Customer")
+        self.promise_page.add_item("WIDGET-ALPHA", qty=5)
+        with hits.action("first evaluate"):
+            self.promise_page.evaluate_promise().wait_for_results()
+        expect(self.page.get_by_test_id("promise-cached-badge")).to_have_count(0)
+
+        with hits.action("second evaluate"):
+            self.page.get_by_role("button", name=self.promise_page.EVALUATE_PROMISE_BUTTON_TEXT).click()
+            expect(self.page.get_by_test_id("promise-cached-badge")).to_be_visible(timeout=10000)
+
+        promise_key = "POST " + self.promise_page.PROMISE_ENDPOINT
+        self.assertEqual(hits.count("first evaluate", promise_key), 1, hits.report())
+        self.assertEqual(hits.count("second evaluate", promise_key), 0, hits.report())
+
+    def test_results_05_large_order_plan_streamed(self):
+        """Component Test: A 50-line order is evaluated over the stream endpoint, one allocation row per line."""
+        name = "SAL-ORD-2026-00050"
+        self._serve_large_sales_order(name, 50)
+        hits = NetworkHits(self.page)
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.switch_to_sales_order_mode()
+        self.promise_page.select_sales_order(name)
+
+        with hits.action("evaluate"):
+            self.promise_page.evaluate_promise().wait_for_results()
+
+        # Streamed tables stay expanded once the summary arrives
+        rows = self.page.locator(self.promise_page.ALLOCATION_ROW)
+        expect(rows).to_have_count(50)
+        expect(self.page.locator(self.promise_page.ALLOCATION_STREAMING)).to_have_count(0)
+        self.assertEqual(hits.count("evaluate", "POST " + self.promise_page.PROMISE_STREAM_ENDPOINT), 1,
+                         hits.report())
+        self.assertEqual(hits.count("evaluate", "POST " + self.promise_page.PROMISE_ENDPOINT), 0, hits.report())
+
+    # ========================================================================
+    # COMPONENT: Network usage
+    # Test: Identical concurrent requests are coalesced into one fetch
+    # ========================================================================
+
+    def test_network_01_page_load_checks_health_once(self):
+        """Component Test: Components checking health together share one request."""
+        hits = NetworkHits(self.page)
+        with hits.action("load"):
+            self.promise_page.navigate_to_promise_calculator()
+
+        health = hits.count("load", "GET /health") + hits.count("load", "GET /otp/health")
+        self.assertEqual(health, 1, hits.report())
+
+    def test_network_02_sales_order_details_fetched_once(self):
+        """Component Test: Selecting a Sales Order fetches its details once."""
+        hits = NetworkHits(self.page)
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.switch_to_sales_order_mode()
+        with hits.action("select sales order"):
+            self.promise_page.select_sales_order("SAL-ORD-2026-00001")
+
+        self.assertEqual(hits.count("select sales order", "GET /otp/sales-orders/SAL-ORD-2026-00001"), 1,
+                         hits.report())
+
+    def test_network_03_health_poll_backs_off_and_pauses_when_hidden(self):
+        """Component Test: Health polls back off while offline, return to 30 s and pause in hidden tabs."""
+        backend = {"up": False}
+        self.mock_router.add("/health", lambda request, rest: (200, HEALTH_BODY) if backend["up"]
+                             else (503, serialize({"detail": "Service Unavailable"})))
+        badge = self.page.locator(self.promise_page.API_HEALTH_BADGE).first
+        hits = NetworkHits(self.page)
+
+        self.context.clock.install()
+        self.promise_page.navigate_to_promise_calculator()
+        expect(badge).to_have_attribute("data-health-status", "offline")
+        # Freeze time: every poll from here on is fired by run_for
+        self.context.clock.pause_at(self.page.evaluate("Date.now()") + 10)
+
+        def poll(label):
+            """Advance to the scheduled poll, wait for its result, return the delay it waited."""
+            before = self.promise_page.get_health_schedule()
+            with hits.action(label):
+                self.context.clock.run_for(before["next_check_at"] - before["checked_at"])
+                expect(badge).not_to_have_attribute("data-checked-at", str(before["checked_at"]))
+            self.assertEqual(hits.count(label, "GET /health"), 1, hits.report())
+            return before["next_check_at"] - before["checked_at"]
+
+        # Offline: 5 s, then doubling (OFFLINE_BASE_MS in healthMonitor.ts)
+        self.assertEqual([poll(f"offline {n}") for n in range(1, 4)], [5000, 10000, 20000])
+        backend["up"] = True
+        self.assertEqual(poll("recovered"), 40000)
+        expect(badge).to_have_attribute("data-health-status", "healthy")
+        self.assertEqual(poll("healthy"), 30000)
+
+        # Hidden tab: nothing scheduled, nothing sent
+        self.page.evaluate("""() => {
+            Object.defineProperty(document, "visibilityState", { configurable: true, get: () => "hidden" })
+            document.dispatchEvent(new Event("visibilitychange"))
+        }""")
+        expect(badge).to_have_attribute("data-next-check-at", "")
+        with hits.action("hidden"):
+            self.context.clock.run_for(120000)
+        self.assertEqual(hits.count("hidden", "GET /health"), 0, hits.report())
+
+        # Visible again and overdue: one poll right away
+        with hits.action("visible"):
+            self.page.evaluate("""() => {
+                Object.defineProperty(document, "visibilityState", { configurable: true, get: () => "visible" })
+                document.dispatchEvent(new Event("visibilitychange"))
+            }""")
+            expect(badge).not_to_have_attribute("data-next-check-at", "")
+        self.assertEqual(hits.count("visible", "GET /health"), 1, hits.report())
+
+    def test_network_04_one_tab_polls_health_for_all(self):
+        """Component Test: Open tabs share health results instead of each polling."""
+        self.context.clock.install()
+        self.promise_page.navigate_to_promise_calculator()
+        second_page = self.context.new_page()
+        PromiseCalculatorPage(second_page).navigate_to_promise_calculator()
+        for page in (self.page, second_page):
+            expect(page.locator(self.promise_page.API_HEALTH_BADGE).first).to_have_attribute(
+                "data-health-status", "healthy"
+            )
+        self.context.clock.pause_at(self.page.evaluate("Date.now()") + 10)
+
+        hits = [NetworkHits(self.page), NetworkHits(second_page)]
+        with hits[0].action("poll window"), hits[1].action("poll window"):
+            # One healthy interval plus half the follower grace (PEER_GRACE_MS)
+            self.context.clock.run_for(30000 + 500)
+        polls = [tab.count("poll window", "GET /health") for tab in hits]
+        self.assertEqual(sum(polls), 1, f"health polls per tab: {polls}")
+
+    # ========================================================================
+    # COMPONENT: Batch Re-promise
+    # Test: Many Sales Orders evaluated in one streamed request
+    # ========================================================================
+
+    def test_batch_01_listed_orders_repromised_in_one_request(self):
+        """Component Test: "Add all" + Re-promise sends one batch request and fills every row."""
+        hits = NetworkHits(self.page)
+        self.promise_page.navigate_to_promise_calculator()
+        self.promise_page.open_batch_repromise()
+        self.promise_page.add_all_listed_sales_orders()
+        rows = self.page.locator(self.promise_page.BATCH_ROW)
+        expect(rows).to_have_count(len(MOCK_SALES_ORDERS_LIST["sales_orders"]))
+
+        with hits.action("re-promise"):
+            self.promise_page.run_batch()
+
+        progress = self.page.locator(self.promise_page.BATCH_PROGRESS)
+        expect(progress).to_have_attribute("data-done", "3")
+        # SAL-ORD-2026-00010 is listed but has no details mock: reported per row, not for the batch
+        expect(rows.filter(has_text="SAL-ORD-2026-00010")).to_have_attribute("data-status", "failed")
+        expect(self.page.locator(f'{self.promise_page.BATCH_ROW}[data-status="done"]')).to_have_count(2)
+        self.assertEqual(hits.count("re-promise", "POST " + self.promise_page.PROMISE_BATCH_ENDPOINT), 1,
+                         hits.report())
+        self.assertEqual(hits.count("re-promise", "POST " + self.promise_page.PROMISE_ENDPOINT), 0, hits.report())
+
 
 if __name__ == "__main__":
     unittest.main()
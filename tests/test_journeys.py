@@ -13,16 +13,12 @@ Follows AutomationSamana25 course pattern with unittest framework.
 """
 
 import unittest
-import json
-from playwright.sync_api import sync_playwright, Page, expect
+from playwright.sync_api import Page, expect
 from tests.pages.promise_calculator_page import PromiseCalculatorPage
-from tests.mocks.otp import (
-    MOCK_HEALTH_RESPONSE,
-    MOCK_SALES_ORDERS_LIST,
-    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001,
-    MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002,
-    MOCK_PROMISE_RESPONSE_SUCCESS,
-)
+from tests.support.worker_browser import get_worker_browser
+from tests.support.warm_start import new_warm_context
+from tests.mocks.routes import install_otp_mocks
+from tests.perf.web_vitals import attach_vitals_probe, benchmark_enabled, record_vitals
 
 
 class PromiseCalculatorJourneyTest(unittest.TestCase):
@@ -30,99 +26,27 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up browser once for all tests in this class."""
-        cls.playwright = sync_playwright().start()
-        cls.browser = cls.playwright.chromium.launch(headless=False)
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up after all tests are done."""
-        import threading
-        
-        def close_browser():
-            try:
-                cls.browser.close()
-            except (KeyboardInterrupt, Exception):
-                pass
-        
-        # Close browser in a thread with timeout
-        thread = threading.Thread(target=close_browser, daemon=True)
-        thread.start()
-        thread.join(timeout=5)
-        
-        try:
-            cls.playwright.stop()
-        except (KeyboardInterrupt, Exception):
-            pass
+        """Attach to the long-lived browser owned by this worker process."""
+        cls.browser = get_worker_browser()
 
     def setUp(self):
-        """Set up before each test method."""
-        self.page = self.browser.new_page()
-        self.promise_page = PromiseCalculatorPage(self.page)
+        """Set up a fresh browser context and page for each test method."""
+        self.context = new_warm_context(self.browser)
         self._mock_api_endpoints()
+        if benchmark_enabled():
+            attach_vitals_probe(self.context)
+        self.page = self.context.new_page()
+        self.promise_page = PromiseCalculatorPage(self.page)
 
     def tearDown(self):
         """Clean up after each test method."""
-        self.page.close()
+        if benchmark_enabled():
+            record_vitals(self.id(), self.page)
+        self.context.close()
 
     def _mock_api_endpoints(self):
-        """Mock all API endpoints."""
-        # Mock health check endpoints
-        def handle_health(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_HEALTH_RESPONSE),
-            )
-
-        self.page.route("**/health", handle_health)
-        self.page.route("**/otp/health", handle_health)
-
-        # Mock sales orders list
-        def handle_sales_orders_list(route):
-            url = route.request.url
-            if "/otp/sales-orders/" in url:
-                return
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDERS_LIST),
-            )
-
-        self.page.route("**/otp/sales-orders**", handle_sales_orders_list)
-
-        # Mock individual sales order details
-        def handle_so_00001(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00001),
-            )
-
-        def handle_so_00002(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_SALES_ORDER_DETAILS_SAL_ORD_00002),
-            )
-
-        self.page.route("**/otp/sales-orders/SAL-ORD-2026-00001**", handle_so_00001)
-        self.page.route("**/otp/sales-orders/SAL-ORD-2026-00002**", handle_so_00002)
-
-        # Mock promise evaluation endpoint
-        def handle_promise_eval(route):
-            route.fulfill(
-                status=200,
-                content_type="application/json",
-                headers={"access-control-allow-origin": "*"},
-                body=json.dumps(MOCK_PROMISE_RESPONSE_SUCCESS),
-            )
-
-        self.page.route("**/otp/promise", handle_promise_eval)
+        """Mock all API endpoints (one route on the test's BrowserContext)."""
+        self.mock_router = install_otp_mocks(self.context)
 
     # ========================================================================
     # SMOKE TESTS - Basic Page Functionality
@@ -192,17 +116,16 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
 
         item_code_inputs.nth(0).fill("WIDGET-ALPHA")
         item_code_inputs.nth(0).press("Tab")
-        self.page.wait_for_timeout(500)  # Increased wait time
 
         qty_inputs.nth(0).clear()
         qty_inputs.nth(0).fill("5")
         qty_inputs.nth(0).press("Tab")  # Trigger blur/validation
-        self.page.wait_for_timeout(500)
 
         add_button = self.page.get_by_role("button", name="Add Item")
         if add_button.is_visible():
             add_button.click()
-            self.page.wait_for_timeout(800)  # Wait for new row to appear
+            # Wait for new row to appear
+            self.promise_page.wait_for_element_count('input[placeholder="e.g., SKU001"]', 2)
 
         # Step 4: Add second item (WIDGET-BETA, qty 10)
         # Refresh locators to get updated list
@@ -212,16 +135,14 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
         # Fill the second row
         item_code_inputs.nth(1).fill("WIDGET-BETA")
         item_code_inputs.nth(1).press("Tab")
-        self.page.wait_for_timeout(800)  # Increased wait for validation
         
         qty_inputs.nth(1).clear()
         qty_inputs.nth(1).fill("10")
         qty_inputs.nth(1).press("Tab")  # Trigger blur/validation
-        self.page.wait_for_timeout(800)  # Wait for validation to complete
 
         # Step 5: Set desired delivery date
         # Step 6: Ensure no validation errors, backend connected, then click Evaluate Promise
-        self.page.wait_for_timeout(1000)  # Additional wait for all validations
+        self.promise_page.wait_for_query_idle()  # Wait for all in-flight requests
         
         error_messages = self.page.locator("p.text-red-600")
         if error_messages.count() > 0:
@@ -237,8 +158,7 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
         
         if evaluate_btn.is_visible() and not evaluate_btn.is_disabled():
             # Click the evaluate button and wait for response
-            evaluate_btn.click()
-            self.page.wait_for_timeout(3000)  # Increased wait for API response/results
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Step 7: Verify results appear - look for result panel or promise date
             # Try multiple selectors to find results
@@ -280,7 +200,6 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             'input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -289,8 +208,7 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
         # Evaluate promise
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible():
-            evaluate_btn.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Verify results render
             results_label = self.page.get_by_text("Promise Date").first
@@ -309,7 +227,6 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             'input[placeholder="e.g., SKU001"]'
         ).first
         item_code_input.fill("WIDGET-ALPHA")
-        self.page.wait_for_timeout(300)
 
         qty_input = self.page.locator('input[type="number"]').first
         qty_input.clear()
@@ -319,15 +236,13 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
         warehouse_select = self.page.locator('select').first
         if warehouse_select.is_visible():
             warehouse_select.select_option(label="Finished Goods - SD")
-            self.page.wait_for_timeout(300)
 
         # Evaluate - wait for validation to complete
-        self.page.wait_for_timeout(1000)  # Give time for item validation
+        self.promise_page.wait_for_query_idle()
         evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
         if evaluate_btn.is_visible() and not evaluate_btn.is_disabled():
-            evaluate_btn.click()
-            # Wait longer for API call and results to render
-            self.page.wait_for_timeout(3000)
+            # Wait for the API call; results render from its response
+            self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
             # Step 6: Verify results appear - look for result panel or promise date
             results_visible = False
@@ -357,29 +272,26 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             "input-mode-sales-order"
         ).first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Step 2: Select a sales order from combobox (VERIFIED: testId="sales-order-combobox")
         combobox_container = self.page.get_by_test_id("sales-order-combobox").first
         combobox_input = combobox_container.locator('input[role="combobox"]').first
         combobox_input.click()
-        self.page.wait_for_timeout(300)
 
         # Type to filter
-        combobox_input.fill("SAL-ORD-2026-00001")
-        self.page.wait_for_timeout(500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00001")
 
         # Click the option
         option = self.page.get_by_role("option").first
-        if option.is_visible():
+        if self.promise_page.try_wait_for_locator(option):
             option.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_query_idle()
 
             # Step 3: Click Evaluate Promise button
             evaluate_btn = self.page.get_by_role("button", name="Evaluate Promise")
             if evaluate_btn.is_visible():
-                evaluate_btn.click()
-                self.page.wait_for_timeout(500)
+                self.promise_page.wait_for_api_response("/otp/promise", evaluate_btn.click)
 
                 # Step 5: Verify results appear
                 results_section = self.page.locator(
@@ -396,20 +308,18 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             "input-mode-sales-order"
         ).first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Select first sales order (VERIFIED combobox)
         combobox_container = self.page.get_by_test_id("sales-order-combobox").first
         combobox_input = combobox_container.locator('input[role="combobox"]').first
         combobox_input.click()
-        self.page.wait_for_timeout(300)
-        combobox_input.fill("SAL-ORD-2026-00001")
-        self.page.wait_for_timeout(500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00001")
 
         option = self.page.get_by_role("option").first
-        if option.is_visible():
+        if self.promise_page.try_wait_for_locator(option):
             option.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_query_idle()
 
             # Verify first SO is selected
             selected = combobox_input.input_value()
@@ -419,18 +329,16 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             clear_button = self.page.get_by_role("button", name="Clear").first
             if clear_button.is_visible():
                 clear_button.click()
-                self.page.wait_for_timeout(300)
+                self.promise_page.wait_for_input_value(combobox_input, "")
 
                 # Select second SO
                 combobox_input.click()
-                self.page.wait_for_timeout(300)
-                combobox_input.fill("SAL-ORD-2026-00002")
-                self.page.wait_for_timeout(500)
+                self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00002")
 
                 option2 = self.page.get_by_role("option").first
-                if option2.is_visible():
+                if self.promise_page.try_wait_for_locator(option2):
                     option2.click()
-                    self.page.wait_for_timeout(500)
+                    self.promise_page.wait_for_query_idle()
 
                     # Verify second SO is selected
                     selected2 = combobox_input.input_value()
@@ -445,20 +353,18 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             "input-mode-sales-order"
         ).first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Select a sales order (VERIFIED combobox)
         combobox_container = self.page.get_by_test_id("sales-order-combobox").first
         combobox_input = combobox_container.locator('input[role="combobox"]').first
         combobox_input.click()
-        self.page.wait_for_timeout(300)
-        combobox_input.fill("SAL-ORD-2026-00001")
-        self.page.wait_for_timeout(500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00001")
 
         option = self.page.get_by_role("option").first
-        if option.is_visible():
+        if self.promise_page.try_wait_for_locator(option):
             option.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_query_idle()
 
             # Verify selected
             selected = combobox_input.input_value()
@@ -468,7 +374,7 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             clear_button = self.page.get_by_role("button", name="Clear").first
             if clear_button.is_visible():
                 clear_button.click()
-                self.page.wait_for_timeout(300)
+                self.promise_page.wait_for_input_value(combobox_input, "")
 
                 # Verify cleared
                 cleared = combobox_input.input_value()
@@ -483,20 +389,18 @@ class PromiseCalculatorJourneyTest(unittest.TestCase):
             "input-mode-sales-order"
         ).first
         so_mode_button.click()
-        self.page.wait_for_timeout(500)
+        self.promise_page.wait_for_query_idle()
 
         # Select a sales order (VERIFIED combobox)
         combobox_container = self.page.get_by_test_id("sales-order-combobox").first
         combobox_input = combobox_container.locator('input[role="combobox"]').first
         combobox_input.click()
-        self.page.wait_for_timeout(300)
-        combobox_input.fill("SAL-ORD-2026-00001")
-        self.page.wait_for_timeout(500)
+        self.promise_page.search_sales_orders(combobox_input, "SAL-ORD-2026-00001")
 
         option = self.page.get_by_role("option").first
-        if option.is_visible():
+        if self.promise_page.try_wait_for_locator(option):
             option.click()
-            self.page.wait_for_timeout(500)
+            self.promise_page.wait_for_query_idle()
 
             # Verify item code input is populated
             item_code_input = self.page.locator(